@@ -22,6 +22,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Set
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 from enum import Enum
 
@@ -258,6 +259,7 @@ class AfterHoursScanner:
         return injected
 
 
+@instrumented("scanner", "afterhours")
 async def run_afterhours_scan(price_client, universe: Set[str] = None) -> Dict:
     """
     Run after-hours scan.
@@ -239,6 +239,10 @@ class APIBudgetManager:
         self._priority_cache[symbol] = priority
         return priority
     
+    def peek_ticker_priority(self, symbol: str) -> Optional[TickerPriority]:
+        """Return the cached priority for a ticker without assigning one."""
+        return self._priority_cache.get(symbol)
+    
     def update_ticker_priority(self, symbol: str, score: float, is_dui: bool = False):
         """Update ticker priority based on new score."""
         if symbol in self._priority_cache:
@@ -285,7 +289,18 @@ class APIBudgetManager:
                 return False
         
         return True
-    
+
+    def window_headroom(self, force_scan: bool = False) -> int:
+        """
+        UW calls left before the current ceiling.
+
+        Before 2 PM ET this stops at the afternoon reservation; force_scan
+        (or the afternoon) measures against the full daily limit.
+        """
+        self._check_reset()
+        ceiling = self.daily_limit if force_scan else self._effective_ceiling()
+        return max(0, ceiling - self._calls_today)
+
     def record_call(self, symbol: str, calls: int = 1):
         """Record API call(s) for budget tracking."""
         self._check_reset()
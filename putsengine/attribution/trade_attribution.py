@@ -32,7 +32,6 @@ Schema per trade:
 This is how you PROVE the Vega Gate is doing its job.
 """
 
-import json
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, date, timedelta
@@ -42,6 +41,8 @@ from enum import Enum
 from loguru import logger
 import statistics
 
+from putsengine.codec import dump_file, load_file
+
 
 class TradeOutcome(Enum):
     """Trade outcome classification."""
@@ -145,8 +146,7 @@ def load_attribution_history() -> Dict:
         }
     
     try:
-        with open(ATTRIBUTION_FILE, 'r') as f:
-            return json.load(f)
+        return load_file(ATTRIBUTION_FILE)
     except Exception as e:
         logger.error(f"Error loading attribution history: {e}")
         return {"trades": [], "summary": {}, "last_updated": None}
@@ -156,8 +156,7 @@ def save_attribution_history(history: Dict):
     """Save trade attribution history to file."""
     try:
         history["last_updated"] = datetime.now().isoformat()
-        with open(ATTRIBUTION_FILE, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        dump_file(history, ATTRIBUTION_FILE)
         logger.info(f"Attribution history saved: {len(history['trades'])} trades")
     except Exception as e:
         logger.error(f"Error saving attribution history: {e}")
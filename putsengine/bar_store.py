@@ -0,0 +1,290 @@
+"""
+Bar Store - incremental intraday bars, fetched as a delta since the last scan.
+
+WHY:
+Every 30-minute scan re-downloaded the full minute-bar window (up to
+5 days / 5000 bars) per ticker through ``PolygonClient.get_minute_bars``,
+although only the bars since the previous scan were new.
+
+HOW:
+- One series per (symbol, timespan) held as a ``BarArray``; ``covered_from``
+  records the oldest date the series is complete from.
+- ``window(symbol, from_date)`` answers from the series. It only calls
+  Polygon when the series is missing or too short (one full request for
+  the window) or stale (one request from the last stored bar to now).
+  The last stored bar is re-requested because it may have been partial;
+  overlapping timestamps are replaced by the newer data.
+- Concurrent requests for the same series wait on one fetch (per-key lock),
+  and a series refreshed less than ``refresh_seconds`` ago is served as-is,
+  so the four layers of one scan pass cost at most one request.
+- Bars older than ``retention_days`` are dropped on merge. A window that
+  starts before the retention cutoff is fetched and returned directly,
+  without touching the stored series.
+- At most ``max_series`` series stay in memory; the least recently used
+  one is dropped first (it reloads from disk when persisted).
+- Optional persistence (``root``): one ``.npz`` partition per UTC day per
+  series plus the date the series is complete from, so a restarted daemon
+  starts from disk instead of from zero.
+  Only partitions touched by a merge are rewritten.
+
+Usage:
+    store = MinuteBarStore(polygon)                 # or get_minute_bar_store(polygon, settings)
+    bars = await store.window("AAPL", date.today() - timedelta(days=2))
+"""
+
+import asyncio
+import os
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from putsengine.bars import BarArray, _COLUMNS
+
+
+DEFAULT_RETENTION_DAYS = 7
+DEFAULT_REFRESH_SECONDS = 30.0
+DEFAULT_MAX_SERIES = 600   # ~ universe + DUI names, one timespan
+MAX_REQUEST_LIMIT = 50000  # Polygon's aggregate page cap
+
+_DAY_MS = 86_400_000
+_COVERAGE_FILE = "covered_from"
+
+SeriesKey = Tuple[str, str]
+_LockMap = Dict[SeriesKey, asyncio.Lock]
+
+
+class _Series:
+    __slots__ = ("bars", "covered_from", "refreshed_at")
+
+    def __init__(self, bars: BarArray, covered_from: Optional[date]):
+        self.bars = bars
+        self.covered_from = covered_from
+        self.refreshed_at = 0.0
+
+
+def merge_bars(old: BarArray, new: BarArray) -> BarArray:
+    """Union of two ascending series; on equal timestamps ``new`` wins."""
+    if not len(old):
+        return new
+    if not len(new):
+        return old
+    keep = ~np.isin(old.ts, new.ts)
+    merged = {c: np.concatenate([getattr(old, c)[keep], getattr(new, c)]) for c in _COLUMNS}
+    order = np.argsort(merged["ts"], kind="stable")
+    return BarArray(*(merged[c][order] for c in _COLUMNS), utc=old.utc)
+
+
+class MinuteBarStore:
+    """Local intraday bar series that only requests what it doesn't have."""
+
+    def __init__(
+        self,
+        polygon,
+        root: Optional[Union[str, Path]] = None,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        self.polygon = polygon
+        self.root = Path(root) if root is not None else None
+        self.retention_days = retention_days
+        self.refresh_seconds = refresh_seconds
+        self.max_series = max(1, max_series)
+        self._series: OrderedDict[SeriesKey, _Series] = OrderedDict()
+        # asyncio locks are loop-bound: one lock map per event loop
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LockMap] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.full_fetches = 0
+        self.delta_fetches = 0
+        self.hits = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def window(
+        self,
+        symbol: str,
+        from_date: date,
+        limit: int = 5000,
+        timespan: str = "minute",
+    ) -> BarArray:
+        """
+        Bars for ``symbol`` on/after ``from_date``, oldest first, capped at
+        ``limit`` - the same rows ``get_minute_bars(symbol, from_date,
+        limit=limit)`` returns.
+        """
+        if from_date < self._cutoff():
+            # Older than what the store keeps: serve it without storing it
+            bars = await self._fetch(symbol, timespan, from_date)
+            self.full_fetches += 1
+            return bars.since(from_date)[:limit]
+
+        key = (symbol, timespan)
+        series = self._get_series(key)
+        async with self._lock(key):
+            try:
+                await self._ensure(key, series, from_date)
+            except Exception as e:
+                logger.debug(f"{symbol}: bar store refresh failed: {e}")
+        return series.bars.since(from_date)[:limit]
+
+    def _get_series(self, key: SeriesKey) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series.setdefault(key, _Series(*self._load(key)))
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+        else:
+            self._series.move_to_end(key)
+        return series
+
+    def _lock(self, key: SeriesKey) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        locks = self._locks.get(loop)
+        if locks is None:
+            locks = self._locks[loop] = {}
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks[key] = asyncio.Lock()
+        return lock
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "series": len(self._series),
+            "full_fetches": self.full_fetches,
+            "delta_fetches": self.delta_fetches,
+            "hits": self.hits,
+        }
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    async def _ensure(self, key: SeriesKey, series: _Series, from_date: date) -> None:
+        symbol, timespan = key
+        if series.covered_from is None or from_date < series.covered_from or not len(series.bars):
+            # Missing or too short: one request for the whole window
+            bars = await self._fetch(symbol, timespan, from_date)
+            self.full_fetches += 1
+            series.covered_from = from_date
+        elif time.monotonic() - series.refreshed_at >= self.refresh_seconds:
+            # Delta from the last stored bar (inclusive - it may have been partial)
+            bars = await self._fetch(symbol, timespan, int(series.bars.ts[-1]))
+            self.delta_fetches += 1
+        else:
+            self.hits += 1
+            return
+
+        old = series.bars
+        series.bars = self._trim(merge_bars(old, bars))
+        series.covered_from = max(series.covered_from, self._cutoff())
+        series.refreshed_at = time.monotonic()
+        if len(bars) >= MAX_REQUEST_LIMIT:
+            # Page cap hit: the newest bars are still missing; fetch again next call
+            series.refreshed_at = 0.0
+        self._save(key, series.bars, bars, series.covered_from)
+
+    async def _fetch(self, symbol: str, timespan: str, start: Union[date, int]) -> BarArray:
+        return await self.polygon.get_aggregates(
+            symbol=symbol,
+            multiplier=1,
+            timespan=timespan,
+            from_date=start,
+            to_date=date.today(),
+            limit=MAX_REQUEST_LIMIT,
+        )
+
+    def _cutoff(self) -> date:
+        return date.today() - timedelta(days=self.retention_days)
+
+    def _trim(self, bars: BarArray) -> BarArray:
+        return bars.since(self._cutoff()) if len(bars) else bars
+
+    # ------------------------------------------------------------------
+    # Persistence (one .npz per UTC day per series)
+    # ------------------------------------------------------------------
+
+    def _series_dir(self, key: SeriesKey) -> Path:
+        symbol, timespan = key
+        return self.root / timespan / symbol
+
+    def _load(self, key: SeriesKey) -> Tuple[BarArray, Optional[date]]:
+        """Persisted bars and the date they are complete from."""
+        if self.root is None:
+            return BarArray.empty(), None
+        directory = self._series_dir(key)
+        if not directory.exists():
+            return BarArray.empty(), None
+        cutoff = self._cutoff().isoformat()
+        parts = []
+        covered_from = None
+        try:
+            covered_from = date.fromisoformat((directory / _COVERAGE_FILE).read_text().strip())
+        except (OSError, ValueError):
+            pass
+        for path in sorted(directory.glob("[0-9]*.npz")):
+            if path.stem < cutoff:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+                continue
+            try:
+                with np.load(path) as data:
+                    parts.append(BarArray(*(data[c] for c in _COLUMNS)))
+            except Exception as e:
+                logger.debug(f"Skipping unreadable bar partition {path}: {e}")
+        bars = BarArray.empty()
+        for part in parts:
+            bars = merge_bars(bars, part)
+        if covered_from is not None:
+            covered_from = max(covered_from, self._cutoff())
+        return bars, (covered_from if len(bars) else None)
+
+    def _save(
+        self, key: SeriesKey, bars: BarArray, changed: BarArray, covered_from: Optional[date]
+    ) -> None:
+        if self.root is None or not len(changed):
+            return
+        directory = self._series_dir(key)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            if covered_from is not None:
+                (directory / _COVERAGE_FILE).write_text(covered_from.isoformat())
+            days = bars.ts // _DAY_MS
+            for day in np.unique(changed.ts // _DAY_MS):
+                part = bars[days == day]
+                name = datetime.fromtimestamp(int(day) * 86400, tz=timezone.utc).date().isoformat()
+                tmp = directory / f".{name}.{os.getpid()}.npz"
+                np.savez(tmp, **{c: getattr(part, c) for c in _COLUMNS})
+                os.replace(tmp, directory / f"{name}.npz")
+        except OSError as e:
+            logger.debug(f"Could not persist bars for {key}: {e}")
+
+
+_store: Optional[MinuteBarStore] = None
+
+
+def get_minute_bar_store(polygon, settings=None) -> MinuteBarStore:
+    """
+    Process-wide store. The cached bars are shared; fetching goes through
+    the most recent caller's client (a recreated client replaces a closed one).
+    """
+    global _store
+    if _store is None:
+        root = getattr(settings, "bar_store_path", None) if settings is not None else None
+        _store = MinuteBarStore(polygon, root=root)
+    elif polygon is not None and _store.polygon is not polygon:
+        _store.polygon = polygon
+    return _store
@@ -0,0 +1,191 @@
+"""
+BarArray - columnar OHLCV bars.
+
+WHY:
+``get_aggregates`` / ``get_bars`` built one PriceBar dataclass and one
+``datetime`` per bar. A 5,000-bar minute request meant 5,000 objects and
+5,000 ``fromtimestamp`` calls before any layer looked at the data, and the
+layers then walked those objects in Python generator expressions.
+
+HOW:
+- Contiguous NumPy columns: ts (int64 epoch ms), open/high/low/close/vwap
+  (float64), volume (int64), filled straight from the JSON response.
+- Sequence-compatible: ``len``, truthiness, iteration, ``bars[-1].close``
+  and ``bars[-10:-1]`` all still work. Integer indexing materializes a
+  PriceBar on demand; slicing returns another BarArray (a view, no copy).
+- Hot paths use the columns directly (``bars.close``, ``bars.since(d)``).
+
+Timestamp semantics match what the clients produced before: Polygon bars
+materialize naive local datetimes, Alpaca bars timezone-aware UTC.
+"""
+
+from collections.abc import Sequence
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from putsengine.models import PriceBar
+
+
+_COLUMNS = ("ts", "open", "high", "low", "close", "volume", "vwap")
+
+
+class BarArray(Sequence):
+    """Columnar OHLCV bars with a PriceBar sequence view."""
+
+    __slots__ = _COLUMNS + ("utc",)
+
+    def __init__(
+        self,
+        ts: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        vwap: Optional[np.ndarray] = None,
+        utc: bool = False,
+    ):
+        self.ts = np.asarray(ts, dtype=np.int64)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.int64)
+        self.vwap = (np.zeros(len(self.ts)) if vwap is None
+                     else np.asarray(vwap, dtype=np.float64))
+        self.utc = utc
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls, utc: bool = False) -> "BarArray":
+        z = np.zeros(0)
+        return cls(z, z, z, z, z, z, z, utc=utc)
+
+    @classmethod
+    def from_polygon(cls, results: List[Dict[str, Any]]) -> "BarArray":
+        """Build from Polygon aggregate ``results`` (t = epoch ms)."""
+        if not results:
+            return cls.empty()
+        rows = np.array(
+            [
+                (r["t"], r["o"], r["h"], r["l"], r["c"], r["v"], r.get("vw", 0) or 0)
+                for r in results
+            ],
+            dtype=np.float64,
+        )
+        return cls(rows[:, 0].astype(np.int64), rows[:, 1], rows[:, 2], rows[:, 3],
+                   rows[:, 4], rows[:, 5].astype(np.int64), rows[:, 6])
+
+    @classmethod
+    def from_alpaca(cls, bars: List[Dict[str, Any]]) -> "BarArray":
+        """Build from Alpaca ``bars`` (t = RFC 3339 string, UTC)."""
+        if not bars:
+            return cls.empty(utc=True)
+        stamps = [b["t"] for b in bars]
+        if all(s.endswith("Z") for s in stamps):
+            ts = np.array([s[:-1] for s in stamps], dtype="datetime64[ms]").astype(np.int64)
+        else:
+            # Explicit offsets (+00:00) - numpy can't apply those
+            ts = np.array([
+                int(datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp() * 1000)
+                for s in stamps
+            ], dtype=np.int64)
+        rows = np.array(
+            [(b["o"], b["h"], b["l"], b["c"], b["v"], b.get("vw", 0) or 0) for b in bars],
+            dtype=np.float64,
+        )
+        return cls(ts, rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3],
+                   rows[:, 4].astype(np.int64), rows[:, 5], utc=True)
+
+    @classmethod
+    def from_bars(cls, bars: Iterable[PriceBar]) -> "BarArray":
+        """Build from PriceBar objects (e.g. legacy cached lists)."""
+        bars = list(bars)
+        if not bars:
+            return cls.empty()
+        utc = bars[0].timestamp.tzinfo is not None
+        return cls(
+            [int(b.timestamp.timestamp() * 1000) for b in bars],
+            [b.open for b in bars], [b.high for b in bars], [b.low for b in bars],
+            [b.close for b in bars], [b.volume for b in bars],
+            [b.vwap or 0.0 for b in bars], utc=utc,
+        )
+
+    # ------------------------------------------------------------------
+    # Sequence view
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def _datetime(self, ms: int) -> datetime:
+        if self.utc:
+            return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+        return datetime.fromtimestamp(ms / 1000)
+
+    def _bar(self, i: int) -> PriceBar:
+        return PriceBar(
+            timestamp=self._datetime(int(self.ts[i])),
+            open=float(self.open[i]),
+            high=float(self.high[i]),
+            low=float(self.low[i]),
+            close=float(self.close[i]),
+            volume=int(self.volume[i]),
+            vwap=float(self.vwap[i]),
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            n = len(self.ts)
+            if index < 0:
+                index += n
+            if not 0 <= index < n:
+                raise IndexError("BarArray index out of range")
+            return self._bar(index)
+        # slice / boolean mask / index array -> BarArray
+        return BarArray(*(getattr(self, c)[index] for c in _COLUMNS), utc=self.utc)
+
+    def __iter__(self) -> Iterator[PriceBar]:
+        for i in range(len(self.ts)):
+            yield self._bar(i)
+
+    def __add__(self, other) -> List[PriceBar]:
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> List[PriceBar]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"BarArray(n={len(self)}, utc={self.utc})"
+
+    def to_bars(self) -> List[PriceBar]:
+        return list(self)
+
+    # ------------------------------------------------------------------
+    # Columnar helpers
+    # ------------------------------------------------------------------
+
+    def _epoch_ms(self, when: Union[date, datetime]) -> int:
+        if not isinstance(when, datetime):
+            when = datetime.combine(when, time())
+        if self.utc and when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return int(when.timestamp() * 1000)
+
+    def since(self, when: Union[date, datetime]) -> "BarArray":
+        """Bars at/after ``when`` (a date means its midnight). Bars must be ascending."""
+        return self[int(np.searchsorted(self.ts, self._epoch_ms(when), side="left")):]
+
+    @property
+    def typical_price(self) -> np.ndarray:
+        return (self.high + self.low + self.close) / 3.0
+
+
+def as_bar_array(bars) -> BarArray:
+    """Columnar view of ``bars`` (no copy if it already is a BarArray)."""
+    return bars if isinstance(bars, BarArray) else BarArray.from_bars(bars)
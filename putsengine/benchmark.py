@@ -0,0 +1,702 @@
+"""
+Pipeline Benchmark - repeatable timing and API-call budgets for the scan pipeline.
+
+WHY:
+Regressions only showed up in the logs after a deploy: a 21-minute market
+pulse scan, 65-second batch waits, scans that quietly doubled their UW
+calls. Nothing measured the pipeline before it shipped.
+
+HOW:
+- Providers are served by the replay transport (``clients.transport``):
+  a recorded archive, synthetic data, or both (synthetic fills archive
+  misses). No network, no keys, no quota.
+- Scenarios run in pipeline order, each feeding the next through the
+  usual files: ``run_scan`` -> ``run_early_warning_scan`` ->
+  ``MarketWeatherEngine.analyze_universe`` (via ``run``, which writes the
+  report) -> ``ConvergenceEngine.run``.
+- Per scenario:
+    * wall time
+    * p50/p95 latency of each layer / per-symbol step (``LatencyProbe``)
+    * HTTP calls per provider, and per symbol
+    * JSON file I/O (``json.dump``/``json.load``) calls and time
+    * peak RSS
+- Everything runs in a scratch working directory with its own state DB,
+  footprint store and scan history, so live result files are not touched.
+- Results are written as JSON. ``check_thresholds`` applies absolute
+  limits and ``compare_to_baseline`` flags growth against a previous
+  results file; the CLI exits non-zero on either.
+
+Usage:
+    python -m putsengine.benchmark --symbols 25 --out benchmark_results.json
+    python -m putsengine.benchmark --archive archives/ews.jsonl.gz --baseline last.json
+"""
+
+import asyncio
+import hashlib
+import importlib
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from putsengine.clients import transport
+from putsengine import codec
+from putsengine.clients.transport import Exchange, Replayer
+from putsengine.codec import dump_file
+from putsengine.metrics import provider_for_host
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+SCENARIOS = ("run_scan", "run_early_warning_scan", "analyze_universe", "convergence")
+
+# Timed per call: label -> "module:Class.method"
+LAYER_TARGETS = {
+    "market_regime": "putsengine.layers.market_regime:MarketRegimeLayer.analyze",
+    "distribution": "putsengine.layers.distribution:DistributionLayer.analyze",
+    "liquidity": "putsengine.layers.liquidity:LiquidityVacuumLayer.analyze",
+    "acceleration": "putsengine.layers.acceleration:AccelerationWindowLayer.analyze",
+    "ews_symbol": "putsengine.early_warning_system:EarlyWarningScanner.scan_symbol",
+    "weather_ticker": "putsengine.predictive_engine:MarketWeatherEngine._analyze_ticker",
+}
+
+# Ceilings for a synthetic, unpaced run ("scenario.metric.path": limit).
+# Tighten these as the pipeline gets faster; override with --thresholds.
+DEFAULT_THRESHOLDS = {
+    "run_scan.wall_seconds": 120.0,
+    "run_scan.calls_per_symbol.uw": 20.0,
+    "run_scan.calls_per_symbol.polygon": 12.0,
+    "run_early_warning_scan.wall_seconds": 120.0,
+    "run_early_warning_scan.calls_per_symbol.uw": 15.0,
+    "run_early_warning_scan.calls_per_symbol.polygon": 15.0,
+    "analyze_universe.wall_seconds": 60.0,
+    "analyze_universe.calls_per_symbol.polygon": 15.0,
+    "convergence.wall_seconds": 10.0,
+    "convergence.json_io.ms": 2000.0,
+}
+
+# Metrics compared against a baseline run (lower is better)
+BASELINE_METRICS = ("wall_seconds", "http_calls", "json_io.ms")
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no samples)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024) if peak > 1 << 32 else peak / 1024, 1)
+
+
+def _lookup(path: Dict[str, Any], dotted: str) -> Any:
+    value: Any = path
+    for part in dotted.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+# ----------------------------------------------------------------------
+# Probes
+# ----------------------------------------------------------------------
+
+class LatencyProbe:
+    """Times every call to the target async methods while active."""
+
+    def __init__(self, targets: Dict[str, str] = LAYER_TARGETS):
+        self.targets = targets
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self._patched: List[tuple] = []
+
+    def _wrap(self, label: str, fn: Callable) -> Callable:
+        samples = self.samples[label]
+
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                samples.append((time.perf_counter() - started) * 1000)
+
+        timed.__wrapped__ = fn
+        return timed
+
+    def __enter__(self) -> "LatencyProbe":
+        for label, target in self.targets.items():
+            module_name, attr = target.split(":")
+            class_name, method = attr.split(".")
+            try:
+                cls = getattr(importlib.import_module(module_name), class_name)
+            except (ImportError, AttributeError) as e:
+                logger.debug(f"Benchmark probe {label} unavailable: {e}")
+                continue
+            original = cls.__dict__[method]
+            setattr(cls, method, self._wrap(label, original))
+            self._patched.append((cls, method, original))
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        for cls, method, original in reversed(self._patched):
+            setattr(cls, method, original)
+        self._patched.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            label: {
+                "calls": len(values),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "max_ms": round(max(values), 2),
+                "total_ms": round(sum(values), 1),
+            }
+            for label, values in self.samples.items() if values
+        }
+
+
+class JsonIOTimer:
+    """
+    Counts and times JSON encode/decode while active: ``json.dump``/``json.load``
+    and the codec entry points (``dump_file``, ``load_file``, ``dumps``,
+    ``loads``) wherever a module imported them. Nested calls (``load_file``
+    -> ``loads``) count once.
+    """
+
+    CODEC_FUNCTIONS = ("dump_file", "load_file", "dumps", "loads")
+
+    def __init__(self):
+        self.calls = 0
+        self.ms = 0.0
+        self._depth = 0
+        self._patched: List[tuple] = []
+
+    def _timed(self, fn: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            if self._depth:
+                return fn(*args, **kwargs)
+            self._depth += 1
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                self.calls += 1
+                self.ms += (time.perf_counter() - started) * 1000
+        return timed
+
+    def __enter__(self) -> "JsonIOTimer":
+        targets = [(json, "dump", json.dump), (json, "load", json.load)]
+        originals = {id(getattr(codec, name)): name for name in self.CODEC_FUNCTIONS}
+        for module in list(sys.modules.values()):
+            if module is None or not getattr(module, "__name__", "").startswith("putsengine"):
+                continue
+            for attr, value in list(vars(module).items()):
+                if callable(value) and originals.get(id(value)) == attr:
+                    targets.append((module, attr, value))
+        wrappers: Dict[int, Callable] = {}
+        for module, attr, original in targets:
+            wrapper = wrappers.setdefault(id(original), self._timed(original))
+            setattr(module, attr, wrapper)
+            self._patched.append((module, attr, original))
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        for module, attr, original in reversed(self._patched):
+            setattr(module, attr, original)
+        self._patched.clear()
+
+    def summary(self) -> Dict[str, float]:
+        return {"calls": self.calls, "ms": round(self.ms, 1)}
+
+
+# ----------------------------------------------------------------------
+# Synthetic provider
+# ----------------------------------------------------------------------
+
+class SyntheticReplayer(Replayer):
+    """
+    Replayer that fabricates plausible responses for unrecorded requests.
+
+    Daily/minute bars (Polygon aggregates, Alpaca stock bars) are a seeded
+    random walk per symbol; every other endpoint answers 200 with an empty
+    payload, so each code path still makes - and is charged for - its calls.
+    """
+
+    MAX_MINUTE_BARS = 2 * 390
+
+    def __init__(
+        self, source: Union[str, Path, List[Exchange]] = (), seed: int = 0, **options: Any
+    ):
+        source = list(source) if not isinstance(source, (str, Path)) else source
+        super().__init__(source, seed=seed, **options)
+        self.seed = seed
+
+    def _walk(self, symbol: str, stamps: List[datetime]) -> List[Dict[str, float]]:
+        digest = hashlib.sha256(f"{self.seed}:{symbol}".encode()).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        price = 20 + rng.random() * 300
+        bars = []
+        for ts in stamps:
+            open_ = price
+            price = max(1.0, price * (1 + rng.gauss(0, 0.015)))
+            high = max(open_, price) * (1 + rng.random() * 0.01)
+            low = min(open_, price) * (1 - rng.random() * 0.01)
+            volume = int(rng.uniform(2e5, 5e6))
+            bars.append({
+                "ts": ts, "o": round(open_, 2), "h": round(high, 2), "l": round(low, 2),
+                "c": round(price, 2), "v": volume, "vw": round((high + low + price) / 3, 2),
+            })
+        return bars
+
+    @staticmethod
+    def _day_stamps(start: date, end: date) -> List[datetime]:
+        days = []
+        day = start
+        while day <= end:
+            if day.weekday() < 5:
+                days.append(datetime(day.year, day.month, day.day, 21, tzinfo=timezone.utc))
+            day += timedelta(days=1)
+        return days
+
+    @classmethod
+    def _minute_stamps(cls, end: date) -> List[datetime]:
+        stamps = []
+        for day in cls._day_stamps(end - timedelta(days=4), end)[-2:]:
+            open_ = day.replace(hour=14, minute=30)
+            stamps.extend(open_ + timedelta(minutes=i) for i in range(390))
+        return stamps[-cls.MAX_MINUTE_BARS:]
+
+    @staticmethod
+    def _date(value: str, default: date) -> date:
+        try:
+            if value.isdigit():
+                return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc).date()
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return default
+
+    def synthesize(self, method: str, url: str, params: Any) -> Exchange:
+        params = dict(params or {})
+        parts = [p for p in urlsplit(url).path.split("/") if p]
+        today = date.today()
+        body: Any = {"data": [], "results": []}
+
+        if "range" in parts and "ticker" in parts:
+            # Polygon /v2/aggs/ticker/{sym}/range/{n}/{span}/{from}/{to}
+            i = parts.index("range")
+            symbol, span = parts[parts.index("ticker") + 1], parts[i + 2]
+            end = self._date(parts[i + 4], today)
+            start = self._date(parts[i + 3], today - timedelta(days=30))
+            stamps = self._minute_stamps(end) if span == "minute" else self._day_stamps(start, end)
+            bars = self._walk(symbol, stamps)
+            body = {"status": "OK", "resultsCount": len(bars), "results": [
+                {**{k: v for k, v in b.items() if k != "ts"}, "t": int(b["ts"].timestamp() * 1000)}
+                for b in bars
+            ]}
+        elif parts[-1:] == ["bars"] and "stocks" in parts and "alpaca" in url:
+            # Alpaca /v2/stocks/{sym}/bars
+            symbol = parts[-2]
+            end = self._date(str(params.get("end", "")), today)
+            start = self._date(str(params.get("start", "")), end - timedelta(days=30))
+            minute = "Min" in str(params.get("timeframe", ""))
+            stamps = self._minute_stamps(end) if minute else self._day_stamps(start, end)
+            bars = self._walk(symbol, stamps)
+            body = {"symbol": symbol, "next_page_token": None, "bars": [
+                {
+                    **{k: v for k, v in b.items() if k != "ts"},
+                    "t": b["ts"].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+                for b in bars
+            ]}
+
+        return {
+            "m": method, "u": url, "p": params, "s": 200,
+            "h": {"Content-Type": "application/json"}, "t": json.dumps(body), "ms": 0.0,
+        }
+
+    def _lookup(self, method: str, url: str, params: Any, body: Any) -> Optional[Exchange]:
+        exchange = super()._lookup(method, url, params, body)
+        if exchange is None:
+            self.stats["synthetic"] += 1
+            exchange = self.synthesize(method, url, params)
+        return exchange
+
+
+# ----------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------
+
+class _Universe:
+    """Restricts ``EngineConfig.get_all_tickers`` to the benchmark symbols."""
+
+    def __init__(self, symbols: List[str]):
+        self.symbols = symbols
+
+    def __enter__(self):
+        from putsengine.config import EngineConfig
+        self._original = EngineConfig.__dict__["get_all_tickers"]
+        symbols = list(self.symbols)
+        EngineConfig.get_all_tickers = classmethod(lambda cls: list(symbols))
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        from putsengine.config import EngineConfig
+        EngineConfig.get_all_tickers = self._original
+
+
+def _write_ews_alerts(
+    results: Dict[str, Any], path: Path, seed_symbols: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """Save EWS results the way the scheduler does; ``seed_symbols`` get a WATCH-level stand-in."""
+    alerts = {
+        symbol: {
+            "ipi": pressure.ipi,
+            "level": pressure.level.value,
+            "unique_footprints": pressure.unique_footprints,
+            "days_building": pressure.days_building,
+            "recommendation": pressure.recommendation,
+            "footprints": [
+                {"type": f.footprint_type.value, "strength": f.strength, "details": f.details}
+                for f in pressure.footprints[:10]
+            ],
+        }
+        for symbol, pressure in results.items()
+    }
+    for symbol in seed_symbols:
+        alerts.setdefault(symbol, {"ipi": 0.6, "level": "watch", "unique_footprints": 2,
+                                   "days_building": 1, "recommendation": "", "footprints": []})
+    alert_data = {"timestamp": datetime.now().isoformat(), "alerts": alerts}
+    dump_file(alert_data, path)
+    return alert_data
+
+
+class PipelineBenchmark:
+    """Runs the pipeline scenarios against a replay transport and measures them."""
+
+    def __init__(
+        self,
+        replayer: Replayer,
+        symbols: List[str],
+        workdir: Union[str, Path],
+        synthetic: bool = False,
+    ):
+        self.replayer = replayer
+        self.symbols = symbols
+        self.workdir = Path(workdir)
+        self.synthetic = synthetic
+        self._scheduler = None
+
+    async def _clients(self):
+        if self._scheduler is None:
+            from putsengine.scheduler import PutsEngineScheduler
+            self._scheduler = PutsEngineScheduler()
+            self._scheduler._load_dui_tickers = lambda: []
+        await self._scheduler._init_clients()
+        return self._scheduler
+
+    async def run_scan(self) -> None:
+        scheduler = await self._clients()
+        await scheduler.run_scan("benchmark")
+
+    async def run_early_warning_scan(self) -> None:
+        from putsengine.early_warning_system import run_early_warning_scan
+        from putsengine.state_store import get_state_store
+
+        scheduler = await self._clients()
+        results = await run_early_warning_scan(
+            scheduler._alpaca, scheduler._polygon, scheduler._uw, self.symbols
+        )
+        # Random-walk data rarely builds real pressure; seed the synthetic
+        # universe so the weather and convergence scenarios have candidates.
+        seeded = self.symbols if self.synthetic else ()
+        alert_data = _write_ews_alerts(results, Path("early_warning_alerts.json"), seeded)
+        get_state_store().record_ews(alert_data)
+
+    async def analyze_universe(self) -> None:
+        from putsengine.predictive_engine import MarketWeatherEngine, ReportMode
+
+        scheduler = await self._clients()
+        engine = MarketWeatherEngine(scheduler._polygon, scheduler._uw, scheduler.settings)
+        # run() wraps analyze_universe and writes the report convergence reads
+        await engine.run(ReportMode.AM)
+
+    async def convergence(self) -> None:
+        from putsengine.convergence_engine import ConvergenceEngine
+        ConvergenceEngine().run(force=True)
+
+    async def measure(self, name: str) -> Dict[str, Any]:
+        """Run one scenario and return its metrics."""
+        calls_before = Counter(self.replayer.calls_by_host)
+        stats_before = Counter(self.replayer.stats)
+        rss_before = peak_rss_mb()
+
+        with LatencyProbe() as probe, JsonIOTimer() as json_io, _Universe(self.symbols):
+            started = time.perf_counter()
+            error = None
+            try:
+                await getattr(self, name)()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                logger.warning(f"Benchmark scenario {name} failed: {error}")
+            wall = time.perf_counter() - started
+
+        by_provider: Counter = Counter()
+        for host, count in (Counter(self.replayer.calls_by_host) - calls_before).items():
+            by_provider[provider_for_host(host)] += count
+        stats = Counter(self.replayer.stats) - stats_before
+        n = max(1, len(self.symbols))
+        rss_after = peak_rss_mb()
+
+        return {
+            "wall_seconds": round(wall, 3),
+            "symbols": len(self.symbols),
+            "error": error,
+            "http_calls": sum(by_provider.values()),
+            "http": dict(by_provider),
+            "calls_per_symbol": {p: round(c / n, 2) for p, c in by_provider.items()},
+            "replay": {
+                k: stats.get(k, 0)
+                for k in ("exact", "route", "synthetic", "misses", "throttled")
+            },
+            "layers": probe.summary(),
+            "json_io": json_io.summary(),
+            "peak_rss_mb": rss_after,
+            "rss_growth_mb": round(rss_after - rss_before, 1) if rss_after is not None else None,
+        }
+
+    async def run(self, scenarios: Iterable[str] = SCENARIOS) -> Dict[str, Dict[str, Any]]:
+        results = {}
+        try:
+            for name in scenarios:
+                logger.info(f"Benchmark: {name} ({len(self.symbols)} symbols)")
+                results[name] = await self.measure(name)
+        finally:
+            if self._scheduler is not None:
+                await self._scheduler._close_clients()
+        return results
+
+
+# ----------------------------------------------------------------------
+# Entry point
+# ----------------------------------------------------------------------
+
+# Writers that use package-relative paths: (module, attribute)
+REDIRECTED_PATHS = (
+    ("putsengine.scan_history", "SCAN_HISTORY_FILE"),
+    ("putsengine.flash_alerts", "FLASH_ALERTS_FILE"),
+)
+
+
+def _redirect_paths(workdir: Path) -> Callable[[], None]:
+    """Point package-relative output files into ``workdir``; returns a restore callback."""
+    previous = []
+    for module_name, attr in REDIRECTED_PATHS:
+        module = importlib.import_module(module_name)
+        original = getattr(module, attr)
+        previous.append((module, attr, original))
+        setattr(module, attr, workdir / Path(original).name)
+
+    def restore():
+        for module, attr, original in previous:
+            setattr(module, attr, original)
+    return restore
+
+
+def _unpace_gateway() -> Callable[[], None]:
+    """Lift gateway rate limits (replay has no quota); returns a restore callback."""
+    from putsengine.clients.gateway import ProviderConfig, get_provider_gateway
+
+    gateway = get_provider_gateway()
+    previous = {name: state.config for name, state in gateway._states.items()}
+    for name in previous:
+        gateway.configure(name, ProviderConfig(rate_per_second=1e6, burst=10 ** 6))
+
+    def restore():
+        for name, config in previous.items():
+            gateway.configure(name, config)
+    return restore
+
+
+def run_benchmark(
+    archive: Optional[Union[str, Path]] = None,
+    symbols: int = 25,
+    scenarios: Iterable[str] = SCENARIOS,
+    workdir: Optional[Union[str, Path]] = None,
+    paced: bool = False,
+    latency_ms: Optional[float] = None,
+    throttle_rate: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark and return the results document.
+
+    Args:
+        archive: Recorded transport archive; None for synthetic data only
+        symbols: Universe size (first N tickers, sorted); 0 for all
+        scenarios: Subset of SCENARIOS, run in the given order
+        workdir: Scratch directory (a temporary one by default)
+        paced: Keep production gateway rate limits (default: unpaced)
+        latency_ms / throttle_rate / seed: Replay options (see ``Replayer``)
+    """
+    from putsengine import flash_alerts, footprint_store, state_store
+    from putsengine.config import EngineConfig
+
+    universe = sorted(EngineConfig.get_all_tickers())
+    universe = universe[:symbols] if symbols else universe
+    synthetic = archive is None
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="putsengine_bench_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    for key in ("ALPACA_API_KEY", "ALPACA_SECRET_KEY", "POLYGON_API_KEY", "UNUSUAL_WHALES_API_KEY"):
+        os.environ.setdefault(key, "benchmark")
+    os.environ.pop("HTTP_CACHE_PATH", None)
+    # Fresh stores in the workdir (no legacy import: results must not
+    # depend on whatever history the checkout holds)
+    previous_stores = (state_store._store, footprint_store._footprint_store, flash_alerts._tracker)
+    state_store._store = state_store.StateStore(workdir / "state.db")
+    footprint_store._footprint_store = footprint_store.FootprintStore(workdir / "footprints")
+    flash_alerts._tracker = None
+
+    options = {"latency_ms": latency_ms, "throttle_rate": throttle_rate}
+    if synthetic:
+        replayer = SyntheticReplayer(seed=seed, **options)
+    else:
+        replayer = Replayer(archive, seed=seed, **options)
+
+    cwd = os.getcwd()
+    previous_transport = transport.get_transport()
+    restore_gateway = (lambda: None) if paced else _unpace_gateway()
+    restore_paths = _redirect_paths(workdir)
+    started = datetime.now()
+    try:
+        os.chdir(workdir)
+        transport.set_transport(replayer)
+        benchmark = PipelineBenchmark(replayer, universe, workdir, synthetic)
+        results = asyncio.run(benchmark.run(scenarios))
+    finally:
+        transport.set_transport(previous_transport)
+        restore_gateway()
+        restore_paths()
+        state_store._store.close()
+        (
+            state_store._store, footprint_store._footprint_store, flash_alerts._tracker
+        ) = previous_stores
+        os.chdir(cwd)
+
+    return {
+        "meta": {
+            "started_at": started.isoformat(),
+            "source": str(archive) if archive else "synthetic",
+            "symbols": len(universe),
+            "paced": paced,
+            "latency_ms": latency_ms,
+            "throttle_rate": throttle_rate,
+            "seed": seed,
+            "workdir": str(workdir),
+        },
+        "scenarios": results,
+    }
+
+
+def check_thresholds(
+    results: Dict[str, Any], thresholds: Dict[str, float] = DEFAULT_THRESHOLDS
+) -> List[str]:
+    """Violations of ``{"scenario.metric.path": limit}`` (missing metrics are skipped)."""
+    violations = []
+    for key, limit in thresholds.items():
+        value = _lookup(results.get("scenarios", {}), key)
+        if isinstance(value, (int, float)) and value > limit:
+            violations.append(f"{key} = {value} > {limit}")
+    for name, scenario in results.get("scenarios", {}).items():
+        if scenario.get("error"):
+            violations.append(f"{name} failed: {scenario['error']}")
+    return violations
+
+
+def compare_to_baseline(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25
+) -> List[str]:
+    """Metrics that grew more than ``tolerance`` (fraction) over the baseline run."""
+    regressions = []
+    for name, scenario in results.get("scenarios", {}).items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        metrics = list(BASELINE_METRICS) + [f"http.{p}" for p in scenario.get("http", {})]
+        for metric in metrics:
+            new, old = _lookup(scenario, metric), _lookup(before, metric)
+            if isinstance(new, (int, float)) and isinstance(old, (int, float)) and old > 0:
+                if new > old * (1 + tolerance):
+                    growth = (new / old - 1) * 100
+                    regressions.append(f"{name}.{metric}: {old} -> {new} (+{growth:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PutsEngine pipeline benchmark")
+    parser.add_argument("--archive", help="Recorded transport archive (default: synthetic data)")
+    parser.add_argument("--symbols", type=int, default=25, help="Universe size, 0 for all")
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS, help="Repeatable; default all"
+    )
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--thresholds", help="JSON file of {scenario.metric: limit}")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--paced", action="store_true", help="Keep production rate limits")
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir")
+    args = parser.parse_args(argv)
+
+    out = Path(args.out).resolve()
+    results = run_benchmark(
+        archive=args.archive, symbols=args.symbols, scenarios=args.scenario or SCENARIOS,
+        workdir=args.workdir, paced=args.paced, latency_ms=args.latency_ms,
+        throttle_rate=args.throttle_rate, seed=args.seed,
+    )
+
+    thresholds = (
+        json.loads(Path(args.thresholds).read_text()) if args.thresholds else DEFAULT_THRESHOLDS
+    )
+    results["violations"] = check_thresholds(results, thresholds)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        results["regressions"] = compare_to_baseline(results, baseline, args.tolerance)
+
+    out.write_text(json.dumps(results, indent=2, default=str))
+    for name, scenario in results["scenarios"].items():
+        print(f"{name:24s} {scenario['wall_seconds']:8.2f}s  calls={scenario['http']}")
+    for line in results["violations"] + results.get("regressions", []):
+        print(f"FAIL {line}")
+    print(f"Results: {out}")
+    return 1 if results["violations"] or results.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -27,6 +27,8 @@ from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 import pytz
 from loguru import logger
+from putsengine.compute_pool import score_as_fetched
+from putsengine.metrics import instrumented
 from dataclasses import dataclass, field
 import json
 
@@ -155,6 +157,10 @@ class BigMoversScanner:
                 logger.debug(f"Failed to get bars for {symbol}: {e}")
                 return None
         
+        return self.score_bars(symbol, bars)
+    
+    def score_bars(self, symbol: str, bars: List) -> Optional[BigMoverPattern]:
+        """Pattern checks on fetched daily bars (pure CPU; runs on the compute pool)."""
         if not bars or len(bars) < 5:
             return None
         
@@ -437,9 +443,13 @@ class BigMoversScanner:
             "scan_time": now.isoformat()
         }
         
-        for symbol in symbols:
-            pattern = await self.analyze_symbol(symbol)
-            
+        # Fetch and score overlap: batches are scored on worker processes
+        scored = await score_as_fetched(
+            score_big_mover, symbols,
+            fetch=lambda symbol: self.price_client.get_daily_bars(symbol, limit=15),
+        )
+        
+        for symbol, pattern in scored.items():
             if pattern:
                 results["all_patterns"].append(pattern)
                 results[pattern.pattern_type].append(pattern)
@@ -546,6 +556,12 @@ def analyze_historical_movers(movers_data: Dict) -> Dict:
     return patterns
 
 
+def score_big_mover(symbol: str, bars: List) -> Optional[BigMoverPattern]:
+    """Compute-pool scorer (module level so worker processes can import it)."""
+    return BigMoversScanner().score_bars(symbol, bars)
+
+
+@instrumented("scanner", "big_movers")
 async def run_big_movers_scan(price_client, symbols: List[str]) -> Dict:
     """
     Run big movers scan on symbols.
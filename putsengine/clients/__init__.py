@@ -6,5 +6,15 @@ Provides unified interfaces to Alpaca, Polygon, and Unusual Whales APIs.
 from putsengine.clients.alpaca_client import AlpacaClient
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.clients.gateway import ProviderGateway, get_provider_gateway
+from putsengine.clients.transport import recording, replaying
 
-__all__ = ["AlpacaClient", "PolygonClient", "UnusualWhalesClient"]
+__all__ = [
+    "AlpacaClient",
+    "PolygonClient",
+    "UnusualWhalesClient",
+    "ProviderGateway",
+    "get_provider_gateway",
+    "recording",
+    "replaying",
+]
@@ -9,8 +9,12 @@ from typing import Optional, List, Dict, Any
 import aiohttp
 from loguru import logger
 
+from putsengine.bars import BarArray
 from putsengine.config import Settings
 from putsengine.models import PriceBar, OptionsContract, TradeExecution
+from putsengine.clients.gateway import get_provider_gateway, retry_after_seconds
+from putsengine.clients.transport import create_session
+from putsengine.codec import read_json
 
 
 class AlpacaClient:
@@ -25,6 +29,8 @@ class AlpacaClient:
         self.options_url = settings.alpaca_options_url
         self._session: Optional[aiohttp.ClientSession] = None
         self._session_loop_id: Optional[int] = None  # Track which event loop owns the session
+        # Shared token bucket (200 req/min data API limit)
+        self._gateway = get_provider_gateway(settings)
 
     @property
     def _headers(self) -> Dict[str, str]:
@@ -64,7 +70,7 @@ class AlpacaClient:
                     pass  # Session's loop may already be closed
                 self._session = None
             
-            self._session = aiohttp.ClientSession(headers=self._headers)
+            self._session = create_session(headers=self._headers)
             self._session_loop_id = current_loop_id
         
         return self._session
@@ -87,22 +93,34 @@ class AlpacaClient:
         json_data: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Make HTTP request to Alpaca API."""
-        session = await self._get_session()
-        try:
-            async with session.request(method, url, params=params, json=json_data) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 429:
-                    logger.warning("Alpaca rate limit hit, waiting 1 second...")
-                    await asyncio.sleep(1)
-                    return await self._request(method, url, params, json_data)
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Alpaca API error {response.status}: {error_text}")
-                    return {}
-        except Exception as e:
-            logger.error(f"Alpaca request failed: {e}")
-            return {}
+        max_retries = 3
+        for attempt in range(max_retries):
+            await self._gateway.acquire("alpaca")
+            session = await self._get_session()
+            try:
+                async with session.request(method, url, params=params, json=json_data) as response:
+                    if response.status == 200:
+                        self._gateway.report_success("alpaca")
+                        return await read_json(response)
+                    elif response.status == 429:
+                        penalty = self._gateway.report_throttled(
+                            "alpaca", retry_after_seconds(response.headers)
+                        )
+                        logger.warning(
+                            f"Alpaca rate limit hit (attempt {attempt + 1}/{max_retries}), "
+                            f"gateway backoff {penalty:.1f}s..."
+                        )
+                        continue
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Alpaca API error {response.status}: {error_text}")
+                        return {}
+            except Exception as e:
+                logger.error(f"Alpaca request failed: {e}")
+                return {}
+
+        logger.error(f"Alpaca request failed after {max_retries} rate-limited attempts")
+        return {}
 
     # ==================== Account & Trading ====================
 
@@ -149,9 +167,37 @@ class AlpacaClient:
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order by ID."""
         url = f"{self.base_url}/orders/{order_id}"
-        session = await self._get_session()
-        async with session.delete(url) as response:
-            return response.status in [200, 204]
+        max_retries = 3
+        for attempt in range(max_retries):
+            await self._gateway.acquire("alpaca")
+            session = await self._get_session()
+            try:
+                async with session.delete(url) as response:
+                    if response.status in [200, 204]:
+                        self._gateway.report_success("alpaca")
+                        return True
+                    elif response.status == 429:
+                        penalty = self._gateway.report_throttled(
+                            "alpaca", retry_after_seconds(response.headers)
+                        )
+                        logger.warning(
+                            f"Alpaca rate limit hit cancelling {order_id} "
+                            f"(attempt {attempt + 1}/{max_retries}), "
+                            f"gateway backoff {penalty:.1f}s..."
+                        )
+                        continue
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Alpaca cancel error {response.status}: {error_text}")
+                        return False
+            except Exception as e:
+                logger.error(f"Alpaca cancel request failed: {e}")
+                return False
+
+        logger.error(
+            f"Alpaca cancel of {order_id} failed after {max_retries} rate-limited attempts"
+        )
+        return False
 
     # ==================== Market Data ====================
 
@@ -162,7 +208,7 @@ class AlpacaClient:
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
         limit: int = 1000
-    ) -> List[PriceBar]:
+    ) -> BarArray:
         """Get historical price bars."""
         if start is None:
             start = datetime.now() - timedelta(days=5)
@@ -179,27 +225,14 @@ class AlpacaClient:
         }
 
         result = await self._request("GET", url, params=params)
-        bars = []
-
-        if "bars" in result:
-            for bar in result["bars"]:
-                bars.append(PriceBar(
-                    timestamp=datetime.fromisoformat(bar["t"].replace("Z", "+00:00")),
-                    open=float(bar["o"]),
-                    high=float(bar["h"]),
-                    low=float(bar["l"]),
-                    close=float(bar["c"]),
-                    volume=int(bar["v"]),
-                    vwap=float(bar.get("vw", 0))
-                ))
-        return bars
+        return BarArray.from_alpaca(result.get("bars") or [])
 
     async def get_daily_bars(
         self,
         symbol: str,
         limit: int = 30,
         from_date: Optional[date] = None
-    ) -> List[PriceBar]:
+    ) -> BarArray:
         """
         Get daily price bars for a symbol.
         
@@ -318,7 +351,7 @@ class AlpacaClient:
         timeframe: str = "1Day",
         start: Optional[datetime] = None,
         limit: int = 100
-    ) -> Dict[str, List[PriceBar]]:
+    ) -> Dict[str, BarArray]:
         """Get bars for multiple symbols."""
         if start is None:
             start = datetime.now() - timedelta(days=30)
@@ -336,18 +369,7 @@ class AlpacaClient:
 
         if "bars" in result:
             for symbol, bar_list in result["bars"].items():
-                bars_dict[symbol] = [
-                    PriceBar(
-                        timestamp=datetime.fromisoformat(bar["t"].replace("Z", "+00:00")),
-                        open=float(bar["o"]),
-                        high=float(bar["h"]),
-                        low=float(bar["l"]),
-                        close=float(bar["c"]),
-                        volume=int(bar["v"]),
-                        vwap=float(bar.get("vw", 0))
-                    )
-                    for bar in bar_list
-                ]
+                bars_dict[symbol] = BarArray.from_alpaca(bar_list or [])
         return bars_dict
 
     # ==================== Options Data ====================
@@ -17,6 +17,7 @@ from loguru import logger
 
 from putsengine.config import Settings
 from putsengine.models import ShortInterestData
+from putsengine.clients.transport import create_session
 
 
 class FINRAClient:
@@ -61,7 +62,7 @@ class FINRAClient:
                     pass
                 self._session = None
             
-            self._session = aiohttp.ClientSession()
+            self._session = create_session()
             self._session_loop_id = current_loop_id
         
         return self._session
@@ -37,6 +37,9 @@ except ImportError:
     logger.warning("BeautifulSoup not installed — FinViz parsing will be limited")
 
 from putsengine.config import Settings
+from putsengine.clients.gateway import get_provider_gateway, retry_after_seconds
+from putsengine.clients.transport import create_session
+from putsengine.codec import read_json
 
 
 @dataclass
@@ -111,8 +114,8 @@ class FinVizClient:
         self.api_key = settings.finviz_api_key
         self._session: Optional[aiohttp.ClientSession] = None
         self._session_loop_id: Optional[int] = None  # Track which event loop owns the session
-        self._last_request_time = 0.0
-        self._request_interval = 0.5  # 2 requests per second max
+        # Shared token bucket (2 requests per second max)
+        self._gateway = get_provider_gateway(settings)
         
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session, auto-healing on event loop change."""
@@ -136,7 +139,7 @@ class FinVizClient:
                     pass
                 self._session = None
             
-            self._session = aiohttp.ClientSession()
+            self._session = create_session()
             self._session_loop_id = current_loop_id
         
         return self._session
@@ -152,13 +155,8 @@ class FinVizClient:
         self._session_loop_id = None
             
     async def _rate_limit_wait(self):
-        """Wait to respect rate limits."""
-        import time
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._request_interval:
-            await asyncio.sleep(self._request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Wait for a token from the shared provider gateway."""
+        await self._gateway.acquire("finviz")
         
     async def _request(
         self,
@@ -170,34 +168,44 @@ class FinVizClient:
             logger.warning("FinViz API key not configured")
             return {}
             
-        await self._rate_limit_wait()
-        
         if params is None:
             params = {}
         params["auth"] = self.api_key
         
-        session = await self._get_session()
-        try:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    content_type = response.headers.get('content-type', '')
-                    if 'json' in content_type:
-                        return await response.json()
+        max_retries = 3
+        for attempt in range(max_retries):
+            await self._rate_limit_wait()
+            session = await self._get_session()
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status == 200:
+                        self._gateway.report_success("finviz")
+                        content_type = response.headers.get('content-type', '')
+                        if 'json' in content_type:
+                            return await read_json(response)
+                        else:
+                            # FinViz often returns CSV
+                            text = await response.text()
+                            return {"raw": text}
+                    elif response.status == 429:
+                        penalty = self._gateway.report_throttled(
+                            "finviz", retry_after_seconds(response.headers)
+                        )
+                        logger.warning(
+                            f"FinViz rate limit hit (attempt {attempt + 1}/{max_retries}), "
+                            f"gateway backoff {penalty:.1f}s..."
+                        )
+                        continue
                     else:
-                        # FinViz often returns CSV
-                        text = await response.text()
-                        return {"raw": text}
-                elif response.status == 429:
-                    logger.warning("FinViz rate limit hit, waiting 5 seconds...")
-                    await asyncio.sleep(5)
-                    return await self._request(url, params)
-                else:
-                    error_text = await response.text()
-                    logger.error(f"FinViz API error {response.status}: {error_text[:200]}")
-                    return {}
-        except Exception as e:
-            logger.error(f"FinViz request failed: {e}")
-            return {}
+                        error_text = await response.text()
+                        logger.error(f"FinViz API error {response.status}: {error_text[:200]}")
+                        return {}
+            except Exception as e:
+                logger.error(f"FinViz request failed: {e}")
+                return {}
+        
+        logger.error(f"FinViz request failed after {max_retries} rate-limited attempts")
+        return {}
             
     async def _request_csv(self, params: Dict) -> str:
         """
@@ -215,7 +223,11 @@ class FinVizClient:
         try:
             async with session.get(self.BASE_URL, params=params) as response:
                 if response.status == 200:
+                    self._gateway.report_success("finviz")
                     return await response.text()
+                elif response.status == 429:
+                    self._gateway.report_throttled("finviz", retry_after_seconds(response.headers))
+                    return ""
                 else:
                     logger.debug(f"FinViz CSV export returned {response.status}")
                     return ""
@@ -0,0 +1,393 @@
+"""
+Provider Gateway - one shared rate budget for every API client.
+
+WHY:
+Each client used to enforce its own spacing (`_rate_limit_wait` in the
+Polygon, UW and FinViz clients, a recursive retry in Alpaca). Polygon's
+version had no lock, so concurrent callers all passed the check at once
+and then hit 429s. The EWS scan, weather engine and scheduler each slowed
+themselves down without knowing what the others were spending.
+
+HOW:
+- One token bucket per provider (steady rate + burst capacity).
+- Waiters queue in priority order: P1 (DUI / active signals) before P3.
+  Ties are served FIFO.
+- 429-aware adaptive backoff (AIMD):
+    * on 429 -> rate is halved, bucket drained, provider paused for an
+      exponentially growing penalty (or the server's Retry-After)
+    * on success -> rate recovers additively toward the configured ceiling
+- Live counters (queue depth, waits, throttles) via ``get_status()``.
+- Safe across event loops (the scheduler loop, ``asyncio.run`` in worker
+  threads): each loop keeps its own waiter queue and wake timer, and all
+  loops draw from the provider's one bucket under a ``threading.Lock``.
+
+Usage:
+    gateway = get_provider_gateway()
+    await gateway.acquire("uw", priority=1)
+    ... make HTTP call ...
+    gateway.report_success("uw")        # or gateway.report_throttled("uw")
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+# Priority levels (match TickerPriority values in api_budget.py)
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+DEFAULT_PRIORITY = PRIORITY_NORMAL
+
+
+@dataclass
+class ProviderConfig:
+    """Steady-state rate and burst capacity for one provider."""
+    rate_per_second: float
+    burst: int = 1
+    min_rate_per_second: float = 0.1   # Floor for adaptive backoff
+    max_penalty_seconds: float = 60.0  # Cap on exponential 429 pause
+
+
+class TokenBucket:
+    """Classic token bucket (not coroutine-aware; the gateway does the waiting)."""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_take(self, cost: float = 1.0) -> bool:
+        now = time.monotonic()
+        self._refill(now)
+        if self._tokens >= cost:
+            self._tokens -= cost
+            return True
+        return False
+
+    def time_until(self, cost: float = 1.0) -> float:
+        """Seconds until ``cost`` tokens are available."""
+        self._refill(time.monotonic())
+        missing = cost - self._tokens
+        if missing <= 0:
+            return 0.0
+        return missing / max(self.rate, 1e-6)
+
+    def drain(self):
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+
+    def refund(self, cost: float = 1.0):
+        """Return tokens taken for a request that was never sent."""
+        self._refill(time.monotonic())
+        self._tokens = min(self.capacity, self._tokens + cost)
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+
+@dataclass
+class _LoopQueue:
+    """Waiters of one event loop; only touched from that loop's thread."""
+    loop: asyncio.AbstractEventLoop
+    waiters: List[Tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    wake_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def depth(self) -> int:
+        return sum(1 for _, _, fut in self.waiters if not fut.done())
+
+
+@dataclass
+class _ProviderState:
+    name: str
+    config: ProviderConfig
+    bucket: TokenBucket
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueue]" = field(
+        default_factory=weakref.WeakKeyDictionary
+    )
+    paused_until: float = 0.0
+    consecutive_throttles: int = 0
+    # Counters
+    acquired: int = 0
+    waited: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    throttles: int = 0
+
+    def live_queues(self) -> List[_LoopQueue]:
+        with self.lock:
+            items = list(self.queues.items())
+        return [q for loop, q in items if not loop.is_closed()]
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(q.depth for q in self.live_queues())
+
+
+class ProviderGateway:
+    """
+    Async gateway that every client in ``putsengine/clients/`` routes
+    its HTTP calls through.
+
+    Unknown providers are passed through without limits.
+    """
+
+    def __init__(self, providers: Optional[Dict[str, ProviderConfig]] = None):
+        self._states: Dict[str, _ProviderState] = {}
+        self._seq = itertools.count()
+        for name, config in (providers or {}).items():
+            self.configure(name, config)
+
+    def configure(self, provider: str, config: ProviderConfig):
+        """Register or replace the limits for a provider."""
+        self._states[provider] = _ProviderState(
+            name=provider,
+            config=config,
+            bucket=TokenBucket(config.rate_per_second, config.burst),
+        )
+
+    # ------------------------------------------------------------------
+    # Acquire / dispatch
+    # ------------------------------------------------------------------
+
+    async def acquire(self, provider: str, priority: int = DEFAULT_PRIORITY):
+        """
+        Wait until ``provider`` has a token for this request.
+
+        Lower ``priority`` numbers are served first (1 = P1).
+        """
+        state = self._states.get(provider)
+        if state is None:
+            return
+        loop = asyncio.get_running_loop()
+        queue = self._queue(state, loop)
+
+        now = time.monotonic()
+        with state.lock:
+            if not queue.depth and now >= state.paused_until and state.bucket.try_take():
+                state.acquired += 1
+                return
+
+        started = now
+        future = loop.create_future()
+        heapq.heappush(queue.waiters, (priority, next(self._seq), future))
+        self._schedule(state, queue)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted by _dispatch, then cancelled before it resumed:
+                # the token was never spent, so hand it to the next waiter.
+                with state.lock:
+                    state.bucket.refund()
+                if queue.depth:
+                    self._schedule(state, queue)
+            # A still-pending future was cancelled with us; _dispatch skips it.
+            raise
+        waited = time.monotonic() - started
+        with state.lock:
+            state.acquired += 1
+            state.waited += 1
+            state.total_wait_seconds += waited
+            state.max_wait_seconds = max(state.max_wait_seconds, waited)
+
+    def _queue(self, state: _ProviderState, loop: asyncio.AbstractEventLoop) -> _LoopQueue:
+        """This loop's waiter queue (dropped with the loop once it is collected)."""
+        with state.lock:
+            queue = state.queues.get(loop)
+            if queue is None:
+                queue = state.queues[loop] = _LoopQueue(loop)
+            return queue
+
+    def _schedule(self, state: _ProviderState, queue: _LoopQueue):
+        if queue.wake_handle is not None:
+            return
+        with state.lock:
+            delay = max(state.paused_until - time.monotonic(), state.bucket.time_until())
+        if delay <= 0:
+            queue.wake_handle = queue.loop.call_soon(self._dispatch, state, queue)
+        else:
+            queue.wake_handle = queue.loop.call_later(delay, self._dispatch, state, queue)
+
+    def _reschedule(self, state: _ProviderState, queue: _LoopQueue):
+        """Re-time a queue's wake-up (runs on the queue's own loop)."""
+        if queue.wake_handle is not None:
+            queue.wake_handle.cancel()
+            queue.wake_handle = None
+        if queue.depth:
+            self._schedule(state, queue)
+
+    def _dispatch(self, state: _ProviderState, queue: _LoopQueue):
+        queue.wake_handle = None
+        while queue.waiters:
+            _, _, future = queue.waiters[0]
+            if future.done():
+                heapq.heappop(queue.waiters)
+                continue
+            with state.lock:
+                granted = time.monotonic() >= state.paused_until and state.bucket.try_take()
+            if not granted:
+                break
+            heapq.heappop(queue.waiters)
+            future.set_result(None)
+        if queue.depth:
+            self._schedule(state, queue)
+
+    # ------------------------------------------------------------------
+    # Adaptive backoff
+    # ------------------------------------------------------------------
+
+    def report_throttled(self, provider: str, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429 from ``provider``.
+
+        Halves the provider's rate, drains its bucket and pauses dispatch.
+
+        Returns:
+            Seconds the provider is paused for (callers may log it)
+        """
+        state = self._states.get(provider)
+        if state is None:
+            return retry_after or 1.0
+        cfg = state.config
+        with state.lock:
+            state.throttles += 1
+            state.consecutive_throttles += 1
+            state.bucket.rate = max(cfg.min_rate_per_second, state.bucket.rate / 2)
+            state.bucket.drain()
+            penalty = retry_after if retry_after else min(
+                cfg.max_penalty_seconds, 2.0 ** (state.consecutive_throttles - 1)
+            )
+            state.paused_until = max(state.paused_until, time.monotonic() + penalty)
+            count, rate = state.consecutive_throttles, state.bucket.rate
+        logger.warning(
+            f"Gateway: {provider} throttled (429 #{count}) — "
+            f"pausing {penalty:.1f}s, rate now {rate:.2f}/s"
+        )
+        # Timers belong to their own loops; re-time each one from its thread
+        for queue in state.live_queues():
+            if queue.depth:
+                try:
+                    queue.loop.call_soon_threadsafe(self._reschedule, state, queue)
+                except RuntimeError:  # Loop closed meanwhile
+                    pass
+        return penalty
+
+    def report_success(self, provider: str):
+        """Record a successful response; recovers rate toward the configured ceiling."""
+        state = self._states.get(provider)
+        if state is None:
+            return
+        target = state.config.rate_per_second
+        with state.lock:
+            state.consecutive_throttles = 0
+            if state.bucket.rate < target:
+                state.bucket.rate = min(target, state.bucket.rate + target * 0.05)
+
+    # ------------------------------------------------------------------
+    # Monitoring
+    # ------------------------------------------------------------------
+
+    def available_tokens(self, provider: str) -> Optional[float]:
+        """Tokens currently in the provider's bucket (None if unlimited)."""
+        state = self._states.get(provider)
+        if state is None:
+            return None
+        with state.lock:
+            return state.bucket.tokens
+
+    def get_status(self) -> Dict[str, Dict]:
+        """Live counters per provider."""
+        now = time.monotonic()
+        status = {}
+        for name, state in self._states.items():
+            with state.lock:
+                tokens = state.bucket.tokens
+            status[name] = {
+                "rate_per_second": round(state.bucket.rate, 3),
+                "configured_rate_per_second": state.config.rate_per_second,
+                "burst": state.config.burst,
+                "tokens": round(tokens, 2),
+                "queue_depth": state.queue_depth,
+                "acquired": state.acquired,
+                "waited": state.waited,
+                "avg_wait_seconds": round(state.total_wait_seconds / max(1, state.waited), 3),
+                "max_wait_seconds": round(state.max_wait_seconds, 3),
+                "throttles": state.throttles,
+                "paused_for_seconds": round(max(0.0, state.paused_until - now), 2),
+            }
+        return status
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """Parse a numeric Retry-After header (seconds), if present."""
+    try:
+        value = headers.get("Retry-After")
+        return float(value) if value else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _default_providers(settings=None) -> Dict[str, ProviderConfig]:
+    """Provider limits from Settings (falls back to documented plan limits)."""
+    polygon_rps = float(getattr(settings, "polygon_rate_limit", 100))
+    uw_per_minute = getattr(settings, "uw_rate_limit_per_minute", 110)
+    return {
+        # Paid plan: effectively unlimited, burst covers a full scan fan-out
+        "polygon": ProviderConfig(rate_per_second=polygon_rps, burst=int(polygon_rps)),
+        # UW hard limit 120/min; small burst so concurrent scans can't spike past it
+        "uw": ProviderConfig(
+            rate_per_second=uw_per_minute / 60.0, burst=5, min_rate_per_second=0.25
+        ),
+        # Alpaca data API: 200 req/min
+        "alpaca": ProviderConfig(rate_per_second=200 / 60.0, burst=10),
+        # FinViz Elite: ~2 req/s
+        "finviz": ProviderConfig(rate_per_second=2.0, burst=2),
+    }
+
+
+# Singleton instance
+_gateway: Optional[ProviderGateway] = None
+
+
+def get_provider_gateway(settings=None) -> ProviderGateway:
+    """
+    Get singleton provider gateway (shared by all clients in the process).
+
+    Args:
+        settings: Used to size the buckets the first time the gateway is built.
+            Later settings with different limits are logged and ignored; call
+            ``configure`` to change a provider's limits.
+    """
+    global _gateway
+    if _gateway is None:
+        _gateway = ProviderGateway(_default_providers(settings))
+    elif settings is not None:
+        ignored = [
+            name for name, config in _default_providers(settings).items()
+            if name in _gateway._states and _gateway._states[name].config != config
+        ]
+        if ignored:
+            logger.warning(
+                f"Gateway: already configured; ignoring new limits for {', '.join(ignored)} "
+                f"(use configure() to change them)"
+            )
+    return _gateway
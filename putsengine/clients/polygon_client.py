@@ -12,16 +12,35 @@ User has MASSIVE (Polygon) PAID subscription:
 
 PRIMARY DATA SOURCE for all scans (replacing Alpaca)
 ==================================================
+
+PAGINATION:
+List endpoints return one page plus a ``next_url`` cursor. The ``iter_*``
+async generators (trades, options chain, options snapshot, aggregates)
+follow ``next_url`` lazily, one request per page, as the caller reads.
+A caller that stops early (``break``, or ``limit=``) fetches no more
+pages. Filters (contract type, strike and expiration ranges, timestamp
+bounds) go to the server, so rows that would be thrown away are never
+downloaded. The list methods (``get_trades``, ``get_options_chain``,
+``get_options_snapshot``) are built on the iterators. They return every
+row up to ``limit`` instead of truncating at one page.
 """
 
 import asyncio
 from datetime import datetime, date, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
 import aiohttp
 from loguru import logger
 
+from putsengine.bars import BarArray
 from putsengine.config import Settings
 from putsengine.models import PriceBar, OptionsContract, DarkPoolPrint
+from putsengine.clients.gateway import get_provider_gateway, retry_after_seconds
+from putsengine.clients.transport import create_session
+from putsengine.codec import read_json
+from putsengine.loop_monitor import run_blocking
+from putsengine.metrics import record_cache
+from putsengine.utils.persistent_cache import get_persistent_cache
 
 
 class PolygonClient:
@@ -43,8 +62,16 @@ class PolygonClient:
         self.rate_limit = settings.polygon_rate_limit  # Default 100 for paid plans
         self._session: Optional[aiohttp.ClientSession] = None
         self._session_loop_id: Optional[int] = None  # Track which event loop owns the session
-        self._last_request_time = 0.0
-        self._request_interval = 1.0 / max(self.rate_limit, 10)  # Minimum 10 req/sec
+        # Shared token bucket (one budget across every PolygonClient in the process)
+        self._gateway = get_provider_gateway(settings)
+        # Optional on-disk response cache shared between processes (settings.http_cache_path)
+        self._persistent_cache = get_persistent_cache(settings)
+        # Optional incremental minute-bar store (see enable_minute_store)
+        self.minute_store = None
+
+    def enable_minute_store(self, store) -> None:
+        """Serve open-ended ``get_minute_bars`` windows from a MinuteBarStore."""
+        self.minute_store = store
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session, auto-healing on event loop change.
@@ -73,7 +100,7 @@ class PolygonClient:
                     pass
                 self._session = None
             
-            self._session = aiohttp.ClientSession()
+            self._session = create_session()
             self._session_loop_id = current_loop_id
         
         return self._session
@@ -89,13 +116,8 @@ class PolygonClient:
         self._session_loop_id = None
 
     async def _rate_limit_wait(self):
-        """Wait to respect rate limits."""
-        import time
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._request_interval:
-            await asyncio.sleep(self._request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Wait for a token from the shared provider gateway."""
+        await self._gateway.acquire("polygon")
 
     async def _request(
         self,
@@ -103,27 +125,46 @@ class PolygonClient:
         params: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Make HTTP request to Polygon API."""
-        await self._rate_limit_wait()
-
         url = f"{self.BASE_URL}{endpoint}"
         if params is None:
             params = {}
+
+        cache_key = None
+        cache_ttl = 0
+        if self._persistent_cache is not None:
+            cache_ttl = self._persistent_cache.ttl_for("polygon", endpoint)
+            if cache_ttl > 0:
+                cache_key = self._persistent_cache.make_key("polygon", endpoint, params)
+                cached = await run_blocking(self._persistent_cache.get, cache_key)
+                record_cache("polygon", "miss" if cached is None else "hit")
+                if cached is not None:
+                    return cached
+
         params["apiKey"] = self.api_key
 
         session = await self._get_session()
         max_retries = 3
         
         for attempt in range(max_retries):
+            await self._rate_limit_wait()
             try:
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        return await response.json()
+                        self._gateway.report_success("polygon")
+                        result = await read_json(response)
+                        if cache_key and result:
+                            await run_blocking(
+                                self._persistent_cache.set, cache_key, result, cache_ttl
+                            )
+                        return result
                     elif response.status == 429:
-                        # For paid plans (unlimited), this should be rare
-                        # Use exponential backoff: 2s, 4s, 8s
-                        wait_time = 2 ** (attempt + 1)
-                        logger.warning(f"Polygon rate limit (attempt {attempt+1}/{max_retries}), waiting {wait_time}s...")
-                        await asyncio.sleep(wait_time)
+                        # For paid plans (unlimited), this should be rare.
+                        # The gateway pauses ALL Polygon callers and backs off
+                        # exponentially; the retry waits for its next token.
+                        logger.warning(f"Polygon rate limit (attempt {attempt+1}/{max_retries})")
+                        self._gateway.report_throttled(
+                            "polygon", retry_after_seconds(response.headers)
+                        )
                         continue
                     elif response.status == 403:
                         logger.error("Polygon API key invalid or subscription issue")
@@ -143,6 +184,54 @@ class PolygonClient:
         logger.error(f"Polygon request failed after {max_retries} retries")
         return {}
 
+    # ==================== Pagination ====================
+
+    @staticmethod
+    def _next_page(next_url: str) -> Tuple[str, Dict[str, str]]:
+        """Split a ``next_url`` into (endpoint, params) for _request."""
+        parts = urlsplit(next_url)
+        params = dict(parse_qsl(parts.query))
+        params.pop("apiKey", None)
+        return parts.path, params
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each page's ``results``, requesting the next page only when asked."""
+        pages = 0
+        while True:
+            result = await self._request(endpoint, params)
+            results = result.get("results") or []
+            if results:
+                yield results
+            pages += 1
+            next_url = result.get("next_url")
+            if not next_url or (max_pages is not None and pages >= max_pages):
+                return
+            endpoint, params = self._next_page(next_url)
+
+    async def _iter_records(
+        self,
+        endpoint: str,
+        params: Dict,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield records across pages, stopping after ``limit``."""
+        if limit is not None:
+            if limit <= 0:
+                return
+            params["limit"] = min(params["limit"], limit)
+        count = 0
+        async for page in self._paginate(endpoint, params):
+            for record in page:
+                yield record
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
     # ==================== Aggregates / Bars ====================
 
     async def get_aggregates(
@@ -150,10 +239,10 @@ class PolygonClient:
         symbol: str,
         multiplier: int = 1,
         timespan: str = "minute",
-        from_date: Optional[date] = None,
-        to_date: Optional[date] = None,
+        from_date: Optional[Union[date, int]] = None,
+        to_date: Optional[Union[date, int]] = None,
         limit: int = 5000
-    ) -> List[PriceBar]:
+    ) -> BarArray:
         """
         Get aggregate bars for a symbol.
 
@@ -161,8 +250,8 @@ class PolygonClient:
             symbol: Stock ticker symbol
             multiplier: Timespan multiplier (e.g., 1 for 1-minute bars)
             timespan: minute, hour, day, week, month, quarter, year
-            from_date: Start date
-            to_date: End date
+            from_date: Start date, or an epoch-ms timestamp
+            to_date: End date, or an epoch-ms timestamp
             limit: Maximum number of results
         """
         if from_date is None:
@@ -170,7 +259,10 @@ class PolygonClient:
         if to_date is None:
             to_date = date.today()
 
-        endpoint = f"/v2/aggs/ticker/{symbol}/range/{multiplier}/{timespan}/{from_date.isoformat()}/{to_date.isoformat()}"
+        def _bound(value):
+            return str(value) if isinstance(value, int) else value.isoformat()
+
+        endpoint = f"/v2/aggs/ticker/{symbol}/range/{multiplier}/{timespan}/{_bound(from_date)}/{_bound(to_date)}"
         params = {
             "adjusted": "true",
             "sort": "asc",
@@ -178,20 +270,36 @@ class PolygonClient:
         }
 
         result = await self._request(endpoint, params)
-        bars = []
-
-        if "results" in result:
-            for bar in result["results"]:
-                bars.append(PriceBar(
-                    timestamp=datetime.fromtimestamp(bar["t"] / 1000),
-                    open=float(bar["o"]),
-                    high=float(bar["h"]),
-                    low=float(bar["l"]),
-                    close=float(bar["c"]),
-                    volume=int(bar["v"]),
-                    vwap=float(bar.get("vw", 0))
-                ))
-        return bars
+        return BarArray.from_polygon(result.get("results") or [])
+
+    async def iter_aggregates(
+        self,
+        symbol: str,
+        multiplier: int = 1,
+        timespan: str = "minute",
+        from_date: Optional[Union[date, int]] = None,
+        to_date: Optional[Union[date, int]] = None,
+        page_size: int = 50000,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[BarArray]:
+        """
+        Aggregate bars for the whole range, one BarArray chunk per page.
+
+        Unlike get_aggregates, which returns at most one page, this
+        follows ``next_url`` until the range is complete (or ``max_pages``).
+        """
+        if from_date is None:
+            from_date = date.today() - timedelta(days=7)
+        if to_date is None:
+            to_date = date.today()
+
+        def _bound(value):
+            return str(value) if isinstance(value, int) else value.isoformat()
+
+        endpoint = f"/v2/aggs/ticker/{symbol}/range/{multiplier}/{timespan}/{_bound(from_date)}/{_bound(to_date)}"
+        params = {"adjusted": "true", "sort": "asc", "limit": page_size}
+        async for page in self._paginate(endpoint, params, max_pages):
+            yield BarArray.from_polygon(page)
 
     async def get_daily_bars(
         self,
@@ -199,7 +307,7 @@ class PolygonClient:
         from_date: Optional[date] = None,
         to_date: Optional[date] = None,
         limit: int = None
-    ) -> List[PriceBar]:
+    ) -> BarArray:
         """Get daily bars for a symbol.
         
         FEB 10 FIX: Added limit parameter for compatibility with scanners
@@ -224,8 +332,19 @@ class PolygonClient:
         from_date: Optional[date] = None,
         to_date: Optional[date] = None,
         limit: int = 5000
-    ) -> List[PriceBar]:
-        """Get minute bars for a symbol."""
+    ) -> BarArray:
+        """
+        Get minute bars for a symbol.
+
+        Windows that run up to today are served by the minute store when
+        one is enabled (only bars newer than the stored ones are fetched).
+        """
+        if (
+            self.minute_store is not None
+            and from_date is not None
+            and (to_date is None or to_date >= date.today())
+        ):
+            return await self.minute_store.window(symbol, from_date, limit=limit)
         return await self.get_aggregates(
             symbol=symbol,
             multiplier=1,
@@ -345,10 +464,14 @@ class PolygonClient:
         endpoint = f"/v2/snapshot/locale/us/markets/stocks/tickers/{symbol}"
         return await self._request(endpoint)
 
-    async def get_all_tickers_snapshot(self) -> List[Dict[str, Any]]:
-        """Get snapshots for all tickers."""
+    async def get_all_tickers_snapshot(
+        self,
+        tickers: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get snapshots for all tickers (or just ``tickers``, in one call)."""
         endpoint = "/v2/snapshot/locale/us/markets/stocks/tickers"
-        result = await self._request(endpoint)
+        params = {"tickers": ",".join(sorted(tickers))} if tickers else None
+        result = await self._request(endpoint, params)
         return result.get("tickers", [])
 
     async def get_gainers_losers(
@@ -370,24 +493,31 @@ class PolygonClient:
         endpoint = f"/v3/reference/options/contracts/{contract_symbol}"
         return await self._request(endpoint)
 
-    async def get_options_chain(
+    async def iter_options_chain(
         self,
         underlying: str,
         expiration_date: Optional[date] = None,
         contract_type: Optional[str] = None,
         strike_price_gte: Optional[float] = None,
         strike_price_lte: Optional[float] = None,
-        limit: int = 1000
-    ) -> List[Dict[str, Any]]:
-        """Get options chain for an underlying."""
+        expiration_date_gte: Optional[date] = None,
+        expiration_date_lte: Optional[date] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream option contracts for an underlying (filters applied server-side)."""
         endpoint = "/v3/reference/options/contracts"
         params = {
             "underlying_ticker": underlying,
-            "limit": limit
+            "limit": page_size
         }
 
         if expiration_date:
             params["expiration_date"] = expiration_date.isoformat()
+        if expiration_date_gte:
+            params["expiration_date.gte"] = expiration_date_gte.isoformat()
+        if expiration_date_lte:
+            params["expiration_date.lte"] = expiration_date_lte.isoformat()
         if contract_type:
             params["contract_type"] = contract_type
         if strike_price_gte:
@@ -395,16 +525,81 @@ class PolygonClient:
         if strike_price_lte:
             params["strike_price.lte"] = strike_price_lte
 
-        result = await self._request(endpoint, params)
-        return result.get("results", [])
+        async for contract in self._iter_records(endpoint, params, limit):
+            yield contract
 
-    async def get_options_snapshot(
+    async def get_options_chain(
         self,
-        underlying: str
-    ) -> Dict[str, Any]:
-        """Get options snapshot for an underlying."""
+        underlying: str,
+        expiration_date: Optional[date] = None,
+        contract_type: Optional[str] = None,
+        strike_price_gte: Optional[float] = None,
+        strike_price_lte: Optional[float] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Get options chain for an underlying (up to ``limit`` contracts, across pages)."""
+        return [
+            contract async for contract in self.iter_options_chain(
+                underlying,
+                expiration_date=expiration_date,
+                contract_type=contract_type,
+                strike_price_gte=strike_price_gte,
+                strike_price_lte=strike_price_lte,
+                limit=limit,
+            )
+        ]
+
+    async def iter_options_snapshot(
+        self,
+        underlying: str,
+        contract_type: Optional[str] = None,
+        strike_price_gte: Optional[float] = None,
+        strike_price_lte: Optional[float] = None,
+        expiration_date_gte: Optional[date] = None,
+        expiration_date_lte: Optional[date] = None,
+        limit: Optional[int] = None,
+        page_size: int = 250
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream contract snapshots (greeks, quote, OI) for an underlying."""
         endpoint = f"/v3/snapshot/options/{underlying}"
-        return await self._request(endpoint)
+        params: Dict[str, Any] = {"limit": page_size}
+
+        if contract_type:
+            params["contract_type"] = contract_type
+        if strike_price_gte:
+            params["strike_price.gte"] = strike_price_gte
+        if strike_price_lte:
+            params["strike_price.lte"] = strike_price_lte
+        if expiration_date_gte:
+            params["expiration_date.gte"] = expiration_date_gte.isoformat()
+        if expiration_date_lte:
+            params["expiration_date.lte"] = expiration_date_lte.isoformat()
+
+        async for snapshot in self._iter_records(endpoint, params, limit):
+            yield snapshot
+
+    async def get_options_snapshot(
+        self,
+        underlying: str,
+        option_type: Optional[str] = None,
+        strike_price_gte: Optional[float] = None,
+        strike_price_lte: Optional[float] = None,
+        expiration_date_gte: Optional[date] = None,
+        expiration_date_lte: Optional[date] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get contract snapshots for an underlying (every page, up to ``limit``)."""
+        return [
+            snapshot async for snapshot in self.iter_options_snapshot(
+                underlying,
+                contract_type=option_type,
+                strike_price_gte=strike_price_gte,
+                strike_price_lte=strike_price_lte,
+                expiration_date_gte=expiration_date_gte,
+                expiration_date_lte=expiration_date_lte,
+                limit=limit,
+            )
+        ]
 
     async def get_options_quotes(
         self,
@@ -639,21 +834,35 @@ class PolygonClient:
 
     # ==================== Trades ====================
 
-    async def get_trades(
+    async def iter_trades(
         self,
         symbol: str,
         from_date: Optional[date] = None,
-        limit: int = 1000
-    ) -> List[Dict[str, Any]]:
-        """Get historical trades for a symbol."""
+        to_date: Optional[date] = None,
+        order: str = "desc",
+        limit: Optional[int] = None,
+        page_size: int = 50000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream trades for a symbol, newest first by default."""
         endpoint = f"/v3/trades/{symbol}"
-        params = {"limit": limit}
+        params = {"limit": page_size, "order": order, "sort": "timestamp"}
 
         if from_date:
             params["timestamp.gte"] = f"{from_date.isoformat()}T00:00:00Z"
+        if to_date:
+            params["timestamp.lte"] = f"{to_date.isoformat()}T23:59:59Z"
 
-        result = await self._request(endpoint, params)
-        return result.get("results", [])
+        async for trade in self._iter_records(endpoint, params, limit):
+            yield trade
+
+    async def get_trades(
+        self,
+        symbol: str,
+        from_date: Optional[date] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Get historical trades for a symbol (up to ``limit``, across pages)."""
+        return [trade async for trade in self.iter_trades(symbol, from_date, limit=limit)]
 
     # ==================== Dark Pool / Block Trades ====================
 
@@ -661,17 +870,22 @@ class PolygonClient:
         self,
         symbol: str,
         min_size: int = 10000,
-        from_date: Optional[date] = None
+        from_date: Optional[date] = None,
+        max_trades: int = 5000
     ) -> List[DarkPoolPrint]:
         """
         Get large trades that might indicate institutional activity.
         Note: This filters regular trades by size - true dark pool data
         requires a premium data subscription.
+
+        Reads the newest ``max_trades`` trades page by page; only the
+        large ones are kept in memory.
         """
-        trades = await self.get_trades(symbol, from_date, limit=5000)
         large_trades = []
 
-        for trade in trades:
+        async for trade in self.iter_trades(
+            symbol, from_date, limit=max_trades, page_size=min(max_trades, 5000)
+        ):
             size = trade.get("size", 0)
             if size >= min_size:
                 large_trades.append(DarkPoolPrint(
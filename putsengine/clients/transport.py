@@ -0,0 +1,479 @@
+"""
+HTTP Transport - record live API traffic and replay it offline.
+
+WHY:
+``PutsEngine.run_daily_pipeline``, ``PutsEngineScheduler.run_scan`` and
+``run_early_warning_scan`` only ran against live Polygon, UW, Alpaca and
+FinViz. Backtests were one-off scripts, and a full scan could not be
+reproduced, profiled or benchmarked without API keys and quota.
+
+HOW:
+- Every client builds its aiohttp session through ``create_session``.
+  With no transport active this is a plain ``aiohttp.ClientSession``
+  (traced into ``putsengine.metrics``; replayed requests are too).
+- ``Recorder`` wraps the real session. Each response is read once, stored
+  as (method, URL, params, body) -> (status, headers, body, latency), and
+  handed back to the client unchanged. API keys (``apiKey``, ``auth``,
+  ``token`` ...) never reach the archive.
+- The archive is gzip-compressed JSON lines, one exchange per line.
+- ``Replayer`` serves an archive through a session stand-in with the same
+  surface the clients use (``get``/``post``/``delete``/``request`` as
+  async context managers; ``status``, ``headers``, ``json()``, ``text()``).
+    * Matching: exact request first. If none, the request's *route* is
+      used: the path with date/epoch segments wildcarded and date-like or
+      volatile params dropped, so a replay on a later day still finds
+      the ``/range/1/day/<from>/<to>`` or ``start=<now - 5d>`` bars.
+    * Repeated identical requests get the recorded responses in order,
+      then the last one again.
+    * ``latency_ms`` (fixed), ``latency_scale`` (x recorded latency),
+      ``jitter_ms`` and ``throttle_rate`` (fraction of requests answered
+      with 429 + ``Retry-After``) are seeded, so runs are deterministic.
+    * Unmatched requests get a 404 (clients degrade to "no data"), or
+      raise ``ReplayMissError`` with ``strict=True``.
+- Switch on in code (``recording(path)`` / ``replaying(path)`` context
+  managers), or for an unmodified process via ``PUTSENGINE_HTTP_RECORD``
+  / ``PUTSENGINE_HTTP_REPLAY``. A recording started from the environment
+  is saved at exit.
+
+Leave the persistent HTTP cache off (``http_cache_path`` unset) while
+recording or replaying, or cached responses bypass the transport.
+
+Usage:
+    with recording("archives/ews_2026-02-03.jsonl.gz"):
+        await scheduler.run_early_warning_scan()
+
+    with replaying("archives/ews_2026-02-03.jsonl.gz", latency_ms=40, throttle_rate=0.02):
+        await scheduler.run_early_warning_scan()
+
+    python -m putsengine.clients.transport stats archives/ews_2026-02-03.jsonl.gz
+"""
+
+import abc
+import asyncio
+import atexit
+import gzip
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+from loguru import logger
+from multidict import CIMultiDict
+
+from putsengine.metrics import http_trace_config, observe_request
+
+
+RECORD_ENV = "PUTSENGINE_HTTP_RECORD"
+REPLAY_ENV = "PUTSENGINE_HTTP_REPLAY"
+
+# Query params that carry credentials (never written to an archive)
+SECRET_PARAMS = frozenset({"apikey", "api_key", "auth", "token", "access_token", "key"})
+
+# Response headers worth keeping (the clients read only these)
+KEPT_HEADERS = ("Content-Type", "Retry-After")
+
+_DATE_SEGMENT = re.compile(r"^(\d{4}-\d{2}-\d{2}([T ][\d:.]+Z?)?|\d{10,13})$")
+_VOLATILE_PARAMS = frozenset({"start", "end", "from", "to", "date", "timestamp", "timestamp.gte",
+                              "timestamp.lte", "timestamp.gt", "timestamp.lt", "_"})
+
+Exchange = Dict[str, Any]
+
+
+class ReplayMissError(LookupError):
+    """A request had no recorded response (``strict`` replay)."""
+
+
+def _clean_params(params: Any) -> Dict[str, str]:
+    if not params:
+        return {}
+    items = params.items() if hasattr(params, "items") else params
+    return {
+        str(k): str(v) for k, v in items
+        if str(k).lower() not in SECRET_PARAMS
+    }
+
+
+def request_key(method: str, url: str, params: Any = None, body: Any = None) -> str:
+    """Exact match key: method, URL without query secrets, sorted params, JSON body."""
+    parts = urlsplit(url)
+    query = {k: v for k, _, v in (p.partition("=") for p in parts.query.split("&") if p)}
+    merged = {**_clean_params(query), **_clean_params(params)}
+    base = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    key = f"{method.upper()} {base}?{json.dumps(merged, sort_keys=True)}"
+    if body is not None:
+        key += " " + json.dumps(body, sort_keys=True, default=str)
+    return key
+
+
+def route_key(method: str, url: str, params: Any = None) -> str:
+    """Loose match key: date-like path segments and volatile params removed."""
+    parts = urlsplit(url)
+    path = "/".join(
+        "{t}" if _DATE_SEGMENT.match(segment) else segment
+        for segment in parts.path.split("/")
+    )
+    stable = {
+        k: v for k, v in _clean_params(params).items()
+        if k.lower() not in _VOLATILE_PARAMS and not _DATE_SEGMENT.match(v)
+    }
+    return f"{method.upper()} {parts.netloc}{path}?{json.dumps(stable, sort_keys=True)}"
+
+
+# ----------------------------------------------------------------------
+# Responses
+# ----------------------------------------------------------------------
+
+class RecordedResponse:
+    """Response stand-in with the attributes the clients read."""
+
+    def __init__(
+        self, status: int, body: str, headers: Optional[Dict[str, str]] = None, url: str = ""
+    ):
+        self.status = status
+        self.headers = CIMultiDict(headers or {})
+        self.url = url
+        self._body = body
+
+    async def json(self, content_type: Any = None, **kwargs: Any) -> Any:
+        return json.loads(self._body) if self._body else None
+
+    async def text(self, encoding: Optional[str] = None, **kwargs: Any) -> str:
+        return self._body
+
+    async def read(self) -> bytes:
+        return self._body.encode()
+
+    def release(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "RecordedResponse":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class _PendingResponse:
+    """``session.get(...)`` result: awaitable or ``async with``-able, like aiohttp's."""
+
+    def __init__(self, coro):
+        self._coro = coro
+        self._response: Optional[RecordedResponse] = None
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> RecordedResponse:
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class _SessionBase(abc.ABC):
+    """The slice of ``aiohttp.ClientSession`` the clients use."""
+
+    closed = False
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _PendingResponse:
+        return _PendingResponse(
+            self._send(method.upper(), str(url), kwargs.get("params"), kwargs.get("json"))
+        )
+
+    def get(self, url: str, **kwargs: Any) -> _PendingResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _PendingResponse:
+        return self.request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> _PendingResponse:
+        return self.request("DELETE", url, **kwargs)
+
+    @abc.abstractmethod
+    async def _send(self, method: str, url: str, params: Any, body: Any) -> RecordedResponse:
+        """Perform (or look up) one request."""
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+class _RecordingSession(_SessionBase):
+    def __init__(self, recorder: "Recorder", headers: Optional[Dict[str, str]]):
+        self._recorder = recorder
+        self._session = _live_session(headers)
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    async def _send(self, method: str, url: str, params: Any, body: Any) -> RecordedResponse:
+        started = time.perf_counter()
+        async with self._session.request(method, url, params=params, json=body) as response:
+            raw = await response.read()
+            text = raw.decode(response.get_encoding() if raw else "utf-8", errors="replace")
+            headers = {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers}
+            status = response.status
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._recorder.add(method, url, params, body, status, headers, text, latency_ms)
+        return RecordedResponse(status, text, headers, url)
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+class Recorder:
+    """Captures request/response pairs from every session it creates."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.exchanges: List[Exchange] = []
+        self._lock = threading.Lock()
+
+    def session(self, headers: Optional[Dict[str, str]] = None) -> _RecordingSession:
+        return _RecordingSession(self, headers)
+
+    def add(self, method, url, params, body, status, headers, text, latency_ms) -> None:
+        exchange = {
+            "m": method,
+            "u": url.split("?", 1)[0],
+            "p": _clean_params(params),
+            "s": status,
+            "h": headers,
+            "t": text,
+            "ms": latency_ms,
+        }
+        query = urlsplit(url).query
+        if query:
+            exchange["p"] = {**_clean_params(dict(
+                p.split("=", 1) if "=" in p else (p, "") for p in query.split("&") if p
+            )), **exchange["p"]}
+        if body is not None:
+            exchange["b"] = body
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def save(self) -> Path:
+        """Write the archive (gzip JSON lines); returns its path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with self._lock:
+            exchanges = list(self.exchanges)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for exchange in exchanges:
+                f.write(json.dumps(exchange, separators=(",", ":"), default=str) + "\n")
+        os.replace(tmp, self.path)
+        logger.info(f"HTTP recorder: {len(exchanges)} exchanges -> {self.path}")
+        return self.path
+
+
+def load_archive(path: Union[str, Path]) -> List[Exchange]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+
+class _ReplaySession(_SessionBase):
+    def __init__(self, replayer: "Replayer"):
+        self._replayer = replayer
+
+    async def _send(self, method: str, url: str, params: Any, body: Any) -> RecordedResponse:
+        started = time.perf_counter()
+        response = await self._replayer.respond(method, url, params, body)
+        observe_request(method, url, response.status, time.perf_counter() - started)
+        return response
+
+
+class Replayer:
+    """Serves an archive to any number of sessions."""
+
+    def __init__(
+        self,
+        source: Union[str, Path, List[Exchange]],
+        latency_ms: Optional[float] = None,
+        latency_scale: float = 0.0,
+        jitter_ms: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: int = 0,
+        strict: bool = False,
+    ):
+        exchanges = load_archive(source) if isinstance(source, (str, Path)) else list(source)
+        self.latency_ms = latency_ms
+        self.latency_scale = latency_scale
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.strict = strict
+        self._rng = random.Random(seed)
+        self._exact: Dict[str, List[Exchange]] = defaultdict(list)
+        self._routes: Dict[str, List[Exchange]] = defaultdict(list)
+        for e in exchanges:
+            self._exact[request_key(e["m"], e["u"], e.get("p"), e.get("b"))].append(e)
+            self._routes[route_key(e["m"], e["u"], e.get("p"))].append(e)
+        self._served: Counter = Counter()
+        self.stats: Counter = Counter()
+        self.calls_by_host: Counter = Counter()
+
+    def session(self, headers: Optional[Dict[str, str]] = None) -> _ReplaySession:
+        return _ReplaySession(self)
+
+    def _lookup(self, method: str, url: str, params: Any, body: Any) -> Optional[Exchange]:
+        key = request_key(method, url, params, body)
+        candidates = self._exact.get(key)
+        if candidates:
+            self.stats["exact"] += 1
+        else:
+            key = "route:" + route_key(method, url, params)
+            candidates = self._routes.get(key[len("route:"):])
+            if not candidates:
+                return None
+            self.stats["route"] += 1
+        index = min(self._served[key], len(candidates) - 1)
+        self._served[key] += 1
+        return candidates[index]
+
+    def _delay_seconds(self, exchange: Optional[Exchange]) -> float:
+        delay = self.latency_ms or 0.0
+        if exchange is not None and self.latency_scale:
+            delay += exchange.get("ms", 0.0) * self.latency_scale
+        if self.jitter_ms:
+            delay += self._rng.uniform(0, self.jitter_ms)
+        return delay / 1000
+
+    async def respond(
+        self, method: str, url: str, params: Any = None, body: Any = None
+    ) -> RecordedResponse:
+        self.stats["requests"] += 1
+        self.calls_by_host[urlsplit(url).netloc] += 1
+        if self.throttle_rate and self._rng.random() < self.throttle_rate:
+            self.stats["throttled"] += 1
+            await asyncio.sleep(self._delay_seconds(None))
+            return RecordedResponse(429, "", {"Retry-After": str(self.retry_after)}, url)
+
+        exchange = self._lookup(method, url, params, body)
+        delay = self._delay_seconds(exchange)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if exchange is None:
+            self.stats["misses"] += 1
+            if self.strict:
+                raise ReplayMissError(request_key(method, url, params, body))
+            logger.debug(f"HTTP replay miss: {method} {url}")
+            return RecordedResponse(404, "", {}, url)
+        return RecordedResponse(exchange["s"], exchange.get("t", ""), exchange.get("h"), url)
+
+
+# ----------------------------------------------------------------------
+# Activation
+# ----------------------------------------------------------------------
+
+_transport: Optional[Union[Recorder, Replayer]] = None
+_env_checked = False
+
+
+def _from_environment() -> None:
+    global _transport, _env_checked
+    _env_checked = True
+    if _transport is not None:
+        return
+    if os.environ.get(REPLAY_ENV):
+        _transport = Replayer(os.environ[REPLAY_ENV])
+        logger.info(f"HTTP replay from {os.environ[REPLAY_ENV]}")
+    elif os.environ.get(RECORD_ENV):
+        _transport = Recorder(os.environ[RECORD_ENV])
+        atexit.register(_transport.save)
+        logger.info(f"HTTP recording to {os.environ[RECORD_ENV]}")
+
+
+def _live_session(headers: Optional[Dict[str, str]]) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(headers=headers, trace_configs=[http_trace_config()])
+
+
+def create_session(headers: Optional[Dict[str, str]] = None):
+    """Session for an API client: live, recording or replaying."""
+    if not _env_checked:
+        _from_environment()
+    if _transport is None:
+        return _live_session(headers)
+    return _transport.session(headers)
+
+
+def get_transport() -> Optional[Union[Recorder, Replayer]]:
+    return _transport
+
+
+def set_transport(transport: Optional[Union[Recorder, Replayer]]) -> None:
+    """Install (or with None, remove) the transport used by new sessions."""
+    global _transport, _env_checked
+    _transport = transport
+    _env_checked = True
+
+
+@contextmanager
+def recording(path: Union[str, Path]) -> Iterator[Recorder]:
+    """Record every client request made inside the block; saves on exit."""
+    previous = _transport
+    recorder = Recorder(path)
+    set_transport(recorder)
+    try:
+        yield recorder
+    finally:
+        set_transport(previous)
+        recorder.save()
+
+
+@contextmanager
+def replaying(source: Union[str, Path, List[Exchange]], **options: Any) -> Iterator[Replayer]:
+    """Serve client requests inside the block from an archive (see ``Replayer``)."""
+    previous = _transport
+    replayer = Replayer(source, **options)
+    set_transport(replayer)
+    try:
+        yield replayer
+    finally:
+        set_transport(previous)
+
+
+def archive_stats(path: Union[str, Path]) -> Dict[str, Any]:
+    exchanges = load_archive(path)
+    hosts = Counter(urlsplit(e["u"]).netloc for e in exchanges)
+    statuses = Counter(str(e["s"]) for e in exchanges)
+    return {
+        "exchanges": len(exchanges),
+        "hosts": dict(hosts),
+        "statuses": dict(statuses),
+        "body_bytes": sum(len(e.get("t", "")) for e in exchanges),
+        "recorded_ms": round(sum(e.get("ms", 0.0) for e in exchanges), 1),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PutsEngine HTTP archives")
+    parser.add_argument("command", choices=["stats"])
+    parser.add_argument("archive")
+    args = parser.parse_args()
+    print(json.dumps(archive_stats(args.archive), indent=2))
@@ -13,9 +13,10 @@ BUDGET STRATEGY (7,500 calls/day with 67 jobs):
 └── Buffer:                        700 calls  - For retries
 
 RATE LIMIT STRATEGY (120 req/min limit):
-- Batch tickers into groups of 100
-- Wait 65 seconds between batches (rate limit reset)
-- Use 0.6s interval within batch (100 req/min, safe under 120)
+- All UW calls in the process share one token bucket in clients/gateway.py
+- Steady rate settings.uw_rate_limit_per_minute (110/min, safe under 120)
+- P1 tickers (DUI / active signals) are dequeued ahead of P3
+- 429 -> gateway halves the rate and pauses every UW caller
 - Result: ALL tickers scanned per scan, ZERO misses
 
 RESPONSE CACHE STRATEGY (Feb 7, 2026):
@@ -26,6 +27,8 @@ RESPONSE CACHE STRATEGY (Feb 7, 2026):
   - EWS + Earnings Priority: 4 endpoints overlap per earnings stock
   - get_put_flow + get_call_selling_flow: both call flow_recent internally
   - Duplicate 3PM scan eliminated (daily_report + market_pulse)
+- Single-flight: concurrent identical requests (same cache key) share ONE
+  in-flight HTTP call instead of each missing the cache
 """
 
 import asyncio
@@ -33,11 +36,18 @@ import time as _time
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 import aiohttp
+import numpy as np
 from loguru import logger
 
 from putsengine.config import Settings
 from putsengine.models import OptionsFlow, DarkPoolPrint, GEXData
 from putsengine.api_budget import get_budget_manager, TickerPriority
+from putsengine.clients.gateway import get_provider_gateway, retry_after_seconds, DEFAULT_PRIORITY
+from putsengine.clients.transport import create_session
+from putsengine.codec import columns, read_json
+from putsengine.loop_monitor import run_blocking
+from putsengine.metrics import record_cache
+from putsengine.utils.persistent_cache import get_persistent_cache
 
 
 class UnusualWhalesClient:
@@ -58,7 +68,8 @@ class UnusualWhalesClient:
     BASE_URL = "https://api.unusualwhales.com"
     
     # Rate limiting: 0.6s = 100 req/min (safe under 120 limit)
-    # When batched: 100 tickers x 0.6s = 60s per batch, then wait 65s
+    # Enforced by the shared provider gateway token bucket (settings.uw_rate_limit_per_minute),
+    # so every UW client in the process shares ONE budget.
     MIN_REQUEST_INTERVAL = 0.6  # 600ms between requests (100 req/min max)
 
     # =========================================================================
@@ -86,8 +97,8 @@ class UnusualWhalesClient:
         self._session_loop_id: Optional[int] = None  # Track which event loop owns the session
         self._calls_today = 0
         self._calls_reset_date = date.today()
-        self._last_request_time = 0.0  # For rate limiting
-        self._rate_limit_lock: Optional[asyncio.Lock] = None  # Lazy init for thread-safe rate limiting
+        # Shared token bucket + priority queue (one budget across EWS, weather, scheduler)
+        self._gateway = get_provider_gateway(settings)
         
         # Budget manager for smart API allocation
         self._budget_manager = get_budget_manager()
@@ -103,9 +114,25 @@ class UnusualWhalesClient:
         # Value: (response_data, timestamp_seconds)
         # =====================================================================
         self._response_cache: Dict[str, Tuple[Any, float]] = {}
+        # Optional on-disk tier shared with the dashboard / scripts (settings.http_cache_path)
+        self._persistent_cache = get_persistent_cache(settings)
         self._cache_hits = 0
         self._cache_misses = 0
         self._cache_saves = 0  # Number of API calls saved
+        
+        # =====================================================================
+        # SINGLE-FLIGHT (in-flight request coalescing)
+        # Key: same cache key as the response cache
+        # Value: future resolved with the response of the one real request
+        #
+        # WHY: the 30-min cache only helps AFTER a call completes. When
+        # DealerPositioningLayer.analyze, _check_gamma_flip and _check_net_delta
+        # all ask for get_gex_data(symbol) at once, each used to miss the cache
+        # and spend its own UW call.
+        # =====================================================================
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._inflight_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._coalesced = 0
     
     def set_force_scan_mode(self, enabled: bool):
         """
@@ -141,7 +168,7 @@ class UnusualWhalesClient:
         """
         return endpoint
     
-    def _get_cached_response(self, cache_key: str) -> Optional[Any]:
+    async def _get_cached_response(self, cache_key: str) -> Optional[Any]:
         """Get cached response if still valid (within TTL)."""
         if cache_key in self._response_cache:
             data, cached_at = self._response_cache[cache_key]
@@ -149,16 +176,38 @@ class UnusualWhalesClient:
             if age < self.RESPONSE_CACHE_TTL:
                 self._cache_hits += 1
                 self._cache_saves += 1
+                record_cache("uw", "hit")
                 return data
             else:
                 # Expired - remove stale entry
                 del self._response_cache[cache_key]
+        if self._persistent_cache is not None:
+            found = await run_blocking(
+                self._persistent_cache.get_with_expiry,
+                self._persistent_cache.make_key("uw", cache_key),
+            )
+            if found is not None:
+                data, expires_at = found
+                # Another process fetched it — keep the original age in memory
+                cached_at = min(_time.time(), expires_at - self.RESPONSE_CACHE_TTL)
+                self._response_cache[cache_key] = (data, cached_at)
+                self._cache_hits += 1
+                self._cache_saves += 1
+                record_cache("uw", "hit")
+                return data
         self._cache_misses += 1
+        record_cache("uw", "miss")
         return None
     
-    def _cache_response(self, cache_key: str, data: Any):
+    async def _cache_response(self, cache_key: str, data: Any):
         """Store API response in cache with current timestamp."""
         self._response_cache[cache_key] = (data, _time.time())
+        if self._persistent_cache is not None:
+            ttl = min(self.RESPONSE_CACHE_TTL, self._persistent_cache.ttl_for("uw", cache_key))
+            await run_blocking(
+                self._persistent_cache.set,
+                self._persistent_cache.make_key("uw", cache_key), data, ttl,
+            )
         
         # Prevent unbounded growth
         if len(self._response_cache) > self.CACHE_MAX_ENTRIES:
@@ -180,12 +229,19 @@ class UnusualWhalesClient:
         """Get response cache statistics for monitoring."""
         total = self._cache_hits + self._cache_misses
         hit_rate = round(self._cache_hits / max(1, total) * 100, 1)
+        coalesce_rate = round(self._coalesced / max(1, self._cache_misses) * 100, 1)
         return {
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "cache_entries": len(self._response_cache),
             "cache_hit_rate_pct": hit_rate,
+            "requests_coalesced": self._coalesced,
+            "coalesce_rate_pct": coalesce_rate,  # share of cache misses that joined an in-flight call
+            "requests_in_flight": len(self._inflight),
             "api_calls_saved": self._cache_saves,
+            "budget_calls_today": self._calls_today,
+            "budget_remaining_today": self.remaining_calls,
+            "persistent_cache": self._persistent_cache.stats() if self._persistent_cache else None,
         }
     
     def clear_cache(self):
@@ -194,6 +250,7 @@ class UnusualWhalesClient:
         self._cache_hits = 0
         self._cache_misses = 0
         self._cache_saves = 0
+        self._coalesced = 0
         logger.info("UW response cache cleared")
 
     @property
@@ -238,12 +295,15 @@ class UnusualWhalesClient:
     def get_budget_status(self) -> Dict:
         """Get current API budget status."""
         if self._budget_manager:
-            return self._budget_manager.get_status()
-        return {
-            "daily_used": self._calls_today,
-            "daily_limit": self.daily_limit,
-            "daily_remaining": self.remaining_calls,
-        }
+            status = self._budget_manager.get_status()
+        else:
+            status = {
+                "daily_used": self._calls_today,
+                "daily_limit": self.daily_limit,
+                "daily_remaining": self.remaining_calls,
+            }
+        status["gateway"] = self._gateway.get_status().get("uw", {})
+        return status
     
     def update_ticker_priority(self, symbol: str, score: float, is_dui: bool = False):
         """Update ticker priority based on new score (affects future API allocation)."""
@@ -277,7 +337,7 @@ class UnusualWhalesClient:
                     pass
                 self._session = None
             
-            self._session = aiohttp.ClientSession(headers=self._headers)
+            self._session = create_session(headers=self._headers)
             self._session_loop_id = current_loop_id
         
         return self._session
@@ -292,19 +352,19 @@ class UnusualWhalesClient:
         self._session = None
         self._session_loop_id = None
 
-    async def _rate_limit_wait(self):
-        """Wait to respect rate limits - prevents 429 errors. Thread-safe with lock."""
-        import time
-        # Lazy initialization of lock (must be done inside async context)
-        if self._rate_limit_lock is None:
-            self._rate_limit_lock = asyncio.Lock()
-        async with self._rate_limit_lock:
-            now = time.time()
-            elapsed = now - self._last_request_time
-            if elapsed < self.MIN_REQUEST_INTERVAL:
-                wait_time = self.MIN_REQUEST_INTERVAL - elapsed
-                await asyncio.sleep(wait_time)
-            self._last_request_time = time.time()
+    async def _rate_limit_wait(self, priority: int = DEFAULT_PRIORITY):
+        """Wait for a UW token from the shared gateway (P1 tickers are served first)."""
+        await self._gateway.acquire("uw", priority=priority)
+
+    def _gateway_priority(self, symbol: Optional[str], priority: Optional[TickerPriority]) -> int:
+        """Resolve the gateway queue priority for a request."""
+        if priority is not None:
+            return priority.value
+        if symbol and self._budget_manager:
+            known = self._budget_manager.peek_ticker_priority(symbol)
+            if known is not None:
+                return known.value
+        return DEFAULT_PRIORITY
 
     async def _request(
         self,
@@ -320,6 +380,7 @@ class UnusualWhalesClient:
         CACHE STRATEGY (Feb 7, 2026):
         - Before making HTTP call, check if endpoint is in the 30-min cache
         - If cached and fresh -> return cached data (0 API calls, 0 budget impact)
+        - If not cached but the same key is in flight -> await that call (single-flight)
         - If not cached -> make real API call -> store in cache
         - Cache key = endpoint path only (normalizes limit params)
         
@@ -341,11 +402,60 @@ class UnusualWhalesClient:
         # This saves budget, rate limit capacity, and latency.
         # =====================================================================
         cache_key = self._get_cache_key(endpoint)
-        cached_data = self._get_cached_response(cache_key)
+        cached_data = await self._get_cached_response(cache_key)
         if cached_data is not None:
             logger.debug(f"UW CACHE HIT: {endpoint} (saved 1 API call)")
             return cached_data
         
+        # =====================================================================
+        # STEP 0b: Single-flight — if an identical request is already in
+        # flight, await its result instead of spending another UW call.
+        # =====================================================================
+        loop = asyncio.get_running_loop()
+        if self._inflight_loop is not loop:
+            # Futures from a previous (possibly closed) loop can't be awaited here
+            self._inflight = {}
+            self._inflight_loop = loop
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self._coalesced += 1
+            self._cache_saves += 1
+            record_cache("uw", "coalesced")
+            logger.debug(f"UW COALESCED: {endpoint} (joined in-flight request)")
+            # shield: one cancelled waiter must not cancel the shared request
+            return await asyncio.shield(inflight)
+        
+        future = loop.create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._request_uncached(
+                endpoint, cache_key, params, symbol, priority, force_scan
+            )
+        except asyncio.CancelledError:
+            # e.g. a scan timeout: joined callers see the cancellation, not {}
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Joined callers re-raise it; no "never retrieved" log
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+
+    async def _request_uncached(
+        self,
+        endpoint: str,
+        cache_key: str,
+        params: Optional[Dict],
+        symbol: Optional[str],
+        priority: Optional[TickerPriority],
+        force_scan: bool
+    ) -> Any:
+        """Budget check + rate-limited HTTP call for a cache miss (see _request)."""
         # =====================================================================
         # STEP 1: Budget check (only if cache missed)
         # =====================================================================
@@ -366,31 +476,36 @@ class UnusualWhalesClient:
         # =====================================================================
         url = f"{self.BASE_URL}{endpoint}"
         max_retries = 2  # 1 initial attempt + 1 retry on 429
+        gateway_priority = self._gateway_priority(symbol, priority)
         
         for attempt in range(max_retries):
-            await self._rate_limit_wait()
+            await self._rate_limit_wait(gateway_priority)
             session = await self._get_session()
 
             try:
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
+                        self._gateway.report_success("uw")
                         # Only count successful calls against daily budget
                         self._calls_today += 1
                         if symbol and self._budget_manager:
                             self._budget_manager.record_call(symbol)
                         
-                        result = await response.json()
+                        result = await read_json(response)
                         # =========================================================
                         # STEP 3: Cache successful response for future reuse
                         # =========================================================
                         if result:  # Only cache non-empty responses
-                            self._cache_response(cache_key, result)
+                            await self._cache_response(cache_key, result)
                         return result
                     elif response.status == 429:
+                        # Gateway halves the UW rate and pauses ALL UW callers
+                        penalty = self._gateway.report_throttled(
+                            "uw", retry_after_seconds(response.headers)
+                        )
                         if attempt < max_retries - 1:
-                            # Rate limited — wait and actually retry (no budget cost)
-                            logger.debug(f"UW rate limit 429 on {endpoint} — backoff 5s then retry (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(5.0)
+                            # Rate limited — the retry waits for the gateway (no budget cost)
+                            logger.debug(f"UW rate limit 429 on {endpoint} — gateway backoff {penalty:.1f}s then retry (attempt {attempt + 1}/{max_retries})")
                             continue  # Retry without counting against budget
                         else:
                             # Final attempt also 429 — give up, don't waste budget
@@ -950,7 +1065,7 @@ class UnusualWhalesClient:
         try:
             # Method 1: Check flow-recent cache (underlying_price field)
             cache_key = self._get_cache_key(f"/api/stock/{symbol}/flow-recent")
-            cached = self._get_cached_response(cache_key)
+            cached = await self._get_cached_response(cache_key)
             if cached:
                 data = cached.get("data", cached) if isinstance(cached, dict) else cached
                 if isinstance(data, list):
@@ -962,7 +1077,7 @@ class UnusualWhalesClient:
             
             # Method 2: Check stock info cache
             cache_key2 = self._get_cache_key(f"/api/stock/{symbol}/info")
-            cached2 = self._get_cached_response(cache_key2)
+            cached2 = await self._get_cached_response(cache_key2)
             if cached2:
                 info = cached2.get("data", cached2) if isinstance(cached2, dict) else cached2
                 if isinstance(info, dict):
@@ -971,7 +1086,7 @@ class UnusualWhalesClient:
             
             # Method 3: Check options-volume cache (has close price)
             cache_key3 = self._get_cache_key(f"/api/stock/{symbol}/options-volume")
-            cached3 = self._get_cached_response(cache_key3)
+            cached3 = await self._get_cached_response(cache_key3)
             if cached3:
                 data = cached3.get("data", cached3) if isinstance(cached3, dict) else cached3
                 if isinstance(data, list) and data:
@@ -982,7 +1097,7 @@ class UnusualWhalesClient:
             
             # Method 4: Check max-pain cache (has close price)
             cache_key4 = self._get_cache_key(f"/api/stock/{symbol}/max-pain")
-            cached4 = self._get_cached_response(cache_key4)
+            cached4 = await self._get_cached_response(cache_key4)
             if cached4:
                 data = cached4.get("data", cached4) if isinstance(cached4, dict) else cached4
                 if isinstance(data, list) and data:
@@ -1149,6 +1264,23 @@ class UnusualWhalesClient:
             params["expiry"] = expiration.isoformat()
         return await self._request(endpoint, params)
 
+    async def get_oi_strikes(
+        self,
+        symbol: str,
+        expiration: Optional[date] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        OI-per-strike decoded straight into arrays: ``strike``, ``put_oi``,
+        ``call_oi`` (same cached response as get_oi_by_strike).
+        """
+        oi_data = await self.get_oi_by_strike(symbol, expiration)
+        rows = oi_data.get("data", []) if isinstance(oi_data, dict) else oi_data
+        return columns(rows if isinstance(rows, list) else [], {
+            "strike": ("strike", "strike_price"),
+            "put_oi": ("put_oi", "put_open_interest"),
+            "call_oi": ("call_oi", "call_open_interest"),
+        })
+
     async def get_oi_per_expiry(self, symbol: str) -> Dict[str, Any]:
         """
         Get open interest by expiration.
@@ -1328,20 +1460,10 @@ class UnusualWhalesClient:
         deep OTM strikes as the "wall" (e.g., $300 for a $411 stock is valid,
         but $5 is not).
         """
-        oi_data = await self.get_oi_by_strike(symbol)
-
-        if not oi_data:
-            return None
+        oi = await self.get_oi_strikes(symbol)
+        strikes, put_oi = oi["strike"], oi["put_oi"]
 
-        # Handle both list responses and dict with "data" key
-        if isinstance(oi_data, list):
-            data = oi_data
-        elif isinstance(oi_data, dict):
-            data = oi_data.get("data", [])
-        else:
-            data = []
-            
-        if not isinstance(data, list) or len(data) == 0:
+        if not len(strikes):
             return None
 
         # Get current price for ±30% range filter
@@ -1354,21 +1476,11 @@ class UnusualWhalesClient:
             low_bound = 0
             high_bound = float('inf')
 
-        max_put_oi = 0
-        put_wall = None
-
-        for strike_data in data:
-            if not isinstance(strike_data, dict):
-                continue
-            strike = float(strike_data.get("strike", strike_data.get("strike_price", 0)))
-            if strike < low_bound or strike > high_bound:
-                continue  # Skip strikes outside ±30% range
-            put_oi = int(strike_data.get("put_oi", strike_data.get("put_open_interest", 0)))
-            if put_oi > max_put_oi:
-                max_put_oi = put_oi
-                put_wall = strike
-
-        return put_wall
+        # Highest put OI among strikes inside the ±30% range (first one on ties)
+        in_range = (strikes >= low_bound) & (strikes <= high_bound) & (put_oi > 0)
+        if not in_range.any():
+            return None
+        return float(strikes[np.argmax(np.where(in_range, put_oi, -1))])
 
     # ==================== Market-Wide ====================
 
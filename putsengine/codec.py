@@ -0,0 +1,160 @@
+"""
+Codec - One JSON layer for provider payloads and state files.
+
+WHY:
+Every provider response went through aiohttp's ``response.json()``
+(stdlib ``json``). Every state file was rewritten with
+``json.dump(..., indent=2, default=str)``. That includes the multi-MB EWS
+alert and scan result files, rewritten many times a day. On small scans,
+encoding and decoding JSON took more time than scoring.
+
+HOW:
+- ``orjson`` is used when it is installed (``pip install orjson``). If
+  not, stdlib ``json`` is used with the same defaults, so both backends
+  write the same shapes:
+  - numpy scalars and arrays become numbers and lists
+  - datetimes, dataclasses and anything else unknown go through ``str()``
+  - NaN is written as null under orjson
+- ``read_json(response)`` decodes an aiohttp response body in one pass.
+  All clients use it.
+- ``dump_file`` writes compact JSON by default, since these files are
+  machine-read. Pass ``indent=True`` for files people open by hand. The
+  write is atomic (tmp file + ``os.replace``), so readers in other
+  processes never see a half-written file.
+- ``columns`` turns a list of payload rows into numpy columns in one
+  pass. It is used for typed decoding of hot payloads such as
+  OI-per-strike.
+
+Usage:
+    data = await read_json(response)
+    dump_file(alert_data, "early_warning_alerts.json")
+    strikes = columns(rows, {"strike": ("strike", "strike_price")})
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+PathLike = Union[str, Path]
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+if orjson is not None:
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME     # str(datetime), as json's default=str did
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    JSONDecodeError = orjson.JSONDecodeError  # Subclass of json.JSONDecodeError
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps_bytes(value: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(value, default=_default,
+                            option=(_OPTIONS | orjson.OPT_INDENT_2) if indent else _OPTIONS)
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps_bytes(value: Any, indent: bool = False) -> bytes:
+        if indent:
+            text = json.dumps(value, default=_default, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False)
+        return text.encode()
+
+
+def dumps(value: Any, indent: bool = False) -> str:
+    return dumps_bytes(value, indent).decode()
+
+
+async def read_json(response) -> Any:
+    """Decode an aiohttp response body (``None`` for an empty body)."""
+    body = await response.read()
+    if not body or not body.strip():
+        return None
+    return loads(body)
+
+
+def load_file(path: PathLike, default: Any = None) -> Any:
+    """Parse a JSON file; ``default`` if it does not exist."""
+    try:
+        with open(path, "rb") as f:
+            return loads(f.read())
+    except FileNotFoundError:
+        return default
+
+
+def dump_file(value: Any, path: PathLike, indent: bool = False) -> None:
+    """Atomically write ``value`` as JSON (compact unless ``indent``)."""
+    path = Path(path)
+    data = dumps_bytes(value, indent)
+    # Unique per call, so concurrent writers (threads too) never share a tmp file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep the usual file mode
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def columns(
+    rows: Iterable[Dict[str, Any]],
+    fields: Dict[str, Union[str, Sequence[str]]],
+    dtype: Any = np.float64,
+) -> Dict[str, np.ndarray]:
+    """
+    Decode payload rows into numpy columns.
+
+    ``fields`` maps each output column to a key, or a tuple of fallback
+    keys (the first present one wins). Missing, null and non-numeric
+    values become 0. Rows that are not dicts are skipped.
+    """
+    keys: Dict[str, Tuple[str, ...]] = {
+        name: (key,) if isinstance(key, str) else tuple(key) for name, key in fields.items()
+    }
+    out: Dict[str, list] = {name: [] for name in keys}
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        for name, candidates in keys.items():
+            value = None
+            for key in candidates:
+                value = row.get(key)
+                if value is not None:
+                    break
+            try:
+                out[name].append(float(value) if value is not None else 0.0)
+            except (TypeError, ValueError):
+                out[name].append(0.0)
+    return {name: np.asarray(values, dtype=dtype) for name, values in out.items()}
@@ -0,0 +1,256 @@
+"""
+Compute Pool - CPU-bound bar scoring on worker processes.
+
+WHY:
+The bar scanners (multi-day weakness, big movers, volume-price divergence)
+fetched one symbol at a time and scored it right away. Their pattern
+checks are pure Python over already-fetched bars, and they ran on the
+event loop that also drives every HTTP call. So a universe scan used one
+core, and it never fetched and scored at the same time.
+
+HOW:
+- ``score_as_fetched`` fetches symbols with bounded concurrency. Each
+  batch of fetched bars goes to the process pool, and fetching continues
+  while the batch is scored.
+- A batch travels as one ``SharedMemory`` block: a column-major float64
+  matrix of all the batch's bars, plus a tiny ``(symbol, start, stop, utc)``
+  index. Workers attach by name and score ``BarArray`` views of the
+  block. Bars are never pickled.
+- Scorers are module-level ``(symbol, bars) -> record`` functions. They
+  return compact records (the scanners' own dataclasses), not bars.
+- Workers come from ``forkserver`` (spawn off Linux). The daemon has
+  threads by then (loop monitor, blocking pool), so a plain fork could
+  copy a held lock into the child.
+- ``workers=0`` (``Settings.compute_workers``) scores in-process on the
+  blocking pool. The same happens if the process pool can't start or
+  breaks.
+
+Usage:
+    results = await score_as_fetched(
+        score_weakness, symbols,
+        fetch=lambda s: polygon.get_daily_bars(s, limit=20),
+    )
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from putsengine.bars import _COLUMNS, BarArray, as_bar_array
+from putsengine.loop_monitor import run_blocking
+
+
+BATCH_SIZE = 48            # Symbols per shared-memory block / worker task
+FETCH_CONCURRENCY = 16     # Bar fetches in flight (the gateway still paces providers)
+
+Scorer = Callable[[str, BarArray], Any]
+IndexEntry = Tuple[str, int, int, bool]
+
+
+class SharedBars:
+    """One batch of BarArrays packed into a shared-memory block."""
+
+    def __init__(self, bars_by_symbol: Dict[str, Any]):
+        arrays = [(symbol, as_bar_array(bars)) for symbol, bars in bars_by_symbol.items()]
+        self.rows = sum(len(bars) for _, bars in arrays)
+        self.shm = SharedMemory(create=True, size=max(1, self.rows * len(_COLUMNS) * 8))
+        self.index: List[IndexEntry] = []
+        matrix = np.ndarray((len(_COLUMNS), self.rows), dtype=np.float64, buffer=self.shm.buf)
+        pos = 0
+        for symbol, bars in arrays:
+            n = len(bars)
+            for c, column in enumerate(_COLUMNS):
+                matrix[c, pos:pos + n] = getattr(bars, column)
+            self.index.append((symbol, pos, pos + n, bars.utc))
+            pos += n
+        del matrix
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def release(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _score_batch(
+    block: str, rows: int, index: List[IndexEntry], score: Scorer
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Worker entry: score every symbol of a shared block."""
+    shm = SharedMemory(name=block)
+    records: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    try:
+        matrix = np.ndarray((len(_COLUMNS), rows), dtype=np.float64, buffer=shm.buf)
+        for symbol, start, stop, utc in index:
+            bars = BarArray(*(matrix[c, start:stop] for c in range(len(_COLUMNS))), utc=utc)
+            try:
+                records[symbol] = score(symbol, bars)
+            except Exception as e:
+                errors[symbol] = str(e)
+            del bars
+        del matrix   # No views may outlive the mapping
+    finally:
+        shm.close()
+    return records, errors
+
+
+def _score_inline(
+    score: Scorer, bars_by_symbol: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    records: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for symbol, bars in bars_by_symbol.items():
+        try:
+            records[symbol] = score(symbol, as_bar_array(bars))
+        except Exception as e:
+            errors[symbol] = str(e)
+    return records, errors
+
+
+class ComputePool:
+    """Lazily started process pool for batch scoring."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = max(1, (os.cpu_count() or 2) - 1) if workers is None else workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._lock = threading.Lock()
+        self.stats = {"batches": 0, "symbols": 0, "inline_batches": 0, "errors": 0}
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers == 0 or self._broken:
+            return None
+        with self._lock:
+            if self._executor is None:
+                method = "forkserver" if sys.platform.startswith("linux") else "spawn"
+                context = multiprocessing.get_context(method)
+                if method == "forkserver":
+                    # Import once, fork workers warm
+                    context.set_forkserver_preload(["putsengine"])
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=context
+                    )
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Compute pool unavailable, scoring in-process: {e}")
+                    self._broken = True
+            return self._executor
+
+    async def score(self, score: Scorer, bars_by_symbol: Dict[str, Any]) -> Dict[str, Any]:
+        """Score one batch; returns ``{symbol: record}`` (failed symbols are left out)."""
+        if not bars_by_symbol:
+            return {}
+        executor = self._get_executor()
+        records = errors = None
+        if executor is not None:
+            block = SharedBars(bars_by_symbol)
+            try:
+                records, errors = await asyncio.get_running_loop().run_in_executor(
+                    executor, _score_batch, block.name, block.rows, block.index, score,
+                )
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Compute pool broke, scoring in-process from now on: {e}")
+                self._broken = True
+            finally:
+                block.release()
+        if records is None:
+            records, errors = await run_blocking(_score_inline, score, bars_by_symbol)
+            self.stats["inline_batches"] += 1
+        self.stats["batches"] += 1
+        self.stats["symbols"] += len(bars_by_symbol)
+        self.stats["errors"] += len(errors)
+        for symbol, error in errors.items():
+            logger.debug(f"Scoring {symbol} failed: {error}")
+        return records
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+_pool: Optional[ComputePool] = None
+_pool_lock = threading.Lock()
+
+
+def configure_compute_pool(workers: Optional[int]) -> ComputePool:
+    """Replace the process-wide pool (scheduler start-up, from Settings)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = ComputePool(workers)
+        return _pool
+
+
+def get_compute_pool() -> ComputePool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ComputePool()
+        return _pool
+
+
+def shutdown_compute_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+async def score_as_fetched(
+    score: Scorer,
+    symbols: Iterable[str],
+    fetch: Callable[[str], Awaitable[Any]],
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = FETCH_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Fetch bars for ``symbols`` and score them on the compute pool.
+
+    Full batches are scored while the remaining fetches are in flight.
+    Returns ``{symbol: record}`` in ``symbols`` order. Symbols whose fetch
+    or scoring failed are left out.
+    """
+    symbols = list(symbols)
+    pool = get_compute_pool()
+    semaphore = asyncio.Semaphore(concurrency)
+    batch: Dict[str, Any] = {}
+    scoring: List[asyncio.Task] = []
+
+    def flush() -> None:
+        nonlocal batch
+        if batch:
+            scoring.append(asyncio.create_task(pool.score(score, batch)))
+            batch = {}
+
+    async def fetch_one(symbol: str) -> None:
+        async with semaphore:
+            try:
+                bars = await fetch(symbol)
+            except Exception as e:
+                logger.debug(f"Failed to get bars for {symbol}: {e}")
+                return
+        batch[symbol] = bars if bars is not None else BarArray.empty()
+        if len(batch) >= batch_size:
+            flush()
+
+    await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+    flush()
+    merged: Dict[str, Any] = {}
+    for records in await asyncio.gather(*scoring):
+        merged.update(records)
+    return {symbol: merged[symbol] for symbol in symbols if symbol in merged}
@@ -80,6 +80,29 @@ class Settings(BaseSettings):
     uw_daily_limit: int = Field(default=15000, description="Unusual Whales daily API limit (Feb 8, 2026: new key, 15k/day)")
     # FEB 2, 2026: Updated for Options Advanced ($199/mo) plan - UNLIMITED API calls
     polygon_rate_limit: int = Field(default=100, description="Polygon requests per second (unlimited for paid plans)")
+    uw_rate_limit_per_minute: int = Field(default=110, description="UW requests per rolling minute (server hard limit is 120)")
+
+    # Concurrent scan executor (scheduler run_scan)
+    scan_max_in_flight: int = Field(default=24, ge=1, description="Symbols analyzed concurrently during a full scan")
+    scan_polygon_concurrency: int = Field(default=32, ge=1, description="Concurrent Polygon calls during a full scan")
+    scan_uw_concurrency: int = Field(default=4, ge=1, description="Symbols allowed to run UW-backed analysis at once")
+
+    # Shortlist screening: one full-market snapshot instead of one request per symbol
+    shortlist_bulk_snapshot: bool = Field(default=True, description="Screen the universe from a single bulk Polygon snapshot")
+
+    # Incremental minute-bar store (get_minute_bars fetches only the delta since the last call)
+    minute_store_enabled: bool = Field(default=True, description="Serve minute-bar windows from the incremental bar store")
+    bar_store_path: Optional[str] = Field(default=None, description="Directory for persisted minute bars; None keeps them in memory only")
+
+    # Persistent HTTP response cache (shared by dashboard, daemon and scripts)
+    http_cache_path: Optional[str] = Field(default=None, description="SQLite cache file; None disables the persistent cache")
+    http_cache_max_mb: int = Field(default=256, ge=1, description="Size bound for the persistent cache (LRU eviction)")
+
+    # Hot-path metrics (putsengine.metrics); files are always exported by the daemon
+    metrics_port: Optional[int] = Field(default=None, description="Serve /metrics and /metrics.json on localhost; None disables the endpoint")
+
+    # CPU-bound bar scoring (putsengine.compute_pool)
+    compute_workers: Optional[int] = Field(default=None, ge=0, description="Scoring processes; None = cores - 1, 0 = score in-process")
 
     # Logging
     log_level: str = Field(default="INFO")
@@ -625,18 +648,27 @@ class DynamicUniverseManager:
         return cls._instance
     
     def _load_persisted(self):
-        """Load persisted dynamic universe from file."""
+        """Load persisted dynamic universe (state store, or the JSON file if newer)."""
         import json
         from pathlib import Path
         from datetime import datetime
         
+        today = datetime.now().date().isoformat()
         persistence_file = Path(EngineConfig.DUI_PERSISTENCE_FILE)
+        try:
+            from putsengine.state_store import get_state_store, file_is_newer
+            store = get_state_store()
+            if not file_is_newer(persistence_file, store.get_meta("dui_updated_at")):
+                self._dynamic_set = store.dui_entries(active_on=today)
+                return
+        except Exception:
+            pass
+        
         if persistence_file.exists():
             try:
                 with open(persistence_file, 'r') as f:
                     data = json.load(f)
                     # Filter out expired entries
-                    today = datetime.now().date().isoformat()
                     self._dynamic_set = {
                         symbol: info 
                         for symbol, info in data.items()
@@ -648,10 +680,16 @@ class DynamicUniverseManager:
             self._dynamic_set = {}
     
     def _persist(self):
-        """Persist dynamic universe to file."""
+        """Persist dynamic universe to the state store and the JSON export."""
         import json
         from pathlib import Path
         
+        try:
+            from putsengine.state_store import get_state_store
+            get_state_store().replace_dui(self._dynamic_set)
+        except Exception:
+            pass
+        
         persistence_file = Path(EngineConfig.DUI_PERSISTENCE_FILE)
         with open(persistence_file, 'w') as f:
             json.dump(self._dynamic_set, f, indent=2)
@@ -87,14 +87,20 @@ OUTPUT: logs/convergence/latest_top9.json
 """
 
 import json
+import threading
+import time
 from datetime import datetime, timedelta, date
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from loguru import logger
 from collections import Counter
 import pytz
 
+from putsengine.codec import dump_file, load_file
+from putsengine.metrics import instrumented
+from putsengine.state_store import get_state_store, file_is_newer
+
 ET = pytz.timezone('US/Eastern')
 
 # ============================================================================
@@ -113,6 +119,10 @@ OUTPUT_DIR = Path("logs/convergence")
 OUTPUT_FILE = OUTPUT_DIR / "latest_top9.json"
 HISTORY_DIR = OUTPUT_DIR / "history"
 
+# Supplementary sources are only used while younger than these
+INTRADAY_MAX_AGE_SECONDS = 7200
+FINVIZ_MAX_AGE_SECONDS = 86400
+
 # ============================================================================
 # WEIGHTS — Institutional Microstructure Rationale (see docstring)
 # ============================================================================
@@ -243,14 +253,38 @@ class ConvergenceEngine:
         self._finviz_bearish: List = []        # Gap 5/6: FinViz sentiment
         self._short_interest: Dict = {}        # Gap 7: Short interest
         self._previous_top9: Dict[str, Dict] = {}  # v2: previous run data
+        self._intraday_ts: str = ""
+        self._finviz_ts: str = ""
+        
+        # Incremental state (kept between runs of the same instance):
+        # source versions last loaded, merged universe, scored candidates
+        self._source_versions: Dict[str, tuple] = {}
+        self._universe: Dict[str, Dict] = {}
+        self._scored: Dict[str, ConvergenceCandidate] = {}
+        self._score_context: Optional[tuple] = None
+        self.last_run_stats: Dict = {}
     
-    def run(self) -> Dict:
+    @instrumented("scanner", "convergence")
+    def run(self, force: bool = False) -> Dict:
         """
         Main entry point. Reads all 4 sources, merges, ranks, outputs Top 9.
         
+        Incremental: only sources whose version (file mtime/size, state
+        store write time) changed since this instance's previous run are
+        re-read; the universe is re-merged only if a source changed, and
+        only symbols whose merged inputs (or the shared staleness penalty)
+        changed are re-scored. A new instance, or ``force``, does the
+        full pass.
+        
         Returns the convergence report dict (also saved to JSON).
         """
         self.now = datetime.now(ET)
+        started = time.perf_counter()
+        if force:
+            self._source_versions = {}
+            self._universe = {}
+            self._scored = {}
+            self._score_context = None
         logger.info("=" * 70)
         logger.info("🎯 CONVERGENCE ENGINE v2.0 — Automated Decision Hierarchy")
         logger.info(f"Time: {self.now.strftime('%Y-%m-%d %H:%M:%S ET')}")
@@ -259,19 +293,13 @@ class ConvergenceEngine:
         
         try:
             # Step 0: Load previous run for trajectory comparison
+            self._previous_top9 = {}
             self._load_previous_top9()
             
-            # Step 1: Load all data sources (self-healing — tolerates missing data)
-            self._load_ews()
-            self._load_direction()
-            self._load_scan_results()
-            self._load_weather()
-            
-            # Step 1b: Load supplementary data sources (Gaps 5/6/7/12)
-            # These are optional — engine works without them, but they boost quality
-            self._load_intraday_alerts()     # Gap 12: Intraday momentum
-            self._load_finviz_bearish()       # Gap 5/6: Sentiment + macro
-            self._load_short_interest()       # Gap 7: Short interest
+            # Step 1: Load data sources that changed since the last run
+            # (self-healing — tolerates missing data). Supplementary sources
+            # (Gaps 5/6/7/12) are optional but boost quality.
+            changed_sources = self._reload_changed_sources()
             
             # Log source status
             available_count = sum(1 for s in self.source_statuses.values() if s.available)
@@ -286,14 +314,22 @@ class ConvergenceEngine:
                 return self._write_degraded("All 4 data sources unavailable")
             
             # Step 2: Build candidate universe (union of all tickers across all sources)
-            all_candidates = self._merge_candidates()
+            # Sector contagion and regime couple symbols, so the merge is
+            # redone as a whole - but only when some source changed.
+            if changed_sources or not self._universe:
+                all_candidates = self._merge_candidates()
+            else:
+                all_candidates = self._universe
             logger.info(f"Unique candidate tickers: {len(all_candidates)}")
             
-            # Step 3: Score each candidate
-            scored = self._score_candidates(all_candidates)
+            # Step 3: Score candidates whose inputs changed
+            rescored = self._update_scores(all_candidates)
+            self._universe = all_candidates
+            scored = list(self._scored.values())
             
             # Step 4: Rank and select Top 9 with sector diversity
-            top9 = self._select_top9_diverse(scored)
+            # (copies — permission/trajectory are per-run, the cache is not)
+            top9 = [replace(c) for c in self._select_top9_diverse(scored)]
             
             # Step 5: Assign permission lights
             for c in top9:
@@ -304,6 +340,13 @@ class ConvergenceEngine:
             
             # Step 7: Build and save report
             report = self._build_report(top9)
+            self.last_run_stats = {
+                "changed_sources": changed_sources,
+                "universe": len(all_candidates),
+                "rescored": rescored,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+            report["incremental"] = self.last_run_stats
             self._save_report(report)
             self._save_history(report)
             
@@ -339,6 +382,109 @@ class ConvergenceEngine:
             logger.error(traceback.format_exc())
             return self._write_degraded(str(e))
     
+    # ======================================================================
+    # INCREMENTAL STATE — source versions and per-symbol re-scoring
+    # ======================================================================
+    
+    def _source_versions_now(self) -> Dict[str, tuple]:
+        """
+        Cheap version stamp per source: (mtime_ns, size) of its file(s),
+        plus the state store write time for store-backed sources and the
+        freshness gate for the age-limited supplementary feeds.
+        """
+        def stat(*paths: Path) -> tuple:
+            stamps = []
+            for path in paths:
+                try:
+                    st = path.stat()
+                    stamps.append((st.st_mtime_ns, st.st_size))
+                except OSError:
+                    stamps.append(None)
+            return tuple(stamps)
+        
+        try:
+            store = get_state_store()
+            ews_recorded = store.latest_ews_recorded_at()
+            scan_recorded = store.latest_scan_recorded_at()
+        except Exception:
+            ews_recorded = scan_recorded = None
+        
+        return {
+            "ews": stat(EWS_FILE) + (ews_recorded,),
+            "direction": stat(DIRECTION_FILE),
+            "gamma": stat(SCAN_RESULTS_FILE) + (scan_recorded,),
+            "weather": stat(WEATHER_PM_FILE, WEATHER_AM_FILE),
+            "intraday": stat(INTRADAY_FILE) + (
+                bool(self._intraday_ts) and self._calc_age(self._intraday_ts) < INTRADAY_MAX_AGE_SECONDS,
+            ),
+            "finviz": stat(FINVIZ_BEARISH_FILE) + (
+                bool(self._finviz_ts) and self._calc_age(self._finviz_ts) < FINVIZ_MAX_AGE_SECONDS,
+            ),
+            "short_interest": stat(SHORT_INTEREST_FILE),
+        }
+    
+    def _reload_changed_sources(self) -> List[str]:
+        """Re-run the loaders of sources whose version changed; returns their names."""
+        loaders = {
+            "ews": self._load_ews,
+            "direction": self._load_direction,
+            "gamma": self._load_scan_results,
+            "weather": self._load_weather,
+            "intraday": self._load_intraday_alerts,     # Gap 12: Intraday momentum
+            "finviz": self._load_finviz_bearish,        # Gap 5/6: Sentiment + macro
+            "short_interest": self._load_short_interest,  # Gap 7: Short interest
+        }
+        versions = self._source_versions_now()
+        changed = [
+            name for name in loaders
+            if name not in self._source_versions or versions[name] != self._source_versions[name]
+        ]
+        for name in changed:
+            loaders[name]()
+        
+        # The loaders' own timestamps can flip a freshness gate; stamp after loading
+        self._source_versions = self._source_versions_now()
+        
+        # Unchanged sources keep their data but age with the clock
+        for key, status in self.source_statuses.items():
+            if key not in changed and status.timestamp:
+                status.age_seconds = self._calc_age(status.timestamp)
+                status.freshness = self._classify_freshness(status.age_seconds)
+        
+        if changed:
+            logger.info(f"Changed sources: {', '.join(changed)}")
+        return changed
+    
+    def _update_scores(self, universe: Dict[str, Dict]) -> int:
+        """
+        Re-score symbols whose merged inputs changed (all of them if the
+        source staleness penalty or data age changed) and drop symbols that
+        left the universe. Returns the number of symbols scored.
+        """
+        ages = [
+            s.age_seconds for k, s in self.source_statuses.items()
+            if k in ("ews", "direction", "gamma", "weather") and s.available
+        ]
+        context = (
+            tuple(sorted(self._compute_source_penalty().items())),
+            self._format_age(max(ages) if ages else 0),
+        )
+        if context != self._score_context:
+            dirty = universe
+        else:
+            dirty = {
+                sym: data for sym, data in universe.items()
+                if sym not in self._scored or self._universe.get(sym) != data
+            }
+        
+        for sym in list(self._scored):
+            if sym not in universe:
+                del self._scored[sym]
+        for c in self._score_candidates(dirty):
+            self._scored[c.symbol] = c
+        self._score_context = context
+        return len(dirty)
+    
     # ======================================================================
     # DATA LOADERS (self-healing — each handles its own errors)
     # ======================================================================
@@ -357,17 +503,37 @@ class ConvergenceEngine:
         except Exception as e:
             logger.debug(f"No previous run (first time or corrupt): {e}")
     
+    def _load_from_state_store(self, kind: str) -> Optional[Dict]:
+        """
+        Latest EWS run / scan from the state store, or None to read the JSON
+        file instead (store empty, unavailable, or the file is newer).
+        """
+        try:
+            store = get_state_store()
+            if kind == "ews":
+                recorded_at, path, loader = store.latest_ews_recorded_at(), EWS_FILE, store.latest_ews
+            else:
+                recorded_at, path, loader = store.latest_scan_recorded_at(), SCAN_RESULTS_FILE, store.latest_scan
+            if recorded_at is None or file_is_newer(path, recorded_at):
+                return None
+            return loader()
+        except Exception as e:
+            logger.debug(f"State store read failed for {kind}: {e}")
+            return None
+    
     def _load_ews(self):
         """Load Early Warning System alerts"""
+        self._ews_data = {}
         status = SourceStatus(name="Early Warning (EWS)")
         try:
-            if not EWS_FILE.exists():
-                status.error = "File not found"
-                self.source_statuses["ews"] = status
-                return
-            
-            with open(EWS_FILE) as f:
-                data = json.load(f)
+            data = self._load_from_state_store("ews")
+            if data is None:
+                if not EWS_FILE.exists():
+                    status.error = "File not found"
+                    self.source_statuses["ews"] = status
+                    return
+                
+                data = load_file(EWS_FILE)
             
             alerts = data.get("alerts", {})
             ts = data.get("timestamp", "")
@@ -388,6 +554,7 @@ class ConvergenceEngine:
     
     def _load_direction(self):
         """Load Market Direction analysis"""
+        self._direction_data = {}
         status = SourceStatus(name="Market Direction")
         try:
             if not DIRECTION_FILE.exists():
@@ -416,15 +583,17 @@ class ConvergenceEngine:
     
     def _load_scan_results(self):
         """Load Gamma Drain / Distribution / Liquidity scan results"""
+        self._scan_data = {}
         status = SourceStatus(name="Gamma Drain Engine")
         try:
-            if not SCAN_RESULTS_FILE.exists():
-                status.error = "File not found"
-                self.source_statuses["gamma"] = status
-                return
-            
-            with open(SCAN_RESULTS_FILE) as f:
-                data = json.load(f)
+            data = self._load_from_state_store("scans")
+            if data is None:
+                if not SCAN_RESULTS_FILE.exists():
+                    status.error = "File not found"
+                    self.source_statuses["gamma"] = status
+                    return
+                
+                data = load_file(SCAN_RESULTS_FILE)
             
             ts = data.get("last_scan", "")
             total = (
@@ -449,6 +618,7 @@ class ConvergenceEngine:
     
     def _load_weather(self):
         """Load Market Weather forecast (latest of AM/PM)"""
+        self._weather_data = {}
         status = SourceStatus(name="Weather Forecast")
         try:
             # Try PM first (most recent), then AM
@@ -497,6 +667,7 @@ class ConvergenceEngine:
         boost convergence scores. A stock dropping 3%+ intraday with
         EWS footprints is very high conviction.
         """
+        self._intraday_data = []
         try:
             if not INTRADAY_FILE.exists():
                 return
@@ -504,9 +675,10 @@ class ConvergenceEngine:
                 data = json.load(f)
             alerts = data.get("alerts", data if isinstance(data, list) else [])
             ts = data.get("timestamp", "") if isinstance(data, dict) else ""
+            self._intraday_ts = ts
             age = self._calc_age(ts) if ts else 99999
             # Only use intraday data if fresh (< 2 hours old)
-            if age < 7200:
+            if age < INTRADAY_MAX_AGE_SECONDS:
                 self._intraday_data = alerts
                 logger.debug(f"Intraday alerts loaded: {len(alerts)} movers")
             else:
@@ -526,6 +698,7 @@ class ConvergenceEngine:
         
         Macro events are captured via FinViz news sentiment scoring.
         """
+        self._finviz_bearish = []
         try:
             if not FINVIZ_BEARISH_FILE.exists():
                 return
@@ -533,9 +706,10 @@ class ConvergenceEngine:
                 data = json.load(f)
             candidates = data.get("candidates", [])
             ts = data.get("timestamp", "")
+            self._finviz_ts = ts
             age = self._calc_age(ts) if ts else 99999
             # FinViz data is daily — accept up to 24 hours
-            if age < 86400:
+            if age < FINVIZ_MAX_AGE_SECONDS:
                 self._finviz_bearish = candidates
                 logger.debug(f"FinViz bearish loaded: {len(candidates)} candidates")
         except Exception as e:
@@ -552,6 +726,7 @@ class ConvergenceEngine:
         - With bearish signals → cascade risk (shorts pile on)
         - Without bearish signals → squeeze risk (avoid)
         """
+        self._short_interest = {}
         try:
             if not SHORT_INTEREST_FILE.exists():
                 return
@@ -1877,8 +2052,7 @@ class ConvergenceEngine:
     def _save_report(self, report: Dict):
         """Save report to JSON file"""
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_FILE, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        dump_file(report, OUTPUT_FILE)
         logger.info(f"Convergence report saved to {OUTPUT_FILE}")
     
     def _save_history(self, report: Dict):
@@ -2049,8 +2223,7 @@ class ConvergenceEngine:
             if len(ledger) > 500:
                 ledger = ledger[-500:]
             
-            with open(BACKTEST_FILE, "w") as f:
-                json.dump(ledger, f, indent=2, default=str)
+            dump_file(ledger, BACKTEST_FILE)
             
             logger.debug(f"Backtest ledger: recorded {len(top9)} picks (total entries: {len(ledger)})")
             
@@ -2122,14 +2295,36 @@ class ConvergenceEngine:
             logger.debug(f"EWS→DUI injection skipped: {e}")
 
 
-def run_convergence() -> Dict:
+_engine: Optional[ConvergenceEngine] = None
+_engine_lock = threading.Lock()
+_run_lock = threading.Lock()   # Incremental runs come from several threads (job graph, cron, daily report)
+
+
+def get_convergence_engine() -> ConvergenceEngine:
+    """Process-wide engine whose scored universe persists between runs."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = ConvergenceEngine()
+        return _engine
+
+
+def run_convergence(incremental: bool = False) -> Dict:
     """
     Convenience function to run the convergence engine.
-    Called by scheduler every 30 minutes and after each EWS scan.
+    Called by scheduler every 30 minutes and after each upstream job.
     Zero API calls — reads only from cached JSON files.
+    
+    Args:
+        incremental: Reuse the process-wide engine, so only changed
+            sources and symbols are recomputed (scheduler). False runs a
+            fresh engine (CLI, one-off callers).
     """
-    engine = ConvergenceEngine()
-    return engine.run()
+    if not incremental:
+        return ConvergenceEngine().run()
+    engine = get_convergence_engine()
+    with _run_lock:
+        return engine.run()
 
 
 if __name__ == "__main__":
@@ -68,6 +68,26 @@ def load_scheduled_scan_results() -> Optional[Dict]:
         pass
     return None
 
+
+SCAN_PROGRESS_FILE = Path(__file__).parent.parent / "scan_progress.json"
+
+
+def load_scan_progress() -> Optional[Dict]:
+    """Partial candidates of the scan the scheduler is running now, if any."""
+    try:
+        if SCAN_PROGRESS_FILE.exists():
+            with open(SCAN_PROGRESS_FILE, 'r') as f:
+                data = json.load(f)
+            if not data.get('scan_in_progress'):
+                return None
+            # Ignore a file left behind by a scheduler that died mid-scan
+            updated_at = datetime.fromisoformat(data['updated_at'])
+            if (datetime.now(pytz.UTC) - updated_at).total_seconds() < 5 * 60:
+                return data
+    except Exception:
+        pass
+    return None
+
 # ============================================================================
 # AUTO-REFRESH CONFIGURATION - 30 MINUTES (FULLY AUTOMATIC)
 # ============================================================================
@@ -876,6 +896,22 @@ def render_engine_tab(engine, engine_name, engine_key, engine_type, results_key)
             else:
                 st.warning(f"⚠️ **No Active Signals** (scanned {total_scanned} tickers) | Week of {next_week} | Next live scan when market opens")
     
+    # Scan in flight: show its candidates so far next to the last complete scan
+    progress = load_scan_progress()
+    if progress:
+        partial = progress.get(engine_key, [])
+        st.info(
+            f"⏳ **Scan in progress** ({progress.get('scan_type', 'scan')}) | "
+            f"{progress.get('tickers_scanned', 0)} tickers done | "
+            f"{len(partial)} {engine_name} candidates so far"
+        )
+        if partial:
+            with st.expander(f"Partial {engine_name} results (scan in progress)"):
+                render_puts_table(
+                    format_validated_candidates(partial, engine_type),
+                    f"{engine_name} PUT Candidates (partial)"
+                )
+    
     # ALWAYS display the validated data from JSON FIRST (no waiting)
     # This ensures data shows immediately while any scans run in background
     display_results = validated_results
@@ -958,7 +994,6 @@ def render_early_warning_tab():
     
     # Load early warning data
     early_warning_file = Path(__file__).parent.parent / "early_warning_alerts.json"
-    footprint_history_file = Path(__file__).parent.parent / "footprint_history.json"
     
     early_warning_data = None
     if early_warning_file.exists():
@@ -972,18 +1007,16 @@ def render_early_warning_tab():
         st.error("⚠️ Early warning data not yet available. Scans run at 8 AM, 10 AM, 12 PM, 2:30 PM, 4:30 PM, and 10 PM ET.")
         
         # Check if there's any footprint history
-        if footprint_history_file.exists():
-            try:
-                with open(footprint_history_file, 'r') as f:
-                    history = json.load(f)
-                if history:
-                    st.markdown("### 📜 Recent Footprint History")
-                    recent_symbols = sorted(history.keys(), key=lambda x: len(history[x]), reverse=True)[:10]
-                    for symbol in recent_symbols:
-                        footprints = history[symbol]
-                        st.markdown(f"**{symbol}**: {len(footprints)} footprints detected")
-            except Exception:
-                pass
+        try:
+            from putsengine.footprint_store import get_footprint_store
+            counts = get_footprint_store().counts()
+            if counts:
+                st.markdown("### 📜 Recent Footprint History")
+                recent_symbols = sorted(counts, key=counts.get, reverse=True)[:10]
+                for symbol in recent_symbols:
+                    st.markdown(f"**{symbol}**: {counts[symbol]} footprints detected")
+        except Exception:
+            pass
         return
     
     # ===== DATA FRESHNESS INDICATOR =====
@@ -42,7 +42,6 @@ MARKET_DIRECTION_FILE = _PROJECT_ROOT / "logs" / "market_direction.json"
 SCAN_RESULTS_FILE = _PROJECT_ROOT / "scan_results.json"
 PATTERN_SCAN_FILE = _PROJECT_ROOT / "pattern_scan_results.json"
 EARLY_WARNING_FILE = _PROJECT_ROOT / "early_warning_alerts.json"  # Same as main dashboard
-FOOTPRINT_HISTORY_FILE = _PROJECT_ROOT / "footprint_history.json"
 SCAN_HISTORY_FILE = _PROJECT_ROOT / "scan_history.json"  # For 48-hour frequency
 BIG_MOVERS_FILE = _PROJECT_ROOT / "big_movers_analysis.json"  # Big movers patterns
 
@@ -314,23 +313,24 @@ def load_early_warning_picks() -> List[Dict]:
     """Load picks from Early Warning System - same source as main dashboard."""
     if not EARLY_WARNING_FILE.exists():
         # Try footprint history as fallback
-        if FOOTPRINT_HISTORY_FILE.exists():
-            try:
-                with open(FOOTPRINT_HISTORY_FILE, 'r') as f:
-                    history = json.load(f)
-                picks = []
-                for symbol, footprints in history.items():
-                    if isinstance(footprints, list) and len(footprints) > 0:
-                        picks.append({
-                            "symbol": symbol,
-                            "score": len(footprints) * 0.15,  # Approximate IPI
-                            "level": "WATCH" if len(footprints) < 3 else "PREPARE" if len(footprints) < 5 else "ACT",
-                            "footprints": len(footprints),
-                            "signals": [fp.get("type", "") for fp in footprints[:3]] if isinstance(footprints[0], dict) else []
-                        })
-                return sorted(picks, key=lambda x: x.get("score", 0), reverse=True)[:15]
-            except:
-                pass
+        try:
+            from putsengine.footprint_store import get_footprint_store
+            store = get_footprint_store()
+            counts = store.counts()
+            top = sorted(counts, key=counts.get, reverse=True)[:15]
+            picks = []
+            for symbol in top:
+                count = counts[symbol]
+                picks.append({
+                    "symbol": symbol,
+                    "score": count * 0.15,  # Approximate IPI
+                    "level": "WATCH" if count < 3 else "PREPARE" if count < 5 else "ACT",
+                    "footprints": count,
+                    "signals": [fp.get("footprint_type", "") for fp in store.query(symbol)[:3]]
+                })
+            return picks
+        except Exception:
+            pass
         return []
     
     try:
@@ -61,10 +61,25 @@ Each footprint contributes to an "Institutional Pressure Index" (IPI):
 
 The key is ACCUMULATION over 2-3 days. Single-day signals are noise.
 Multi-day convergence is signal.
+
+CONCURRENCY:
+============
+- ``run_early_warning_scan`` scans up to ``EWS_CONCURRENCY`` symbols at
+  once. UW pacing is left to the provider gateway. There is no fixed
+  sleep.
+- ``scan_symbol`` runs all of its footprint detectors together with
+  ``asyncio.gather``.
+- Each scanner fetches a symbol's daily bars once (a 10-day window, memoized
+  for the scan). Every detector slices that window. Sector ETF, SPY and peer
+  bars are fetched once per scan and shared by all symbols.
+- REFRESH scans (``full_scan=False``) re-check the tickers chosen by
+  ``refresh_planner``. Those are the ones whose Polygon snapshot moved most
+  since their last scan, plus any that have gone stale, up to what the UW
+  budget allows. Every scan, FULL or REFRESH, records the IPI and snapshot
+  of the tickers it covered as their baseline for the next plan.
 """
 
 import asyncio
-import json
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
@@ -73,6 +88,18 @@ from pathlib import Path
 import numpy as np
 from loguru import logger
 
+from putsengine.api_budget import get_budget_manager
+from putsengine.bars import as_bar_array
+from putsengine.flash_alerts import get_ipi_tracker, observe_pressure
+from putsengine.footprint_store import get_footprint_store
+from putsengine.metrics import instrumented
+from putsengine.refresh_planner import (
+    MAX_REFRESH_SYMBOLS,
+    fetch_snapshot_features,
+    plan_refresh,
+    record_scanned,
+)
+
 
 class FootprintType(Enum):
     """The 8 institutional footprints."""
@@ -140,55 +167,26 @@ class InstitutionalPressure:
 # FOOTPRINT HISTORY STORAGE
 # ============================================================================
 
-FOOTPRINT_HISTORY_FILE = Path(__file__).parent.parent / "footprint_history.json"
+FOOTPRINT_HISTORY_FILE = Path(__file__).parent.parent / "footprint_history.json"  # Legacy, migrated on first use
 
 
 def load_footprint_history() -> Dict[str, List[Dict]]:
-    """Load footprint history from file."""
-    if not FOOTPRINT_HISTORY_FILE.exists():
-        return {}
+    """Load footprint history grouped by symbol (prefer FootprintStore.query for one symbol)."""
     try:
-        with open(FOOTPRINT_HISTORY_FILE, 'r') as f:
-            return json.load(f)
+        return get_footprint_store().history()
     except Exception as e:
         logger.warning(f"Could not load footprint history: {e}")
         return {}
 
 
-def save_footprint_history(history: Dict[str, List[Dict]]):
-    """Save footprint history to file."""
-    try:
-        # Prune old entries (keep last 5 days)
-        cutoff = (datetime.now() - timedelta(days=5)).isoformat()
-        for symbol in list(history.keys()):
-            history[symbol] = [
-                f for f in history[symbol]
-                if f.get("timestamp", "") > cutoff
-            ]
-            if not history[symbol]:
-                del history[symbol]
-        
-        with open(FOOTPRINT_HISTORY_FILE, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
-    except Exception as e:
-        logger.warning(f"Could not save footprint history: {e}")
-
-
 def add_footprint_to_history(symbol: str, footprint: FootprintSignal):
-    """Add a footprint to history."""
-    history = load_footprint_history()
-    
-    if symbol not in history:
-        history[symbol] = []
-    
-    history[symbol].append({
+    """Add a footprint to history (single append, no rewrite)."""
+    get_footprint_store().append(symbol, {
         "footprint_type": footprint.footprint_type.value,
         "timestamp": footprint.timestamp.isoformat(),
         "strength": footprint.strength,
         "details": footprint.details,
     })
-    
-    save_footprint_history(history)
 
 
 # ============================================================================
@@ -219,6 +217,9 @@ class EarlyWarningScanner:
     # λ = 0.03 gives half-life of ~23 hours
     DECAY_LAMBDA = 0.03
     
+    # Daily bars: one fetch per symbol per scan, sliced by each detector
+    DAILY_WINDOW_DAYS = 10
+    
     def __init__(self, alpaca_client, polygon_client, uw_client):
         """
         Initialize early warning scanner.
@@ -231,6 +232,31 @@ class EarlyWarningScanner:
         self.alpaca = alpaca_client
         self.polygon = polygon_client
         self.uw = uw_client
+        # symbol -> in-flight/finished daily-bar fetch; a scanner lives for one scan
+        self._daily_bars_memo: Dict[str, asyncio.Task] = {}
+    
+    async def _daily_bars(self, symbol: str, days: int):
+        """
+        Daily bars since ``days`` ago, cut from one memoized
+        ``DAILY_WINDOW_DAYS`` fetch per symbol. Concurrent callers (a
+        sector ETF or SPY wanted by many symbols) share that fetch.
+        """
+        task = self._daily_bars_memo.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self.polygon.get_daily_bars(
+                symbol=symbol,
+                from_date=date.today() - timedelta(days=self.DAILY_WINDOW_DAYS),
+            ))
+            self._daily_bars_memo[symbol] = task
+        try:
+            bars = await asyncio.shield(task)
+        except Exception:
+            if self._daily_bars_memo.get(symbol) is task:
+                del self._daily_bars_memo[symbol]   # Let the next caller retry
+            raise
+        if not bars:
+            return bars
+        return as_bar_array(bars).since(date.today() - timedelta(days=days))
     
     async def scan_symbol(self, symbol: str, full_scan: bool = True) -> InstitutionalPressure:
         """
@@ -250,64 +276,34 @@ class EarlyWarningScanner:
         """
         logger.info(f"Early Warning Scan: {symbol}" + (" [REFRESH]" if not full_scan else ""))
         
-        # Detect current footprints
-        current_footprints = []
+        # Detect current footprints (all detectors in flight together;
+        # each handles its own errors and returns None on failure)
+        detectors = []
         
         # ---- UW-DEPENDENT FOOTPRINTS (only in FULL mode) ----
         if full_scan and self.uw is not None:
-            # Footprint 1: Dark Pool Sequence (UW)
-            dp_footprint = await self._detect_dark_pool_sequence(symbol)
-            if dp_footprint:
-                current_footprints.append(dp_footprint)
-                add_footprint_to_history(symbol, dp_footprint)
-            
-            # Footprint 2: Put OI Accumulation (UW + Polygon)
-            poi_footprint = await self._detect_put_oi_accumulation(symbol)
-            if poi_footprint:
-                current_footprints.append(poi_footprint)
-                add_footprint_to_history(symbol, poi_footprint)
-            
-            # Footprint 3: IV Term Structure Inversion (UW)
-            iv_footprint = await self._detect_iv_term_inversion(symbol)
-            if iv_footprint:
-                current_footprints.append(iv_footprint)
-                add_footprint_to_history(symbol, iv_footprint)
-            
-            # Footprint 5: Options Flow Divergence (UW + Polygon)
-            flow_footprint = await self._detect_flow_divergence(symbol)
-            if flow_footprint:
-                current_footprints.append(flow_footprint)
-                add_footprint_to_history(symbol, flow_footprint)
-            
-            # Footprint 8: Net Premium Flow (UW net-prem-ticks) — Best institutional flow signal
-            net_prem_footprint = await self._detect_net_premium_flow(symbol)
-            if net_prem_footprint:
-                current_footprints.append(net_prem_footprint)
-                add_footprint_to_history(symbol, net_prem_footprint)
+            detectors += [
+                self._detect_dark_pool_sequence,     # 1: Dark Pool Sequence (UW)
+                self._detect_put_oi_accumulation,    # 2: Put OI Accumulation (UW + Polygon)
+                self._detect_iv_term_inversion,      # 3: IV Term Structure Inversion (UW)
+                self._detect_flow_divergence,        # 5: Options Flow Divergence (UW + Polygon)
+                self._detect_net_premium_flow,       # 8: Net Premium Flow (UW net-prem-ticks)
+            ]
         
         # ---- NON-UW FOOTPRINTS (run in both FULL and REFRESH modes) ----
+        detectors += [
+            self._detect_quote_degradation,          # 4: Quote Quality Degradation (Alpaca)
+            self._detect_multi_day_distribution,     # 6: Multi-Day Distribution Pattern (Polygon)
+            self._detect_cross_asset_divergence,     # 7: Cross-Asset Divergence (Polygon)
+        ]
         
-        # Footprint 4: Quote Quality Degradation (Alpaca)
-        quote_footprint = await self._detect_quote_degradation(symbol)
-        if quote_footprint:
-            current_footprints.append(quote_footprint)
-            add_footprint_to_history(symbol, quote_footprint)
-        
-        # Footprint 6: Multi-Day Distribution Pattern (Polygon)
-        dist_footprint = await self._detect_multi_day_distribution(symbol)
-        if dist_footprint:
-            current_footprints.append(dist_footprint)
-            add_footprint_to_history(symbol, dist_footprint)
-        
-        # Footprint 7: Cross-Asset Divergence (Polygon)
-        cross_footprint = await self._detect_cross_asset_divergence(symbol)
-        if cross_footprint:
-            current_footprints.append(cross_footprint)
-            add_footprint_to_history(symbol, cross_footprint)
+        found = await asyncio.gather(*(detect(symbol) for detect in detectors))
+        current_footprints = [fp for fp in found if fp]
+        for footprint in current_footprints:
+            add_footprint_to_history(symbol, footprint)
         
         # Load historical footprints and combine
-        history = load_footprint_history()
-        historical = history.get(symbol, [])
+        historical = get_footprint_store().query(symbol)
         
         # Convert historical to FootprintSignal objects
         all_footprints = current_footprints.copy()
@@ -531,10 +527,7 @@ class EarlyWarningScanner:
             if put_oi_change_pct >= 30:
                 # Check if price has NOT dropped significantly (stealth)
                 try:
-                    bars = await self.polygon.get_daily_bars(
-                        symbol=symbol,
-                        from_date=date.today() - timedelta(days=5)
-                    )
+                    bars = await self._daily_bars(symbol, 5)
                     if bars and len(bars) >= 3:
                         price_change = (bars[-1].close - bars[-3].close) / bars[-3].close
                         
@@ -710,10 +703,7 @@ class EarlyWarningScanner:
             if put_ratio > 0.60:
                 # Check if price is NOT dropping (divergence)
                 try:
-                    bars = await self.polygon.get_daily_bars(
-                        symbol=symbol,
-                        from_date=date.today() - timedelta(days=3)
-                    )
+                    bars = await self._daily_bars(symbol, 3)
                     if bars and len(bars) >= 2:
                         price_change = (bars[-1].close - bars[-2].close) / bars[-2].close
                         
@@ -827,10 +817,7 @@ class EarlyWarningScanner:
         - Price failing to make new highs
         """
         try:
-            bars = await self.polygon.get_daily_bars(
-                symbol=symbol,
-                from_date=date.today() - timedelta(days=10)
-            )
+            bars = await self._daily_bars(symbol, 10)
             
             if not bars or len(bars) < 5:
                 return None
@@ -983,10 +970,7 @@ class EarlyWarningScanner:
             from putsengine.config import EngineConfig
             
             # Get symbol's price change (last 3 days)
-            symbol_bars = await self.polygon.get_daily_bars(
-                symbol=symbol,
-                from_date=date.today() - timedelta(days=5)
-            )
+            symbol_bars = await self._daily_bars(symbol, 5)
             
             if not symbol_bars or len(symbol_bars) < 2:
                 return None
@@ -1005,10 +989,7 @@ class EarlyWarningScanner:
                 etf = self.SECTOR_ETF_MAP.get(sector)
                 if etf:
                     try:
-                        etf_bars = await self.polygon.get_daily_bars(
-                            symbol=etf,
-                            from_date=date.today() - timedelta(days=5)
-                        )
+                        etf_bars = await self._daily_bars(etf, 5)
                         if etf_bars and len(etf_bars) >= 2:
                             etf_change = (etf_bars[-1].close - etf_bars[-2].close) / etf_bars[-2].close
                             details["sector_etf"] = etf
@@ -1029,10 +1010,7 @@ class EarlyWarningScanner:
             
             # ── Method 2: SPY relative weakness ──
             try:
-                spy_bars = await self.polygon.get_daily_bars(
-                    symbol="SPY",
-                    from_date=date.today() - timedelta(days=5)
-                )
+                spy_bars = await self._daily_bars("SPY", 5)
                 if spy_bars and len(spy_bars) >= 2:
                     spy_change = (spy_bars[-1].close - spy_bars[-2].close) / spy_bars[-2].close
                     details["spy_change_pct"] = round(spy_change * 100, 2)
@@ -1048,17 +1026,15 @@ class EarlyWarningScanner:
             peers = EngineConfig.get_sector_peers(symbol)
             if peers and len(peers) >= 2:
                 peer_changes = []
-                for peer in peers[:5]:
-                    try:
-                        peer_bars = await self.polygon.get_daily_bars(
-                            symbol=peer,
-                            from_date=date.today() - timedelta(days=3)
-                        )
-                        if peer_bars and len(peer_bars) >= 2:
-                            change = (peer_bars[-1].close - peer_bars[-2].close) / peer_bars[-2].close
-                            peer_changes.append(change)
-                    except Exception:
+                fetched = await asyncio.gather(
+                    *(self._daily_bars(peer, 3) for peer in peers[:5]), return_exceptions=True
+                )
+                for peer_bars in fetched:
+                    if isinstance(peer_bars, Exception):
                         continue
+                    if peer_bars and len(peer_bars) >= 2:
+                        change = (peer_bars[-1].close - peer_bars[-2].close) / peer_bars[-2].close
+                        peer_changes.append(change)
                 
                 if peer_changes:
                     avg_peer_change = np.mean(peer_changes)
@@ -1095,81 +1071,38 @@ class EarlyWarningScanner:
 # INTEGRATION WITH SCHEDULER
 # ============================================================================
 
-# ============================================================================
-# LAST SCAN RESULTS CACHE (for smart refresh)
-# ============================================================================
-_LAST_EWS_RESULTS_FILE = Path(__file__).parent.parent / "logs" / "ews_last_results.json"
-
-
-def _save_last_ews_results(results: Dict[str, InstitutionalPressure]):
-    """Save last EWS results for smart refresh."""
-    try:
-        _LAST_EWS_RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            symbol: {
-                "ipi": p.ipi,
-                "level": p.level.value,
-                "unique_footprints": p.unique_footprints,
-                "timestamp": datetime.now().isoformat(),
-            }
-            for symbol, p in results.items()
-        }
-        with open(_LAST_EWS_RESULTS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        logger.warning(f"Could not save EWS results cache: {e}")
-
-
-def _load_last_ews_results() -> Dict[str, Dict]:
-    """Load last EWS results for smart refresh."""
-    try:
-        if _LAST_EWS_RESULTS_FILE.exists():
-            with open(_LAST_EWS_RESULTS_FILE, 'r') as f:
-                return json.load(f)
-    except Exception as e:
-        logger.warning(f"Could not load EWS results cache: {e}")
-    return {}
-
-
-def get_refresh_tickers(all_symbols: List[str], sample_size: int = 50) -> List[str]:
+async def get_refresh_tickers(
+    all_symbols: List[str],
+    polygon=None,
+    max_symbols: int = MAX_REFRESH_SYMBOLS,
+    features: Optional[Dict[str, Dict[str, float]]] = None,
+) -> List[str]:
     """
     Get tickers for a REFRESH scan (not full scan).
     
-    Strategy:
-    - All tickers with IPI > 0.2 from last scan (high priority re-check)
-    - Random sample of remaining tickers (discover new signals)
+    Strategy (see refresh_planner):
     - Index ETFs always included
+    - Tickers never scanned, or not for STALENESS_FLOOR_MINUTES
+    - Then the largest expected information gain since the last scan:
+      price move, volume pace and spread widening from one bulk Polygon
+      snapshot, plus the previous IPI
+    - K is capped by the APIBudgetManager's remaining window
     
-    Returns: List of tickers to scan (~80-120 tickers vs full 361)
+    Returns: List of tickers to scan, most informative first
     """
-    import random
-    
-    last_results = _load_last_ews_results()
-    
-    # Always include high-IPI tickers from last scan
-    high_ipi_tickers = [sym for sym, data in last_results.items() if data.get("ipi", 0) > 0.2]
-    
-    # Always include index ETFs
-    index_etfs = {"SPY", "QQQ", "IWM", "DIA"}
-    
-    # Random sample of remaining tickers
-    remaining = [s for s in all_symbols if s not in high_ipi_tickers and s not in index_etfs]
-    sample = random.sample(remaining, min(sample_size, len(remaining)))
-    
-    refresh_set = list(set(high_ipi_tickers) | index_etfs | set(sample))
-    
-    logger.info(
-        f"EWS REFRESH mode: {len(high_ipi_tickers)} high-IPI + "
-        f"{len(index_etfs)} index + {len(sample)} random sample = "
-        f"{len(refresh_set)} tickers (vs {len(all_symbols)} full)"
-    )
-    
-    return refresh_set
+    if features is None:
+        features = await fetch_snapshot_features(polygon, all_symbols) if polygon else {}
+    return plan_refresh(all_symbols, features, budget=get_budget_manager(), max_symbols=max_symbols)
+
 
+EWS_CONCURRENCY = 8   # Symbols in flight; UW pacing is the gateway's job
 
+
+@instrumented("scanner", "early_warning")
 async def run_early_warning_scan(
     alpaca, polygon, uw, symbols: List[str], 
-    full_scan: bool = True
+    full_scan: bool = True,
+    concurrency: int = EWS_CONCURRENCY,
 ) -> Dict[str, InstitutionalPressure]:
     """
     Run early warning scan on a list of symbols.
@@ -1179,7 +1112,10 @@ async def run_early_warning_scan(
         polygon: PolygonClient
         uw: UnusualWhalesClient
         symbols: List of tickers to scan
-        full_scan: If True, scan ALL symbols. If False, only scan high-IPI + sample.
+        full_scan: If True, scan ALL symbols. If False, only the tickers
+            that changed most since their last scan (get_refresh_tickers).
+        concurrency: Symbols scanned at once (footprints within a symbol
+            are concurrent too)
         
     Returns:
         Dict of symbol -> InstitutionalPressure for symbols with IPI > 0.3
@@ -1187,40 +1123,60 @@ async def run_early_warning_scan(
     scanner = EarlyWarningScanner(alpaca, polygon, uw)
     results = {}
     
+    # One bulk snapshot: the REFRESH pre-pass and the baseline for the next one
+    features = await fetch_snapshot_features(polygon, symbols) if polygon else {}
+    
     # Determine which tickers to scan
     if full_scan:
         scan_symbols = symbols
         scan_mode = "FULL"
     else:
-        scan_symbols = get_refresh_tickers(symbols)
+        scan_symbols = await get_refresh_tickers(symbols, features=features)
         scan_mode = "REFRESH"
     
     uw_calls_made = 0
     uw_calls_skipped = 0
+    scanned = 0
+    ipi_by_symbol: Dict[str, float] = {}
+    semaphore = asyncio.Semaphore(max(1, concurrency))
     
-    logger.info(f"Early Warning System [{scan_mode}]: Scanning {len(scan_symbols)} symbols...")
+    logger.info(
+        f"Early Warning System [{scan_mode}]: Scanning {len(scan_symbols)} symbols "
+        f"({concurrency} concurrent)..."
+    )
     
-    for i, symbol in enumerate(scan_symbols):
+    async def scan_one(symbol: str) -> None:
+        nonlocal scanned, uw_calls_made
         try:
-            pressure = await scanner.scan_symbol(symbol)
-            
-            if pressure.ipi > 0.3:  # Only track significant pressure
-                results[symbol] = pressure
-            
-            # Count UW calls (4 UW methods per ticker, some may be skipped by budget)
-            # We track this via the budget manager
-            uw_calls_made += 4  # Approximate (actual may be fewer if budget-blocked)
-            
-            # Rate limiting
-            if (i + 1) % 10 == 0:
-                logger.info(
-                    f"Early Warning [{scan_mode}]: {i+1}/{len(scan_symbols)} scanned, "
-                    f"{len(results)} with pressure"
-                )
-                await asyncio.sleep(0.5)
-                
+            async with semaphore:
+                pressure = await scanner.scan_symbol(symbol)
         except Exception as e:
             logger.debug(f"Early warning scan failed for {symbol}: {e}")
+            return
+        
+        # Flash alerts fire now, not after the scan's files are written
+        try:
+            observe_pressure(symbol, pressure)
+        except Exception as e:
+            logger.debug(f"IPI tracking failed for {symbol}: {e}")
+        
+        ipi_by_symbol[symbol] = pressure.ipi
+        if pressure.ipi > 0.3:  # Only track significant pressure
+            results[symbol] = pressure
+        
+        # Count UW calls (4 UW methods per ticker, some may be skipped by budget)
+        # We track this via the budget manager
+        uw_calls_made += 4  # Approximate (actual may be fewer if budget-blocked)
+        
+        scanned += 1
+        if scanned % 10 == 0:
+            logger.info(
+                f"Early Warning [{scan_mode}]: {scanned}/{len(scan_symbols)} scanned, "
+                f"{len(results)} with pressure"
+            )
+    
+    # Rate limiting: the provider gateway paces UW/Polygon/Alpaca calls
+    await asyncio.gather(*(scan_one(symbol) for symbol in scan_symbols))
     
     # Sort by IPI
     sorted_results = dict(sorted(
@@ -1229,8 +1185,9 @@ async def run_early_warning_scan(
         reverse=True
     ))
     
-    # Save results for smart refresh
-    _save_last_ews_results(sorted_results)
+    # Baselines the next REFRESH scan plans against (FULL scans included)
+    record_scanned(features, ipi_by_symbol)
+    get_ipi_tracker().flush()
     
     logger.info(
         f"Early Warning [{scan_mode}] Complete: "
@@ -1248,16 +1205,14 @@ def get_early_warning_summary() -> Dict:
     Returns:
         Dict with summary statistics and top alerts
     """
-    history = load_footprint_history()
-    
     now = datetime.now()
     cutoff_48h = (now - timedelta(hours=48)).isoformat()
+    history = get_footprint_store().history(since=cutoff_48h)
     
     # Count symbols with recent footprints
     active_symbols = {}
     
-    for symbol, footprints in history.items():
-        recent = [f for f in footprints if f.get("timestamp", "") > cutoff_48h]
+    for symbol, recent in history.items():
         if recent:
             # Count unique footprint types
             unique_types = len(set(f["footprint_type"] for f in recent))
@@ -27,6 +27,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Set
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 from enum import Enum
 import json
@@ -374,6 +375,7 @@ class EarningsCalendar:
         return result
 
 
+@instrumented("scanner", "earnings_check")
 async def run_earnings_check(uw_client, universe: Set[str] = None) -> Dict:
     """
     Run daily earnings calendar check.
@@ -32,6 +32,7 @@ from dataclasses import dataclass
 from enum import Enum
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 import json
 from pathlib import Path
 
@@ -459,6 +460,7 @@ class EarningsPriorityScanner:
         return injected
 
 
+@instrumented("scanner", "earnings_priority")
 async def run_earnings_priority_scan(uw_client, price_client) -> Dict:
     """
     Run earnings priority scan (scheduled job wrapper).
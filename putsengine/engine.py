@@ -43,8 +43,14 @@ from putsengine.layers.distribution import DistributionLayer
 from putsengine.layers.liquidity import LiquidityVacuumLayer
 from putsengine.layers.acceleration import AccelerationWindowLayer
 from putsengine.layers.dealer import DealerPositioningLayer
+from putsengine.layers.context import SymbolContext
+from putsengine.market_datasets import MarketDatasets
+from putsengine.screening import UniverseSnapshot, screen
 from putsengine.scoring.scorer import PutScorer
 from putsengine.scoring.strike_selector import StrikeSelector
+from putsengine.utils.cache import enable_persistent_caches
+from putsengine.utils.persistent_cache import get_persistent_cache
+from putsengine.bar_store import get_minute_bar_store
 
 
 class PutsEngine:
@@ -66,9 +72,14 @@ class PutsEngine:
         self.settings = settings or get_settings()
         self.config = EngineConfig
 
+        # Share cached responses with the daemon / other processes (opt-in)
+        enable_persistent_caches(get_persistent_cache(self.settings))
+
         # Initialize API clients
         self.alpaca = AlpacaClient(self.settings)
         self.polygon = PolygonClient(self.settings)
+        if self.settings.minute_store_enabled:
+            self.polygon.enable_minute_store(get_minute_bar_store(self.polygon, self.settings))
         self.unusual_whales = UnusualWhalesClient(self.settings)
         
         # FinViz client (optional - for technical screening enhancement)
@@ -108,6 +119,10 @@ class PutsEngine:
         self._cached_regime: Optional[MarketRegimeData] = None
         self._regime_cache_time: Optional[datetime] = None
         self._regime_cache_ttl = 300  # 5 minutes cache
+
+        # Market-wide UW feeds (congress, SPY greeks) shared by every symbol
+        self._market_datasets: Optional[MarketDatasets] = None
+        self._market_datasets_ttl = 300  # 5 minutes cache
         
         # File-based caching for market regime (persists across dashboard reloads)
         self._regime_cache_file = Path(__file__).parent.parent / "market_regime_cache.json"
@@ -363,12 +378,39 @@ class PutsEngine:
         Build initial shortlist from universe.
 
         Filters for:
-        - Overextended stocks (RSI > 70 or recent run-up)
+        - Down on the day
         - Below VWAP
         - Elevated volume
 
+        With ``shortlist_bulk_snapshot`` (default) the whole universe is
+        screened from one full-market snapshot and the top 15 by screen
+        score are returned; otherwise (or if the bulk snapshot fails)
+        tickers are screened one snapshot at a time.
+
         Returns max 15 names.
         """
+        if self.settings.shortlist_bulk_snapshot:
+            try:
+                tickers = await self.polygon.get_all_tickers_snapshot()
+                if tickers:
+                    snapshot = UniverseSnapshot.from_tickers(tickers, universe)
+                    results = screen(snapshot, limit=15)
+                    logger.info(
+                        f"Bulk screen: {len(snapshot)} of {len(universe)} symbols with day data, "
+                        f"{len(results)} shortlisted"
+                    )
+                    return [r.symbol for r in results]
+                logger.warning("Bulk snapshot empty, screening per symbol")
+            except Exception as e:
+                logger.warning(f"Bulk snapshot failed ({e}), screening per symbol")
+
+        return await self._build_shortlist_per_symbol(universe)
+
+    async def _build_shortlist_per_symbol(
+        self,
+        universe: List[str]
+    ) -> List[str]:
+        """Screen one snapshot per symbol, keeping the first 15 that pass."""
         shortlist = []
 
         for symbol in universe:
@@ -424,6 +466,7 @@ class PutsEngine:
         Runs all layers: Distribution, Liquidity, Acceleration, Dealer
         """
         candidates = []
+        market = await self.get_market_datasets()
 
         for i, symbol in enumerate(shortlist):
             logger.info(f"\nAnalyzing [{i+1}/{len(shortlist)}]: {symbol}")
@@ -435,13 +478,13 @@ class PutsEngine:
             )
 
             try:
-                # Get current price
-                quote = await self.alpaca.get_latest_quote(symbol)
-                if quote and "quote" in quote:
-                    candidate.current_price = float(quote["quote"].get("ap", 0))
+                # Fetch bars/quote/snapshot once; every layer slices this
+                context = await SymbolContext.fetch(symbol, self.polygon, self.alpaca, market=market)
+                if context.quote and "quote" in context.quote:
+                    candidate.current_price = float(context.quote["quote"].get("ap", 0))
 
                 # Layer 3: Distribution Detection
-                distribution = await self.distribution.analyze(symbol)
+                distribution = await self.distribution.analyze(symbol, context=context)
                 candidate.distribution = distribution
                 candidate.distribution_score = distribution.score
 
@@ -467,12 +510,12 @@ class PutsEngine:
                     continue
 
                 # Layer 4: Liquidity Vacuum
-                liquidity = await self.liquidity.analyze(symbol)
+                liquidity = await self.liquidity.analyze(symbol, context=context)
                 candidate.liquidity = liquidity
                 candidate.liquidity_score = liquidity.score
 
                 # Layer 5: Acceleration Window
-                acceleration = await self.acceleration.analyze(symbol)
+                acceleration = await self.acceleration.analyze(symbol, context=context)
                 candidate.acceleration = acceleration
 
                 if acceleration.is_late_entry:
@@ -481,9 +524,12 @@ class PutsEngine:
                     continue
 
                 # Layer 6: Dealer Positioning (GATE)
-                is_blocked, dealer_reasons, gex_data = await self.dealer.analyze(symbol)
+                dealer_analysis = await self.dealer.analyze(symbol, context=context)
+                is_blocked, dealer_reasons, gex_data = dealer_analysis
                 candidate.gex_data = gex_data
-                candidate.dealer_score = await self.dealer.get_dealer_score(symbol)
+                candidate.dealer_score = await self.dealer.get_dealer_score(
+                    symbol, context=context, analysis=dealer_analysis
+                )
 
                 if is_blocked:
                     candidate.block_reasons.extend(dealer_reasons)
@@ -764,6 +810,15 @@ class PutsEngine:
         
         return self._cached_regime
 
+    async def get_market_datasets(self) -> MarketDatasets:
+        """Scan-wide UW feeds, refetched at most every 5 minutes."""
+        if (
+            self._market_datasets is None
+            or (datetime.now() - self._market_datasets.fetched_at).total_seconds() >= self._market_datasets_ttl
+        ):
+            self._market_datasets = await MarketDatasets.fetch(self.unusual_whales)
+        return self._market_datasets
+
     async def run_single_symbol(
         self,
         symbol: str,
@@ -788,17 +843,18 @@ class PutsEngine:
             # Use cached market regime (saves 1 API call per ticker)
             regime = await self.get_cached_regime()
             
-            # FAST MODE: Quick price check first
-            quote = await self.alpaca.get_latest_quote(symbol)
-            if quote and "quote" in quote:
-                candidate.current_price = float(quote["quote"].get("ap", 0))
+            # Fetch bars/quote/snapshot once; every layer slices this
+            market = await self.get_market_datasets()
+            context = await SymbolContext.fetch(symbol, self.polygon, self.alpaca, market=market)
+            if context.quote and "quote" in context.quote:
+                candidate.current_price = float(context.quote["quote"].get("ap", 0))
             
             if candidate.current_price == 0:
                 candidate.composite_score = 0.0
                 return candidate
 
             # Distribution analysis (core signal)
-            candidate.distribution = await self.distribution.analyze(symbol)
+            candidate.distribution = await self.distribution.analyze(symbol, context=context)
             candidate.distribution_score = candidate.distribution.score
 
             # FAST MODE: Early exit if distribution score too low
@@ -808,7 +864,7 @@ class PutsEngine:
                 return candidate
 
             # Liquidity check
-            candidate.liquidity = await self.liquidity.analyze(symbol)
+            candidate.liquidity = await self.liquidity.analyze(symbol, context=context)
             candidate.liquidity_score = candidate.liquidity.score
 
             # FAST MODE: Early exit if liquidity too low
@@ -818,7 +874,7 @@ class PutsEngine:
                 return candidate
 
             # Acceleration window (timing)
-            candidate.acceleration = await self.acceleration.analyze(symbol)
+            candidate.acceleration = await self.acceleration.analyze(symbol, context=context)
 
             if candidate.acceleration.is_late_entry:
                 candidate.block_reasons.append(BlockReason.LATE_IV_SPIKE)
@@ -827,9 +883,12 @@ class PutsEngine:
                     return candidate
 
             # Dealer positioning (most expensive - UW API)
-            is_blocked, reasons, gex = await self.dealer.analyze(symbol)
+            dealer_analysis = await self.dealer.analyze(symbol, context=context)
+            is_blocked, reasons, gex = dealer_analysis
             candidate.gex_data = gex
-            candidate.dealer_score = await self.dealer.get_dealer_score(symbol)
+            candidate.dealer_score = await self.dealer.get_dealer_score(
+                symbol, context=context, analysis=dealer_analysis
+            )
             
             if is_blocked:
                 candidate.block_reasons.extend(reasons)
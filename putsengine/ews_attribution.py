@@ -28,7 +28,6 @@ DO NOT:
 We're past build phase. We're in MEASURE & REFINE phase.
 """
 
-import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
@@ -37,6 +36,8 @@ from enum import Enum
 import pytz
 from loguru import logger
 
+from putsengine.state_store import get_state_store
+
 
 EST = pytz.timezone("US/Eastern")
 
@@ -116,46 +117,82 @@ class EWSEvent:
         return asdict(self)
 
 
-# File path
+# File path (legacy - imported into the state store, which now holds the ledger)
 EWS_ATTRIBUTION_FILE = Path(__file__).parent.parent / "ews_attribution.json"
 
+_EMPTY_SUMMARY = {
+    "total_events": 0,
+    "act_events": 0,
+    "vacuum_open_confirmations": 0,
+    "trades_taken": 0,
+    "wins": 0,
+    "losses": 0,
+}
+
 
 def load_attribution_log() -> Dict[str, Any]:
-    """Load attribution log from file."""
-    if not EWS_ATTRIBUTION_FILE.exists():
+    """Load the attribution log (ews_attribution.json shape) from the state store."""
+    try:
+        store = get_state_store()
         return {
-            "version": "1.0",
-            "created": datetime.now().isoformat(),
-            "events": [],
-            "summary": {
-                "total_events": 0,
-                "act_events": 0,
-                "vacuum_open_confirmations": 0,
-                "trades_taken": 0,
-                "wins": 0,
-                "losses": 0,
-            }
+            "version": store.get_meta("attribution:version", "1.0"),
+            "created": store.get_meta("attribution:created", datetime.now().isoformat()),
+            "last_updated": store.get_meta("attribution:last_updated"),
+            "events": store.attribution_events(),
+            "summary": store.get_meta("attribution:summary", dict(_EMPTY_SUMMARY)),
         }
-    
-    try:
-        with open(EWS_ATTRIBUTION_FILE, 'r') as f:
-            return json.load(f)
     except Exception as e:
         logger.warning(f"Could not load attribution log: {e}")
         return {"events": [], "summary": {}}
 
 
 def save_attribution_log(data: Dict[str, Any]):
-    """Save attribution log to file."""
+    """Save a whole attribution log (every event + summary) to the state store."""
     try:
-        data["last_updated"] = datetime.now().isoformat()
-        with open(EWS_ATTRIBUTION_FILE, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
-        logger.info(f"Attribution log saved to {EWS_ATTRIBUTION_FILE}")
+        store = get_state_store()
+        for event in data.get("events", []):
+            store.put_attribution_event(event)
+        for key in ("version", "created"):
+            if key in data:
+                store.set_meta(f"attribution:{key}", data[key])
+        _save_summary(store, data.get("summary", {}))
+        logger.info("Attribution log saved to state store")
     except Exception as e:
         logger.warning(f"Could not save attribution log: {e}")
 
 
+def _save_summary(store, summary: Dict[str, Any]):
+    store.set_meta("attribution:summary", summary)
+    store.set_meta("attribution:last_updated", datetime.now().isoformat())
+
+
+def _bump_summary(store, key: str, amount: int = 1) -> Dict[str, Any]:
+    summary = store.get_meta("attribution:summary", dict(_EMPTY_SUMMARY))
+    summary[key] = summary.get(key, 0) + amount
+    return summary
+
+
+def _update_event(event_id: str, update) -> Optional[Dict[str, Any]]:
+    """
+    Apply ``update(event, summary)`` to one stored event and persist it.
+
+    Only that event's row (and the summary counters) is rewritten.
+    """
+    try:
+        store = get_state_store()
+        event = store.get_attribution_event(event_id)
+        if event is None:
+            return None
+        summary = store.get_meta("attribution:summary", dict(_EMPTY_SUMMARY))
+        update(event, summary)
+        store.put_attribution_event(event)
+        _save_summary(store, summary)
+        return event
+    except Exception as e:
+        logger.warning(f"Could not update attribution event {event_id}: {e}")
+        return None
+
+
 def log_ews_detection(
     symbol: str,
     ews_level: str,
@@ -176,8 +213,6 @@ def log_ews_detection(
     Returns:
         event_id for later updates
     """
-    data = load_attribution_log()
-    
     # Generate event ID
     event_id = f"{symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
@@ -190,14 +225,18 @@ def log_ews_detection(
         ews_footprints=footprints,
     )
     
-    data["events"].append(event.to_dict())
-    
-    # Update summary
-    data["summary"]["total_events"] = len(data["events"])
-    if ews_level == "act":
-        data["summary"]["act_events"] = data["summary"].get("act_events", 0) + 1
-    
-    save_attribution_log(data)
+    try:
+        store = get_state_store()
+        store.put_attribution_event(event.to_dict())
+        
+        # Update summary
+        summary = store.get_meta("attribution:summary", dict(_EMPTY_SUMMARY))
+        summary["total_events"] = store.attribution_count()
+        if ews_level == "act":
+            summary["act_events"] = summary.get("act_events", 0) + 1
+        _save_summary(store, summary)
+    except Exception as e:
+        logger.warning(f"Could not log EWS event {event_id}: {e}")
     
     logger.info(f"EWS Event logged: {event_id} | {symbol} | {ews_level.upper()} | IPI={ews_ipi:.2f}")
     
@@ -214,22 +253,16 @@ def update_zero_hour(
     
     Call this after Zero-Hour scan runs.
     """
-    data = load_attribution_log()
-    
-    for event in data["events"]:
-        if event["event_id"] == event_id:
-            event["zero_hour_verdict"] = verdict
-            event["zero_hour_gap_pct"] = gap_pct
-            event["zero_hour_timestamp"] = datetime.now().isoformat()
-            
-            if verdict == "vacuum_open":
-                data["summary"]["vacuum_open_confirmations"] = \
-                    data["summary"].get("vacuum_open_confirmations", 0) + 1
-            
-            logger.info(f"Zero-Hour updated: {event_id} | {verdict.upper()}")
-            break
+    def update(event, summary):
+        event["zero_hour_verdict"] = verdict
+        event["zero_hour_gap_pct"] = gap_pct
+        event["zero_hour_timestamp"] = datetime.now().isoformat()
+        
+        if verdict == "vacuum_open":
+            summary["vacuum_open_confirmations"] = summary.get("vacuum_open_confirmations", 0) + 1
     
-    save_attribution_log(data)
+    if _update_event(event_id, update):
+        logger.info(f"Zero-Hour updated: {event_id} | {verdict.upper()}")
 
 
 def update_engine_confirmation(
@@ -242,16 +275,12 @@ def update_engine_confirmation(
     
     Call this after main engine scan runs.
     """
-    data = load_attribution_log()
-    
-    for event in data["events"]:
-        if event["event_id"] == event_id:
-            event["engines_confirmed"] = engines
-            event["engine_score"] = score
-            logger.info(f"Engine confirmation updated: {event_id} | {engines}")
-            break
+    def update(event, summary):
+        event["engines_confirmed"] = engines
+        event["engine_score"] = score
     
-    save_attribution_log(data)
+    if _update_event(event_id, update):
+        logger.info(f"Engine confirmation updated: {event_id} | {engines}")
 
 
 def update_structure(
@@ -265,17 +294,13 @@ def update_structure(
     
     Call this after Vega Gate runs.
     """
-    data = load_attribution_log()
-    
-    for event in data["events"]:
-        if event["event_id"] == event_id:
-            event["structure"] = structure
-            event["iv_rank"] = iv_rank
-            event["ews_vega_override"] = ews_override
-            logger.info(f"Structure updated: {event_id} | {structure} | IV={iv_rank:.0f}%")
-            break
+    def update(event, summary):
+        event["structure"] = structure
+        event["iv_rank"] = iv_rank
+        event["ews_vega_override"] = ews_override
     
-    save_attribution_log(data)
+    if _update_event(event_id, update):
+        logger.info(f"Structure updated: {event_id} | {structure} | IV={iv_rank:.0f}%")
 
 
 def update_trade_entry(
@@ -286,19 +311,15 @@ def update_trade_entry(
     """
     Update an EWS event when trade is entered.
     """
-    data = load_attribution_log()
-    
-    for event in data["events"]:
-        if event["event_id"] == event_id:
-            event["entry_price"] = entry_price
-            event["lead_time_hours"] = lead_time_hours
-            event["outcome"] = "open"
-            
-            data["summary"]["trades_taken"] = data["summary"].get("trades_taken", 0) + 1
-            logger.info(f"Trade entry logged: {event_id} | ${entry_price:.2f} | Lead={lead_time_hours:.1f}h")
-            break
+    def update(event, summary):
+        event["entry_price"] = entry_price
+        event["lead_time_hours"] = lead_time_hours
+        event["outcome"] = "open"
+        
+        summary["trades_taken"] = summary.get("trades_taken", 0) + 1
     
-    save_attribution_log(data)
+    if _update_event(event_id, update):
+        logger.info(f"Trade entry logged: {event_id} | ${entry_price:.2f} | Lead={lead_time_hours:.1f}h")
 
 
 def update_trade_exit(
@@ -313,31 +334,27 @@ def update_trade_exit(
     
     This completes the attribution cycle.
     """
-    data = load_attribution_log()
-    
-    for event in data["events"]:
-        if event["event_id"] == event_id:
-            event["exit_price"] = exit_price
-            event["max_return"] = max_return
-            event["outcome"] = outcome
-            event["notes"] = notes
-            
-            entry = event.get("entry_price", 0)
-            if entry > 0:
-                event["actual_return"] = exit_price / entry
-            
-            if outcome == "win":
-                data["summary"]["wins"] = data["summary"].get("wins", 0) + 1
-            elif outcome == "loss":
-                data["summary"]["losses"] = data["summary"].get("losses", 0) + 1
-            
-            logger.info(
-                f"Trade exit logged: {event_id} | {outcome.upper()} | "
-                f"Max={max_return:.1f}x | Actual={event.get('actual_return', 0):.1f}x"
-            )
-            break
-    
-    save_attribution_log(data)
+    def update(event, summary):
+        event["exit_price"] = exit_price
+        event["max_return"] = max_return
+        event["outcome"] = outcome
+        event["notes"] = notes
+        
+        entry = event.get("entry_price", 0)
+        if entry and entry > 0:
+            event["actual_return"] = exit_price / entry
+        
+        if outcome == "win":
+            summary["wins"] = summary.get("wins", 0) + 1
+        elif outcome == "loss":
+            summary["losses"] = summary.get("losses", 0) + 1
+    
+    event = _update_event(event_id, update)
+    if event:
+        logger.info(
+            f"Trade exit logged: {event_id} | {outcome.upper()} | "
+            f"Max={max_return:.1f}x | Actual={event.get('actual_return', 0):.1f}x"
+        )
 
 
 def get_attribution_report() -> Dict:
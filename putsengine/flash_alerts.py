@@ -16,19 +16,34 @@ Then:
 
 This mimics how institutional desks escalate urgency.
 
+STREAMING (IPITracker):
+Each symbol keeps its recent IPI history in memory, in a fixed-size ring
+of NumPy columns (timestamp, IPI, footprint count). The ring is loaded
+once from the state store. ``observe_pressure`` is called as soon as
+``scan_symbol`` returns. It appends one point and checks only that
+symbol for a surge, so a flash alert fires mid-scan instead of after the
+whole scan is written. New points are written to the state store in
+batches (every ``FLUSH_BATCH`` points or ``FLUSH_SECONDS``, and at the
+end of the scan).
+
 WHY IT MATTERS:
 Rapid pressure accumulation suggests institutional consensus is forming.
 This is a "drop everything and look" signal.
 """
 
-import json
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
+import numpy as np
 import pytz
 from loguru import logger
 
+from putsengine.codec import dump_file, load_file
+from putsengine.state_store import get_state_store
+
 
 EST = pytz.timezone("US/Eastern")
 
@@ -54,7 +69,7 @@ class FlashAlert:
 
 # File paths
 FOOTPRINT_HISTORY_FILE = Path(__file__).parent.parent / "footprint_history.json"
-IPI_HISTORY_FILE = Path(__file__).parent.parent / "ipi_history.json"
+IPI_HISTORY_FILE = Path(__file__).parent.parent / "ipi_history.json"  # Legacy, imported into the state store
 FLASH_ALERTS_FILE = Path(__file__).parent.parent / "flash_alerts.json"
 
 # Thresholds
@@ -63,144 +78,241 @@ MIN_FOOTPRINT_TYPES = 2        # Minimum unique footprint categories
 MAX_MINUTES_WINDOW = 60        # Time window for surge detection
 
 
+# IPI history lives in the state store (ipi_snapshots table, indexed by
+# symbol/time); ipi_history.json is imported once and no longer rewritten.
+IPI_HISTORY_HOURS = 24
+IPI_HISTORY_PER_SYMBOL = 24
+FLUSH_BATCH = 100              # Snapshots buffered before a state-store write
+FLUSH_SECONDS = 60
+
+
 def load_ipi_history() -> Dict[str, List[Dict]]:
-    """Load IPI history for surge detection."""
-    if not IPI_HISTORY_FILE.exists():
-        return {}
+    """Load IPI history for surge detection (last 24h, newest 24 per symbol)."""
     try:
-        with open(IPI_HISTORY_FILE, 'r') as f:
-            return json.load(f)
+        cutoff = datetime.now() - timedelta(hours=IPI_HISTORY_HOURS)
+        return get_state_store().ipi_history(since=cutoff, per_symbol=IPI_HISTORY_PER_SYMBOL)
     except Exception as e:
         logger.warning(f"Could not load IPI history: {e}")
         return {}
 
 
 def save_ipi_history(history: Dict[str, List[Dict]]):
-    """Save IPI history."""
+    """Append IPI snapshots (``{symbol: [snapshot, ...]}``) and prune entries older than 24h."""
     try:
-        # Prune old entries (keep last 24 hours)
-        cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
-        for symbol in list(history.keys()):
-            history[symbol] = [
-                h for h in history[symbol]
-                if h.get("timestamp", "") > cutoff
-            ]
-            if not history[symbol]:
-                del history[symbol]
-        
-        with open(IPI_HISTORY_FILE, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        store = get_state_store()
+        store.record_ipi_many(history)
+        store.prune_ipi(datetime.now() - timedelta(hours=IPI_HISTORY_HOURS))
     except Exception as e:
         logger.warning(f"Could not save IPI history: {e}")
 
 
+def _recommendation(symbol: str, ipi_change: float, minutes_elapsed: int) -> str:
+    if ipi_change >= 0.40:
+        return (
+            f"🚨 CRITICAL FLASH ALERT: {symbol} IPI surged {ipi_change:+.2f} in {minutes_elapsed} min. "
+            f"INSTITUTIONAL CONSENSUS FORMING. Drop everything and analyze immediately."
+        )
+    return (
+        f"⚡ FLASH ALERT: {symbol} IPI surged {ipi_change:+.2f} in {minutes_elapsed} min. "
+        f"Rapid pressure accumulation detected. Review for potential entry timing."
+    )
+
+
+class _IPIRing:
+    """Last ``capacity`` IPI snapshots of one symbol, in arrival order."""
+
+    __slots__ = ("ts", "ipi", "unique", "count", "head", "latest_types")
+
+    def __init__(self, capacity: int):
+        self.ts = np.zeros(capacity)                      # epoch seconds
+        self.ipi = np.zeros(capacity)
+        self.unique = np.zeros(capacity, dtype=np.int32)
+        self.count = 0
+        self.head = 0                                     # next write slot
+        self.latest_types: List[str] = []
+
+    def append(self, ts: float, ipi: float, unique: int, types: List[str]) -> None:
+        self.ts[self.head] = ts
+        self.ipi[self.head] = ipi
+        self.unique[self.head] = unique
+        self.latest_types = types
+        self.head = (self.head + 1) % len(self.ts)
+        self.count = min(self.count + 1, len(self.ts))
+
+    @property
+    def newest_ts(self) -> Optional[float]:
+        return float(self.ts[self.head - 1]) if self.count else None
+
+    def ordered(self, column: np.ndarray) -> np.ndarray:
+        if self.count < len(column):
+            return column[:self.count]
+        return np.concatenate((column[self.head:], column[:self.head]))
+
+    def surge(self, symbol: str) -> Optional[FlashAlert]:
+        """Compare the newest point with the latest one 45-90 min before it."""
+        if self.count < 2:
+            return None
+        ts = self.ordered(self.ts)
+        ipi = self.ordered(self.ipi)
+        minutes_ago = (ts[-1] - ts[:-1]) / 60
+        candidates = np.flatnonzero((minutes_ago >= 45) & (minutes_ago <= 90))
+        if not len(candidates):
+            return None
+        j = candidates[-1]
+        current_ipi, prev_ipi = float(ipi[-1]), float(ipi[j])
+        ipi_change = current_ipi - prev_ipi
+        unique_footprints = int(self.ordered(self.unique)[-1])
+        if ipi_change < MIN_IPI_CHANGE or unique_footprints < MIN_FOOTPRINT_TYPES:
+            return None
+        minutes_elapsed = int(minutes_ago[j])
+        return FlashAlert(
+            symbol=symbol,
+            current_ipi=current_ipi,
+            previous_ipi=prev_ipi,
+            ipi_change=ipi_change,
+            minutes_elapsed=minutes_elapsed,
+            unique_footprints=unique_footprints,
+            footprint_types=self.latest_types,
+            timestamp=datetime.fromtimestamp(ts[-1]),
+            recommendation=_recommendation(symbol, ipi_change, minutes_elapsed),
+        )
+
+
+class IPITracker:
+    """
+    In-memory IPI history with incremental surge detection.
+
+    Loaded once from the state store. Points are written back in batches,
+    and flash alerts are evaluated per symbol as points arrive.
+    """
+
+    def __init__(self, capacity: int = IPI_HISTORY_PER_SYMBOL, load: bool = True):
+        self.capacity = capacity
+        self.rings: Dict[str, _IPIRing] = {}
+        self.alerts: Dict[str, FlashAlert] = {}   # Current surge per symbol
+        self._pending: Dict[str, List[Dict]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        if load:
+            for symbol, snapshots in load_ipi_history().items():
+                for snap in snapshots:
+                    try:
+                        ts = datetime.fromisoformat(snap["timestamp"]).timestamp()
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    self._ring(symbol).append(ts, snap.get("ipi", 0) or 0,
+                                              snap.get("unique_footprints", 0) or 0,
+                                              snap.get("footprint_types") or [])
+
+    def _ring(self, symbol: str) -> _IPIRing:
+        ring = self.rings.get(symbol)
+        if ring is None:
+            ring = self.rings[symbol] = _IPIRing(self.capacity)
+        return ring
+
+    def observe(
+        self,
+        symbol: str,
+        ipi: float,
+        unique_footprints: int,
+        footprint_types: List[str],
+        timestamp: Optional[datetime] = None,
+    ) -> Optional[FlashAlert]:
+        """Append one snapshot and return the symbol's flash alert, if it is surging."""
+        when = timestamp or datetime.now()
+        ts = when.timestamp()
+        with self._lock:
+            ring = self._ring(symbol)
+            newest = ring.newest_ts
+            if newest is not None and ts <= newest:
+                return self.alerts.get(symbol)      # Already observed (e.g. scan + post-scan check)
+            ring.append(ts, ipi, unique_footprints, footprint_types)
+            self._pending.setdefault(symbol, []).append({
+                "timestamp": when.isoformat(),
+                "ipi": ipi,
+                "unique_footprints": unique_footprints,
+                "footprint_types": footprint_types,
+            })
+            self._pending_count += 1
+            alert = ring.surge(symbol)
+            fired = alert is not None and symbol not in self.alerts
+            if alert is None:
+                self.alerts.pop(symbol, None)
+            else:
+                self.alerts[symbol] = alert
+            if self._pending_count >= FLUSH_BATCH or time.monotonic() - self._last_flush >= FLUSH_SECONDS:
+                self.flush()
+        if fired:
+            logger.warning(
+                f"FLASH ALERT: {symbol} IPI {alert.previous_ipi:.2f} → {alert.current_ipi:.2f} "
+                f"({alert.ipi_change:+.2f} in {alert.minutes_elapsed} min)"
+            )
+            save_flash_alerts(self.current_alerts())
+        return alert
+
+    def current_alerts(self) -> List[FlashAlert]:
+        """Surging symbols (latest surge within the window), largest IPI change first."""
+        cutoff = datetime.now() - timedelta(minutes=MAX_MINUTES_WINDOW)
+        with self._lock:
+            for symbol in [s for s, a in self.alerts.items() if a.timestamp < cutoff]:
+                del self.alerts[symbol]
+            return sorted(self.alerts.values(), key=lambda a: a.ipi_change, reverse=True)
+
+    def flush(self) -> int:
+        """Write buffered snapshots to the state store (and prune beyond 24h)."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            count, self._pending_count = self._pending_count, 0
+            self._last_flush = time.monotonic()
+        if pending:
+            save_ipi_history(pending)
+        return count
+
+
+_tracker: Optional[IPITracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_ipi_tracker() -> IPITracker:
+    """Process-wide tracker (history loaded from the state store on first use)."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = IPITracker()
+        return _tracker
+
+
+def observe_pressure(symbol: str, pressure) -> Optional[FlashAlert]:
+    """Feed one EWS ``InstitutionalPressure`` into the tracker (call as scan_symbol returns)."""
+    return get_ipi_tracker().observe(
+        symbol,
+        pressure.ipi,
+        getattr(pressure, "unique_footprints", 0),
+        [f.footprint_type.value for f in getattr(pressure, "footprints", [])[:10]],
+        timestamp=getattr(pressure, "last_updated", None),
+    )
+
+
 def record_ipi_snapshot(symbol: str, ipi: float, unique_footprints: int, footprint_types: List[str]):
     """
     Record an IPI snapshot for surge detection.
     
     Call this after each EWS scan to track IPI changes over time.
     """
-    history = load_ipi_history()
-    
-    if symbol not in history:
-        history[symbol] = []
-    
-    history[symbol].append({
-        "timestamp": datetime.now().isoformat(),
-        "ipi": ipi,
-        "unique_footprints": unique_footprints,
-        "footprint_types": footprint_types,
-    })
-    
-    # Keep only last 24 entries per symbol
-    history[symbol] = history[symbol][-24:]
-    
-    save_ipi_history(history)
+    get_ipi_tracker().observe(symbol, ipi, unique_footprints, footprint_types)
 
 
 def detect_flash_alerts() -> List[FlashAlert]:
     """
-    Detect flash alerts by comparing current IPI to recent history.
+    Current flash alerts for symbols whose latest IPI snapshot is a surge.
     
-    Returns list of FlashAlert for symbols with rapid IPI increases.
+    Surges are evaluated incrementally as snapshots arrive (IPITracker);
+    this just collects them and saves the alerts file.
     """
-    history = load_ipi_history()
-    alerts = []
-    
-    now = datetime.now()
-    
-    for symbol, snapshots in history.items():
-        if len(snapshots) < 2:
-            continue
-        
-        # Get most recent snapshot
-        current = snapshots[-1]
-        current_ts = datetime.fromisoformat(current["timestamp"])
-        current_ipi = current.get("ipi", 0)
-        
-        # Find snapshot from ~60 minutes ago
-        comparison = None
-        for snap in reversed(snapshots[:-1]):
-            snap_ts = datetime.fromisoformat(snap["timestamp"])
-            minutes_ago = (current_ts - snap_ts).total_seconds() / 60
-            
-            if 45 <= minutes_ago <= 90:  # Allow some flexibility
-                comparison = snap
-                break
-        
-        if not comparison:
-            continue
-        
-        # Calculate IPI change
-        prev_ipi = comparison.get("ipi", 0)
-        ipi_change = current_ipi - prev_ipi
-        
-        # Get time elapsed
-        comp_ts = datetime.fromisoformat(comparison["timestamp"])
-        minutes_elapsed = int((current_ts - comp_ts).total_seconds() / 60)
-        
-        # Check if alert criteria met
-        unique_footprints = current.get("unique_footprints", 0)
-        footprint_types = current.get("footprint_types", [])
-        
-        if ipi_change >= MIN_IPI_CHANGE and unique_footprints >= MIN_FOOTPRINT_TYPES:
-            # Generate recommendation
-            if ipi_change >= 0.40:
-                recommendation = (
-                    f"🚨 CRITICAL FLASH ALERT: {symbol} IPI surged {ipi_change:+.2f} in {minutes_elapsed} min. "
-                    f"INSTITUTIONAL CONSENSUS FORMING. Drop everything and analyze immediately."
-                )
-            else:
-                recommendation = (
-                    f"⚡ FLASH ALERT: {symbol} IPI surged {ipi_change:+.2f} in {minutes_elapsed} min. "
-                    f"Rapid pressure accumulation detected. Review for potential entry timing."
-                )
-            
-            alert = FlashAlert(
-                symbol=symbol,
-                current_ipi=current_ipi,
-                previous_ipi=prev_ipi,
-                ipi_change=ipi_change,
-                minutes_elapsed=minutes_elapsed,
-                unique_footprints=unique_footprints,
-                footprint_types=footprint_types,
-                timestamp=now,
-                recommendation=recommendation,
-            )
-            alerts.append(alert)
-            
-            logger.warning(
-                f"FLASH ALERT: {symbol} IPI {prev_ipi:.2f} → {current_ipi:.2f} "
-                f"({ipi_change:+.2f} in {minutes_elapsed} min)"
-            )
-    
-    # Sort by IPI change (largest first)
-    alerts.sort(key=lambda a: a.ipi_change, reverse=True)
-    
-    # Save flash alerts
+    alerts = get_ipi_tracker().current_alerts()
     if alerts:
         save_flash_alerts(alerts)
-    
     return alerts
 
 
@@ -227,8 +339,7 @@ def save_flash_alerts(alerts: List[FlashAlert]):
             ]
         }
         
-        with open(FLASH_ALERTS_FILE, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        dump_file(data, FLASH_ALERTS_FILE)
         
         logger.info(f"Flash alerts saved to {FLASH_ALERTS_FILE}")
     except Exception as e:
@@ -246,8 +357,7 @@ def get_flash_alerts() -> Dict:
         return {"alerts": [], "alerts_count": 0, "critical_count": 0}
     
     try:
-        with open(FLASH_ALERTS_FILE, 'r') as f:
-            return json.load(f)
+        return load_file(FLASH_ALERTS_FILE)
     except Exception:
         return {"alerts": [], "alerts_count": 0, "critical_count": 0}
 
@@ -256,23 +366,20 @@ def check_for_flash_alerts_in_ews_scan(ews_results: Dict[str, any]):
     """
     Check for flash alerts after an EWS scan.
     
-    Call this at the end of each EWS scan to record IPI history
-    and detect surges.
+    Call this at the end of each EWS scan. Snapshots not yet seen by the
+    tracker are recorded, buffered history is flushed, and the current
+    flash alerts are returned.
     
     Args:
         ews_results: Dict of symbol -> InstitutionalPressure from EWS scan
     """
-    # Record current IPI snapshots
+    # Symbols already observed as scan_symbol returned are skipped (same timestamp)
+    tracker = get_ipi_tracker()
     for symbol, pressure in ews_results.items():
         if hasattr(pressure, 'ipi'):
-            record_ipi_snapshot(
-                symbol=symbol,
-                ipi=pressure.ipi,
-                unique_footprints=pressure.unique_footprints if hasattr(pressure, 'unique_footprints') else 0,
-                footprint_types=[f.footprint_type.value for f in pressure.footprints[:10]] if hasattr(pressure, 'footprints') else []
-            )
+            observe_pressure(symbol, pressure)
+    tracker.flush()
     
-    # Detect flash alerts
     alerts = detect_flash_alerts()
     
     if alerts:
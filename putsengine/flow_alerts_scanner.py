@@ -24,6 +24,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 
 
 class FlowAlertsScanner:
@@ -51,10 +52,14 @@ class FlowAlertsScanner:
         self.uw_client = uw_client
         self._last_scan_time: Optional[datetime] = None
         
-    async def scan_flow_alerts(self, limit: int = 100) -> Dict[str, List[Dict]]:
+    async def scan_flow_alerts(self, limit: int = 100, market=None) -> Dict[str, List[Dict]]:
         """
         Scan market-wide flow alerts for unusual put activity.
         
+        Args:
+            limit: Alerts requested from UW
+            market: MarketDatasets already holding this scan's flow alerts
+        
         Returns:
             Dict with categories:
             - critical: Premium >= $5M
@@ -73,8 +78,11 @@ class FlowAlertsScanner:
         }
         
         try:
-            # Get global flow alerts from UW
-            alerts = await self.uw_client.get_global_flow_alerts(limit=limit)
+            # Get global flow alerts from UW (reuse the scan's copy if prefetched)
+            if market is not None and market.flow_alerts_raw is not None:
+                alerts = market.flow_alerts_raw
+            else:
+                alerts = await self.uw_client.get_global_flow_alerts(limit=limit)
             
             if not alerts:
                 logger.warning("Flow Alerts Scanner: No alerts returned from UW API")
@@ -221,7 +229,8 @@ class FlowAlertsScanner:
         return injected
 
 
-async def run_flow_alerts_scan(uw_client) -> Dict:
+@instrumented("scanner", "flow_alerts")
+async def run_flow_alerts_scan(uw_client, market=None) -> Dict:
     """
     Run market-wide flow alerts scan and inject results into DUI.
     
@@ -230,13 +239,17 @@ async def run_flow_alerts_scan(uw_client) -> Dict:
     - Extra at 9:35 AM (opening flow)
     - Extra at 3:30 PM (closing flow)
     
+    Args:
+        uw_client: UnusualWhalesClient instance
+        market: Optional MarketDatasets with flow alerts already fetched
+    
     Returns:
         Scan results with injected count
     """
     scanner = FlowAlertsScanner(uw_client)
     
     # Run the scan
-    results = await scanner.scan_flow_alerts()
+    results = await scanner.scan_flow_alerts(market=market)
     
     # Inject into DUI
     injected = await scanner.inject_alerts_to_dui(results)
@@ -0,0 +1,317 @@
+"""
+Footprint Store - append-only, day-segmented footprint history.
+
+WHY:
+``add_footprint_to_history`` used to load footprint_history.json (~3 MB),
+append one record, prune and rewrite the whole file. ``scan_symbol`` calls
+it up to 8 times per ticker, so one EWS scan did thousands of full JSON
+parse/dump cycles, and every reader (weather engine, dashboard) had to
+parse the full file to look at a single symbol.
+
+HOW:
+- One JSONL segment per day (``footprints/YYYY-MM-DD.jsonl``). An append
+  is a single O_APPEND write of one line; nothing is ever rewritten, and
+  appends from several processes don't clobber each other.
+- Pruning deletes whole segments older than the retention window.
+- An in-memory index (symbol -> [(timestamp, segment, offset)]) is built
+  once per process and then tailed: each query only reads bytes appended
+  since the last one, and only the lines for the requested symbol.
+- The legacy footprint_history.json is imported once on first use.
+
+Usage:
+    store = get_footprint_store()
+    store.append("AAPL", {"footprint_type": "dark_pool_sequence", ...})
+    recent = store.query("AAPL", since=datetime.now() - timedelta(hours=48))
+    counts = store.counts()          # {symbol: n_footprints}
+"""
+
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from putsengine.codec import dumps, load_file, loads
+
+
+DEFAULT_STORE_DIR = Path(__file__).parent.parent / "footprints"
+LEGACY_HISTORY_FILE = Path(__file__).parent.parent / "footprint_history.json"
+
+SEGMENT_SUFFIX = ".jsonl"
+_MIGRATED_MARKER = ".migrated"
+
+TimeLike = Union[datetime, str]
+
+
+def _iso(value: Optional[TimeLike]) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+class FootprintStore:
+    """
+    Append-only footprint history with a per-symbol index.
+
+    Records are the same dicts the JSON file held
+    (``footprint_type``, ``timestamp``, ``strength``, ``details``).
+    Queries only return records inside the retention window, matching the
+    old prune-on-save behaviour.
+    """
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_STORE_DIR, retention_days: int = 5):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        # segment name -> bytes indexed so far
+        self._offsets: Dict[str, int] = {}
+        # symbol -> [(timestamp, segment name, byte offset)]
+        self._index: Dict[str, List[Tuple[str, str, int]]] = {}
+        self._last_prune: Optional[date] = None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, day: str) -> Path:
+        return self.root / f"{day}{SEGMENT_SUFFIX}"
+
+    def append(self, symbol: str, record: Dict) -> None:
+        """Append one footprint record for ``symbol`` (O(1), no rewrite)."""
+        timestamp = _iso(record.get("timestamp")) or datetime.now().isoformat()
+        line = dumps({**record, "symbol": symbol, "timestamp": timestamp})
+        self._write_lines(timestamp[:10], [line])
+        self._maybe_prune()
+
+    def _write_lines(self, day: str, lines: List[str]) -> bool:
+        """Append complete lines to a day segment in one O_APPEND write."""
+        data = "".join(line + "\n" for line in lines).encode("utf-8")
+        try:
+            fd = os.open(self._segment_path(day), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.warning(f"Could not append footprint: {e}")
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def _cutoff(self) -> datetime:
+        return datetime.now() - timedelta(days=self.retention_days)
+
+    def _maybe_prune(self) -> None:
+        today = date.today()
+        if self._last_prune != today:
+            self._last_prune = today
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete segments that lie entirely outside the retention window."""
+        oldest_kept = self._cutoff().date().isoformat()
+        removed = 0
+        for path in self._segment_files():
+            if path.stem < oldest_kept:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"Could not remove footprint segment {path.name}: {e}")
+        if removed:
+            logger.debug(f"Footprint store pruned {removed} expired segments")
+        return removed
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _segment_files(self) -> List[Path]:
+        return sorted(self.root.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def _refresh_locked(self) -> None:
+        """Index bytes appended since the last call (by any process)."""
+        present = {}
+        for path in self._segment_files():
+            try:
+                present[path.name] = path.stat().st_size
+            except OSError:
+                continue
+
+        stale = [name for name, done in self._offsets.items()
+                 if name not in present or present[name] < done]
+        if stale:
+            self._drop_segments_locked(set(stale))
+
+        for name, size in present.items():
+            done = self._offsets.get(name, 0)
+            if size > done:
+                self._offsets[name] = self._index_segment_locked(name, done)
+
+    def _drop_segments_locked(self, names: set) -> None:
+        for name in names:
+            self._offsets.pop(name, None)
+        for symbol in list(self._index):
+            kept = [entry for entry in self._index[symbol] if entry[1] not in names]
+            if kept:
+                self._index[symbol] = kept
+            else:
+                del self._index[symbol]
+
+    def _index_segment_locked(self, name: str, start: int) -> int:
+        """Index complete lines from ``start``; returns the new indexed offset."""
+        offset = start
+        with open(self.root / name, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Partial line from an in-progress append
+                try:
+                    rec = loads(raw)
+                    self._index.setdefault(rec["symbol"], []).append(
+                        (rec.get("timestamp", ""), name, offset)
+                    )
+                except (ValueError, KeyError, TypeError):
+                    pass
+                offset += len(raw)
+        return offset
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _entries(self, symbol: str, since: Optional[str], until: Optional[str]):
+        floor = max(since or "", self._cutoff().isoformat())
+        return [
+            entry for entry in self._index.get(symbol, [])
+            if entry[0] > floor and (until is None or entry[0] <= until)
+        ]
+
+    def query(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[TimeLike] = None,
+        until: Optional[TimeLike] = None,
+    ) -> List[Dict]:
+        """
+        Footprint records ordered by timestamp.
+
+        Args:
+            symbol: Only this symbol (None = all symbols)
+            since: Exclusive lower bound on timestamp
+            until: Inclusive upper bound on timestamp
+
+        Returns:
+            Record dicts (each includes a ``symbol`` key)
+        """
+        since_s, until_s = _iso(since), _iso(until)
+        with self._lock:
+            self._refresh_locked()
+            symbols = [symbol] if symbol is not None else list(self._index)
+            entries = []
+            for sym in symbols:
+                entries.extend(self._entries(sym, since_s, until_s))
+        return self._read(sorted(entries))
+
+    def _read(self, entries: List[Tuple[str, str, int]]) -> List[Dict]:
+        records = []
+        handles = {}
+        try:
+            for _, name, offset in entries:
+                f = handles.get(name)
+                if f is None:
+                    try:
+                        f = handles[name] = open(self.root / name, "rb")
+                    except OSError:
+                        continue  # Pruned by another process
+                f.seek(offset)
+                try:
+                    records.append(loads(f.readline()))
+                except ValueError:
+                    continue
+        finally:
+            for f in handles.values():
+                f.close()
+        return records
+
+    def history(self, since: Optional[TimeLike] = None) -> Dict[str, List[Dict]]:
+        """
+        Records grouped by symbol (the old footprint_history.json shape).
+
+        The ``symbol`` key is dropped from each record, as the legacy file
+        only carried it as the grouping key.
+        """
+        grouped: Dict[str, List[Dict]] = {}
+        for rec in self.query(since=since):
+            grouped.setdefault(rec.pop("symbol"), []).append(rec)
+        return grouped
+
+    def counts(self, since: Optional[TimeLike] = None) -> Dict[str, int]:
+        """Footprint count per symbol, answered from the index alone."""
+        since_s = _iso(since)
+        with self._lock:
+            self._refresh_locked()
+            counts = {sym: len(self._entries(sym, since_s, None)) for sym in self._index}
+        return {sym: n for sym, n in counts.items() if n}
+
+    def symbols(self, since: Optional[TimeLike] = None) -> List[str]:
+        """Symbols with at least one footprint in the window."""
+        return sorted(self.counts(since))
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def migrate_legacy(self, path: Union[str, Path] = LEGACY_HISTORY_FILE) -> int:
+        """
+        Import footprint_history.json once (guarded by a marker file).
+
+        Returns:
+            Number of records imported
+        """
+        marker = self.root / _MIGRATED_MARKER
+        path = Path(path)
+        if marker.exists() or not path.exists():
+            return 0
+        try:
+            legacy = load_file(path)
+        except Exception as e:
+            logger.warning(f"Could not read legacy footprint history: {e}")
+            return 0
+
+        cutoff = self._cutoff().isoformat()
+        by_day: Dict[str, List[str]] = {}
+        for symbol, records in legacy.items():
+            for rec in records if isinstance(records, list) else []:
+                ts = rec.get("timestamp", "") if isinstance(rec, dict) else ""
+                if ts > cutoff:
+                    line = dumps({**rec, "symbol": symbol})
+                    by_day.setdefault(ts[:10], []).append(line)
+
+        imported = 0
+        for day, lines in by_day.items():
+            if self._write_lines(day, lines):
+                imported += len(lines)
+        marker.touch()
+        logger.info(f"Footprint store: imported {imported} records from {path.name}")
+        return imported
+
+
+# Singleton instance
+_footprint_store: Optional[FootprintStore] = None
+
+
+def get_footprint_store() -> FootprintStore:
+    """Get singleton footprint store (migrates the legacy JSON file on first use)."""
+    global _footprint_store
+    if _footprint_store is None:
+        _footprint_store = FootprintStore()
+        _footprint_store.migrate_legacy()
+        _footprint_store.prune()
+    return _footprint_store
@@ -32,6 +32,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Set, Optional, Tuple
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 
 # Extended universe for gap scanning (beyond our normal 175)
 # This includes major names that might gap on news
@@ -317,6 +318,7 @@ class GapScanner:
         return injected
 
 
+@instrumented("scanner", "premarket_gap")
 async def run_premarket_gap_scan(price_client) -> Dict:
     """
     Run pre-market gap scan and inject results into DUI.
@@ -37,6 +37,8 @@ from typing import Optional, List, Dict, Tuple
 from enum import Enum
 from loguru import logger
 
+from putsengine.bars import as_bar_array
+from putsengine import indicators as ind
 from putsengine.models import OptionsContract, PutCandidate
 
 
@@ -399,27 +401,15 @@ class VegaGate:
             # Calculate realized volatility windows
             import numpy as np
             
-            # Get daily returns
-            closes = [bar.close for bar in bars]
-            returns = np.diff(np.log(closes))
-            
             # Calculate rolling 20-day realized volatility (annualized)
             window = 20
-            if len(returns) < window:
-                return None
-            
-            rv_values = []
-            for i in range(len(returns) - window + 1):
-                window_returns = returns[i:i + window]
-                rv = np.std(window_returns) * np.sqrt(252)
-                rv_values.append(rv)
-            
-            if not rv_values:
+            closes = as_bar_array(bars).close
+            if len(closes) - 1 < window:
                 return None
             
             # Use realized volatility as IV proxy
             # (In production, would use actual historical IV data)
-            rv_array = np.array(rv_values)
+            rv_array = ind.realized_vol(closes, window)[window:]
             
             return {
                 "avg_iv": float(np.mean(rv_array)),
@@ -0,0 +1,295 @@
+"""
+Vectorized technical indicators shared by layers, gates and scanners.
+
+WHY:
+RSI was implemented twice (DistributionLayer, AccelerationWindowLayer),
+VWAP four times (distribution, liquidity, acceleration, market_regime),
+EMA in acceleration, and VegaGate computed a rolling 20-day std in a
+Python loop over ``np.std`` slices. Each walked PriceBar objects one at a
+time, per ticker.
+
+HOW:
+- Every function works along the last axis, so the same call handles a
+  single series (1-D) or a whole universe at once (2-D, symbol x time;
+  build one with ``stack``).
+- Outputs are aligned with the input: same shape, NaN during warm-up.
+- Recursive indicators (EMA, Wilder RSI/ATR) loop over time only; each
+  step is one vector operation across all symbols.
+- ``EMAState`` / ``RSIState`` / ``VWAPState`` carry the recursion forward
+  so a new bar (or a new column of bars for the universe) updates in O(1)
+  instead of recomputing the series.
+
+Usage:
+    from putsengine import indicators as ind
+
+    rsi = ind.wilder_rsi(bars.close, 14)[-1]
+    vwap = ind.vwap(today.high, today.low, today.close, today.volume)
+
+    closes = ind.stack([bars_by_symbol[s].close for s in symbols])
+    rsi_all = ind.wilder_rsi(closes, 14)[:, -1]   # one value per symbol
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+def _f64(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def stack(series: Iterable, length: Optional[int] = None) -> np.ndarray:
+    """
+    Stack per-symbol series into a 2-D (symbol x time) array.
+
+    Rows are right-aligned (most recent value last) and cut to ``length``
+    or, by default, to the shortest series.
+    """
+    rows = [_f64(s) for s in series]
+    if not rows:
+        return np.zeros((0, length or 0))
+    n = min(len(r) for r in rows) if length is None else length
+    out = np.full((len(rows), n), np.nan)
+    for i, r in enumerate(rows):
+        take = min(n, len(r))
+        if take:
+            out[i, n - take:] = r[len(r) - take:]
+    return out
+
+
+# ============================================================================
+# MOVING AVERAGES
+# ============================================================================
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """Simple moving average over ``window`` values (NaN until full)."""
+    x = _f64(values)
+    out = np.full(x.shape, np.nan)
+    if window <= 0 or x.shape[-1] < window:
+        return out
+    csum = np.cumsum(x, axis=-1)
+    out[..., window - 1] = csum[..., window - 1]
+    out[..., window:] = csum[..., window:] - csum[..., :-window]
+    out[..., window - 1:] /= window
+    return out
+
+
+def rolling_std(values, window: int) -> np.ndarray:
+    """Rolling population std (ddof=0, same as ``np.std``) over ``window`` values."""
+    x = _f64(values)
+    out = np.full(x.shape, np.nan)
+    if window <= 0 or x.shape[-1] < window:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(x, window, axis=-1)
+    out[..., window - 1:] = windows.std(axis=-1)
+    return out
+
+
+def ema(values, period: int) -> np.ndarray:
+    """
+    Exponential moving average seeded with the SMA of the first ``period``
+    values (first defined value at index ``period - 1``).
+    """
+    x = _f64(values)
+    out = np.full(x.shape, np.nan)
+    if period <= 0 or x.shape[-1] < period:
+        return out
+    alpha = 2.0 / (period + 1)
+    current = x[..., :period].mean(axis=-1)
+    out[..., period - 1] = current
+    for t in range(period, x.shape[-1]):
+        current = current + (x[..., t] - current) * alpha
+        out[..., t] = current
+    return out
+
+
+# ============================================================================
+# MOMENTUM / VOLATILITY
+# ============================================================================
+
+def _wilder(values: np.ndarray, period: int, start: int) -> np.ndarray:
+    """Wilder smoothing: SMA seed over values[start:start+period], then (n-1)/n decay."""
+    out = np.full(values.shape, np.nan)
+    seed_end = start + period
+    if values.shape[-1] < seed_end:
+        return out
+    current = values[..., start:seed_end].mean(axis=-1)
+    out[..., seed_end - 1] = current
+    for t in range(seed_end, values.shape[-1]):
+        current = (current * (period - 1) + values[..., t]) / period
+        out[..., t] = current
+    return out
+
+
+def wilder_rsi(close, period: int = 14) -> np.ndarray:
+    """
+    Wilder RSI aligned with ``close`` (first value at index ``period``).
+
+    RSI is 100 where the average loss is zero.
+    """
+    c = _f64(close)
+    out = np.full(c.shape, np.nan)
+    if c.shape[-1] < period + 1:
+        return out
+    deltas = np.diff(c, axis=-1)
+    avg_gain = _wilder(np.where(deltas > 0, deltas, 0.0), period, 0)
+    avg_loss = _wilder(np.where(deltas < 0, -deltas, 0.0), period, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    rsi = np.where(avg_loss == 0, 100.0, rsi)
+    rsi = np.where(np.isnan(avg_gain), np.nan, rsi)
+    out[..., 1:] = rsi
+    return out
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True range; the first bar uses high - low."""
+    hi, lo, cl = _f64(high), _f64(low), _f64(close)
+    tr = hi - lo
+    if hi.shape[-1] > 1:
+        prev = cl[..., :-1]
+        tr[..., 1:] = np.maximum.reduce([
+            hi[..., 1:] - lo[..., 1:],
+            np.abs(hi[..., 1:] - prev),
+            np.abs(lo[..., 1:] - prev),
+        ])
+    return tr
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """Wilder ATR (first value at index ``period``, seeded from bars 1..period)."""
+    tr = true_range(high, low, close)
+    return _wilder(tr, period, 1)
+
+
+def log_returns(close) -> np.ndarray:
+    """Log returns aligned with ``close`` (NaN at index 0)."""
+    c = _f64(close)
+    out = np.full(c.shape, np.nan)
+    out[..., 1:] = np.diff(np.log(c), axis=-1)
+    return out
+
+
+def realized_vol(close, window: int = 20, periods_per_year: int = 252) -> np.ndarray:
+    """Rolling annualized realized volatility of log returns (NaN until ``window`` returns)."""
+    r = log_returns(close)
+    out = np.full(r.shape, np.nan)
+    out[..., 1:] = rolling_std(r[..., 1:], window)
+    return out * np.sqrt(periods_per_year)
+
+
+# ============================================================================
+# VOLUME
+# ============================================================================
+
+def typical_price(high, low, close) -> np.ndarray:
+    return (_f64(high) + _f64(low) + _f64(close)) / 3.0
+
+
+def vwap(high, low, close, volume) -> np.ndarray:
+    """
+    Volume-weighted average typical price over the whole window.
+
+    Returns a scalar for 1-D input, one value per row for 2-D. Falls back
+    to the last close where total volume is zero.
+    """
+    c = _f64(close)
+    v = _f64(volume)
+    pv = (typical_price(high, low, c) * v).sum(axis=-1)
+    total = v.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(total > 0, pv / total, c[..., -1] if c.shape[-1] else 0.0)
+    return result[()] if np.ndim(result) == 0 else result
+
+
+def cumulative_vwap(high, low, close, volume) -> np.ndarray:
+    """Running VWAP aligned with the bars (use on one session's bars)."""
+    v = _f64(volume)
+    cum_pv = np.cumsum(typical_price(high, low, close) * v, axis=-1)
+    cum_v = np.cumsum(v, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cum_v > 0, cum_pv / cum_v, _f64(close))
+
+
+def rvol(volume, window: int = 20) -> np.ndarray:
+    """Volume relative to the mean of the previous ``window`` bars (NaN during warm-up)."""
+    v = _f64(volume)
+    out = np.full(v.shape, np.nan)
+    prior = rolling_mean(v, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[..., window:] = v[..., window:] / prior[..., window - 1:-1]
+    return out
+
+
+# ============================================================================
+# INCREMENTAL STATE
+# ============================================================================
+
+class EMAState:
+    """EMA carried forward one bar at a time (scalar or one value per symbol)."""
+
+    def __init__(self, period: int, value=None):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value = None if value is None else _f64(value)
+
+    @classmethod
+    def from_series(cls, values, period: int) -> "EMAState":
+        return cls(period, ema(values, period)[..., -1])
+
+    def update(self, x) -> np.ndarray:
+        x = _f64(x)
+        self.value = x if self.value is None else self.value + (x - self.value) * self.alpha
+        return self.value
+
+
+class RSIState:
+    """Wilder RSI carried forward one close at a time."""
+
+    def __init__(self, period: int, avg_gain, avg_loss, last_close):
+        self.period = period
+        self.avg_gain = _f64(avg_gain)
+        self.avg_loss = _f64(avg_loss)
+        self.last_close = _f64(last_close)
+
+    @classmethod
+    def from_series(cls, close, period: int = 14) -> "RSIState":
+        c = _f64(close)
+        deltas = np.diff(c, axis=-1)
+        gain = _wilder(np.where(deltas > 0, deltas, 0.0), period, 0)[..., -1]
+        loss = _wilder(np.where(deltas < 0, -deltas, 0.0), period, 0)[..., -1]
+        return cls(period, gain, loss, c[..., -1])
+
+    @property
+    def value(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+        return np.where(self.avg_loss == 0, 100.0, rsi)
+
+    def update(self, close) -> np.ndarray:
+        close = _f64(close)
+        delta = close - self.last_close
+        n = self.period
+        self.avg_gain = (self.avg_gain * (n - 1) + np.where(delta > 0, delta, 0.0)) / n
+        self.avg_loss = (self.avg_loss * (n - 1) + np.where(delta < 0, -delta, 0.0)) / n
+        self.last_close = close
+        return self.value
+
+
+class VWAPState:
+    """Session VWAP accumulated bar by bar; call ``reset()`` at the session open."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.cum_pv = 0.0
+        self.cum_volume = 0.0
+
+    def update(self, high, low, close, volume) -> np.ndarray:
+        v = _f64(volume)
+        self.cum_pv = self.cum_pv + typical_price(high, low, close) * v
+        self.cum_volume = self.cum_volume + v
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.cum_volume > 0, self.cum_pv / self.cum_volume, _f64(close))
+
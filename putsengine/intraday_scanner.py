@@ -25,6 +25,7 @@ from loguru import logger
 
 from putsengine.config import Settings, get_settings
 from putsengine.clients.polygon_client import PolygonClient
+from putsengine.metrics import instrumented
 
 
 @dataclass
@@ -141,6 +142,7 @@ class IntradayScanner:
         return alerts
 
 
+@instrumented("scanner", "intraday")
 async def run_intraday_scan(symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
     """
     Run the intraday scanner on given symbols or full universe.
@@ -0,0 +1,423 @@
+"""
+Job Graph - scheduler jobs that run when their inputs are fresh, not at fixed offsets.
+
+WHY:
+``PutsEngineScheduler._schedule_jobs`` chained jobs with hand-tuned cron
+gaps: Weather AM at 9:05 "after" the 9:00 scan, Weather PM at 3:08, 16
+convergence runs at :10/:40, Market Pulse moved from 3:00 to 2:45 PM
+because it took 21 minutes and the 3:15 PM read saw 9 AM data. A gap was
+either idle time (the upstream finished early) or a stale read (it
+finished late).
+
+HOW:
+- Jobs declare the artifacts they read (``inputs``) and write
+  (``outputs``). An artifact is fresh while it is younger than its
+  ``max_age_seconds``. Its age comes from the last successful producer run
+  or from the mtime of its files, so results written before a restart
+  still count.
+- ``run(job)`` is the cron entry point for a root job. When a job
+  finishes, every consumer of its outputs whose inputs are all fresh (and
+  whose time-of-day ``window`` is open) starts at once. Independent
+  branches run concurrently. ``any_input`` consumers (convergence) start
+  when any one input is fresh instead, and make do with the rest.
+- A job fails when it raises or returns ``False`` (scheduler wrappers log
+  and return ``False``). A failed job does not mark its outputs fresh,
+  does not count as finished for ``ensure`` and triggers nothing.
+- A consumer already running when triggered again is rerun once after it
+  finishes, so it always ends on the newest inputs.
+- A job keeps the arguments of its last cron trigger (e.g. the scan type).
+  Cascaded runs, reruns and ``ensure`` without arguments reuse them.
+- ``once_per_window`` jobs (e.g. the full AM/PM weather reports) run at
+  most once per window per day.
+- ``ensure(job, max_age)`` is the deadline fallback. A cron calls it at
+  the latest acceptable time and it only runs the job if nothing ran it
+  recently.
+- Each ``run`` cascade produces a latency report: the critical path (the
+  trigger chain that ended last) with per-job wait/run times. It also
+  lists missed ``deadline_seconds`` (cascade start to job end) and the
+  consumers skipped and why.
+
+Usage:
+    graph = JobGraph(tz=EST)
+    graph.add_artifact("ews", max_age_seconds=14 * 3600, paths=["early_warning_alerts.json"])
+    graph.add_job("early_warning", run_ews, outputs=("ews",))
+    graph.add_job("convergence", run_convergence, inputs=("ews", "scan"), deadline_seconds=1800)
+    scheduler.add_job(graph.run, CronTrigger(hour=8), args=["early_warning"])
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, time as dtime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from putsengine.loop_monitor import run_blocking
+from putsengine.metrics import stage
+
+
+@dataclass
+class Artifact:
+    """A job output other jobs read (usually one or more JSON files)."""
+    name: str
+    max_age_seconds: float
+    paths: Tuple[Path, ...] = ()
+    produced_at: Optional[float] = None  # epoch of last successful producer run
+
+    def fresh_at(self) -> Optional[float]:
+        stamps = [self.produced_at] if self.produced_at is not None else []
+        for path in self.paths:
+            try:
+                stamps.append(path.stat().st_mtime)
+            except OSError:
+                pass
+        return max(stamps) if stamps else None
+
+    def age_seconds(self, now: Optional[float] = None) -> Optional[float]:
+        fresh_at = self.fresh_at()
+        if fresh_at is None:
+            return None
+        return (now if now is not None else time.time()) - fresh_at
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        age = self.age_seconds(now)
+        return age is not None and age <= self.max_age_seconds
+
+
+@dataclass
+class JobSpec:
+    """One node of the graph."""
+    name: str
+    fn: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    deadline_seconds: Optional[float] = None
+    window: Optional[Tuple[dtime, dtime]] = None
+    once_per_window: bool = False
+    any_input: bool = False
+    args: Tuple[Any, ...] = ()  # from the last trigger that passed any
+
+
+@dataclass
+class JobRun:
+    """One execution of a job inside a cascade."""
+    job: str
+    triggered_by: str
+    queued_at: float
+    args: Tuple[Any, ...] = ()
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    error: Optional[str] = None
+    upstream: Optional["JobRun"] = None
+
+    @property
+    def wait_ms(self) -> float:
+        return round((self.started_at - self.queued_at) * 1000, 1)
+
+    @property
+    def run_ms(self) -> float:
+        return round((self.finished_at - self.started_at) * 1000, 1)
+
+
+@dataclass
+class _Cascade:
+    root: str
+    started_at: float
+    runs: List[JobRun] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    missed_deadlines: List[str] = field(default_factory=list)
+
+    def critical_path(self) -> List[JobRun]:
+        if not self.runs:
+            return []
+        last = max(self.runs, key=lambda r: r.finished_at)
+        path = []
+        while last is not None:
+            path.append(last)
+            last = last.upstream
+        return path[::-1]
+
+    def report(self) -> Dict[str, Any]:
+        finished = max((r.finished_at for r in self.runs), default=self.started_at)
+        return {
+            "root": self.root,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "total_ms": round((finished - self.started_at) * 1000, 1),
+            "jobs_run": [r.job for r in self.runs],
+            "critical_path": [
+                {
+                    "job": r.job,
+                    "triggered_by": r.triggered_by,
+                    "wait_ms": r.wait_ms,
+                    "run_ms": r.run_ms,
+                    "finished_ms": round((r.finished_at - self.started_at) * 1000, 1),
+                    "error": r.error,
+                }
+                for r in self.critical_path()
+            ],
+            "missed_deadlines": list(self.missed_deadlines),
+            "skipped": dict(self.skipped),
+        }
+
+
+class JobGraph:
+    """Dependency-aware job runner layered on top of the cron scheduler."""
+
+    def __init__(self, tz=None):
+        self.tz = tz
+        self.artifacts: Dict[str, Artifact] = {}
+        self.jobs: Dict[str, JobSpec] = {}
+        self.last_finished: Dict[str, float] = {}
+        self._running: Set[str] = set()
+        self._rerun: Set[str] = set()
+        self._reports: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Definition
+    # ------------------------------------------------------------------
+
+    def add_artifact(
+        self, name: str, max_age_seconds: float, paths: Iterable[Any] = ()
+    ) -> Artifact:
+        artifact = Artifact(name, max_age_seconds, tuple(Path(p) for p in paths))
+        self.artifacts[name] = artifact
+        return artifact
+
+    def add_job(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        inputs: Iterable[str] = (),
+        outputs: Iterable[str] = (),
+        deadline_seconds: Optional[float] = None,
+        window: Optional[Tuple[dtime, dtime]] = None,
+        once_per_window: bool = False,
+        any_input: bool = False,
+    ) -> JobSpec:
+        spec = JobSpec(
+            name, fn, tuple(inputs), tuple(outputs), deadline_seconds, window, once_per_window,
+            any_input,
+        )
+        for artifact in spec.inputs + spec.outputs:
+            if artifact not in self.artifacts:
+                raise ValueError(f"Job '{name}' references unknown artifact '{artifact}'")
+        self.jobs[name] = spec
+        cycle = self._find_cycle()
+        if cycle:
+            del self.jobs[name]
+            raise ValueError(f"Job '{name}' creates a cycle: {' -> '.join(cycle)}")
+        return spec
+
+    def consumers(self, name: str) -> List[str]:
+        """Jobs that read any output of ``name`` (definition order)."""
+        outputs = set(self.jobs[name].outputs)
+        return [
+            j.name for j in self.jobs.values()
+            if outputs.intersection(j.inputs) and j.name != name
+        ]
+
+    def _find_cycle(self) -> Optional[List[str]]:
+        state: Dict[str, int] = {}
+
+        def visit(node: str, stack: List[str]) -> Optional[List[str]]:
+            state[node] = 1
+            for nxt in self.consumers(node):
+                if state.get(nxt) == 1:
+                    return stack + [node, nxt]
+                if nxt not in state:
+                    found = visit(nxt, stack + [node])
+                    if found:
+                        return found
+            state[node] = 2
+            return None
+
+        for job in self.jobs:
+            if job not in state:
+                found = visit(job, [])
+                if found:
+                    return found
+        return None
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run(self, name: str, *args: Any) -> Optional[Dict[str, Any]]:
+        """
+        Run ``name`` now (cron entry point) and everything downstream that
+        becomes ready. Returns the cascade's latency report, or None if the
+        job was already running.
+        """
+        if name in self._running:
+            logger.warning(f"Job graph: {name} already running, skipping this trigger")
+            return None
+        spec = self.jobs[name]
+        if args:
+            spec.args = args
+        cascade = _Cascade(root=name, started_at=time.time())
+        await self._execute(name, spec.args, cascade, "cron", None)
+        return self._finish(cascade)
+
+    async def ensure(self, name: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+        """Deadline fallback: run ``name`` unless it finished within ``max_age_seconds``."""
+        last = self.last_finished.get(name)
+        if last is not None and time.time() - last <= max_age_seconds:
+            logger.debug(f"Job graph: {name} ran {time.time() - last:.0f}s ago, deadline met")
+            return None
+        if self.jobs[name].once_per_window and self._ran_in_window(self.jobs[name]):
+            return None
+        return await self.run(name)
+
+    def _finish(self, cascade: _Cascade) -> Dict[str, Any]:
+        report = cascade.report()
+        self._reports[cascade.root] = report
+        path = " -> ".join(
+            f"{step['job']} ({step['wait_ms'] / 1000:.1f}s wait, {step['run_ms'] / 1000:.1f}s run)"
+            for step in report["critical_path"]
+        )
+        logger.info(
+            f"Job graph: {cascade.root} cascade {report['total_ms'] / 1000:.1f}s "
+            f"| critical path: {path}"
+        )
+        for job in cascade.missed_deadlines:
+            logger.warning(f"Job graph: {job} missed its deadline in the {cascade.root} cascade")
+        return report
+
+    async def _execute(
+        self,
+        name: str,
+        args: Tuple[Any, ...],
+        cascade: _Cascade,
+        triggered_by: str,
+        upstream: Optional[JobRun],
+    ) -> None:
+        spec = self.jobs[name]
+        queued_at = upstream.finished_at if upstream else time.time()
+        run = JobRun(name, triggered_by, queued_at=queued_at, args=args, upstream=upstream)
+        self._running.add(name)
+        run.started_at = time.time()
+        try:
+            with stage("job", name):
+                if inspect.iscoroutinefunction(spec.fn):
+                    result = await spec.fn(*args)
+                else:
+                    # Sync jobs (convergence) do file/CPU work; keep the loop free
+                    result = await run_blocking(spec.fn, *args)
+                    if inspect.isawaitable(result):
+                        result = await result
+            if result is False:
+                run.error = "job reported failure"
+                logger.error(f"Job graph: {name} reported failure")
+        except Exception as e:
+            run.error = str(e)
+            logger.error(f"Job graph: {name} failed: {e}")
+        finally:
+            run.finished_at = time.time()
+            self._running.discard(name)
+        cascade.runs.append(run)
+
+        elapsed = run.finished_at - cascade.started_at
+        if spec.deadline_seconds is not None and elapsed > spec.deadline_seconds:
+            cascade.missed_deadlines.append(name)
+        if run.error is not None:
+            return
+
+        self.last_finished[name] = run.finished_at
+        for artifact in spec.outputs:
+            self.artifacts[artifact].produced_at = run.finished_at
+
+        ready = []
+        for consumer in self.consumers(name):
+            reason = self._not_ready_reason(self.jobs[consumer])
+            if reason is None:
+                ready.append(consumer)
+            else:
+                cascade.skipped[consumer] = reason
+        branches = [self._execute_or_defer(c, cascade, name, run) for c in ready]
+
+        # Triggered while running: run once more on the inputs that arrived meanwhile
+        if name in self._rerun:
+            self._rerun.discard(name)
+            branches.append(self._execute(name, run.args, cascade, "rerun", run))
+        if branches:
+            await asyncio.gather(*branches)
+
+    async def _execute_or_defer(
+        self, name: str, cascade: _Cascade, triggered_by: str, upstream: JobRun
+    ) -> None:
+        if name in self._running:
+            self._rerun.add(name)
+            cascade.skipped[name] = "running (rerun queued)"
+            return
+        await self._execute(name, self.jobs[name].args, cascade, triggered_by, upstream)
+
+    def _not_ready_reason(self, spec: JobSpec) -> Optional[str]:
+        now = time.time()
+        if spec.window is not None and not self._in_window(spec):
+            return "outside window"
+        if spec.once_per_window and self._ran_in_window(spec):
+            return "already ran in window"
+        stale = []
+        for name in spec.inputs:
+            artifact = self.artifacts[name]
+            if not artifact.is_fresh(now):
+                age = artifact.age_seconds(now)
+                detail = f" ({age:.0f}s)" if age is not None else " (missing)"
+                stale.append(f"stale input {name}{detail}")
+        if not stale or (spec.any_input and len(stale) < len(spec.inputs)):
+            return None
+        return ", ".join(stale) if spec.any_input else stale[0]
+
+    def _local_now(self) -> datetime:
+        return datetime.now(self.tz) if self.tz is not None else datetime.now()
+
+    def _in_window(self, spec: JobSpec) -> bool:
+        start, end = spec.window
+        return start <= self._local_now().time() <= end
+
+    def _ran_in_window(self, spec: JobSpec) -> bool:
+        last = self.last_finished.get(spec.name)
+        if last is None:
+            return False
+        now = self._local_now()
+        last_local = datetime.fromtimestamp(last, now.tzinfo)
+        if last_local.date() != now.date():
+            return False
+        if spec.window is None:
+            return True
+        start, end = spec.window
+        return start <= last_local.time() <= end
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def latency_report(self) -> Dict[str, Dict[str, Any]]:
+        """Latest cascade report per root job."""
+        return dict(self._reports)
+
+    def status(self) -> Dict[str, Any]:
+        """Artifact ages and job states, for dashboards and health checks."""
+        now = time.time()
+
+        def age(artifact: Artifact) -> Optional[float]:
+            seconds = artifact.age_seconds(now)
+            return None if seconds is None else round(seconds, 1)
+
+        return {
+            "artifacts": {
+                name: {
+                    "age_seconds": age(a),
+                    "fresh": a.is_fresh(now),
+                }
+                for name, a in self.artifacts.items()
+            },
+            "running": sorted(self._running),
+            "last_finished": {
+                name: datetime.fromtimestamp(ts).isoformat()
+                for name, ts in self.last_finished.items()
+            },
+        }
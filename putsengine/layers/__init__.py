@@ -8,11 +8,13 @@ from putsengine.layers.distribution import DistributionLayer
 from putsengine.layers.liquidity import LiquidityVacuumLayer
 from putsengine.layers.acceleration import AccelerationWindowLayer
 from putsengine.layers.dealer import DealerPositioningLayer
+from putsengine.layers.context import SymbolContext
 
 __all__ = [
     "MarketRegimeLayer",
     "DistributionLayer",
     "LiquidityVacuumLayer",
     "AccelerationWindowLayer",
-    "DealerPositioningLayer"
+    "DealerPositioningLayer",
+    "SymbolContext",
 ]
@@ -19,13 +19,18 @@ IF IV spikes >20% same session AND put volume explodes late day
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict
 from loguru import logger
-import numpy as np
 
 from putsengine.config import EngineConfig, Settings
 from putsengine.models import AccelerationWindow, PriceBar, GEXData, EngineType
 from putsengine.clients.alpaca_client import AlpacaClient
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.bars import as_bar_array
+from putsengine import indicators as ind
+from putsengine.metrics import instrumented
+from putsengine.layers.context import (
+    SymbolContext, context_daily_bars, context_minute_bars, context_quote
+)
 
 
 class AccelerationWindowLayer:
@@ -53,12 +58,18 @@ class AccelerationWindowLayer:
         self.settings = settings
         self.config = EngineConfig
 
-    async def analyze(self, symbol: str) -> AccelerationWindow:
+    @instrumented("layer", "acceleration")
+    async def analyze(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None
+    ) -> AccelerationWindow:
         """
         Analyze acceleration window timing for a symbol.
 
         Args:
             symbol: Stock ticker to analyze
+            context: Prefetched market data (bars/quote are sliced from it)
 
         Returns:
             AccelerationWindow with timing analysis
@@ -72,15 +83,17 @@ class AccelerationWindowLayer:
 
         try:
             # Get price data
-            minute_bars = await self.polygon.get_minute_bars(
-                symbol=symbol,
+            minute_bars = await context_minute_bars(
+                self.polygon, symbol,
                 from_date=date.today() - timedelta(days=5),
-                limit=5000
+                limit=5000,
+                context=context
             )
 
-            daily_bars = await self.polygon.get_daily_bars(
-                symbol=symbol,
-                from_date=date.today() - timedelta(days=30)
+            daily_bars = await context_daily_bars(
+                self.polygon, symbol,
+                from_date=date.today() - timedelta(days=30),
+                context=context
             )
 
             if not minute_bars or not daily_bars:
@@ -90,7 +103,7 @@ class AccelerationWindowLayer:
             # Calculate indicators
             current_price = minute_bars[-1].close
             vwap = self._calculate_today_vwap(minute_bars)
-            ema_20 = self._calculate_ema([b.close for b in daily_bars], 20)
+            ema_20 = self._calculate_ema(as_bar_array(daily_bars).close, 20)
             prior_low = self._get_prior_low(daily_bars)
 
             # 1. Price below VWAP
@@ -115,7 +128,7 @@ class AccelerationWindowLayer:
 
             # 7. Gamma flipping short + Zero-Gamma Trigger Detection
             # Per Final Architect: "Price below Zero-Gamma / Volatility Trigger"
-            gamma_result = await self._check_gamma_flip(symbol)
+            gamma_result = await self._check_gamma_flip(symbol, context)
             window.gamma_flipping_short = gamma_result[0]
             
             # Store zero-gamma info for reporting (if we have the fields)
@@ -130,7 +143,7 @@ class AccelerationWindowLayer:
 
             # 8. RSI Overbought Detection (for Engine 3 - Snapback)
             # Per Architect: RSI > 75 required for snapback
-            rsi_values = self._calculate_rsi([b.close for b in daily_bars], period=14)
+            rsi_values = self._calculate_rsi(as_bar_array(daily_bars).close, period=14)
             if rsi_values and len(rsi_values) > 0:
                 current_rsi = rsi_values[-1]
                 window.rsi_overbought = current_rsi > 75
@@ -163,33 +176,19 @@ class AccelerationWindowLayer:
     def _calculate_today_vwap(self, bars: List[PriceBar]) -> float:
         """Calculate VWAP for today's session."""
         today = date.today()
-        today_bars = [b for b in bars if b.timestamp.date() == today]
+        today_bars = as_bar_array(bars).since(today)
 
         if not today_bars:
             return 0.0
 
-        total_volume = 0
-        total_vwap = 0.0
-
-        for bar in today_bars:
-            typical_price = (bar.high + bar.low + bar.close) / 3
-            total_vwap += typical_price * bar.volume
-            total_volume += bar.volume
-
-        return total_vwap / total_volume if total_volume > 0 else today_bars[-1].close
+        return float(ind.vwap(today_bars.high, today_bars.low, today_bars.close, today_bars.volume))
 
     def _calculate_ema(self, prices: List[float], period: int) -> Optional[float]:
         """Calculate Exponential Moving Average."""
         if len(prices) < period:
             return None
 
-        multiplier = 2 / (period + 1)
-        ema = np.mean(prices[:period])  # Start with SMA
-
-        for price in prices[period:]:
-            ema = (price - ema) * multiplier + ema
-
-        return ema
+        return float(ind.ema(prices, period)[-1])
 
     def _get_prior_low(self, daily_bars: List[PriceBar]) -> Optional[float]:
         """Get the prior session's low."""
@@ -204,32 +203,8 @@ class AccelerationWindowLayer:
         Calculate RSI indicator.
         Per Architect: RSI > 75 indicates overbought (snapback condition).
         """
-        if len(prices) < period + 1:
-            return []
-
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        rsi_values = []
-
-        # Initial average
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
-
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-
-            rsi_values.append(rsi)
-
-        return rsi_values
+        # Values start after the Wilder seed (historical layer convention)
+        return ind.wilder_rsi(prices, period)[period + 1:].tolist()
 
     def _detect_lower_high(self, daily_bars: List[PriceBar]) -> bool:
         """
@@ -266,7 +241,7 @@ class AccelerationWindowLayer:
     ) -> bool:
         """Detect failed reclaim attempts of VWAP."""
         today = date.today()
-        today_bars = [b for b in bars if b.timestamp.date() == today]
+        today_bars = as_bar_array(bars).since(today)
 
         if len(today_bars) < 30:
             return False
@@ -433,7 +408,11 @@ class AccelerationWindowLayer:
 
         return False
 
-    async def _check_gamma_flip(self, symbol: str) -> tuple:
+    async def _check_gamma_flip(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None
+    ) -> tuple:
         """
         Check if gamma is flipping to short.
         
@@ -455,7 +434,7 @@ class AccelerationWindowLayer:
 
             if gex_data:
                 # Current price below GEX flip level = dealers short gamma
-                current_quote = await self.alpaca.get_latest_quote(symbol)
+                current_quote = await context_quote(self.alpaca, symbol, context)
                 if current_quote and "quote" in current_quote:
                     current_price = float(current_quote["quote"].get("ap", 0))
                     
@@ -539,7 +518,7 @@ class AccelerationWindowLayer:
 
             # Check for volume explosion in last hour
             today = date.today()
-            today_bars = [b for b in bars if b.timestamp.date() == today]
+            today_bars = as_bar_array(bars).since(today)
 
             if len(today_bars) > 60:
                 last_hour = today_bars[-60:]
@@ -0,0 +1,198 @@
+"""
+Symbol Context - one market-data snapshot shared by every layer.
+
+WHY:
+For one symbol in one pipeline pass, Distribution, Liquidity, Acceleration
+and Dealer each fetched their own minute bars, daily bars, Alpaca quote
+and Polygon snapshot with slightly different date ranges: 10-13 HTTP
+round-trips for data that is identical within a few seconds.
+
+HOW:
+- ``SymbolContext.fetch`` pulls the widest window any layer needs
+  (30 days of daily bars, 5 days / 5000 minute bars, quote, snapshot)
+  with the four requests running concurrently.
+- Layers take an optional ``context`` and slice it through the
+  ``context_*`` helpers below. A helper falls back to a live request
+  when there is no context, when the context does not cover the
+  requested window, or when the prefetch for that item failed, so every
+  layer still works standalone.
+
+Usage:
+    context = await SymbolContext.fetch(symbol, polygon, alpaca)
+    distribution = await distribution_layer.analyze(symbol, context=context)
+    liquidity = await liquidity_layer.analyze(symbol, context=context)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from putsengine.bars import BarArray
+from putsengine.market_datasets import MarketDatasets
+from putsengine.models import PriceBar
+
+
+# Widest windows any layer asks for
+DAILY_LOOKBACK_DAYS = 30
+MINUTE_LOOKBACK_DAYS = 5
+MINUTE_LIMIT = 5000
+
+
+@dataclass
+class SymbolContext:
+    """
+    Market data for one symbol, fetched once per pipeline pass.
+
+    ``None`` for a field means "not prefetched" (skipped or the request
+    failed); callers then fetch it themselves.
+    """
+    symbol: str
+    fetched_at: datetime
+    daily_from: date
+    minute_from: date
+    minute_limit: int
+    daily_bars: Optional[List[PriceBar]] = None
+    minute_bars: Optional[List[PriceBar]] = None
+    quote: Optional[Dict[str, Any]] = None
+    snapshot: Optional[Dict[str, Any]] = None
+    # Scan-wide feeds (congress, flow alerts, SPY greeks) shared by all symbols
+    market: Optional[MarketDatasets] = None
+    fetch_seconds: float = 0.0
+
+    @classmethod
+    async def fetch(
+        cls,
+        symbol: str,
+        polygon,
+        alpaca=None,
+        daily_days: int = DAILY_LOOKBACK_DAYS,
+        minute_days: int = MINUTE_LOOKBACK_DAYS,
+        minute_limit: int = MINUTE_LIMIT,
+        include_snapshot: bool = True,
+        market: Optional[MarketDatasets] = None,
+    ) -> "SymbolContext":
+        """
+        Prefetch bars, quote and snapshot for ``symbol`` concurrently.
+
+        Args:
+            symbol: Stock ticker
+            polygon: PolygonClient (bars + snapshot)
+            alpaca: AlpacaClient for the latest quote (None = skip quote)
+            daily_days: Daily-bar lookback in calendar days
+            minute_days: Minute-bar lookback in calendar days
+            minute_limit: Max minute bars requested
+            include_snapshot: Also fetch the Polygon snapshot
+            market: Scan-wide MarketDatasets to attach (not fetched here)
+        """
+        today = date.today()
+        context = cls(
+            symbol=symbol,
+            fetched_at=datetime.now(),
+            daily_from=today - timedelta(days=daily_days),
+            minute_from=today - timedelta(days=minute_days),
+            minute_limit=minute_limit,
+            market=market,
+        )
+        started = time.monotonic()
+
+        async def _none():
+            return None
+
+        results = await asyncio.gather(
+            polygon.get_daily_bars(symbol=symbol, from_date=context.daily_from),
+            polygon.get_minute_bars(
+                symbol=symbol, from_date=context.minute_from, limit=minute_limit
+            ),
+            alpaca.get_latest_quote(symbol) if alpaca is not None else _none(),
+            polygon.get_snapshot(symbol) if include_snapshot else _none(),
+            return_exceptions=True,
+        )
+        names = ("daily_bars", "minute_bars", "quote", "snapshot")
+        for name, value in zip(names, results, strict=True):
+            if isinstance(value, BaseException):
+                logger.debug(f"{symbol}: context prefetch of {name} failed: {value}")
+                continue
+            setattr(context, name, value)
+
+        context.fetch_seconds = time.monotonic() - started
+        return context
+
+    # ------------------------------------------------------------------
+    # Slicing
+    # ------------------------------------------------------------------
+
+    def daily_since(self, from_date: date) -> Optional[List[PriceBar]]:
+        """Daily bars on/after ``from_date``, or None if not covered."""
+        if self.daily_bars is None or from_date < self.daily_from:
+            return None
+        if isinstance(self.daily_bars, BarArray):
+            return self.daily_bars.since(from_date)
+        return [b for b in self.daily_bars if b.timestamp.date() >= from_date]
+
+    def minute_since(self, from_date: date, limit: int = MINUTE_LIMIT) -> Optional[List[PriceBar]]:
+        """
+        Minute bars on/after ``from_date`` capped at ``limit`` (oldest first,
+        same as Polygon's ``sort=asc&limit=N``), or None if not covered.
+        """
+        if self.minute_bars is None or from_date < self.minute_from:
+            return None
+        if len(self.minute_bars) >= self.minute_limit and from_date > self.minute_from:
+            # Our window was truncated at the limit; the newest bars a
+            # narrower request would return may be missing.
+            return None
+        if isinstance(self.minute_bars, BarArray):
+            return self.minute_bars.since(from_date)[:limit]
+        bars = [b for b in self.minute_bars if b.timestamp.date() >= from_date]
+        return bars[:limit]
+
+    @property
+    def current_price(self) -> float:
+        """Alpaca ask price, falling back to the snapshot's last trade (0.0 if neither)."""
+        if self.quote and "quote" in self.quote:
+            price = float(self.quote["quote"].get("ap", 0) or 0)
+            if price:
+                return price
+        if self.snapshot and "ticker" in self.snapshot:
+            return float(self.snapshot["ticker"].get("lastTrade", {}).get("p", 0) or 0)
+        return 0.0
+
+
+# ============================================================================
+# LAYER HELPERS - slice the context, or fetch live when it can't answer
+# ============================================================================
+
+async def context_daily_bars(
+    polygon, symbol: str, from_date: date, context: Optional[SymbolContext] = None
+) -> List[PriceBar]:
+    if context is not None:
+        bars = context.daily_since(from_date)
+        if bars is not None:
+            return bars
+    return await polygon.get_daily_bars(symbol=symbol, from_date=from_date)
+
+
+async def context_minute_bars(
+    polygon, symbol: str, from_date: date, limit: int = MINUTE_LIMIT,
+    context: Optional[SymbolContext] = None
+) -> List[PriceBar]:
+    if context is not None:
+        bars = context.minute_since(from_date, limit)
+        if bars is not None:
+            return bars
+    return await polygon.get_minute_bars(symbol=symbol, from_date=from_date, limit=limit)
+
+
+async def context_quote(alpaca, symbol: str, context: Optional[SymbolContext] = None):
+    if context is not None and context.quote is not None:
+        return context.quote
+    return await alpaca.get_latest_quote(symbol)
+
+
+async def context_snapshot(polygon, symbol: str, context: Optional[SymbolContext] = None):
+    if context is not None and context.snapshot is not None:
+        return context.snapshot
+    return await polygon.get_snapshot(symbol)
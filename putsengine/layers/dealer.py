@@ -21,10 +21,14 @@ from loguru import logger
 import numpy as np
 
 from putsengine.config import EngineConfig, Settings
+from putsengine.metrics import instrumented
 from putsengine.models import GEXData, PriceBar, BlockReason
 from putsengine.clients.alpaca_client import AlpacaClient
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.layers.context import (
+    SymbolContext, context_daily_bars, context_quote, context_snapshot
+)
 
 
 class DealerPositioningLayer:
@@ -52,12 +56,18 @@ class DealerPositioningLayer:
         self.settings = settings
         self.config = EngineConfig
 
-    async def analyze(self, symbol: str) -> Tuple[bool, List[BlockReason], Optional[GEXData]]:
+    @instrumented("layer", "dealer")
+    async def analyze(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None
+    ) -> Tuple[bool, List[BlockReason], Optional[GEXData]]:
         """
         Analyze dealer positioning for a symbol.
 
         Args:
             symbol: Stock ticker to analyze
+            context: Prefetched market data (quote/snapshot/bars are sliced from it)
 
         Returns:
             Tuple of (is_blocked, block_reasons, gex_data)
@@ -69,14 +79,14 @@ class DealerPositioningLayer:
 
         try:
             # Get current price
-            quote = await self.alpaca.get_latest_quote(symbol)
+            quote = await context_quote(self.alpaca, symbol, context)
             current_price = 0.0
             if quote and "quote" in quote:
                 current_price = float(quote["quote"].get("ap", 0))
 
             if current_price == 0:
                 # Fallback to snapshot
-                snapshot = await self.polygon.get_snapshot(symbol)
+                snapshot = await context_snapshot(self.polygon, symbol, context)
                 if snapshot and "ticker" in snapshot:
                     current_price = float(
                         snapshot["ticker"].get("lastTrade", {}).get("p", 0)
@@ -91,7 +101,7 @@ class DealerPositioningLayer:
 
             # Check 1: Put Wall Detection
             put_wall_block = await self._check_put_wall(
-                symbol, current_price, gex_data
+                symbol, current_price, gex_data, context
             )
             if put_wall_block:
                 block_reasons.append(BlockReason.PUT_WALL_SUPPORT)
@@ -129,7 +139,8 @@ class DealerPositioningLayer:
         self,
         symbol: str,
         current_price: float,
-        gex_data: Optional[GEXData]
+        gex_data: Optional[GEXData],
+        context: Optional[SymbolContext] = None
     ) -> bool:
         """
         MANDATORY GATE: Check if there's a put wall near current price.
@@ -166,38 +177,23 @@ class DealerPositioningLayer:
                     )
 
             # === SIGNAL 2: Check OI concentration by strike ===
-            oi_data = await self.unusual_whales.get_oi_by_strike(symbol)
-            
-            # Handle both list and dict responses
-            if isinstance(oi_data, list):
-                data_list = oi_data
-            elif isinstance(oi_data, dict):
-                data_list = oi_data.get("data", [])
-            else:
-                data_list = []
+            oi = await self.unusual_whales.get_oi_strikes(symbol)
+            strikes, put_ois = oi["strike"], oi["put_oi"]
 
-            if data_list:
+            if len(strikes) and current_price > 0:
                 max_put_oi = 0
                 max_put_strike = None
 
-                for strike_data in data_list:
-                    if not isinstance(strike_data, dict):
-                        continue
-                    strike = float(strike_data.get("strike", strike_data.get("strike_price", 0)))
-                    put_oi = int(strike_data.get("put_oi", strike_data.get("put_open_interest", 0)))
-
-                    # Check if strike is within 5% of current price
-                    if current_price > 0 and abs(strike - current_price) / current_price <= 0.05:
-                        if put_oi > max_put_oi:
-                            max_put_oi = put_oi
-                            max_put_strike = strike
+                # Highest put OI within 5% of current price (first one on ties)
+                near = (np.abs(strikes - current_price) / current_price <= 0.05) & (put_ois > 0)
+                if near.any():
+                    i = int(np.argmax(np.where(near, put_ois, -1)))
+                    max_put_oi = int(put_ois[i])
+                    max_put_strike = float(strikes[i])
 
                 if max_put_strike:
                     # Check if this is a significant put wall (>15% concentration)
-                    total_put_oi = sum(
-                        int(s.get("put_oi", s.get("put_open_interest", 0)))
-                        for s in data_list if isinstance(s, dict)
-                    )
+                    total_put_oi = int(put_ois.sum())
 
                     concentration = max_put_oi / total_put_oi if total_put_oi > 0 else 0
                     
@@ -215,7 +211,7 @@ class DealerPositioningLayer:
 
             # === SIGNAL 3: Check historical bounces from put wall level ===
             if put_wall_strike:
-                has_bounces = await self._check_historical_bounces(symbol, put_wall_strike)
+                has_bounces = await self._check_historical_bounces(symbol, put_wall_strike, context)
                 if has_bounces:
                     put_wall_strength += 1
                     logger.warning(f"{symbol}: Historical bounces detected at {put_wall_strike:.2f}")
@@ -266,7 +262,8 @@ class DealerPositioningLayer:
     async def _check_historical_bounces(
         self,
         symbol: str,
-        level: float
+        level: float,
+        context: Optional[SymbolContext] = None
     ) -> bool:
         """
         Check if price has bounced from a level multiple times.
@@ -276,9 +273,10 @@ class DealerPositioningLayer:
         """
         try:
             # Get daily bars
-            bars = await self.polygon.get_daily_bars(
-                symbol=symbol,
-                from_date=date.today() - timedelta(days=30)
+            bars = await context_daily_bars(
+                self.polygon, symbol,
+                from_date=date.today() - timedelta(days=30),
+                context=context
             )
 
             if len(bars) < 10:
@@ -297,7 +295,12 @@ class DealerPositioningLayer:
             logger.warning(f"Error checking bounces for {symbol}: {e}")
             return False
 
-    async def get_dealer_score(self, symbol: str) -> float:
+    async def get_dealer_score(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None,
+        analysis: Optional[Tuple[bool, List[BlockReason], Optional[GEXData]]] = None
+    ) -> float:
         """
         Calculate dealer positioning score for the PUT candidate.
 
@@ -310,13 +313,21 @@ class DealerPositioningLayer:
         These second-order Greeks detect conditions where dealer hedging
         will AMPLIFY rather than dampen price moves.
 
+        Args:
+            symbol: Stock ticker
+            context: Prefetched market data
+            analysis: Result of ``analyze`` already run for this symbol
+                (skips running it a second time)
+
         Returns:
             Score from 0.0 to 1.0
         """
         score = 0.5  # Start neutral
 
         try:
-            is_blocked, block_reasons, gex_data = await self.analyze(symbol)
+            if analysis is None:
+                analysis = await self.analyze(symbol, context)
+            is_blocked, block_reasons, gex_data = analysis
 
             if is_blocked:
                 return 0.0  # Hard block = 0 score
@@ -334,7 +345,7 @@ class DealerPositioningLayer:
                     score += 0.10
 
                 # Price below GEX flip = dealers short gamma
-                quote = await self.alpaca.get_latest_quote(symbol)
+                quote = await context_quote(self.alpaca, symbol, context)
                 if quote and "quote" in quote:
                     current_price = float(quote["quote"].get("ap", 0))
                     if gex_data.gex_flip_level and current_price < gex_data.gex_flip_level:
@@ -19,6 +19,7 @@ Options-Led Distribution (CRITICAL):
 This typically appears 1-3 days before breakdown.
 """
 
+import asyncio
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Tuple, Any
 from loguru import logger
@@ -31,6 +32,11 @@ from putsengine.models import (
 from putsengine.clients.alpaca_client import AlpacaClient
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.bars import as_bar_array
+from putsengine import indicators as ind
+from putsengine.metrics import instrumented
+from putsengine.layers.context import SymbolContext, context_daily_bars, context_minute_bars
+from putsengine.layers.stages import StageRunner
 
 
 class DistributionLayer:
@@ -57,12 +63,18 @@ class DistributionLayer:
         self.settings = settings
         self.config = EngineConfig
 
-    async def analyze(self, symbol: str) -> DistributionSignal:
+    @instrumented("layer", "distribution")
+    async def analyze(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None
+    ) -> DistributionSignal:
         """
         Perform complete distribution analysis for a symbol.
 
         Args:
             symbol: Stock ticker to analyze
+            context: Prefetched market data (bars are sliced from it)
 
         Returns:
             DistributionSignal with detection results and score
@@ -77,8 +89,33 @@ class DistributionLayer:
             signals={}
         )
 
+        # Run the sub-analyses concurrently. Only the dark pool context
+        # guard needs price-volume output (VWAP, price, session high); its
+        # prints are fetched in parallel and evaluated once pv is done.
+        runner = StageRunner(symbol)
+        runner.add("price_volume", lambda: self._analyze_price_volume(symbol, context), default={})
+        runner.add("options_flow", lambda: self._analyze_options_flow(symbol), default={})
+        runner.add("dark_pool_prints", lambda: self._fetch_dark_pool_prints(symbol), default=[])
+        runner.add(
+            "dark_pool",
+            lambda pv, prints: self._analyze_dark_pool(
+                symbol,
+                current_vwap=pv.get("current_vwap"),
+                current_price=pv.get("current_price"),
+                session_high=pv.get("session_high"),
+                dp_prints=prints,
+            ),
+            after=("price_volume", "dark_pool_prints"),
+            default={},
+        )
+        runner.add("insider", lambda: self._analyze_insider_activity(symbol), default={})
+        runner.add("congress", lambda: self._analyze_congress_activity(symbol, context), default={})
+        runner.add("earnings", lambda: self.polygon.check_earnings_proximity(symbol), default={})
+        stages = await runner.run()
+        signal.stage_latency_ms = runner.timings
+
         # A. Price-Volume Analysis
-        pv_signals = await self._analyze_price_volume(symbol)
+        pv_signals = stages["price_volume"]
         signal.flat_price_rising_volume = pv_signals.get("flat_price_rising_volume", False)
         signal.failed_breakout = pv_signals.get("failed_breakout", False)
         signal.lower_highs_flat_rsi = pv_signals.get("lower_highs_flat_rsi", False)
@@ -88,43 +125,33 @@ class DistributionLayer:
         high_rvol_red_day = pv_signals.get("high_rvol_red_day", False)
         gap_down_no_recovery = pv_signals.get("gap_down_no_recovery", False)
         multi_day_weakness = pv_signals.get("multi_day_weakness", False)
-        
-        # Extract context data for dark pool analysis (ARCHITECT-4 REFINEMENT)
-        current_vwap = pv_signals.get("current_vwap")
-        current_price = pv_signals.get("current_price")
-        session_high = pv_signals.get("session_high")
 
         # B. Options Flow Analysis
-        options_signals = await self._analyze_options_flow(symbol)
+        options_signals = stages["options_flow"]
         signal.call_selling_at_bid = options_signals.get("call_selling_at_bid", False)
         signal.put_buying_at_ask = options_signals.get("put_buying_at_ask", False)
         signal.rising_put_oi = options_signals.get("rising_put_oi", False)
         signal.skew_steepening = options_signals.get("skew_steepening", False)
 
         # C. Dark Pool Analysis (with ARCHITECT-4 Context Guard)
-        dp_signals = await self._analyze_dark_pool(
-            symbol,
-            current_vwap=current_vwap,
-            current_price=current_price,
-            session_high=session_high
-        )
+        dp_signals = stages["dark_pool"]
         signal.repeated_sell_blocks = dp_signals.get("repeated_sell_blocks", False)
         
         # FEB 8, 2026: Dark pool violence (thin NBBO books + large prints)
         dark_pool_violence = dp_signals.get("dark_pool_violence", False)
 
         # D. Insider Trading Analysis (per Architect Blueprint)
-        insider_result = await self._analyze_insider_activity(symbol)
+        insider_result = stages["insider"]
         insider_boost = insider_result.get("boost", 0.0)
         
         # E. Congress Trading Analysis (per Architect Blueprint)
-        congress_result = await self._analyze_congress_activity(symbol)
+        congress_result = stages["congress"]
         congress_boost = congress_result.get("boost", 0.0)
         
         # F. Earnings Proximity Check (per Final Architect Report)
         # "Never buy puts BEFORE earnings"
         # "Buy 1 day AFTER earnings only if gap down + VWAP reclaim fails"
-        earnings_data = await self.polygon.check_earnings_proximity(symbol)
+        earnings_data = stages["earnings"]
         is_pre_earnings = earnings_data.get("is_pre_earnings", False)
         is_post_earnings = earnings_data.get("is_post_earnings", False)
         guidance_sentiment = earnings_data.get("guidance_sentiment", "neutral")
@@ -210,7 +237,11 @@ class DistributionLayer:
         if signal.score >= 0.55 and has_reversal_pattern:
             # Check index GEX condition (attempt to fetch, but don't fail if unavailable)
             try:
-                spy_gex = await self.unusual_whales.get_greek_exposure("SPY")
+                market = context.market if context is not None else None
+                if market is not None and market.has("spy_greek_exposure"):
+                    spy_gex = market.spy_greek_exposure
+                else:
+                    spy_gex = await self.unusual_whales.get_greek_exposure("SPY")
                 if spy_gex:
                     net_gex = spy_gex.get("net_gex", 0)
                     if net_gex is None or net_gex <= 0:  # Neutral or negative = dealer permission
@@ -289,7 +320,11 @@ class DistributionLayer:
 
         return signal
 
-    async def _analyze_price_volume(self, symbol: str) -> Dict[str, bool]:
+    async def _analyze_price_volume(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None
+    ) -> Dict[str, bool]:
         """
         Analyze price-volume contradictions.
 
@@ -319,19 +354,21 @@ class DistributionLayer:
 
         try:
             # Get daily bars for pattern analysis
-            daily_bars = await self.polygon.get_daily_bars(
-                symbol=symbol,
-                from_date=date.today() - timedelta(days=30)
+            daily_bars = await context_daily_bars(
+                self.polygon, symbol,
+                from_date=date.today() - timedelta(days=30),
+                context=context
             )
 
             if len(daily_bars) < 10:
                 return signals
 
             # Get minute bars for intraday analysis
-            minute_bars = await self.polygon.get_minute_bars(
-                symbol=symbol,
+            minute_bars = await context_minute_bars(
+                self.polygon, symbol,
                 from_date=date.today() - timedelta(days=2),
-                limit=2000
+                limit=2000,
+                context=context
             )
             
             # ARCHITECT-4 REFINEMENT: Extract context data for dark pool analysis
@@ -339,14 +376,14 @@ class DistributionLayer:
                 signals["current_price"] = daily_bars[-1].close
             if minute_bars:
                 # Calculate VWAP from minute bars
-                today_bars = [b for b in minute_bars if b.timestamp.date() == date.today()]
+                today_bars = as_bar_array(minute_bars).since(date.today())
                 if today_bars:
-                    signals["session_high"] = max(b.high for b in today_bars)
+                    signals["session_high"] = float(today_bars.high.max())
                     # VWAP = Σ(typical_price × volume) / Σ(volume)
-                    total_vp = sum((b.high + b.low + b.close) / 3 * b.volume for b in today_bars)
-                    total_vol = sum(b.volume for b in today_bars)
-                    if total_vol > 0:
-                        signals["current_vwap"] = total_vp / total_vol
+                    if today_bars.volume.sum() > 0:
+                        signals["current_vwap"] = float(ind.vwap(
+                            today_bars.high, today_bars.low, today_bars.close, today_bars.volume
+                        ))
 
             # 1. Flat price + rising volume
             signals["flat_price_rising_volume"] = self._detect_flat_price_rising_volume(
@@ -399,7 +436,7 @@ class DistributionLayer:
             return False
 
         # Calculate average volume (exclude last bar to get true average)
-        avg_volume = np.mean([b.volume for b in bars[-21:-1]])  # Use 20 bars before current
+        avg_volume = as_bar_array(bars).volume[-21:-1].mean()  # Use 20 bars before current
         
         if avg_volume == 0:
             return False
@@ -508,7 +545,7 @@ class DistributionLayer:
         
         # 3. RVOL confirmation (ARCHITECT-4 ADDITION)
         # Use 20-day SMA as baseline per Architect-4
-        avg_volume_20d = np.mean([b.volume for b in bars[-21:-1]])
+        avg_volume_20d = as_bar_array(bars).volume[-21:-1].mean()
         if avg_volume_20d == 0:
             return False
         
@@ -542,18 +579,14 @@ class DistributionLayer:
         if len(bars) < 5:
             return False
 
-        recent = bars[-5:]
+        recent = as_bar_array(bars)[-5:]
         
-        # Count consecutive lower closes
-        lower_closes = 0
-        for i in range(1, len(recent)):
-            if recent[i].close < recent[i-1].close:
-                lower_closes += 1
-            else:
-                break  # Reset count if we get an up close
+        # Count consecutive lower closes (stop at the first up close)
+        lower = np.diff(recent.close) < 0
+        lower_closes = len(lower) if lower.all() else int(np.argmin(lower))
         
         # Count red days (close < open)
-        red_days = sum(1 for b in recent[-3:] if b.close < b.open)
+        red_days = int(np.count_nonzero(recent.close[-3:] < recent.open[-3:]))
         
         # 3+ consecutive lower closes OR 3 red days in last 3 = weakness
         return lower_closes >= 3 or red_days >= 3
@@ -568,14 +601,14 @@ class DistributionLayer:
         if len(bars) < 5:
             return False
 
-        recent = bars[-5:]
+        recent = as_bar_array(bars)[-5:]
 
         # Check price range (should be tight)
-        prices = [b.close for b in recent]
-        price_range = (max(prices) - min(prices)) / np.mean(prices)
+        prices = recent.close
+        price_range = (prices.max() - prices.min()) / prices.mean()
 
         # Check volume trend (should be rising)
-        volumes = [b.volume for b in recent]
+        volumes = recent.volume
         vol_trend = (volumes[-1] - volumes[0]) / volumes[0] if volumes[0] > 0 else 0
 
         # Flat price (< 2% range) + rising volume (> 20% increase)
@@ -591,22 +624,18 @@ class DistributionLayer:
         if len(bars) < 20:
             return False
 
+        b = as_bar_array(bars)
+
         # Find recent high
-        recent_20 = bars[-20:]
-        highs = [b.high for b in recent_20]
-        resistance = max(highs)
-
-        # Check if recent bar broke above then closed below
-        for i in range(-3, 0):
-            bar = bars[i]
-            if bar.high >= resistance * 0.995:  # Touched resistance
-                if bar.close < resistance * 0.98:  # Closed below
-                    # Check if volume was elevated
-                    avg_vol = np.mean([b.volume for b in bars[-20:-1]])
-                    if bar.volume > avg_vol * self.config.VOLUME_SPIKE_THRESHOLD:
-                        return True
+        resistance = b.high[-20:].max()
 
-        return False
+        # Check if recent bar broke above then closed below on elevated volume
+        touched = b.high[-3:] >= resistance * 0.995  # Touched resistance
+        closed_below = b.close[-3:] < resistance * 0.98
+        avg_vol = b.volume[-20:-1].mean()
+        spiked = b.volume[-3:] > avg_vol * self.config.VOLUME_SPIKE_THRESHOLD
+
+        return bool(np.any(touched & closed_below & spiked))
 
     def _detect_lower_highs_flat_rsi(self, bars: List[PriceBar]) -> bool:
         """
@@ -620,15 +649,15 @@ class DistributionLayer:
             return False
 
         # Calculate RSI
-        rsi_values = self._calculate_rsi([b.close for b in bars], period=14)
+        b = as_bar_array(bars)
+        rsi_values = self._calculate_rsi(b.close, period=14)
         if len(rsi_values) < 10:
             return False
 
-        recent = bars[-10:]
         recent_rsi = rsi_values[-10:]
 
         # Check for lower highs in price
-        highs = [b.high for b in recent]
+        highs = b.high[-10:]
         price_making_lower_highs = all(
             highs[i] >= highs[i + 1] for i in range(len(highs) - 3, len(highs) - 1)
         )
@@ -650,25 +679,22 @@ class DistributionLayer:
 
         # Get today's bars only
         today = date.today()
-        today_bars = [b for b in bars if b.timestamp.date() == today]
+        today_bars = as_bar_array(bars).since(today)
 
         if len(today_bars) < 30:
             return False
 
         # Calculate VWAP
         vwap = self._calculate_vwap(today_bars)
-        current_price = today_bars[-1].close
+        current_price = float(today_bars.close[-1])
 
         # Check if below VWAP
         if current_price >= vwap:
             return False
 
-        # Check for failed reclaim attempts
-        reclaim_attempts = 0
-        for i in range(len(today_bars) - 20, len(today_bars)):
-            bar = today_bars[i]
-            if bar.high >= vwap and bar.close < vwap:
-                reclaim_attempts += 1
+        # Check for failed reclaim attempts in the last 20 bars
+        last_20 = today_bars[-20:]
+        reclaim_attempts = int(np.count_nonzero((last_20.high >= vwap) & (last_20.close < vwap)))
 
         return reclaim_attempts >= 2
 
@@ -677,44 +703,13 @@ class DistributionLayer:
         if not bars:
             return 0.0
 
-        total_volume = 0
-        total_vwap = 0.0
-
-        for bar in bars:
-            typical_price = (bar.high + bar.low + bar.close) / 3
-            total_vwap += typical_price * bar.volume
-            total_volume += bar.volume
-
-        return total_vwap / total_volume if total_volume > 0 else bars[-1].close
+        b = as_bar_array(bars)
+        return float(ind.vwap(b.high, b.low, b.close, b.volume))
 
     def _calculate_rsi(self, prices: List[float], period: int = 14) -> List[float]:
         """Calculate RSI indicator."""
-        if len(prices) < period + 1:
-            return []
-
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        rsi_values = []
-
-        # Initial average
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
-
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-
-            rsi_values.append(rsi)
-
-        return rsi_values
+        # Values start after the Wilder seed (historical layer convention)
+        return ind.wilder_rsi(prices, period)[period + 1:].tolist()
 
     async def _analyze_options_flow(self, symbol: str) -> Dict[str, bool]:
         """
@@ -733,18 +728,19 @@ class DistributionLayer:
             "skew_steepening": False
         }
 
-        try:
-            # Get options flow from Unusual Whales
-            put_flow = await self.unusual_whales.get_put_flow(
-                symbol=symbol,
-                min_premium=10000,
-                limit=30
-            )
+        # Flow, call selling, OI change and skew are independent: fetch at once
+        put_flow, call_selling, oi_data, skew_data = await asyncio.gather(
+            self.unusual_whales.get_put_flow(symbol=symbol, min_premium=10000, limit=30),
+            self.unusual_whales.get_call_selling_flow(symbol=symbol, limit=30),
+            self.unusual_whales.get_oi_change(symbol),
+            self.unusual_whales.get_skew(symbol),
+            return_exceptions=True,
+        )
 
-            call_selling = await self.unusual_whales.get_call_selling_flow(
-                symbol=symbol,
-                limit=30
-            )
+        try:
+            for fetched in (put_flow, call_selling):
+                if isinstance(fetched, BaseException):
+                    raise fetched
 
             # 1. Call selling at bid
             if call_selling and isinstance(call_selling, list):
@@ -824,7 +820,8 @@ class DistributionLayer:
             # FEB 10, 2026 FIX: UW /api/stock/{ticker}/oi-change returns a list
             # of daily records with various field names. We try multiple field name
             # patterns and also compute change from absolute put_oi values if available.
-            oi_data = await self.unusual_whales.get_oi_change(symbol)
+            if isinstance(oi_data, BaseException):
+                raise oi_data
             if oi_data:
                 # Normalize to list of records
                 records = []
@@ -873,7 +870,8 @@ class DistributionLayer:
             # Negative risk_reversal = puts expensive vs calls = bearish.
             # Increasingly negative (skew_change < 0) = skew steepening = bearish.
             # NEW: skew_reversal = True when risk_reversal flips sign day-over-day.
-            skew_data = await self.unusual_whales.get_skew(symbol)
+            if isinstance(skew_data, BaseException):
+                raise skew_data
             if skew_data:
                 # Handle list response
                 if isinstance(skew_data, list):
@@ -923,12 +921,17 @@ class DistributionLayer:
 
         return signals
 
+    async def _fetch_dark_pool_prints(self, symbol: str) -> List[DarkPoolPrint]:
+        """Recent dark pool prints for ``symbol``."""
+        return await self.unusual_whales.get_dark_pool_flow(symbol=symbol, limit=30)
+
     async def _analyze_dark_pool(
         self, 
         symbol: str,
         current_vwap: Optional[float] = None,
         current_price: Optional[float] = None,
-        session_high: Optional[float] = None
+        session_high: Optional[float] = None,
+        dp_prints: Optional[List[DarkPoolPrint]] = None
     ) -> Dict[str, bool]:
         """
         Analyze dark pool for distribution signals.
@@ -957,11 +960,9 @@ class DistributionLayer:
         }
 
         try:
-            # Get dark pool prints
-            dp_prints = await self.unusual_whales.get_dark_pool_flow(
-                symbol=symbol,
-                limit=30
-            )
+            # Get dark pool prints (unless analyze() already fetched them)
+            if dp_prints is None:
+                dp_prints = await self._fetch_dark_pool_prints(symbol)
 
             if len(dp_prints) < 5:
                 return signals
@@ -1144,7 +1145,11 @@ class DistributionLayer:
 
         return result
 
-    async def _analyze_congress_activity(self, symbol: str) -> Dict[str, Any]:
+    async def _analyze_congress_activity(
+        self,
+        symbol: str,
+        context: Optional[SymbolContext] = None
+    ) -> Dict[str, Any]:
         """
         Analyze congressional trading patterns per Final Architect Blueprint.
         
@@ -1161,14 +1166,19 @@ class DistributionLayer:
         }
 
         try:
-            congress_trades = await self.unusual_whales.get_congress_trades(limit=100)
+            market = context.market if context is not None else None
+            if market is not None and market.has("congress"):
+                # Scan-wide feed, already indexed by ticker
+                symbol_trades = market.congress_trades(symbol)
+            else:
+                congress_trades = await self.unusual_whales.get_congress_trades(limit=100)
 
-            if not congress_trades:
-                return result
+                if not congress_trades:
+                    return result
 
-            # Filter for this symbol
-            symbol_trades = [t for t in congress_trades 
-                           if str(t.get('ticker', '') or '').upper() == symbol.upper()]
+                # Filter for this symbol
+                symbol_trades = [t for t in congress_trades 
+                               if str(t.get('ticker', '') or '').upper() == symbol.upper()]
             
             if not symbol_trades:
                 return result
@@ -22,6 +22,12 @@ from putsengine.config import EngineConfig, Settings
 from putsengine.models import LiquidityVacuum, PriceBar
 from putsengine.clients.alpaca_client import AlpacaClient
 from putsengine.clients.polygon_client import PolygonClient
+from putsengine.bars import as_bar_array
+from putsengine import indicators as ind
+from putsengine.metrics import instrumented
+from putsengine.layers.context import (
+    SymbolContext, context_minute_bars, context_quote, context_snapshot
+)
 
 
 class LiquidityVacuumLayer:
@@ -46,10 +52,12 @@ class LiquidityVacuumLayer:
         self.settings = settings
         self.config = EngineConfig
 
+    @instrumented("layer", "liquidity")
     async def analyze(
         self, 
         symbol: str,
-        include_sector_context: bool = False
+        include_sector_context: bool = False,
+        context: Optional[SymbolContext] = None
     ) -> LiquidityVacuum:
         """
         Perform liquidity vacuum analysis for a symbol.
@@ -57,6 +65,7 @@ class LiquidityVacuumLayer:
         Args:
             symbol: Stock ticker to analyze
             include_sector_context: If True, also analyze sector peers (ARCHITECT-4)
+            context: Prefetched market data (bars/quote/snapshot are sliced from it)
 
         Returns:
             LiquidityVacuum with detection results and score
@@ -71,17 +80,18 @@ class LiquidityVacuumLayer:
 
         try:
             # Get intraday bars
-            minute_bars = await self.polygon.get_minute_bars(
-                symbol=symbol,
+            minute_bars = await context_minute_bars(
+                self.polygon, symbol,
                 from_date=date.today() - timedelta(days=2),
-                limit=2000
+                limit=2000,
+                context=context
             )
 
             # Get quotes for bid/ask analysis
-            quote_data = await self.alpaca.get_latest_quote(symbol)
+            quote_data = await context_quote(self.alpaca, symbol, context)
 
             # Get snapshot for current market data
-            snapshot = await self.polygon.get_snapshot(symbol)
+            snapshot = await context_snapshot(self.polygon, symbol, context)
 
             # 1. Bid size collapsing (ARCHITECT-4: ADV-normalized)
             vacuum.bid_collapsing = await self._detect_bid_collapse(
@@ -90,7 +100,7 @@ class LiquidityVacuumLayer:
 
             # 2. Spread widening (ARCHITECT-4: 15-min persistence)
             vacuum.spread_widening = await self._detect_spread_widening(
-                symbol, quote_data, snapshot, minute_bars
+                symbol, quote_data, snapshot, minute_bars, context
             )
 
             # 3. Volume with no price progress
@@ -178,18 +188,23 @@ class LiquidityVacuumLayer:
                 return False
 
             # Get historical quote data for comparison
-            # We'll use trades as a proxy for typical liquidity
-            trades = await self.polygon.get_trades(
-                symbol=symbol,
+            # We'll use trades as a proxy for typical liquidity.
+            # Calculate avg_print_size_1000 (rolling baseline from the 1000
+            # most recent trades), streamed: stops reading once it has them
+            print_count = 0
+            print_volume = 0
+            async for trade in self.polygon.iter_trades(
+                symbol,
                 from_date=date.today() - timedelta(days=1),
                 limit=1000
-            )
+            ):
+                print_count += 1
+                print_volume += trade.get("size", 0)
 
-            if not trades:
+            if not print_count:
                 return False
 
-            # Calculate avg_print_size_1000 (rolling baseline from recent trades)
-            avg_print_size_1000 = np.mean([t.get("size", 0) for t in trades])
+            avg_print_size_1000 = print_volume / print_count
 
             # CONDITION 1: Bid collapse relative to print size
             # bid_size < 30% of avg_print_size_1000
@@ -201,7 +216,7 @@ class LiquidityVacuumLayer:
             # ADV proxy: avg minute volume × 390 (minutes in trading day)
             collapse_vs_adv = False
             if minute_bars and len(minute_bars) > 0:
-                avg_minute_volume = np.mean([b.volume for b in minute_bars])
+                avg_minute_volume = float(as_bar_array(minute_bars).volume.mean())
                 adv_shares = avg_minute_volume * 390  # Approx ADV
                 threshold_adv = adv_shares * 0.005  # 0.5% of ADV
                 collapse_vs_adv = current_bid_size < threshold_adv
@@ -229,7 +244,8 @@ class LiquidityVacuumLayer:
         symbol: str,
         quote_data: Dict,
         snapshot: Dict,
-        minute_bars: Optional[List] = None
+        minute_bars: Optional[List] = None,
+        context: Optional[SymbolContext] = None
     ) -> bool:
         """
         Detect if bid-ask spread is widening.
@@ -267,10 +283,11 @@ class LiquidityVacuumLayer:
             spread_pct = current_spread / mid_price if mid_price > 0 else 0
 
             # Get historical bars to estimate normal spread
-            bars = await self.polygon.get_minute_bars(
-                symbol=symbol,
+            bars = await context_minute_bars(
+                self.polygon, symbol,
                 from_date=date.today() - timedelta(days=5),
-                limit=1000
+                limit=1000,
+                context=context
             )
 
             if not bars:
@@ -278,19 +295,17 @@ class LiquidityVacuumLayer:
 
             # Estimate typical spread from high-low range during low volume periods
             # NOTE: This is a PROXY method, not true quote spread history
-            avg_volume = np.mean([b.volume for b in bars])
-            typical_ranges = []
-            for bar in bars:
-                if bar.volume < avg_volume * 0.5:
-                    # Low volume bar - range approximates spread
-                    range_pct = (bar.high - bar.low) / bar.close if bar.close > 0 else 0
-                    typical_ranges.append(range_pct)
-
-            if not typical_ranges:
+            b = as_bar_array(bars)
+            avg_volume = b.volume.mean()
+            # Low volume bars - range approximates spread
+            quiet = b.volume < avg_volume * 0.5
+            typical_ranges = self._range_pct(b)[quiet]
+
+            if not len(typical_ranges):
                 # Default: spread > 0.5% is wide for liquid stocks
                 normal_spread = 0.0025  # 0.25% baseline
             else:
-                normal_spread = np.mean(typical_ranges)
+                normal_spread = float(typical_ranges.mean())
             
             threshold = normal_spread * self.config.SPREAD_WIDENING_THRESHOLD
             current_wide = spread_pct > threshold
@@ -305,17 +320,13 @@ class LiquidityVacuumLayer:
             if minute_bars and len(minute_bars) >= 15:
                 # Get last 15 minutes of bars
                 today = date.today()
-                today_bars = [b for b in minute_bars if b.timestamp.date() == today]
+                today_bars = as_bar_array(minute_bars).since(today)
                 
                 if len(today_bars) >= 15:
                     recent_15 = today_bars[-15:]
                     
                     # Count bars where range (spread proxy) exceeded threshold
-                    wide_count = 0
-                    for bar in recent_15:
-                        bar_range_pct = (bar.high - bar.low) / bar.close if bar.close > 0 else 0
-                        if bar_range_pct > threshold:
-                            wide_count += 1
+                    wide_count = int(np.count_nonzero(self._range_pct(recent_15) > threshold))
                     
                     persistence_pct = wide_count / 15
                     
@@ -352,7 +363,7 @@ class LiquidityVacuumLayer:
 
         # Get today's bars
         today = date.today()
-        today_bars = [b for b in bars if b.timestamp.date() == today]
+        today_bars = as_bar_array(bars).since(today)
 
         if len(today_bars) < 30:
             return False
@@ -361,12 +372,12 @@ class LiquidityVacuumLayer:
         recent = today_bars[-30:]
 
         # Calculate volume vs price change
-        total_volume = sum(b.volume for b in recent)
-        avg_volume = np.mean([b.volume for b in today_bars[:-30]]) if len(today_bars) > 30 else total_volume / 30
+        total_volume = float(recent.volume.sum())
+        avg_volume = today_bars.volume[:-30].mean() if len(today_bars) > 30 else total_volume / 30
 
         # Price change over period
-        price_start = recent[0].open
-        price_end = recent[-1].close
+        price_start = float(recent.open[0])
+        price_end = float(recent.close[-1])
         price_change = abs(price_end - price_start) / price_start if price_start > 0 else 0
 
         # Volume is elevated (>1.5x normal)
@@ -389,14 +400,14 @@ class LiquidityVacuumLayer:
 
         # Get today's bars
         today = date.today()
-        today_bars = [b for b in bars if b.timestamp.date() == today]
+        today_bars = as_bar_array(bars).since(today)
 
         if len(today_bars) < 50:
             return False
 
         # Calculate VWAP
         vwap = self._calculate_vwap(today_bars)
-        current_price = today_bars[-1].close
+        current_price = float(today_bars.close[-1])
 
         # Only relevant if currently below VWAP
         if current_price >= vwap:
@@ -406,33 +417,36 @@ class LiquidityVacuumLayer:
         failed_reclaims = 0
         in_retest = False
 
-        for bar in today_bars:
-            if not in_retest and bar.low < vwap:
+        for low, high, close in zip(
+            today_bars.low.tolist(), today_bars.high.tolist(), today_bars.close.tolist(),
+            strict=True,
+        ):
+            if not in_retest and low < vwap:
                 # Price dipped below VWAP
                 in_retest = True
-            elif in_retest and bar.high >= vwap:
+            elif in_retest and high >= vwap:
                 # Price attempted to reclaim
-                if bar.close < vwap:
+                if close < vwap:
                     # But closed below = failed reclaim
                     failed_reclaims += 1
                     in_retest = False
 
         return failed_reclaims >= 2
 
+    @staticmethod
+    def _range_pct(bars) -> np.ndarray:
+        """(high - low) / close per bar, 0 where close is not positive."""
+        close = bars.close
+        safe = np.where(close > 0, close, 1.0)
+        return np.where(close > 0, (bars.high - bars.low) / safe, 0.0)
+
     def _calculate_vwap(self, bars: List[PriceBar]) -> float:
         """Calculate VWAP from price bars."""
         if not bars:
             return 0.0
 
-        total_volume = 0
-        total_vwap = 0.0
-
-        for bar in bars:
-            typical_price = (bar.high + bar.low + bar.close) / 3
-            total_vwap += typical_price * bar.volume
-            total_volume += bar.volume
-
-        return total_vwap / total_volume if total_volume > 0 else bars[-1].close
+        b = as_bar_array(bars)
+        return float(ind.vwap(b.high, b.low, b.close, b.volume))
 
     def _calculate_liquidity_score(self, vacuum: LiquidityVacuum) -> float:
         """
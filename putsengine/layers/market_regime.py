@@ -27,6 +27,9 @@ from putsengine.models import (
 from putsengine.clients.alpaca_client import AlpacaClient
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.bars import as_bar_array
+from putsengine import indicators as ind
+from putsengine.metrics import instrumented
 
 
 class MarketRegimeLayer:
@@ -56,6 +59,7 @@ class MarketRegimeLayer:
         self._cached_gex = 0.0
         self._gex_cache_time: Optional[datetime] = None
 
+    @instrumented("layer", "market_regime")
     async def analyze(self, force_api_call: bool = False) -> MarketRegimeData:
         """
         Perform complete market regime analysis.
@@ -222,17 +226,8 @@ class MarketRegimeLayer:
             return bars[-1].vwap
 
         # Calculate manually
-        total_volume = 0
-        total_vwap = 0.0
-
-        for bar in bars:
-            typical_price = (bar.high + bar.low + bar.close) / 3
-            total_vwap += typical_price * bar.volume
-            total_volume += bar.volume
-
-        if total_volume > 0:
-            return total_vwap / total_volume
-        return bars[-1].close
+        b = as_bar_array(bars)
+        return float(ind.vwap(b.high, b.low, b.close, b.volume))
 
     async def _get_vix_data(self) -> Tuple[float, float]:
         """
@@ -0,0 +1,79 @@
+"""
+Stage Runner - run a layer's sub-analyses concurrently, respecting dependencies.
+
+WHY:
+``DistributionLayer.analyze`` awaited about ten independent network-bound
+steps one after another (bars, UW flow/OI/skew/dark pool, insider,
+congress, earnings), so per-symbol latency was the sum of all of them.
+
+HOW:
+- Each stage is an async callable plus the names of the stages it needs.
+- Every stage starts as a task immediately; a stage with dependencies
+  awaits their results and receives them as positional arguments, so
+  independent fetches overlap and only true data dependencies serialize.
+- A stage that raises yields its ``default`` (stages are expected to
+  degrade to "no signal", as the layer methods already do).
+- ``timings`` records each stage's own run time in milliseconds
+  (time spent waiting on dependencies is excluded).
+
+Usage:
+    runner = StageRunner(symbol)
+    runner.add("pv", lambda: self._analyze_price_volume(symbol), default={})
+    runner.add("dp", lambda pv: self._analyze_dark_pool(symbol, ...), after=("pv",), default={})
+    results = await runner.run()
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+
+from loguru import logger
+
+
+class StageRunner:
+    """Dependency-aware concurrent runner for one symbol's analysis stages."""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self._stages: Dict[str, Tuple[Callable[..., Awaitable[Any]], Tuple[str, ...], Any]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        after: Iterable[str] = (),
+        default: Any = None,
+    ) -> "StageRunner":
+        after = tuple(after)
+        for dep in after:
+            if dep not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+        self._stages[name] = (fn, after, default)
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every stage; returns {stage name: result or default}."""
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def _run(name: str) -> Any:
+            fn, after, default = self._stages[name]
+            inputs = [await tasks[dep] for dep in after]
+            started = time.perf_counter()
+            try:
+                return await fn(*inputs)
+            except Exception as e:
+                logger.debug(f"{self.label}: stage {name} failed: {e}")
+                return default
+            finally:
+                self.timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+        # Insertion order guarantees dependencies are created first
+        for name in self._stages:
+            tasks[name] = asyncio.ensure_future(_run(name))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return {name: task.result() for name, task in tasks.items()}
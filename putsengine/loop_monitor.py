@@ -0,0 +1,236 @@
+"""
+Loop Monitor - event-loop lag, blocked-loop stack traces, and a blocking-work pool.
+
+WHY:
+The daemon runs every scan, job graph cascade and HTTP call on one asyncio
+loop. The Feb 9 heartbeat (``scheduler_loop_health.json``) only proves the
+loop is alive. Nothing measured how long synchronous work held it:
+    - JSON dumps of the scan results
+    - ``gc.collect()`` after every scan
+    - sync wrappers such as ``_run_convergence_wrapper``
+While the loop is held, every in-flight request, gateway token and
+heartbeat waits.
+
+HOW:
+- ``LoopMonitor`` runs two parts:
+    * A sampler task. It sleeps ``interval`` seconds and records how late
+      it woke up. That is the loop lag. Lags go to a rolling window
+      (percentiles for the heartbeat/watchdog) and to the
+      ``putsengine_event_loop_lag_seconds`` histogram.
+    * A detector thread. If the sampler hasn't ticked for
+      ``stall_threshold`` seconds, the loop is blocked *now*. The thread
+      captures the loop thread's current stack (``sys._current_frames``)
+      while the blocking callback is still on it. When the loop wakes, the
+      stall gets its duration. Recent stalls are kept and logged, and
+      counted in ``putsengine_event_loop_stalls_total``.
+- ``run_blocking(fn, *args)`` runs sync file/CPU work on a managed thread
+  pool. The caller's context is copied, so metrics attribution still
+  applies. The loop keeps serving I/O meanwhile.
+
+Usage:
+    monitor = LoopMonitor()
+    monitor.start()                       # inside the running loop
+    monitor.stats()                       # {"p95_ms": ..., "recent_stalls": [...]}
+
+    await run_blocking(self._save_results)
+"""
+
+import asyncio
+import contextvars
+import functools
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from putsengine.metrics import LAG_BUCKETS, get_metrics
+
+
+SAMPLE_INTERVAL_SECONDS = 0.25
+STALL_THRESHOLD_SECONDS = 0.5     # Loop blocked this long -> capture its stack
+WINDOW_SECONDS = 600              # Percentiles cover the last 10 minutes
+MAX_STALLS_KEPT = 20
+STACK_FRAMES_KEPT = 15
+BLOCKING_POOL_WORKERS = 4
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+
+class LoopMonitor:
+    """Lag sampler + blocked-loop detector for one event loop."""
+
+    def __init__(
+        self,
+        interval: float = SAMPLE_INTERVAL_SECONDS,
+        stall_threshold: float = STALL_THRESHOLD_SECONDS,
+        window_seconds: float = WINDOW_SECONDS,
+    ):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.window_seconds = window_seconds
+        self._samples: Deque[Tuple[float, float]] = deque()   # (monotonic time, lag seconds)
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=MAX_STALLS_KEPT)
+        self.stalls_total = 0
+        self._pending_stall: Optional[Dict[str, Any]] = None
+        self._last_tick = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start sampling the running loop (call from inside it)."""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        self._thread = threading.Thread(
+            target=self._detect, name="putsengine-loop-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=2 * self.interval)
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Sampling (on the loop) and detection (off the loop)
+    # ------------------------------------------------------------------
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        registry = get_metrics()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            now = time.monotonic()
+            self._last_tick = now
+            registry.observe("putsengine_event_loop_lag_seconds", lag, buckets=LAG_BUCKETS)
+            registry.set_gauge("putsengine_event_loop_lag_last_seconds", lag)
+            with self._lock:
+                self._samples.append((now, lag))
+                while self._samples and now - self._samples[0][0] > self.window_seconds:
+                    self._samples.popleft()
+                if self._pending_stall is not None:
+                    self._finish_stall(lag)
+
+    def _detect(self) -> None:
+        while not self._stop.wait(self.interval):
+            blocked_for = time.monotonic() - self._last_tick
+            if blocked_for < self.stall_threshold:
+                continue
+            with self._lock:
+                if self._pending_stall is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = (
+                    traceback.format_stack(frame)[-STACK_FRAMES_KEPT:] if frame is not None else []
+                )
+                self._pending_stall = {
+                    "at": time.time() - blocked_for,
+                    "detected_after_ms": round(blocked_for * 1000, 1),
+                    "where": self._blamed_frame(frame),
+                    "stack": [line.rstrip() for line in stack],
+                }
+
+    @staticmethod
+    def _blamed_frame(frame) -> str:
+        """Innermost frame in our own code (else the innermost frame)."""
+        innermost = None
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            location = f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            innermost = innermost or location
+            if "putsengine" in filename and "loop_monitor" not in filename:
+                return location
+            frame = frame.f_back
+        return innermost or "unknown"
+
+    def _finish_stall(self, lag: float) -> None:
+        stall = self._pending_stall
+        self._pending_stall = None
+        stall["duration_ms"] = round((lag + self.interval) * 1000, 1)
+        self.stalls.append(stall)
+        self.stalls_total += 1
+        get_metrics().inc("putsengine_event_loop_stalls_total")
+        logger.warning(f"Event loop blocked {stall['duration_ms']:.0f}ms at {stall['where']}")
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def stats(self, include_stacks: bool = True) -> Dict[str, Any]:
+        """Lag percentiles over the window plus recent stalls."""
+        with self._lock:
+            lags = sorted(lag for _, lag in self._samples)
+            stalls = [dict(s) for s in self.stalls]
+        if not include_stacks:
+            for stall in stalls:
+                stall.pop("stack", None)
+        return {
+            "window_seconds": self.window_seconds,
+            "samples": len(lags),
+            "p50_ms": round(_percentile(lags, 50) * 1000, 1),
+            "p95_ms": round(_percentile(lags, 95) * 1000, 1),
+            "p99_ms": round(_percentile(lags, 99) * 1000, 1),
+            "max_ms": round(lags[-1] * 1000, 1) if lags else 0.0,
+            "stalls_total": self.stalls_total,
+            "recent_stalls": stalls[-5:],
+        }
+
+
+# ----------------------------------------------------------------------
+# Blocking work off the loop
+# ----------------------------------------------------------------------
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_blocking_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=BLOCKING_POOL_WORKERS, thread_name_prefix="putsengine-blocking"
+            )
+        return _pool
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run sync file/CPU work on the managed pool (context, e.g. metrics attribution, is kept)."""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_blocking_pool(), call)
+
+
+def shutdown_blocking_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
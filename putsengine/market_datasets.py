@@ -0,0 +1,134 @@
+"""
+Market Datasets - market-wide feeds fetched once per scan, indexed by ticker.
+
+WHY:
+Some UW endpoints return the whole market, not one ticker. They were still
+fetched per symbol: ``_analyze_congress_activity`` pulled the 100 latest
+congress trades for every ticker and then filtered the list, and every
+distribution handoff check re-fetched SPY greek exposure. Global flow
+alerts, recent dark pool prints and market tide were pulled separately by
+each scanner and engine that read them. A full scan spent hundreds of
+requests re-downloading identical lists and scanning them.
+
+HOW:
+- ``MarketDatasets.fetch`` pulls each global feed once, concurrently, at
+  the start of a scan, and builds ``{ticker: [records]}`` indexes.
+- Layers reach it through ``SymbolContext.market``; scanners and the
+  pulse/direction engines take it as an optional ``market`` argument.
+  Lookups are dict gets.
+- A feed that wasn't requested or failed to load is ``None``, and
+  ``has(feed)`` is False. Callers then fetch it live, so every consumer
+  still works without a prefetch.
+
+Usage:
+    market = await MarketDatasets.fetch(uw)
+    context = await SymbolContext.fetch(symbol, polygon, alpaca, market=market)
+    trades = market.congress_trades("AAPL")        # [] if none
+    market = await MarketDatasets.fetch(uw, DEFAULT_FEEDS + ("market_tide",))
+    engine = MarketPulseEngine(polygon, uw, market=market)
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+
+# Records requested per list feed
+CONGRESS_LIMIT = 100
+FLOW_ALERTS_LIMIT = 100
+DARK_POOL_LIMIT = 200
+
+# What the per-symbol layers read; scanners and engines ask for the others
+DEFAULT_FEEDS = ("congress", "spy_greek_exposure")
+ALL_FEEDS = DEFAULT_FEEDS + ("flow_alerts", "dark_pool", "market_tide")
+
+
+def index_by_ticker(records: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group records by upper-cased ``ticker`` (or ``symbol``), keeping feed order."""
+    index: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for record in records or []:
+        if not isinstance(record, dict):
+            continue
+        ticker = str(record.get("ticker") or record.get("symbol") or "").upper()
+        if ticker:
+            index[ticker].append(record)
+    return dict(index)
+
+
+@dataclass
+class MarketDatasets:
+    """Global UW feeds for one scan, with per-ticker indexes."""
+    fetched_at: datetime
+    congress: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    flow_alerts: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    dark_pool: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    flow_alerts_raw: Optional[List[Dict[str, Any]]] = None
+    spy_greek_exposure: Optional[Dict[str, Any]] = None
+    market_tide: Optional[Dict[str, Any]] = None
+    fetch_seconds: float = 0.0
+    requests: int = 0
+    failed_feeds: List[str] = field(default_factory=list)
+
+    @classmethod
+    async def fetch(cls, uw, feeds: Iterable[str] = DEFAULT_FEEDS) -> "MarketDatasets":
+        """
+        Fetch the requested global feeds concurrently.
+
+        Args:
+            uw: UnusualWhalesClient
+            feeds: Subset of ALL_FEEDS to load
+        """
+        feeds = [f for f in feeds if f in ALL_FEEDS]
+        datasets = cls(fetched_at=datetime.now())
+        started = time.monotonic()
+
+        calls = {
+            "congress": lambda: uw.get_congress_trades(limit=CONGRESS_LIMIT),
+            "flow_alerts": lambda: uw.get_global_flow_alerts(limit=FLOW_ALERTS_LIMIT),
+            "dark_pool": lambda: uw.get_dark_pool_recent(limit=DARK_POOL_LIMIT),
+            "spy_greek_exposure": lambda: uw.get_greek_exposure("SPY"),
+            "market_tide": lambda: uw.get_market_tide(),
+        }
+        results = await asyncio.gather(*(calls[f]() for f in feeds), return_exceptions=True)
+        datasets.requests = len(feeds)
+
+        for feed, value in zip(feeds, results, strict=True):
+            if isinstance(value, BaseException):
+                logger.debug(f"Market dataset {feed} failed: {value}")
+                datasets.failed_feeds.append(feed)
+                continue
+            if feed in ("congress", "dark_pool"):
+                setattr(datasets, feed, index_by_ticker(value))
+            elif feed == "flow_alerts":
+                datasets.flow_alerts_raw = list(value or [])
+                datasets.flow_alerts = index_by_ticker(datasets.flow_alerts_raw)
+            else:
+                setattr(datasets, feed, value or {})
+
+        datasets.fetch_seconds = time.monotonic() - started
+        logger.info(
+            f"Market datasets: {len(feeds) - len(datasets.failed_feeds)}/{len(feeds)} feeds "
+            f"in {datasets.fetch_seconds:.1f}s"
+        )
+        return datasets
+
+    def has(self, feed: str) -> bool:
+        return getattr(self, feed, None) is not None
+
+    # ------------------------------------------------------------------
+    # Per-ticker lookups ([] when the ticker has no records)
+    # ------------------------------------------------------------------
+
+    def congress_trades(self, symbol: str) -> List[Dict[str, Any]]:
+        return (self.congress or {}).get(symbol.upper(), [])
+
+    def flow_alerts_for(self, symbol: str) -> List[Dict[str, Any]]:
+        return (self.flow_alerts or {}).get(symbol.upper(), [])
+
+    def dark_pool_for(self, symbol: str) -> List[Dict[str, Any]]:
+        return (self.dark_pool or {}).get(symbol.upper(), [])
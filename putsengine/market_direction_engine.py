@@ -34,6 +34,7 @@ from loguru import logger
 from putsengine.config import get_settings, EngineConfig
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.metrics import instrumented
 
 
 class MarketDirection(Enum):
@@ -141,10 +142,11 @@ class MarketDirectionEngine:
     GEX_POSITIVE_THRESHOLD = 2.0   # Strongly positive
     GEX_NEGATIVE_THRESHOLD = -2.0  # Strongly negative
     
-    def __init__(self):
+    def __init__(self, market=None):
         self.settings = get_settings()
         self.polygon: Optional[PolygonClient] = None
         self.uw: Optional[UnusualWhalesClient] = None
+        self.market = market  # Scan-wide MarketDatasets (market tide), optional
         
     async def _init_clients(self):
         """Initialize API clients."""
@@ -160,6 +162,12 @@ class MarketDirectionEngine:
         if self.uw:
             await self.uw.close()
     
+    async def _market_tide(self) -> Dict[str, Any]:
+        """Market tide from the scan's MarketDatasets, or live if it wasn't prefetched."""
+        if self.market is not None and self.market.has("market_tide"):
+            return self.market.market_tide
+        return await self.uw.get_market_tide()
+    
     # =========================================================================
     # SIGNAL GENERATORS
     # =========================================================================
@@ -637,7 +645,7 @@ class MarketDirectionEngine:
         
         try:
             # Get market tide (overall flow sentiment)
-            tide = await self.uw.get_market_tide()
+            tide = await self._market_tide()
             
             if tide:
                 # Parse tide data
@@ -993,6 +1001,7 @@ class MarketDirectionEngine:
             ]
 
 
+@instrumented("scanner", "market_direction")
 async def run_market_direction_analysis() -> MarketDirectionResult:
     """Run market direction analysis."""
     engine = MarketDirectionEngine()
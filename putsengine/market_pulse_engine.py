@@ -37,6 +37,7 @@ from loguru import logger
 from putsengine.config import get_settings, EngineConfig
 from putsengine.clients.polygon_client import PolygonClient
 from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+from putsengine.metrics import instrumented
 
 
 # =============================================================================
@@ -182,7 +183,7 @@ class MarketPulseEngine:
     GEX_POSITIVE = 2.0
     GEX_NEGATIVE = -2.0
     
-    def __init__(self, polygon_client=None, uw_client=None):
+    def __init__(self, polygon_client=None, uw_client=None, market=None):
         """
         Initialize MarketPulseEngine.
         
@@ -196,10 +197,12 @@ class MarketPulseEngine:
         Args:
             polygon_client: Shared PolygonClient from scheduler (optional, creates new if None)
             uw_client: Shared UnusualWhalesClient from scheduler (optional, creates new if None)
+            market: Scan-wide MarketDatasets (market tide is read from it when prefetched)
         """
         self.settings = get_settings()
         self.polygon: Optional[PolygonClient] = polygon_client
         self.uw: Optional[UnusualWhalesClient] = uw_client
+        self.market = market
         # Track if we created our own clients (need to close them ourselves)
         self._owns_clients = polygon_client is None and uw_client is None
         
@@ -218,6 +221,12 @@ class MarketPulseEngine:
             if self.uw:
                 await self.uw.close()
     
+    async def _market_tide(self) -> Dict[str, Any]:
+        """Market tide from the scan's MarketDatasets, or live if it wasn't prefetched."""
+        if self.market is not None and self.market.has("market_tide"):
+            return self.market.market_tide
+        return await self.uw.get_market_tide()
+    
     # =========================================================================
     # TIER 1: DIRECTIONAL BIAS (WHO is in control)
     # =========================================================================
@@ -971,7 +980,7 @@ class MarketPulseEngine:
             # High P/C = retail fear = contrarian bullish
             # Low P/C = retail greed = contrarian bearish
             
-            tide = await self.uw.get_market_tide()
+            tide = await self._market_tide()
             
             if tide:
                 calls = tide.get("calls", {})
@@ -1339,6 +1348,7 @@ class MarketPulseEngine:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+@instrumented("scanner", "market_pulse")
 async def run_market_pulse() -> MarketPulseResult:
     """Run MarketPulse analysis."""
     engine = MarketPulseEngine()
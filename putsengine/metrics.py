@@ -0,0 +1,462 @@
+"""
+Metrics - latency histograms and call attribution for the hot paths.
+
+WHY:
+``UnusualWhalesClient.get_cache_stats`` and ``APIBudgetManager.get_status``
+count calls, but nothing recorded how long each endpoint took, which layer
+or scanner caused a call, or where a scan's wall-clock time went. "Who
+burned the UW budget?" had no answer short of grepping logs.
+
+HOW:
+- One process-wide ``MetricsRegistry`` of counters, gauges and
+  histograms keyed by label sets.
+- Attribution uses context variables. ``attribute(job=...)`` (scheduler
+  jobs, JobGraph runs) and ``instrumented(kind, name)`` (layers, scanner
+  entry points) set the current job / scanner / layer. asyncio tasks
+  inherit the context when they are created, so calls inside StageRunner
+  stages and executor fan-out are charged to the right caller.
+- Every HTTP request goes through ``clients.transport.create_session``,
+  and every session reports to ``observe_request``:
+    * live sessions through an aiohttp ``TraceConfig``
+    * record/replay sessions directly
+  Each request is recorded in:
+    * ``putsengine_http_request_seconds{provider,endpoint}``
+      (the endpoint is normalised: tickers, dates and ids become
+      placeholders)
+    * ``putsengine_http_requests_total{provider,endpoint,status}``
+    * ``putsengine_http_calls_by_caller_total{provider,caller,job}``
+- Cache outcomes go to ``putsengine_cache_events_total{cache,outcome}``
+  (hit / miss / coalesced), from the UW response cache, the Polygon
+  persistent cache and ``SimpleCache``.
+- Event-loop lag goes to ``putsengine_event_loop_lag_seconds``. It is
+  sampled by ``loop_monitor.LoopMonitor`` (started by the scheduler daemon).
+- Export:
+    * ``render()`` gives Prometheus text format.
+    * ``export()`` writes ``logs/metrics.prom`` and ``logs/metrics.json``
+      (read by the dashboard and ``scheduler_watchdog``).
+    * ``serve(port)`` exposes ``/metrics`` and ``/metrics.json`` over HTTP
+      (``Settings.metrics_port``).
+
+Usage:
+    with attribute(job="market_pulse_245pm"):
+        await scheduler.run_scan("market_pulse")
+
+    @instrumented("layer", "distribution")
+    async def analyze(self, symbol): ...
+
+    get_metrics().snapshot()["http"]["by_caller"]
+"""
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PROM_FILE = PROJECT_ROOT / "logs" / "metrics.prom"
+SNAPSHOT_FILE = PROJECT_ROOT / "logs" / "metrics.json"
+
+# Seconds; wide enough for both cache-speed calls and slow UW pages
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+UNATTRIBUTED = "unattributed"
+
+_job: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "putsengine_job", default=None
+)
+_scanner: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "putsengine_scanner", default=None
+)
+_layer: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "putsengine_layer", default=None
+)
+_KIND_VARS = {"job": _job, "scanner": _scanner, "layer": _layer}
+
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_NUMBER = re.compile(r"^\d+(\.\d+)?$")
+_TICKER = re.compile(r"^[A-Z][A-Z0-9.\-]{0,5}$")
+_CONTRACT = re.compile(r"^O:[A-Z]")
+_PATH_WORD = re.compile(r"^[a-z][A-Za-z0-9_.\-]*$")
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels: Any) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def normalize_endpoint(url: str) -> str:
+    """URL path with tickers, dates, numbers and contract ids replaced by placeholders."""
+    segments = []
+    for segment in urlsplit(url).path.split("/"):
+        if not segment:
+            continue
+        if _DATE.match(segment):
+            segments.append("{date}")
+        elif _NUMBER.match(segment):
+            segments.append("{n}")
+        elif _CONTRACT.match(segment):
+            segments.append("{contract}")
+        elif _TICKER.match(segment):
+            segments.append("{ticker}")
+        elif _PATH_WORD.match(segment):
+            segments.append(segment)
+        else:
+            segments.append("{id}")
+    return "/" + "/".join(segments)
+
+
+def provider_for_host(host: str) -> str:
+    for marker, provider in (("polygon", "polygon"), ("unusualwhales", "uw"), ("alpaca", "alpaca"),
+                             ("finviz", "finviz"), ("finra", "finra")):
+        if marker in host:
+            return provider
+    return host or "unknown"
+
+
+def current_caller() -> str:
+    """Innermost attribution: layer, else scanner, else unattributed."""
+    return _layer.get() or _scanner.get() or UNATTRIBUTED
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts[:-1], strict=True):
+            seen += n
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count, 4) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe counters, gauges and histograms."""
+
+    HELP = {
+        "putsengine_http_request_seconds": "HTTP request latency by provider and endpoint",
+        "putsengine_http_requests_total": "HTTP requests by provider, endpoint and status",
+        "putsengine_http_calls_by_caller_total": (
+            "HTTP requests by provider, calling layer/scanner and job"
+        ),
+        "putsengine_stage_seconds": "Run time of layers, scanners and jobs",
+        "putsengine_stage_errors_total": "Layer, scanner and job runs that raised",
+        "putsengine_cache_events_total": "Cache lookups by cache and outcome",
+        "putsengine_event_loop_lag_seconds": "Scheduling delay of the asyncio event loop",
+        "putsengine_event_loop_stalls_total": (
+            "Times the event loop was blocked past the stall threshold"
+        ),
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.gauges: Dict[str, Dict[Labels, float]] = {}
+        self.histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self.started_at = time.time()
+
+    def inc(self, metric: str, value: float = 1.0, **labels: Any) -> None:
+        key = _labels(**labels)
+        with self._lock:
+            series = self.counters.setdefault(metric, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, metric: str, value: float, **labels: Any) -> None:
+        with self._lock:
+            self.gauges.setdefault(metric, {})[_labels(**labels)] = value
+
+    def observe(
+        self, metric: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+        **labels: Any,
+    ) -> None:
+        key = _labels(**labels)
+        with self._lock:
+            series = self.histograms.setdefault(metric, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self.started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+                for name in sorted(metrics):
+                    if name in self.HELP:
+                        lines.append(f"# HELP {name} {self.HELP[name]}")
+                    lines.append(f"# TYPE {name} {kind}")
+                    for labels, value in sorted(metrics[name].items()):
+                        lines.append(f"{name}{_format_labels(labels)} {value:g}")
+            for name in sorted(self.histograms):
+                if name in self.HELP:
+                    lines.append(f"# HELP {name} {self.HELP[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, h in sorted(self.histograms[name].items(), key=lambda item: item[0]):
+                    cumulative = 0
+                    for bound, n in zip(h.buckets, h.counts[:-1], strict=True):  # +Inf below
+                        cumulative += n
+                        bucket = _format_labels(labels, ("le", f"{bound:g}"))
+                        lines.append(f"{name}_bucket{bucket} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {h.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h.sum:.6f}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarised view for the dashboard and watchdog."""
+        with self._lock:
+            latency = {
+                f"{dict(k).get('provider')} {dict(k).get('endpoint')}": h.summary()
+                for k, h in self.histograms.get("putsengine_http_request_seconds", {}).items()
+            }
+            by_caller: Dict[str, Dict[str, float]] = {}
+            for k, n in self.counters.get("putsengine_http_calls_by_caller_total", {}).items():
+                labels = dict(k)
+                caller = by_caller.setdefault(labels["caller"], {})
+                caller[labels["provider"]] = caller.get(labels["provider"], 0) + n
+            by_job: Dict[str, Dict[str, float]] = {}
+            for k, n in self.counters.get("putsengine_http_calls_by_caller_total", {}).items():
+                labels = dict(k)
+                job = by_job.setdefault(labels["job"], {})
+                job[labels["provider"]] = job.get(labels["provider"], 0) + n
+            stages = {
+                f"{dict(k)['kind']}:{dict(k)['name']}": {
+                    **h.summary(), "total_seconds": round(h.sum, 2)
+                }
+                for k, h in self.histograms.get("putsengine_stage_seconds", {}).items()
+            }
+            caches: Dict[str, Dict[str, float]] = {}
+            for k, n in self.counters.get("putsengine_cache_events_total", {}).items():
+                labels = dict(k)
+                caches.setdefault(labels["cache"], {})[labels["outcome"]] = n
+            lag = self.histograms.get("putsengine_event_loop_lag_seconds", {}).get(())
+
+        for outcomes in caches.values():
+            lookups = outcomes.get("hit", 0) + outcomes.get("miss", 0)
+            outcomes["hit_ratio"] = round(outcomes.get("hit", 0) / lookups, 3) if lookups else 0.0
+            misses = max(1, outcomes.get("miss", 0))
+            outcomes["coalesce_ratio"] = round(outcomes.get("coalesced", 0) / misses, 3)
+
+        return {
+            "timestamp": time.time(),
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "http": {"latency": latency, "by_caller": by_caller, "by_job": by_job},
+            "stages": stages,
+            "caches": caches,
+            "event_loop_lag": {**lag.summary(), "max_bucket": lag.quantile(1.0)} if lag else None,
+        }
+
+    def export(self, prom_path: Path = PROM_FILE, json_path: Path = SNAPSHOT_FILE) -> None:
+        """Write the Prometheus text file and the JSON snapshot (atomically)."""
+        for path, content in ((prom_path, self.render()),
+                              (json_path, json.dumps(self.snapshot(), indent=2, default=str))):
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(content)
+            os.replace(tmp, path)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+def load_snapshot(path: Path = SNAPSHOT_FILE) -> Optional[Dict[str, Any]]:
+    """Last exported snapshot (another process's), or None."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# Recording helpers
+# ----------------------------------------------------------------------
+
+def observe_request(method: str, url: str, status: int, seconds: float) -> None:
+    provider = provider_for_host(urlsplit(url).netloc)
+    endpoint = normalize_endpoint(url)
+    _registry.observe(
+        "putsengine_http_request_seconds", seconds, provider=provider, endpoint=endpoint
+    )
+    _registry.inc(
+        "putsengine_http_requests_total", provider=provider, endpoint=endpoint, status=status
+    )
+    _registry.inc(
+        "putsengine_http_calls_by_caller_total",
+        provider=provider, caller=current_caller(), job=_job.get() or UNATTRIBUTED,
+    )
+
+
+def record_cache(cache: str, outcome: str) -> None:
+    _registry.inc("putsengine_cache_events_total", cache=cache, outcome=outcome)
+
+
+@contextmanager
+def attribute(
+    job: Optional[str] = None, scanner: Optional[str] = None, layer: Optional[str] = None
+) -> Iterator[None]:
+    """Charge work done inside the block (and tasks created in it) to these callers."""
+    tokens = [
+        (var, var.set(value))
+        for var, value in ((_job, job), (_scanner, scanner), (_layer, layer))
+        if value is not None
+    ]
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+@contextmanager
+def stage(kind: str, name: str) -> Iterator[None]:
+    """Time a layer / scanner / job run and attribute calls inside it."""
+    started = time.perf_counter()
+    token = _KIND_VARS[kind].set(name) if kind in _KIND_VARS else None
+    try:
+        yield
+    except BaseException:
+        _registry.inc("putsengine_stage_errors_total", kind=kind, name=name)
+        raise
+    finally:
+        if token is not None:
+            _KIND_VARS[kind].reset(token)
+        _registry.observe("putsengine_stage_seconds", time.perf_counter() - started,
+                          buckets=STAGE_BUCKETS, kind=kind, name=name)
+
+
+def instrumented(kind: str, name: str) -> Callable:
+    """Decorator form of ``stage`` for sync and async callables."""
+    def decorate(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with stage(kind, name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(kind, name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def http_trace_config():
+    """aiohttp TraceConfig feeding ``observe_request`` (for live sessions)."""
+    import aiohttp
+
+    async def on_start(session, context, params):
+        context.started = time.perf_counter()
+
+    async def on_end(session, context, params):
+        observe_request(params.method, str(params.url), params.response.status,
+                        time.perf_counter() - context.started)
+
+    async def on_error(session, context, params):
+        observe_request(params.method, str(params.url), 0, time.perf_counter() - context.started)
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_start)
+    config.on_request_end.append(on_end)
+    config.on_request_exception.append(on_error)
+    return config
+
+
+# ----------------------------------------------------------------------
+# HTTP endpoint
+# ----------------------------------------------------------------------
+
+async def serve(port: int, host: str = "127.0.0.1"):
+    """Serve ``/metrics`` (Prometheus) and ``/metrics.json``; returns the aiohttp runner."""
+    from aiohttp import web
+
+    async def prometheus(request):
+        return web.Response(text=_registry.render(), content_type="text/plain", charset="utf-8")
+
+    async def snapshot(request):
+        return web.json_response(_registry.snapshot())
+
+    app = web.Application()
+    app.router.add_get("/metrics", prometheus)
+    app.router.add_get("/metrics.json", snapshot)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Metrics endpoint: http://{host}:{port}/metrics")
+    return runner
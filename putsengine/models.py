@@ -95,7 +95,7 @@ class OptionsContract:
         return self.spread / mid if mid > 0 else float('inf')
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionsFlow:
     """Options flow data from Unusual Whales."""
     timestamp: datetime
@@ -117,7 +117,7 @@ class OptionsFlow:
     sentiment: str = "neutral"  # 'bullish', 'bearish', 'neutral'
 
 
-@dataclass
+@dataclass(slots=True)
 class DarkPoolPrint:
     """Dark pool transaction data."""
     timestamp: datetime
@@ -235,6 +235,8 @@ class DistributionSignal:
     c_level_selling: bool = False
     insider_cluster: bool = False
     congress_selling: bool = False
+    # Per-stage run time of the analysis (ms), e.g. {"options_flow": 412.0}
+    stage_latency_ms: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -44,6 +44,9 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Tuple
 import pytz
 from loguru import logger
+from putsengine.bars import BarArray
+from putsengine.compute_pool import score_as_fetched
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 
 
@@ -139,6 +142,10 @@ class MultiDayWeaknessScanner:
                     recommendation="INSUFFICIENT DATA"
                 )
         
+        return self.score_bars(symbol, bars)
+    
+    def score_bars(self, symbol: str, bars: List) -> WeaknessReport:
+        """Pattern checks on fetched daily bars (pure CPU; runs on the compute pool)."""
         if len(bars) < 5:
             return WeaknessReport(
                 symbol=symbol,
@@ -326,28 +333,37 @@ class MultiDayWeaknessScanner:
             symbols: List of ticker symbols
             
         Returns:
-            Dict of {symbol: WeaknessReport}
+            Dict of {symbol: WeaknessReport} (INSUFFICIENT DATA when the
+            bars could not be fetched)
         """
-        results = {}
-        
-        for symbol in symbols:
+        async def fetch(symbol: str):
             try:
-                report = await self.analyze_symbol(symbol)
-                results[symbol] = report
-                
-                if report.is_actionable:
-                    logger.info(
-                        f"WEAKNESS DETECTED: {symbol} | "
-                        f"Score: {report.total_score:.2f} | "
-                        f"Patterns: {report.signal_count} | "
-                        f"{report.recommendation}"
-                    )
+                return await self.price_client.get_daily_bars(symbol=symbol, limit=20)
             except Exception as e:
-                logger.debug(f"Failed to analyze {symbol}: {e}")
+                logger.error(f"Failed to get bars for {symbol}: {e}")
+                return BarArray.empty()  # scored as INSUFFICIENT DATA, like analyze_symbol
+        
+        # Fetch and score overlap: batches are scored on worker processes
+        results = await score_as_fetched(score_weakness, symbols, fetch=fetch)
+        
+        for symbol, report in results.items():
+            if report.is_actionable:
+                logger.info(
+                    f"WEAKNESS DETECTED: {symbol} | "
+                    f"Score: {report.total_score:.2f} | "
+                    f"Patterns: {report.signal_count} | "
+                    f"{report.recommendation}"
+                )
         
         return results
 
 
+def score_weakness(symbol: str, bars: List) -> WeaknessReport:
+    """Compute-pool scorer (module level so worker processes can import it)."""
+    return MultiDayWeaknessScanner(price_client=None).score_bars(symbol, bars)
+
+
+@instrumented("scanner", "multiday_weakness")
 async def run_multiday_weakness_scan(price_client, symbols: List[str]) -> Dict:
     """
     Run multi-day weakness scan on symbols.
@@ -26,6 +26,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Set
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 
 
@@ -298,6 +299,7 @@ class PreEarningsFlowScanner:
         }
 
 
+@instrumented("scanner", "pre_earnings_flow")
 async def run_pre_earnings_flow_scan(uw_client, earnings_calendar, symbols: List[str]) -> Dict:
     """
     Run pre-earnings flow scan on symbols.
@@ -48,6 +48,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Set, Tuple
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 from enum import Enum
 
@@ -402,6 +403,7 @@ class PreCatalystScanner:
         return injected
 
 
+@instrumented("scanner", "precatalyst")
 async def run_precatalyst_scan(uw_client, price_client) -> Dict:
     """
     Run evening pre-catalyst distribution scan.
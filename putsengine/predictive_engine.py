@@ -51,6 +51,10 @@ from enum import Enum
 import numpy as np
 from loguru import logger
 
+from putsengine.bars import BarArray
+from putsengine.footprint_store import FootprintStore, get_footprint_store
+from putsengine.metrics import instrumented
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -253,7 +257,7 @@ class MarketWeatherEngine:
         # Data caches
         self.ews_data = {}
         self.ews_timestamp = None
-        self.footprint_history = {}
+        self.footprint_store: Optional[FootprintStore] = None
         self._uw_ticker_cache = {}  # Per-ticker UW data cache (gamma flip + flow)
     
     def _load_ews_data(self):
@@ -266,11 +270,8 @@ class MarketWeatherEngine:
                 self.ews_timestamp = data.get("timestamp", "Unknown")
     
     def _load_footprint_history(self):
-        """Load historical footprint data for trajectory analysis"""
-        path = Path("footprint_history.json")
-        if path.exists():
-            with open(path) as f:
-                self.footprint_history = json.load(f)
+        """Attach the footprint store for trajectory analysis (queried per symbol)"""
+        self.footprint_store = get_footprint_store()
     
     # =========================================================================
     # UW DATA CACHE — Avoids redundant UW API calls on 30-min refreshes
@@ -325,6 +326,7 @@ class MarketWeatherEngine:
     # MAIN ENTRY POINT
     # =========================================================================
     
+    @instrumented("scanner", "market_weather")
     async def analyze_universe(self, mode: ReportMode = ReportMode.AM, refresh: bool = False) -> List[WeatherForecast]:
         """
         Analyze all tickers with institutional pressure.
@@ -839,7 +841,7 @@ class MarketWeatherEngine:
                     total_score += 0.10
             
             # ── Volume & Price Pattern Analysis ──
-            if isinstance(bars, list) and len(bars) >= 5:
+            if isinstance(bars, (list, BarArray)) and len(bars) >= 5:
                 recent = bars[-5:]
                 
                 up_days = [b for b in recent if b.close > b.open]
@@ -1197,7 +1199,7 @@ class MarketWeatherEngine:
         Analyze how signals are evolving over time.
         Like tracking a hurricane — is it building or dissipating?
         """
-        history = self.footprint_history.get(symbol, [])
+        history = self.footprint_store.query(symbol) if self.footprint_store else []
         
         if not history:
             return TrajectoryType.NEW, 0
@@ -1410,7 +1412,7 @@ class MarketWeatherEngine:
                     "ews_alerts_count": len(self.ews_data),
                     "polygon_calls": "Unlimited (technical + news + price)",
                     "uw_calls": "CACHED (from last full run)" if refresh else "GEX/flow for gamma flip + flow quality",
-                    "footprint_history_tickers": len(self.footprint_history),
+                    "footprint_history_tickers": len(self.footprint_store.counts()) if self.footprint_store else 0,
                     "run_type": "REFRESH" if refresh else "FULL"
                 }
             },
@@ -25,6 +25,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Tuple
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 
 
@@ -314,6 +315,7 @@ class PumpDumpScanner:
         return min(confidence, 1.0)
 
 
+@instrumented("scanner", "pump_dump")
 async def run_pump_dump_scan(price_client, symbols: List[str]) -> Dict:
     """
     Run pump-and-dump scan on symbols.
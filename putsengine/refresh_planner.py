@@ -0,0 +1,223 @@
+"""
+Refresh Planner - Choosing which tickers an EWS REFRESH scan re-checks.
+
+WHY:
+A REFRESH scan used to re-check the high-IPI tickers plus a random
+sample of 50 others. The random part spent UW calls (5 per ticker) on
+names whose inputs had not changed, while tickers that had just moved
+waited for the next full scan.
+
+HOW:
+- Before the scan, one bulk Polygon snapshot call fetches price, day
+  volume and bid/ask spread for every ticker. This costs no UW calls.
+- Every EWS scan, FULL or REFRESH, upserts a baseline for each ticker it
+  scanned into the state store's ``refresh_baselines`` table: the
+  snapshot at scan time, the resulting IPI, and when it ran. So the
+  high-IPI names from the last full scan are ranked on the next REFRESH.
+- ``information_gain`` scores how much a ticker has changed since its
+  baseline:
+  - price move (drops weigh more than rallies)
+  - volume pace since the last scan, against the prior day's pace
+  - spread widening
+  - the previous IPI
+  - age of the baseline
+- Tickers with no baseline, or one older than
+  ``STALENESS_FLOOR_MINUTES``, always come first, so nothing goes
+  unscanned for long.
+- K is the number of tickers the UW budget can pay for before the
+  ``APIBudgetManager`` ceiling, capped at ``MAX_REFRESH_SYMBOLS``.
+  Index ETFs are always included. The rest is the top of the ranking;
+  tickers below ``MIN_GAIN`` are left for the next full scan.
+
+Usage:
+    features = await fetch_snapshot_features(polygon, symbols)
+    scan_symbols = plan_refresh(symbols, features, budget=get_budget_manager())
+    ...
+    record_scanned(features, {symbol: pressure.ipi, ...})
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from putsengine.state_store import get_state_store
+
+
+INDEX_ETFS = ("SPY", "QQQ", "IWM", "DIA")
+UW_CALLS_PER_SYMBOL = 5          # UW detectors per EWS scan_symbol
+MAX_REFRESH_SYMBOLS = 120        # Upper bound even when budget allows more
+STALENESS_FLOOR_MINUTES = 240    # Re-scan anything older than this regardless of gain
+MIN_GAIN = 0.5                   # Below this, wait for the next full scan
+SESSION_MINUTES = 390            # Regular session length, for volume pace
+
+PRICE_UNIT = 0.01                # A 1% move scores 1.0
+DOWNSIDE_WEIGHT = 1.5            # Drops matter more to a puts engine
+HIGH_IPI = 0.2                   # Previous IPI at this level scores 1.0
+MAX_COMPONENT = 5.0              # Cap any single component
+
+
+def snapshot_features(ticker: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """Price, day volume, prior-day volume and spread (bps) from a Polygon ticker snapshot."""
+    day = ticker.get("day") or {}
+    prev = ticker.get("prevDay") or {}
+    quote = ticker.get("lastQuote") or {}
+    price = (
+        (ticker.get("lastTrade") or {}).get("p")
+        or (ticker.get("min") or {}).get("c")
+        or day.get("c")
+        or prev.get("c")
+    )
+    if not price:
+        return None
+    bid, ask = quote.get("p") or 0, quote.get("P") or 0
+    mid = (bid + ask) / 2
+    return {
+        "price": float(price),
+        "volume": float(day.get("v") or 0),
+        "prev_volume": float(prev.get("v") or 0),
+        "spread_bps": (ask - bid) / mid * 10_000 if bid > 0 and ask >= bid else 0.0,
+    }
+
+
+async def fetch_snapshot_features(polygon, symbols: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """One bulk Polygon snapshot call; returns ``{symbol: features}`` ({} if unavailable)."""
+    symbols = list(symbols)
+    try:
+        tickers = await polygon.get_all_tickers_snapshot(tickers=symbols)
+    except Exception as e:
+        logger.debug(f"Refresh planner: bulk snapshot unavailable: {e}")
+        return {}
+    wanted = set(symbols)
+    features = {}
+    for ticker in tickers or []:
+        symbol = ticker.get("ticker")
+        if symbol in wanted:
+            parsed = snapshot_features(ticker)
+            if parsed:
+                features[symbol] = parsed
+    return features
+
+
+def _age_minutes(baseline: Dict[str, Any], now: datetime) -> float:
+    try:
+        return max(0.0, (now - datetime.fromisoformat(baseline["scanned_at"])).total_seconds() / 60)
+    except (KeyError, TypeError, ValueError):
+        return math.inf
+
+
+def information_gain(
+    current: Optional[Dict[str, float]],
+    baseline: Optional[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> float:
+    """
+    Expected value of re-scanning a ticker (0 = nothing changed).
+
+    ``inf`` when there is no usable baseline.
+    """
+    if not baseline:
+        return math.inf
+    now = now or datetime.now()
+    age = _age_minutes(baseline, now)
+    if math.isinf(age):
+        return math.inf
+
+    gain = min(baseline.get("ipi", 0.0) / HIGH_IPI, MAX_COMPONENT)
+    gain += min(age / STALENESS_FLOOR_MINUTES, 1.0)
+    if not current:
+        return gain
+
+    if baseline.get("price"):
+        move = current["price"] / baseline["price"] - 1
+        weight = DOWNSIDE_WEIGHT if move < 0 else 1.0
+        gain += min(abs(move) / PRICE_UNIT * weight, MAX_COMPONENT)
+
+    # Volume since the baseline (a lower day volume means a new session)
+    traded = current["volume"] - baseline.get("volume", 0.0)
+    if traded < 0:
+        traded = current["volume"]
+    expected = current["prev_volume"] * min(age, SESSION_MINUTES) / SESSION_MINUTES
+    if expected > 0:
+        gain += min(max(0.0, traded / expected - 1), MAX_COMPONENT)
+
+    if baseline.get("spread_bps") and current["spread_bps"]:
+        gain += min(max(0.0, current["spread_bps"] / baseline["spread_bps"] - 1), MAX_COMPONENT)
+
+    return gain
+
+
+def load_baselines() -> Dict[str, Dict[str, Any]]:
+    try:
+        return get_state_store().refresh_baselines()
+    except Exception as e:
+        logger.warning(f"Refresh planner: could not load baselines: {e}")
+        return {}
+
+
+def record_scanned(
+    features: Dict[str, Dict[str, float]],
+    ipi_by_symbol: Dict[str, float],
+    scanned_at: Optional[datetime] = None,
+) -> None:
+    """Store the baseline for every ticker a scan just covered (others are untouched)."""
+    if not ipi_by_symbol:
+        return
+    when = (scanned_at or datetime.now()).isoformat()
+    baselines = {
+        symbol: {"scanned_at": when, "ipi": ipi, **features.get(symbol, {})}
+        for symbol, ipi in ipi_by_symbol.items()
+    }
+    try:
+        get_state_store().upsert_refresh_baselines(baselines)
+    except Exception as e:
+        logger.warning(f"Refresh planner: could not save baselines: {e}")
+
+
+def refresh_capacity(budget=None, max_symbols: int = MAX_REFRESH_SYMBOLS) -> int:
+    """Tickers the UW budget can pay for before the current ceiling."""
+    if budget is None:
+        return max_symbols
+    return min(max_symbols, budget.window_headroom() // UW_CALLS_PER_SYMBOL)
+
+
+def plan_refresh(
+    symbols: List[str],
+    features: Dict[str, Dict[str, float]],
+    budget=None,
+    max_symbols: int = MAX_REFRESH_SYMBOLS,
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Tickers for a REFRESH scan, most informative first.
+
+    Index ETFs, then stale tickers (oldest baseline first), then the
+    highest information gain down to ``MIN_GAIN``, up to the budget's K.
+    """
+    now = now or datetime.now()
+    baselines = load_baselines()
+    capacity = refresh_capacity(budget, max_symbols)
+
+    index_etfs = [s for s in INDEX_ETFS if s in symbols]
+    chosen = set(index_etfs)
+    ranked = []
+    for symbol in symbols:
+        if symbol in chosen:
+            continue
+        baseline = baselines.get(symbol)
+        gain = information_gain(features.get(symbol), baseline, now)
+        stale = math.isinf(gain) or _age_minutes(baseline, now) >= STALENESS_FLOOR_MINUTES
+        if stale or gain >= MIN_GAIN:
+            ranked.append((not stale, -gain, symbol))
+    ranked.sort()
+
+    picked = [symbol for _, _, symbol in ranked[:max(0, capacity - len(index_etfs))]]
+    stale_count = sum(1 for fresh, _, symbol in ranked if not fresh and symbol in picked)
+    logger.info(
+        f"EWS REFRESH plan: {len(index_etfs)} index + {stale_count} stale + "
+        f"{len(picked) - stale_count} changed = {len(index_etfs) + len(picked)} tickers "
+        f"(K={capacity}, {len(ranked)} candidates, {len(symbols)} universe, "
+        f"{len(features)} with snapshots)"
+    )
+    return index_etfs + picked
@@ -0,0 +1,186 @@
+"""
+Concurrent Scan Executor - bounded fan-out for full-universe scans.
+
+WHY:
+The scheduler used to walk ~360 tickers one at a time and sleep a fixed
+65 seconds between 100-ticker batches. Polygon is unlimited on our plan,
+so every Polygon await was pure idle time, and the fixed batch sleeps
+were paid even when the UW rate window had plenty of room left.
+
+HOW:
+- Symbols run concurrently, capped by ``max_in_flight``.
+- Each provider has its own concurrency cap (how many symbols may be
+  inside that provider's stage at once).
+- Request rates are not limited here: every HTTP call waits for a token
+  from the shared provider gateway (clients/gateway.py), so a symbol that
+  needs UW budget waits for real token availability, not a fixed sleep.
+- Results are handed to ``on_result`` as each symbol finishes, so callers
+  can stream candidates into ``scan_progress`` while the scan runs.
+
+Usage:
+    executor = ScanExecutor(max_in_flight=24, limits={
+        "polygon": ProviderLimit(max_concurrency=32),
+        "uw": ProviderLimit(max_concurrency=4),
+    })
+
+    async def worker(symbol):
+        async with executor.slot("uw"):
+            signal = await distribution_layer.analyze(symbol)
+        async with executor.slot("polygon"):
+            bars = await polygon.get_daily_bars(symbol)
+        return signal, bars
+
+    stats = await executor.run(symbols, worker, on_result=handle)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+
+@dataclass
+class ProviderLimit:
+    """Concurrency cap for one data provider (rates are the gateway's job)."""
+    max_concurrency: int = 16
+
+
+@dataclass
+class ScanExecutorStats:
+    """Summary of one executor run (logged and attached to scan results)."""
+    symbols: int = 0
+    completed: int = 0
+    errors: int = 0
+    elapsed_seconds: float = 0.0
+    peak_in_flight: int = 0
+    slot_wait_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "symbols": self.symbols,
+            "completed": self.completed,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "peak_in_flight": self.peak_in_flight,
+            "slot_wait_seconds": {k: round(v, 2) for k, v in self.slot_wait_seconds.items()},
+        }
+
+
+class _ProviderLimiter:
+    """Concurrency semaphore for a single provider."""
+
+    def __init__(self, name: str, limit: ProviderLimit):
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(max(1, limit.max_concurrency))
+        self.wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        started = time.monotonic()
+        async with self._semaphore:
+            self.wait_seconds += time.monotonic() - started
+            yield
+
+
+class ScanExecutor:
+    """
+    Runs a per-symbol coroutine across a universe with bounded concurrency
+    and per-provider limits.
+
+    The executor never raises for a single symbol: worker exceptions are
+    counted in ``ScanExecutorStats.errors`` and logged at debug level, the
+    same way the old sequential loop handled them.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 24,
+        limits: Optional[Dict[str, ProviderLimit]] = None,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self._limiters: Dict[str, _ProviderLimiter] = {
+            name: _ProviderLimiter(name, limit)
+            for name, limit in (limits or {}).items()
+        }
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def slot(self, provider: str):
+        """
+        Async context manager that holds one concurrency slot for ``provider``.
+
+        Unknown providers are unlimited.
+        """
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            return _null_slot()
+        return limiter.slot()
+
+    async def run(
+        self,
+        symbols: Iterable[str],
+        worker: Callable[[str], Awaitable[Any]],
+        on_result: Optional[Callable[[str, Any], None]] = None,
+    ) -> ScanExecutorStats:
+        """
+        Run ``worker(symbol)`` for every symbol.
+
+        Args:
+            symbols: Tickers to scan (order = admission order)
+            worker: Coroutine function doing the per-symbol work
+            on_result: Called synchronously with (symbol, result) as each
+                symbol completes successfully
+
+        Returns:
+            ScanExecutorStats for the run
+        """
+        symbol_list: List[str] = list(symbols)
+        stats = ScanExecutorStats(symbols=len(symbol_list))
+        started = time.monotonic()
+        queue: asyncio.Queue = asyncio.Queue()
+        for symbol in symbol_list:
+            queue.put_nowait(symbol)
+
+        async def _drain():
+            while True:
+                try:
+                    symbol = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                self._in_flight += 1
+                self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+                try:
+                    result = await worker(symbol)
+                    stats.completed += 1
+                    if on_result is not None:
+                        try:
+                            on_result(symbol, result)
+                        except Exception as e:
+                            logger.debug(f"Scan executor on_result failed for {symbol}: {e}")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"Error scanning {symbol}: {e}")
+                    stats.errors += 1
+                finally:
+                    self._in_flight -= 1
+
+        workers = min(self.max_in_flight, len(symbol_list)) or 0
+        if workers:
+            await asyncio.gather(*(_drain() for _ in range(workers)))
+
+        stats.elapsed_seconds = time.monotonic() - started
+        stats.peak_in_flight = self._peak_in_flight
+        stats.slot_wait_seconds = {
+            name: limiter.wait_seconds for name, limiter in self._limiters.items()
+        }
+        return stats
+
+
+@asynccontextmanager
+async def _null_slot():
+    yield
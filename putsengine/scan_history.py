@@ -15,7 +15,6 @@ Role: Strategic conviction layer ("Supreme Court")
 - Used for position sizing, not entry timing
 """
 
-import json
 import math
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -24,6 +23,8 @@ from collections import defaultdict
 import pytz
 from loguru import logger
 
+from putsengine.codec import dump_file, load_file
+
 # History file path
 SCAN_HISTORY_FILE = Path(__file__).parent.parent / "scan_history.json"
 MAX_HISTORY_HOURS = 48  # Keep last 48 hours of data
@@ -50,8 +51,7 @@ def load_scan_history() -> Dict:
         return {"scans": [], "last_cleanup": None}
     
     try:
-        with open(SCAN_HISTORY_FILE, 'r') as f:
-            return json.load(f)
+        return load_file(SCAN_HISTORY_FILE)
     except Exception as e:
         logger.error(f"Error loading scan history: {e}")
         return {"scans": [], "last_cleanup": None}
@@ -60,8 +60,7 @@ def load_scan_history() -> Dict:
 def save_scan_history(history: Dict):
     """Save scan history to file."""
     try:
-        with open(SCAN_HISTORY_FILE, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        dump_file(history, SCAN_HISTORY_FILE)
     except Exception as e:
         logger.error(f"Error saving scan history: {e}")
 
@@ -424,8 +423,7 @@ def initialize_history_from_current_scan():
         try:
             results_file = Path(__file__).parent.parent / "scheduled_scan_results.json"
             if results_file.exists():
-                with open(results_file, 'r') as f:
-                    current_results = json.load(f)
+                current_results = load_file(results_file)
                 
                 add_scan_to_history(current_results)
                 logger.info("Initialized scan history from current results")
@@ -29,10 +29,10 @@ FINAL SCHEDULE: 12 scans/day (ET):
 11  4:00 PM      Market Close
 12  5:00 PM      End of Day
 
-BATCHED SCANNING STRATEGY:
+CONCURRENT SCANNING STRATEGY:
 - All tickers (universe + dynamic) scanned in EVERY scan
-- Split into 3 batches of ~100 tickers
-- Wait 65 seconds between batches (rate limit reset)
+- Symbols run concurrently via ScanExecutor (see scan_executor.py)
+- Separate Polygon / UW limits; UW paced by the shared provider gateway
 - Result: 0 tickers missed, complete coverage
 
 DAEMON MODE:
@@ -47,7 +47,7 @@ import asyncio
 import json
 import os
 import sys
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, time as dtime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -70,8 +70,21 @@ from putsengine.layers.market_regime import MarketRegimeLayer
 from putsengine.layers.distribution import DistributionLayer
 from putsengine.layers.liquidity import LiquidityVacuumLayer
 from putsengine.layers.acceleration import AccelerationWindowLayer
+from putsengine.layers.context import SymbolContext
+from putsengine.market_datasets import DEFAULT_FEEDS, MarketDatasets
 from putsengine.scoring.scorer import PutScorer
 from putsengine.models import PutCandidate, EngineType
+from putsengine.scan_executor import ScanExecutor, ProviderLimit
+from putsengine.utils.cache import enable_persistent_caches
+from putsengine.utils.persistent_cache import get_persistent_cache
+from putsengine.bar_store import get_minute_bar_store
+from putsengine.codec import dump_file
+from putsengine.state_store import get_state_store
+from putsengine.job_graph import JobGraph
+from putsengine.metrics import get_metrics, instrumented, serve as serve_metrics
+from putsengine.loop_monitor import LoopMonitor, run_blocking, shutdown_blocking_pool
+from putsengine.compute_pool import configure_compute_pool, shutdown_compute_pool
+from putsengine import convergence_engine as convergence_paths
 
 # New scanners for after-hours, earnings, and pre-catalyst detection
 from putsengine.afterhours_scanner import run_afterhours_scan, AfterHoursScanner
@@ -146,6 +159,12 @@ def is_trading_day(d: date = None) -> bool:
         return False
     return True
 RESULTS_FILE = Path("scheduled_scan_results.json")
+# Partial candidates of the scan in flight, for the dashboard process
+SCAN_PROGRESS_FILE = Path("scan_progress.json")
+PROGRESS_PUBLISH_SECONDS = 15
+# Market-wide UW feeds shared by run_scan (layers) and the MarketPulse run (tide)
+MARKET_FEEDS = DEFAULT_FEEDS + ("market_tide",)
+MARKET_DATASETS_TTL = 300  # 5 minutes, as PutsEngine.get_market_datasets
 SCAN_LOG_FILE = Path("logs/scheduled_scans.log")
 
 
@@ -209,10 +228,93 @@ class PutsEngineScheduler:
             "last_scan": None,
             "scan_type": None
         }
+        # Partial candidates of the scan in flight (latest_results only ever
+        # holds a complete scan); scans run one at a time. Published to
+        # SCAN_PROGRESS_FILE every PROGRESS_PUBLISH_SECONDS.
+        self.scan_progress: Dict[str, Any] = {"scan_in_progress": False}
+        self._market_datasets: Optional[MarketDatasets] = None
+        self._scan_lock = asyncio.Lock()
+        
+        # Job dependency graph (inputs/outputs instead of fixed cron offsets)
+        self.jobs = self._build_job_graph()
         
         # Setup logging
         self._setup_logging()
     
+    def _build_job_graph(self) -> JobGraph:
+        """
+        Declare which job outputs feed which jobs.
+        
+        Root jobs (scans, EWS, direction, intraday, FinViz) stay on cron;
+        their consumers start as soon as the root finishes and every input
+        is fresh (convergence: any input), instead of at a hand-tuned offset.
+        Wrappers return False on failure so a failed run triggers nothing:
+        
+            scan ─┬─> weather_am (8:45-10:00) / weather_pm (14:30-16:00)
+                  └─> convergence
+            early_warning ─┬─> weather_refresh (market hours) ─> convergence
+                           ├─> earnings_priority_pm (16:15-17:00)
+                           └─> convergence
+            market_direction / intraday / finviz ─> convergence
+        
+        Crons on the consumers remain only as deadline fallbacks (``ensure``).
+        """
+        graph = JobGraph(tz=EST)
+        hour = 3600
+        
+        graph.add_artifact("ews", 14 * hour, [convergence_paths.EWS_FILE])
+        graph.add_artifact("scan", 24 * hour, [RESULTS_FILE])
+        graph.add_artifact("direction", 18 * hour, [convergence_paths.DIRECTION_FILE])
+        graph.add_artifact("weather", 18 * hour, [
+            convergence_paths.WEATHER_AM_FILE, convergence_paths.WEATHER_PM_FILE,
+        ])
+        graph.add_artifact("intraday", 24 * hour, [convergence_paths.INTRADAY_FILE])
+        graph.add_artifact("finviz", 24 * hour, [convergence_paths.FINVIZ_BEARISH_FILE])
+        graph.add_artifact("top9", 1 * hour, [convergence_paths.OUTPUT_FILE])
+        
+        # Roots (cron)
+        graph.add_job("scan", self._run_scan_wrapper, outputs=("scan",), deadline_seconds=25 * 60)
+        graph.add_job("early_warning", self._run_early_warning_scan_wrapper, outputs=("ews",))
+        graph.add_job("market_direction", self._run_market_direction_wrapper, outputs=("direction",))
+        graph.add_job("intraday", self._run_intraday_scan_wrapper, outputs=("intraday",))
+        graph.add_job("finviz", self._run_finviz_bearish_scan_wrapper, outputs=("finviz",))
+        
+        # Weather full reports reuse the scan's warm UW cache
+        graph.add_job(
+            "weather_am", self._run_market_weather_am_wrapper,
+            inputs=("scan",), outputs=("weather",),
+            window=(dtime(8, 45), dtime(10, 0)), once_per_window=True,
+        )
+        graph.add_job(
+            "weather_pm", self._run_market_weather_pm_wrapper,
+            inputs=("scan",), outputs=("weather",),
+            window=(dtime(14, 30), dtime(16, 0)), once_per_window=True,
+        )
+        graph.add_job(
+            "weather_refresh", self._run_market_weather_refresh_wrapper,
+            inputs=("ews",), outputs=("weather",),
+            window=(dtime(9, 30), dtime(15, 45)),
+        )
+        
+        # Earnings priority reuses the 4:30 PM EWS cache (dark pool, OI, flow, IV)
+        graph.add_job(
+            "earnings_priority_pm", self._run_earnings_priority_scan_wrapper,
+            inputs=("ews",),
+            window=(dtime(16, 15), dtime(17, 0)), once_per_window=True,
+        )
+        
+        # Top 9: must be rebuilt within 30 min of whatever triggered it
+        graph.add_job(
+            "convergence", self._run_convergence_wrapper,
+            inputs=("ews", "scan", "weather", "direction", "intraday", "finviz"),
+            outputs=("top9",), deadline_seconds=30 * 60, any_input=True,
+        )
+        return graph
+    
+    def get_job_graph_report(self) -> Dict[str, Any]:
+        """Artifact freshness plus the latest critical-path report per root job."""
+        return {"status": self.jobs.status(), "cascades": self.jobs.latency_report()}
+    
     def _setup_logging(self):
         """Configure logging for scheduler."""
         SCAN_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -226,8 +328,11 @@ class PutsEngineScheduler:
     async def _init_clients(self):
         """Initialize API clients."""
         if self._alpaca is None:
+            enable_persistent_caches(get_persistent_cache(self.settings))
             self._alpaca = AlpacaClient(self.settings)
             self._polygon = PolygonClient(self.settings)
+            if self.settings.minute_store_enabled:
+                self._polygon.enable_minute_store(get_minute_bar_store(self._polygon, self.settings))
             self._uw = UnusualWhalesClient(self.settings)
             
             self._market_regime_layer = MarketRegimeLayer(
@@ -288,9 +393,9 @@ class PutsEngineScheduler:
         # Purpose: Same-day trading decisions based on overnight/pre-market trend
         # ============================================================================
         self.scheduler.add_job(
-            self._run_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=9, minute=0, timezone=EST),
-            args=["pre_market_final"],
+            args=["scan", "pre_market_final"],
             id="pre_market_final_9am",
             name="🎯 Pre-Market Final Scan (9:00 AM ET) - 361 tickers - UW API",
             replace_existing=True
@@ -316,9 +421,9 @@ class PutsEngineScheduler:
         #               early_warning_3pm (saves 1,800 UW calls)
         # ============================================================================
         self.scheduler.add_job(
-            self._run_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=14, minute=45, timezone=EST),
-            args=["market_pulse"],
+            args=["scan", "market_pulse"],
             id="market_pulse_245pm",
             name="📊 Market Pulse Full Scan (2:45 PM ET) - 361 tickers - Feeds Meta Engine 3:15 PM",
             replace_existing=True
@@ -390,15 +495,17 @@ class PutsEngineScheduler:
         # Output: logs/finviz_bearish.json, logs/finviz_short_interest.json
         # ============================================================================
         self.scheduler.add_job(
-            self._run_finviz_bearish_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=8, minute=30, timezone=EST),
+            args=["finviz"],
             id="finviz_bearish_830am",
             name="🔵 FinViz Bearish Scan (8:30 AM ET) - Insider/Downgrade/Short",
             replace_existing=True
         )
         self.scheduler.add_job(
-            self._run_finviz_bearish_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=13, minute=30, timezone=EST),
+            args=["finviz"],
             id="finviz_bearish_130pm",
             name="🔵 FinViz Bearish Scan (1:30 PM ET) - Insider/Downgrade/Short",
             replace_existing=True
@@ -431,11 +538,14 @@ class PutsEngineScheduler:
         )
         
         # FEB 8, 2026: Staggered +2 min after 4:30 PM EWS for same cache benefit.
+        # Now a job-graph consumer of the 4:30 PM EWS: starts the moment EWS
+        # finishes. This cron is only the deadline fallback if EWS never does.
         self.scheduler.add_job(
-            self._run_earnings_priority_scan_wrapper,
-            CronTrigger(hour=16, minute=32, timezone=EST),
+            self.jobs.ensure,
+            CronTrigger(hour=16, minute=50, timezone=EST),
+            args=["earnings_priority_pm", 3600],
             id="earnings_priority_430pm",
-            name="Earnings Priority Scan (4:32 PM ET) - Post-Market [cached from EWS]",
+            name="Earnings Priority Scan (after 4:30 PM EWS, by 4:50 PM ET) - Post-Market [cached from EWS]",
             replace_existing=True
         )
         
@@ -447,16 +557,18 @@ class PutsEngineScheduler:
         # Uses Polygon (unlimited) + cached UW data — lightweight refresh
         # ============================================================================
         self.scheduler.add_job(
-            self._run_market_direction_wrapper,
+            self.jobs.run,
             CronTrigger(hour=8, minute=0, timezone=EST),
+            args=["market_direction"],
             id="market_direction_8am",
             name="🎯 Market Direction Analysis (8:00 AM ET)",
             replace_existing=True
         )
         
         self.scheduler.add_job(
-            self._run_market_direction_wrapper,
+            self.jobs.run,
             CronTrigger(hour=9, minute=0, timezone=EST),
+            args=["market_direction"],
             id="market_direction_9am",
             name="🎯 Market Direction Analysis (9:00 AM ET) - Pre-Open",
             replace_existing=True
@@ -468,8 +580,9 @@ class PutsEngineScheduler:
         # JSON every 30 min, but the JSON itself wasn't being updated.
         for md_hour in [10, 11, 12, 13, 14, 15]:
             self.scheduler.add_job(
-                self._run_market_direction_wrapper,
+                self.jobs.run,
                 CronTrigger(hour=md_hour, minute=0, timezone=EST),
+                args=["market_direction"],
                 id=f"market_direction_{md_hour}",
                 name=f"🎯 Market Direction Refresh ({md_hour}:00 ET) - Intraday",
                 replace_existing=True
@@ -644,48 +757,54 @@ class PutsEngineScheduler:
         # Runs every hour during market hours
         
         self.scheduler.add_job(
-            self._run_intraday_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=10, minute=0, timezone=EST),
+            args=["intraday"],
             id="intraday_10am",
             name="🚨 Intraday Big Mover Scan (10:00 AM ET)",
             replace_existing=True
         )
         
         self.scheduler.add_job(
-            self._run_intraday_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=11, minute=0, timezone=EST),
+            args=["intraday"],
             id="intraday_11am",
             name="🚨 Intraday Big Mover Scan (11:00 AM ET)",
             replace_existing=True
         )
         
         self.scheduler.add_job(
-            self._run_intraday_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=12, minute=0, timezone=EST),
+            args=["intraday"],
             id="intraday_12pm",
             name="🚨 Intraday Big Mover Scan (12:00 PM ET)",
             replace_existing=True
         )
         
         self.scheduler.add_job(
-            self._run_intraday_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=13, minute=0, timezone=EST),
+            args=["intraday"],
             id="intraday_1pm",
             name="🚨 Intraday Big Mover Scan (1:00 PM ET)",
             replace_existing=True
         )
         
         self.scheduler.add_job(
-            self._run_intraday_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=14, minute=0, timezone=EST),
+            args=["intraday"],
             id="intraday_2pm",
             name="🚨 Intraday Big Mover Scan (2:00 PM ET)",
             replace_existing=True
         )
         
         self.scheduler.add_job(
-            self._run_intraday_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=15, minute=0, timezone=EST),
+            args=["intraday"],
             id="intraday_3pm",
             name="🚨 Intraday Big Mover Scan (3:00 PM ET)",
             replace_existing=True
@@ -714,8 +833,9 @@ class PutsEngineScheduler:
         # Scans 361 tickers for overnight institutional footprints
         # This ensures TOP 8 picks are fresh when you need them at 9:30 AM
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=8, minute=0, timezone=EST),
+            args=["early_warning"],
             id="early_warning_8am",
             name="🚨 Early Warning Scan (8:00 AM ET) - PRE-MARKET CRITICAL",
             replace_existing=True
@@ -725,8 +845,9 @@ class PutsEngineScheduler:
         # Catches opening-range institutional flow within first 15 min of market open
         # Moved from 10:00 AM to capture early institutional prints
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=9, minute=45, timezone=EST),
+            args=["early_warning"],
             id="early_warning_945am",
             name="🚨 Early Warning Scan (9:45 AM ET) - OPENING RANGE",
             replace_existing=True
@@ -735,8 +856,9 @@ class PutsEngineScheduler:
         # 11:00 AM EWS - MID-MORNING UPDATE (FEB 7, 2026)
         # Fills 9:45 AM → 12 PM gap for mid-morning institutional positioning
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=11, minute=0, timezone=EST),
+            args=["early_warning"],
             id="early_warning_11am",
             name="🚨 Early Warning Scan (11:00 AM ET) - MID-MORNING",
             replace_existing=True
@@ -756,8 +878,9 @@ class PutsEngineScheduler:
         # 1:00 PM EWS - EARLY AFTERNOON (FEB 7, 2026)
         # Captures lunch-hour institutional accumulation/distribution
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=13, minute=0, timezone=EST),
+            args=["early_warning"],
             id="early_warning_1pm",
             name="🚨 Early Warning Scan (1:00 PM ET) - EARLY AFTERNOON",
             replace_existing=True
@@ -766,8 +889,9 @@ class PutsEngineScheduler:
         # 2:00 PM EWS - AFTERNOON POSITIONING (FEB 7, 2026)
         # Captures pre-close institutional positioning build-up
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=14, minute=0, timezone=EST),
+            args=["early_warning"],
             id="early_warning_2pm",
             name="🚨 Early Warning Scan (2:00 PM ET) - AFTERNOON POSITIONING",
             replace_existing=True
@@ -787,8 +911,9 @@ class PutsEngineScheduler:
         
         # 4:30 PM EWS - After-hours positioning detection
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=16, minute=30, timezone=EST),
+            args=["early_warning"],
             id="early_warning_430pm",
             name="🚨 Early Warning Scan (4:30 PM ET) - POST-MARKET",
             replace_existing=True
@@ -797,8 +922,9 @@ class PutsEngineScheduler:
         # 10:00 PM EWS - Overnight footprint detection
         # Scans 361 tickers for institutional footprints
         self.scheduler.add_job(
-            self._run_early_warning_scan_wrapper,
+            self.jobs.run,
             CronTrigger(hour=22, minute=0, timezone=EST),
+            args=["early_warning"],
             id="early_warning_10pm",
             name="🚨 Early Warning Scan (10:00 PM ET) - OVERNIGHT",
             replace_existing=True
@@ -859,11 +985,16 @@ class PutsEngineScheduler:
         # By 9:05, the cache is partially warm → Weather's gex_data +
         # flow_recent calls hit cache for tickers already processed.
         # SAVINGS: ~200 UW calls (gex + flow × top candidates already cached)
+        #
+        # Job graph: Weather AM now starts as soon as the 9:00 AM scan finishes
+        # (cache fully warm, no fixed 5-min guess). 9:30 AM is the deadline
+        # fallback if the scan overruns or fails.
         self.scheduler.add_job(
-            self._run_market_weather_am_wrapper,
-            CronTrigger(hour=9, minute=5, timezone=EST),
+            self.jobs.ensure,
+            CronTrigger(hour=9, minute=30, timezone=EST),
+            args=["weather_am", 3600],
             id="market_weather_0900",
-            name="🌪️ Market Weather AM (9:05 AM ET) — FULL Open Risk Forecast",
+            name="🌪️ Market Weather AM (after 9:00 AM scan, by 9:30 AM ET) — FULL Open Risk Forecast",
             replace_existing=True
         )
         
@@ -872,11 +1003,16 @@ class PutsEngineScheduler:
         # populate cache for all 361 tickers. By 3:08, Weather's UW calls
         # (gex_data, flow_recent per candidate) are mostly cached.
         # SAVINGS: ~40 UW calls (2 endpoints × top 20 candidates)
+        #
+        # Job graph: Weather PM now starts when the 2:45 PM Market Pulse scan
+        # finishes (~3:06 PM, whenever that really is). 3:20 PM is the deadline
+        # fallback.
         self.scheduler.add_job(
-            self._run_market_weather_pm_wrapper,
-            CronTrigger(hour=15, minute=8, timezone=EST),
+            self.jobs.ensure,
+            CronTrigger(hour=15, minute=20, timezone=EST),
+            args=["weather_pm", 3600],
             id="market_weather_1500",
-            name="🌪️ Market Weather PM (3:08 PM ET) — FULL Overnight Storm Build",
+            name="🌪️ Market Weather PM (after 2:45 PM scan, by 3:20 PM ET) — FULL Overnight Storm Build",
             replace_existing=True
         )
         
@@ -894,8 +1030,9 @@ class PutsEngineScheduler:
             time_str = f"{hour}:{minute:02d}"
             job_id = f"weather_refresh_{hour:02d}{minute:02d}"
             self.scheduler.add_job(
-                self._run_market_weather_refresh_wrapper,
+                self.jobs.run,
                 CronTrigger(hour=hour, minute=minute, timezone=EST),
+                args=["weather_refresh"],
                 id=job_id,
                 name=f"🔄 Market Weather Refresh ({time_str} ET) — Cached UW + Fresh Polygon",
                 replace_existing=True
@@ -928,8 +1065,10 @@ class PutsEngineScheduler:
         #   EWS (35%) → Direction (15%) → Gamma Drain (25%) → Weather (25%)
         # Merges ALL four systems into a single Top 9 Scoreboard.
         #
-        # RUNS: Every 30 min during market hours (8:00 AM — 4:00 PM ET)
-        #   + After each EWS scan completes (triggered in _run_early_warning_scan_wrapper)
+        # RUNS: Job graph consumer of every upstream output (EWS, scans,
+        #   weather, direction, intraday, FinViz) — rebuilt right after each.
+        #   The 30-min crons below are deadline fallbacks: they only run if
+        #   nothing rebuilt the Top 9 in the last 25 minutes.
         # OUTPUT: logs/convergence/latest_top9.json
         # SELF-HEALING: Missing sources → partial data; crash → degraded status
         # =========================================================================
@@ -947,8 +1086,9 @@ class PutsEngineScheduler:
             time_str = f"{hour}:{minute:02d}"
             job_id = f"convergence_{hour:02d}{minute:02d}"
             self.scheduler.add_job(
-                self._run_convergence_wrapper,
+                self.jobs.ensure,
                 CronTrigger(hour=hour, minute=minute, timezone=EST),
+                args=["convergence", 25 * 60],
                 id=job_id,
                 name=f"🎯 Convergence Top 9 ({time_str} ET) — 4-Step Decision Merge",
                 replace_existing=True
@@ -1048,10 +1188,12 @@ class PutsEngineScheduler:
                 if is_pm_scan and hasattr(self, '_uw') and self._uw:
                     self._uw.set_force_scan_mode(False)
                     logger.info(f"Force scan mode DISABLED after {scan_type}")
+            return True
         except Exception as e:
             logger.error(f"Error in scan_{scan_type}: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_afterhours_scan_wrapper(self):
         """Wrapper to run after-hours scan — async for stable event loop."""
@@ -1091,20 +1233,24 @@ class PutsEngineScheduler:
         try:
             await self._init_clients()
             await self.run_earnings_priority_scan()
+            return True
         except Exception as e:
             logger.error(f"Error in earnings_priority_scan: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_market_direction_wrapper(self):
         """Wrapper to run market direction analysis — async for stable event loop."""
         try:
             await self._init_clients()
             await self.run_market_direction_analysis()
+            return True
         except Exception as e:
             logger.error(f"Error in market_direction_analysis: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_premarket_gap_scan_wrapper(self):
         """Wrapper to run pre-market gap scan — async for stable event loop."""
@@ -1149,26 +1295,30 @@ class PutsEngineScheduler:
         # Auto-trigger Convergence Engine after daily report scan
         # Gamma Drain + Distribution + Liquidity scores just updated
         try:
-            self._run_convergence_wrapper()
+            await run_blocking(self._run_convergence_wrapper, "daily_report")
         except Exception as e:
             logger.warning(f"Post-DailyReport convergence trigger failed (non-fatal): {e}")
     
-    def _run_pattern_scan_wrapper(self):
-        """Wrapper to run pattern scan (pump-reversal, two-day rally, high vol run)."""
+    async def _run_pattern_scan_wrapper(self):
+        """Wrapper to run pattern scan (pump-reversal, two-day rally, high vol run) — async subprocess."""
+        proc = None
         try:
-            import subprocess
             from pathlib import Path
-            result = subprocess.run(
-                ["python3", "integrate_patterns.py"],
+            proc = await asyncio.create_subprocess_exec(
+                "python3", "integrate_patterns.py",
                 cwd=str(Path(__file__).parent.parent),
-                capture_output=True,
-                text=True,
-                timeout=120
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            if result.returncode == 0:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
+            if proc.returncode == 0:
                 logger.info("Pattern scan completed successfully")
             else:
-                logger.error(f"Pattern scan failed: {result.stderr}")
+                logger.error(f"Pattern scan failed: {stderr.decode(errors='replace')}")
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error("Pattern scan error: timed out after 120s")
         except Exception as e:
             logger.error(f"Pattern scan error: {e}")
     
@@ -1212,10 +1362,12 @@ class PutsEngineScheduler:
         try:
             await self._init_clients()
             await self.run_intraday_scan()
+            return True
         except Exception as e:
             logger.error(f"Error in intraday_scan: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_market_weather_am_wrapper(self):
         """
@@ -1229,10 +1381,12 @@ class PutsEngineScheduler:
         try:
             await self._init_clients()
             await self.run_market_weather_report("am", refresh=False)
+            return True
         except Exception as e:
             logger.error(f"Error in market_weather_am: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_market_weather_pm_wrapper(self):
         """
@@ -1246,10 +1400,12 @@ class PutsEngineScheduler:
         try:
             await self._init_clients()
             await self.run_market_weather_report("pm", refresh=False)
+            return True
         except Exception as e:
             logger.error(f"Error in market_weather_pm: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_market_weather_refresh_wrapper(self):
         """
@@ -1267,12 +1423,14 @@ class PutsEngineScheduler:
             now_et = datetime.now(EST)
             mode = "pm" if now_et.hour >= 15 else "am"
             await self.run_market_weather_report(mode, refresh=True)
+            return True
         except Exception as e:
             logger.error(f"Error in market_weather_refresh: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
-    def _run_convergence_wrapper(self):
+    def _run_convergence_wrapper(self, trigger: str = "job_graph"):
         """
         Wrapper to run 🎯 Convergence Engine — Automated 4-Step Decision Hierarchy.
         
@@ -1283,9 +1441,15 @@ class PutsEngineScheduler:
           Step 4: Weather (25%)    — Cross-validates with storm_score
         
         Schedule: Every 30 min (8 AM – 4 PM ET)
-        Also triggered automatically after each EWS scan completes.
+        Also triggered by the job graph right after every upstream job (EWS,
+        scans, direction, weather, intraday, FinViz) so the Top 9 is never
+        older than its inputs.
         Output: logs/convergence/latest_top9.json
         
+        INCREMENTAL: the engine lives for the whole scheduler process; each
+        run re-reads only changed sources and re-scores only the symbols
+        whose inputs changed, so an on-demand refresh is cheap.
+        
         SELF-HEALING:
         - If any source file missing/corrupt → uses available data, marks degraded
         - If engine crashes → writes status="degraded" with error message
@@ -1293,22 +1457,27 @@ class PutsEngineScheduler:
         """
         try:
             from putsengine.convergence_engine import run_convergence
-            result = run_convergence()
+            result = run_convergence(incremental=True)
             
             status = result.get("status", "unknown")
             top9_count = len(result.get("top9", []))
             sources = result.get("summary", {}).get("sources_available", 0)
             lights = result.get("summary", {}).get("permission_lights", {})
+            incremental = result.get("incremental", {})
             
             logger.info(
-                f"🎯 Convergence: status={status}, top9={top9_count}, "
+                f"🎯 Convergence ({trigger}): status={status}, top9={top9_count}, "
                 f"sources={sources}/4, "
-                f"🟢{lights.get('green', 0)} 🟡{lights.get('yellow', 0)} 🔴{lights.get('red', 0)}"
+                f"🟢{lights.get('green', 0)} 🟡{lights.get('yellow', 0)} 🔴{lights.get('red', 0)} | "
+                f"rescored {incremental.get('rescored', 0)}/{incremental.get('universe', 0)} "
+                f"in {incremental.get('elapsed_ms', 0)}ms"
             )
+            return True
         except Exception as e:
             logger.error(f"Convergence Engine error: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_finviz_bearish_scan_wrapper(self):
         """
@@ -1405,10 +1574,12 @@ class PutsEngineScheduler:
             finally:
                 await client.close()
             
+            return True
         except Exception as e:
             logger.error(f"FinViz bearish scan error: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
     
     async def _run_attribution_backfill_wrapper(self):
         """
@@ -1706,22 +1877,17 @@ class PutsEngineScheduler:
         
         try:
             await self.run_early_warning_scan()
+            return True
         except Exception as e:
             logger.error(f"Error in early_warning_scan: {e}")
             import traceback
             logger.error(traceback.format_exc())
+            return False
         finally:
             # Always disable force_scan mode after EWS scan
+            # (Convergence re-runs via the job graph once EWS output is fresh)
             if hasattr(self, '_uw') and self._uw is not None:
                 self._uw.set_force_scan_mode(False)
-            
-            # Auto-trigger Convergence Engine after each EWS scan
-            # EWS is the PRIMARY predictive signal — whenever it updates,
-            # the Top 9 scoreboard should re-merge all 4 systems immediately.
-            try:
-                self._run_convergence_wrapper()
-            except Exception as e:
-                logger.warning(f"Post-EWS convergence trigger failed (non-fatal): {e}")
     
     async def _run_zero_hour_scan_wrapper(self):
         """
@@ -1738,25 +1904,44 @@ class PutsEngineScheduler:
             import traceback
             logger.error(traceback.format_exc())
     
+    @instrumented("scanner", "full_scan")
     async def run_scan(self, scan_type: str = "manual"):
         """
         Run a full scan of ALL tickers across all 3 engines.
         
-        BATCHED SCANNING STRATEGY:
-        - Split all tickers into 3 batches of ~100
-        - Process each batch with 0.6s interval (100 req/min)
-        - Wait 65 seconds between batches (rate limit reset)
-        - Result: ALL tickers scanned, ZERO misses
+        Scans are serialized: a scan triggered while another is running
+        (daily_report overlapping market_pulse) waits for it, then runs.
         
         Args:
             scan_type: Type of scan (pre_market_1, market_open, regular, etc.)
         """
+        if self._scan_lock.locked():
+            logger.info(f"Scan {scan_type} waiting for the running scan to finish")
+        async with self._scan_lock:
+            await self._run_scan(scan_type)
+    
+    async def _run_scan(self, scan_type: str):
+        """
+        Body of run_scan (caller holds the scan lock).
+        
+        CONCURRENT SCANNING STRATEGY:
+        - All tickers go through a bounded-fanout ScanExecutor
+        - Polygon and UW have separate concurrency limits
+        - Every UW call waits on the shared gateway token bucket
+          (no fixed 65s sleeps between batches)
+        - Candidates stream into scan_progress as symbols finish and are
+          published to scan_progress.json while the scan runs;
+          latest_results is replaced only when the scan succeeds, so a
+          failed scan keeps the previous results
+        - Result: ALL tickers scanned, ZERO misses
+        """
         now_et = datetime.now(EST)
         logger.info(f"=" * 60)
         logger.info(f"SCHEDULED SCAN: {scan_type.upper()}")
         logger.info(f"Time: {now_et.strftime('%Y-%m-%d %H:%M:%S ET')}")
         logger.info(f"=" * 60)
         
+        progress_task: Optional[asyncio.Task] = None
         try:
             await self._init_clients()
             
@@ -1772,15 +1957,21 @@ class PutsEngineScheduler:
             
             logger.info(f"Scanning {total_tickers} tickers (Universe: {len(all_tickers)}, DUI: {len(dui_tickers)})...")
             
-            # BATCH CONFIGURATION
-            BATCH_SIZE = 100  # Tickers per batch
-            BATCH_WAIT = 65   # Seconds between batches (rate limit reset)
-            
-            # Split tickers into batches
-            batches = [combined_tickers[i:i + BATCH_SIZE] for i in range(0, total_tickers, BATCH_SIZE)]
-            num_batches = len(batches)
+            # CONCURRENT EXECUTOR: symbols run in parallel with separate
+            # Polygon / UW concurrency limits. Every UW HTTP call waits on the
+            # shared gateway token bucket (real token availability), so there
+            # is no fixed 65s sleep between batches.
+            executor = ScanExecutor(
+                max_in_flight=self.settings.scan_max_in_flight,
+                limits={
+                    "polygon": ProviderLimit(max_concurrency=self.settings.scan_polygon_concurrency),
+                    "uw": ProviderLimit(max_concurrency=self.settings.scan_uw_concurrency),
+                },
+            )
             
-            logger.info(f"Split into {num_batches} batches of ~{BATCH_SIZE} tickers")
+            # DUI tickers are P1 in the gateway queue (served ahead of P3)
+            for symbol in dui_tickers:
+                self._uw.update_ticker_priority(symbol, score=0, is_dui=True)
             
             # Results by engine
             gamma_drain_candidates = []
@@ -1799,125 +1990,131 @@ class PutsEngineScheduler:
             first_friday = get_next_friday(today)
             second_friday = get_next_friday(today, offset_weeks=1)
             
-            # Process each batch
-            total_processed = 0
-            total_errors = 0
-            
-            for batch_num, batch in enumerate(batches, 1):
-                batch_start = datetime.now(EST)
-                logger.info(f"--- BATCH {batch_num}/{num_batches} ({len(batch)} tickers) ---")
+            # Stream candidates into scan_progress as symbols finish; a
+            # background task publishes them so the dashboard can show
+            # partial results during a long scan.
+            self.scan_progress = {
+                "gamma_drain": gamma_drain_candidates,
+                "distribution": distribution_candidates,
+                "liquidity": liquidity_candidates,
+                "last_scan": now_et.isoformat(),
+                "scan_type": scan_type,
+                "market_regime": market_regime.regime.value,
+                "tickers_scanned": 0,
+                "scan_in_progress": True,
+            }
+            progress_task = asyncio.create_task(self._publish_progress_periodically())
+            dui_set = set(dui_tickers)
+            
+            # Market-wide UW feeds (congress trades, SPY greeks, tide): once per scan
+            market = await self._get_market_datasets()
+            
+            async def scan_symbol(symbol: str) -> Optional[Dict[str, Any]]:
+                # Prefetch the bars distribution needs (also used for price below)
+                async with executor.slot("polygon"):
+                    context = await SymbolContext.fetch(
+                        symbol, self._polygon, minute_days=2, minute_limit=2000,
+                        include_snapshot=False, market=market
+                    )
                 
-                # Scan each ticker in batch
-                for symbol in batch:
-                    try:
-                        # Run distribution analysis
-                        distribution = await self._distribution_layer.analyze(symbol)
-                        
-                        # ARCHITECT-4: Show ALL Class B+ candidates (0.20+)
-                        # Lowered threshold to catch more candidates
-                        if distribution.score < self.settings.class_b_min_score:
-                            total_processed += 1
-                            continue
-                        
-                        # Get current price
-                        try:
+                # Run distribution analysis (UW-heavy)
+                async with executor.slot("uw"):
+                    distribution = await self._distribution_layer.analyze(symbol, context=context)
+                
+                # ARCHITECT-4: Show ALL Class B+ candidates (0.20+)
+                # Lowered threshold to catch more candidates
+                if distribution.score < self.settings.class_b_min_score:
+                    return None
+                
+                # Get current price
+                try:
+                    bars = context.daily_since(date.today() - timedelta(days=5))
+                    if bars is None:
+                        async with executor.slot("polygon"):
                             bars = await self._polygon.get_daily_bars(
                                 symbol=symbol,
                                 from_date=date.today() - timedelta(days=5)
                             )
-                            current_price = bars[-1].close if bars else 0.0
-                        except:
-                            current_price = 0.0
-                        
-                        # Determine engine type based on signals
-                        engine_type = self._determine_engine_type(distribution)
-                        
-                        # Determine expiry based on score
-                        expiry_date = first_friday if distribution.score >= 0.45 else second_friday
-                        dte = (expiry_date - today).days
-                        
-                        # Check if this is a DUI ticker
-                        is_dui = symbol in dui_tickers
-                        
-                        # ======================================================================
-                        # FEB 1, 2026 FIX: Add signal priority classification
-                        # PRE-breakdown signals = predictive (early entry)
-                        # POST-breakdown signals = reactive (late entry)
-                        # ======================================================================
-                        try:
-                            from putsengine.signal_priority import (
-                                classify_signals,
-                                get_signal_priority_summary,
-                                is_predictive_signal_dominant
-                            )
-                            priority_summary = get_signal_priority_summary(distribution.signals)
-                            pre_signals = priority_summary.get("pre_signals", [])
-                            post_signals = priority_summary.get("post_signals", [])
-                            timing_rec = priority_summary.get("timing_recommendation", "BALANCED")
-                            is_predictive = is_predictive_signal_dominant(distribution.signals)
-                        except Exception as e:
-                            pre_signals = []
-                            post_signals = []
-                            timing_rec = "UNKNOWN"
-                            is_predictive = False
-                        
-                        # Create candidate data
-                        candidate_data = {
-                            "symbol": symbol,
-                            "score": round(distribution.score, 4),
-                            "tier": get_signal_tier(distribution.score),
-                            "engine_type": engine_type.value,
-                            "current_price": current_price,
-                            "expiry": expiry_date.strftime("%b %d"),
-                            "dte": dte,
-                            "signals": [k for k, v in distribution.signals.items() if v],
-                            "signal_count": sum(1 for v in distribution.signals.values() if v),
-                            "scan_time": now_et.strftime("%H:%M ET"),
-                            "scan_type": scan_type,
-                            "is_dui": is_dui,
-                            "batch": batch_num,
-                            # NEW: Signal priority data (Feb 1, 2026)
-                            "pre_signals": pre_signals,
-                            "post_signals": post_signals,
-                            "timing_recommendation": timing_rec,
-                            "is_predictive": is_predictive,
-                        }
-                        
-                        # Add to appropriate engine list
-                        if engine_type == EngineType.GAMMA_DRAIN:
-                            gamma_drain_candidates.append(candidate_data)
-                        elif engine_type == EngineType.DISTRIBUTION_TRAP:
-                            distribution_candidates.append(candidate_data)
-                        else:
-                            liquidity_candidates.append(candidate_data)
-                        
-                        total_processed += 1
-                        
-                    except Exception as e:
-                        logger.debug(f"Error scanning {symbol}: {e}")
-                        total_errors += 1
-                        total_processed += 1
+                    current_price = bars[-1].close if bars else 0.0
+                except Exception:
+                    current_price = 0.0
+                
+                # Determine engine type based on signals
+                engine_type = self._determine_engine_type(distribution)
                 
-                # Batch completion log
-                batch_elapsed = (datetime.now(EST) - batch_start).total_seconds()
-                candidates_this_batch = sum([
-                    len([c for c in gamma_drain_candidates if c.get("batch") == batch_num]),
-                    len([c for c in distribution_candidates if c.get("batch") == batch_num]),
-                    len([c for c in liquidity_candidates if c.get("batch") == batch_num])
-                ])
-                logger.info(f"Batch {batch_num} complete: {len(batch)} tickers in {batch_elapsed:.1f}s, {candidates_this_batch} candidates")
+                # Determine expiry based on score
+                expiry_date = first_friday if distribution.score >= 0.45 else second_friday
+                dte = (expiry_date - today).days
                 
-                # Wait between batches (except after last batch)
-                if batch_num < num_batches:
-                    logger.info(f"⏳ Waiting {BATCH_WAIT}s for rate limit reset before batch {batch_num + 1}...")
-                    await asyncio.sleep(BATCH_WAIT)
+                # ======================================================================
+                # FEB 1, 2026 FIX: Add signal priority classification
+                # PRE-breakdown signals = predictive (early entry)
+                # POST-breakdown signals = reactive (late entry)
+                # ======================================================================
+                try:
+                    from putsengine.signal_priority import (
+                        get_signal_priority_summary,
+                        is_predictive_signal_dominant
+                    )
+                    priority_summary = get_signal_priority_summary(distribution.signals)
+                    pre_signals = priority_summary.get("pre_signals", [])
+                    post_signals = priority_summary.get("post_signals", [])
+                    timing_rec = priority_summary.get("timing_recommendation", "BALANCED")
+                    is_predictive = is_predictive_signal_dominant(distribution.signals)
+                except Exception:
+                    pre_signals = []
+                    post_signals = []
+                    timing_rec = "UNKNOWN"
+                    is_predictive = False
+                
+                return {
+                    "symbol": symbol,
+                    "score": round(distribution.score, 4),
+                    "tier": get_signal_tier(distribution.score),
+                    "engine_type": engine_type.value,
+                    "current_price": current_price,
+                    "expiry": expiry_date.strftime("%b %d"),
+                    "dte": dte,
+                    "signals": [k for k, v in distribution.signals.items() if v],
+                    "signal_count": sum(1 for v in distribution.signals.values() if v),
+                    "scan_time": now_et.strftime("%H:%M ET"),
+                    "scan_type": scan_type,
+                    "is_dui": symbol in dui_set,
+                    # NEW: Signal priority data (Feb 1, 2026)
+                    "pre_signals": pre_signals,
+                    "post_signals": post_signals,
+                    "timing_recommendation": timing_rec,
+                    "is_predictive": is_predictive,
+                }
+            
+            def collect(symbol: str, candidate_data: Optional[Dict[str, Any]]):
+                self.scan_progress["tickers_scanned"] += 1
+                if candidate_data is None:
+                    return
+                # Add to appropriate engine list
+                engine_value = candidate_data["engine_type"]
+                if engine_value == EngineType.GAMMA_DRAIN.value:
+                    gamma_drain_candidates.append(candidate_data)
+                elif engine_value == EngineType.DISTRIBUTION_TRAP.value:
+                    distribution_candidates.append(candidate_data)
+                else:
+                    liquidity_candidates.append(candidate_data)
+            
+            exec_stats = await executor.run(combined_tickers, scan_symbol, on_result=collect)
+            total_processed = exec_stats.completed + exec_stats.errors
+            total_errors = exec_stats.errors
+            logger.info(
+                f"Executor finished {total_tickers} tickers in {exec_stats.elapsed_seconds:.1f}s "
+                f"(peak in-flight {exec_stats.peak_in_flight}, "
+                f"UW gateway {self._uw.get_budget_status().get('gateway', {})})"
+            )
             
             # Sort by score
             gamma_drain_candidates.sort(key=lambda x: x["score"], reverse=True)
             distribution_candidates.sort(key=lambda x: x["score"], reverse=True)
             liquidity_candidates.sort(key=lambda x: x["score"], reverse=True)
             
-            # Update latest results
+            # Publish the complete scan in one assignment
             self.latest_results = {
                 "gamma_drain": gamma_drain_candidates,
                 "distribution": distribution_candidates,
@@ -1926,13 +2123,13 @@ class PutsEngineScheduler:
                 "scan_type": scan_type,
                 "market_regime": market_regime.regime.value,
                 "tickers_scanned": total_tickers,
-                "batches": num_batches,
                 "errors": total_errors,
+                "executor": exec_stats.to_dict(),
                 "total_candidates": len(gamma_drain_candidates) + len(distribution_candidates) + len(liquidity_candidates)
             }
             
-            # Save results to file
-            self._save_results()
+            # Save results to file (off the loop: large JSON dump + state store writes)
+            await run_blocking(self._save_results)
             
             # Update scan history
             try:
@@ -1945,12 +2142,12 @@ class PutsEngineScheduler:
             # Log summary
             logger.info(f"=" * 60)
             logger.info(f"SCAN COMPLETE: {scan_type.upper()}")
-            logger.info(f"Total tickers scanned: {total_tickers} in {num_batches} batches")
+            logger.info(f"Total tickers scanned: {total_tickers} in {exec_stats.elapsed_seconds:.1f}s")
             logger.info(f"Processed: {total_processed}, Errors: {total_errors}")
             logger.info(f"Gamma Drain candidates: {len(gamma_drain_candidates)}")
             logger.info(f"Distribution candidates: {len(distribution_candidates)}")
             logger.info(f"Liquidity candidates: {len(liquidity_candidates)}")
-            logger.info(f"0 TICKERS MISSED (batched scanning)")
+            logger.info("0 TICKERS MISSED (concurrent executor)")
             
             # Log top candidates
             if gamma_drain_candidates:
@@ -1969,10 +2166,18 @@ class PutsEngineScheduler:
             logger.error(f"Scan error: {e}")
             raise
         finally:
+            if progress_task is not None:
+                progress_task.cancel()
+            if self.scan_progress.get("scan_in_progress"):
+                self.scan_progress["scan_in_progress"] = False
+                await self._publish_progress()
             # MEMORY LEAK FIX: Force garbage collection after each scan
-            # This prevents memory buildup over long-running daemon sessions
+            # This prevents memory buildup over long-running daemon sessions.
+            # Young generations only: a full collect walks every object and
+            # holds the GIL (and so the loop) throughout — cleanup_resources()
+            # still runs the full collection periodically.
             import gc
-            gc.collect()
+            gc.collect(1)
             logger.debug("Post-scan garbage collection completed")
     
     async def cleanup_resources(self):
@@ -2127,13 +2332,52 @@ class PutsEngineScheduler:
         logger.debug(f"Engine assignment: DISTRIBUTION (default: gamma={gamma_signals}, liq={liq_signals}, score={score:.3f})")
         return EngineType.DISTRIBUTION_TRAP
     
+    async def _get_market_datasets(self) -> MarketDatasets:
+        """MARKET_FEEDS shared by the scan and MarketPulse, refetched after MARKET_DATASETS_TTL."""
+        market = self._market_datasets
+        if (
+            market is None
+            or (datetime.now() - market.fetched_at).total_seconds() >= MARKET_DATASETS_TTL
+        ):
+            await self._init_clients()
+            market = await MarketDatasets.fetch(self._uw, MARKET_FEEDS)
+            self._market_datasets = market
+        return market
+
+    def _progress_snapshot(self) -> Dict[str, Any]:
+        """Copy of scan_progress with candidates sorted by score (safe to dump off-loop)."""
+        snapshot = {
+            key: (sorted(value, key=lambda x: x["score"], reverse=True)
+                  if isinstance(value, list) else value)
+            for key, value in self.scan_progress.items()
+        }
+        snapshot["updated_at"] = datetime.now(EST).isoformat()
+        return snapshot
+    
+    async def _publish_progress(self):
+        """Write the scan in flight to SCAN_PROGRESS_FILE for other processes."""
+        try:
+            await run_blocking(dump_file, self._progress_snapshot(), SCAN_PROGRESS_FILE)
+        except Exception as e:
+            logger.debug(f"Could not publish scan progress: {e}")
+    
+    async def _publish_progress_periodically(self):
+        while True:
+            await asyncio.sleep(PROGRESS_PUBLISH_SECONDS)
+            await self._publish_progress()
+    
     def _save_results(self):
         """Save scan results to JSON file and history."""
         try:
-            with open(RESULTS_FILE, 'w') as f:
-                json.dump(self.latest_results, f, indent=2, default=str)
+            dump_file(self.latest_results, RESULTS_FILE)
             logger.info(f"Results saved to {RESULTS_FILE}")
             
+            # Indexed copy for cross-process readers (convergence, history queries)
+            try:
+                get_state_store().record_scan(self.latest_results)
+            except Exception as e:
+                logger.warning(f"Could not record scan in state store: {e}")
+            
             # Also save to 48-hour history for frequency analysis
             from putsengine.scan_history import add_scan_to_history
             add_scan_to_history(self.latest_results)
@@ -2389,7 +2633,8 @@ class PutsEngineScheduler:
             from putsengine.market_pulse_engine import MarketPulseEngine
             engine = MarketPulseEngine(
                 polygon_client=self._polygon,
-                uw_client=self._uw
+                uw_client=self._uw,
+                market=await self._get_market_datasets(),
             )
             result = await engine.analyze()
             await engine.close()  # Safe: won't close shared clients (_owns_clients=False)
@@ -3094,9 +3339,9 @@ class PutsEngineScheduler:
                         for symbol, pressure in results.items()
                     }
                 }
-                with open(early_warning_file, 'w') as f:
-                    json.dump(alert_data, f, indent=2, default=str)
+                dump_file(alert_data, early_warning_file)
                 logger.info(f"Early warning alerts saved to {early_warning_file}")
+                get_state_store().record_ews(alert_data)
             except Exception as e:
                 logger.warning(f"Could not save early warning alerts: {e}")
             
@@ -3221,6 +3466,11 @@ class PutsEngineScheduler:
             })
         return jobs
     
+    def _instrument_jobs(self):
+        """Attribute each cron job's API calls and run time to its job id (putsengine.metrics)."""
+        for job in self.scheduler.get_jobs():
+            job.modify(func=instrumented("job", job.id)(job.func))
+
     async def start(self):
         """Start the scheduler as an always-on background service."""
         if self.is_running:
@@ -3243,6 +3493,8 @@ class PutsEngineScheduler:
         
         # Schedule all jobs
         self._schedule_jobs()
+        self._instrument_jobs()
+        configure_compute_pool(self.settings.compute_workers)
         
         # Start scheduler
         self.scheduler.start()
@@ -3301,9 +3553,20 @@ async def run_scheduler():
     sig.signal(sig.SIGTERM, handle_shutdown)
     sig.signal(sig.SIGINT, handle_shutdown)
     
+    loop_monitor = LoopMonitor()
+    metrics_server = None
+    
     try:
         await scheduler.start()
         
+        # Hot-path metrics: loop lag + blocked-loop detection, optional /metrics endpoint
+        loop_monitor.start()
+        if scheduler.settings.metrics_port:
+            try:
+                metrics_server = await serve_metrics(scheduler.settings.metrics_port)
+            except OSError as e:
+                logger.warning(f"Metrics endpoint unavailable: {e}")
+        
         logger.info("Scheduler daemon is now running...")
         logger.info("Press Ctrl+C or send SIGTERM to stop")
         
@@ -3358,11 +3621,15 @@ async def run_scheduler():
                     "api_healthy": api_healthy,
                     "pid": os.getpid(),
                     "consecutive_failures": _consecutive_api_failures,
+                    "loop_lag": loop_monitor.stats(),
                 }
                 health_path = Path("scheduler_loop_health.json")
                 with open(health_path, "w") as _f:
                     _json.dump(health_data, _f, indent=2)
                 
+                # Metrics files for the dashboard and watchdog
+                get_metrics().export()
+                
             except Exception as health_err:
                 logger.warning(f"Health probe error (non-fatal): {health_err}")
             
@@ -3377,7 +3644,12 @@ async def run_scheduler():
         raise
     finally:
         logger.info("Shutting down scheduler daemon...")
+        loop_monitor.stop()
+        if metrics_server is not None:
+            await metrics_server.cleanup()
         await scheduler.stop()
+        shutdown_compute_pool()
+        shutdown_blocking_pool()
         logger.info("Scheduler daemon stopped gracefully")
 
 
@@ -36,6 +36,8 @@ MAX_RESTART_ATTEMPTS = 5  # Max restarts before giving up
 STARTUP_GRACE_PERIOD = 600  # Give scheduler 10 minutes after start before checking responsiveness
 LOOP_HEALTH_FILE = PROJECT_ROOT / "scheduler_loop_health.json"
 MAX_LOOP_STALE_SECONDS = 300  # 5 min — if heartbeat older than this, event loop is dead
+MAX_LOOP_LAG_P99_MS = 1000  # Loop blocked >1s at p99 — alive but starving I/O (warn, no restart)
+METRICS_FILE = PROJECT_ROOT / "logs" / "metrics.json"  # Exported by the daemon (putsengine.metrics)
 
 
 def write_log(message: str):
@@ -63,6 +65,32 @@ def get_daemon_pid() -> Optional[int]:
     return None
 
 
+def read_metrics_summary() -> Optional[dict]:
+    """
+    Summarize the daemon's exported metrics (loop lag, UW calls by caller, caches).
+    
+    Read from the JSON file rather than imported: the watchdog runs as a
+    plain script outside the package.
+    """
+    try:
+        with open(METRICS_FILE) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    by_caller = snapshot.get("http", {}).get("by_caller", {})
+    uw_by_caller = sorted(
+        ((caller, calls.get("uw", 0)) for caller, calls in by_caller.items() if calls.get("uw")),
+        key=lambda item: item[1], reverse=True
+    )
+    return {
+        "age_seconds": round(time.time() - snapshot.get("timestamp", 0), 0),
+        "event_loop_lag": snapshot.get("event_loop_lag"),
+        "uw_calls_by_caller": dict(uw_by_caller[:10]),
+        "caches": snapshot.get("caches", {}),
+    }
+
+
 def check_daemon_health() -> dict:
     """
     Check scheduler daemon health.
@@ -117,6 +145,7 @@ def check_daemon_health() -> dict:
         loop_alive = True
         api_healthy = True
         loop_stale = False
+        loop_lag = None
         
         if LOOP_HEALTH_FILE.exists() and not in_grace_period:
             try:
@@ -125,6 +154,7 @@ def check_daemon_health() -> dict:
                 
                 loop_alive = loop_health.get("loop_alive", True)
                 api_healthy = loop_health.get("api_healthy", True)
+                loop_lag = loop_health.get("loop_lag")
                 
                 # Check if heartbeat is stale (loop stopped writing)
                 loop_ts_str = loop_health.get("timestamp", "")
@@ -151,6 +181,13 @@ def check_daemon_health() -> dict:
             write_log(f"🟡 API sessions unhealthy — may self-heal via _reset_client_sessions")
         elif memory_mb > MAX_MEMORY_MB:
             status = "HIGH_MEMORY"
+        elif loop_lag and loop_lag.get("p99_ms", 0) > MAX_LOOP_LAG_P99_MS:
+            status = "LOOP_LAGGING"
+            stalls = loop_lag.get("recent_stalls") or [{}]
+            write_log(
+                f"🟡 Event loop lagging: p99 {loop_lag['p99_ms']:.0f}ms "
+                f"(max {MAX_LOOP_LAG_P99_MS}ms), last stall at {stalls[-1].get('where', 'unknown')}"
+            )
         elif not in_grace_period and last_activity:
             # Only check responsiveness after grace period
             age_seconds = (datetime.now() - last_activity).total_seconds()
@@ -167,6 +204,8 @@ def check_daemon_health() -> dict:
             "last_activity": last_activity.isoformat() if last_activity else None,
             "process_age_seconds": round(process_age_seconds, 0),
             "in_grace_period": in_grace_period,
+            "loop_lag": loop_lag,
+            "metrics": read_metrics_summary(),
             "status": status
         }
         
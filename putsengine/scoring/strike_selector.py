@@ -356,7 +356,7 @@ class StrikeSelector:
         """
         symbol = candidate.symbol
         current_price = candidate.current_price
-        score = candidate.score
+        score = candidate.composite_score
 
         if current_price == 0:
             logger.warning(f"No current price for {symbol}")
@@ -405,11 +405,14 @@ class StrikeSelector:
             polygon_greeks_available = False
             
             try:
+                # Server-side filters: only puts in the strike/DTE window are paged in
                 polygon_snapshot = await self.polygon.get_options_snapshot(
                     symbol, 
                     option_type="put",
                     strike_price_gte=min_strike * 0.95,
                     strike_price_lte=max_strike * 1.05,
+                    expiration_date_gte=date.today() + timedelta(days=dte_min),
+                    expiration_date_lte=date.today() + timedelta(days=dte_max),
                 )
                 if polygon_snapshot:
                     for snap in polygon_snapshot:
@@ -443,7 +446,8 @@ class StrikeSelector:
                             last=float(snap.get("last_trade", {}).get("price", 0)),
                             volume=int(day.get("volume", 0)),
                             open_interest=int(snap.get("open_interest", 0)),
-                            implied_volatility=float(greeks.get("implied_volatility", 0)),
+                            # IV is top-level in the v3 snapshot, not under greeks
+                            implied_volatility=float(snap.get("implied_volatility") or 0),
                             delta=float(greeks.get("delta", 0)),
                             gamma=float(greeks.get("gamma", 0)),
                             theta=float(greeks.get("theta", 0)),
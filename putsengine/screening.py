@@ -0,0 +1,147 @@
+"""
+Universe Screening - shortlist the whole universe from one bulk snapshot.
+
+WHY:
+``PutsEngine._build_shortlist`` called ``get_snapshot`` once per ticker,
+serially, and kept the first 15 names that passed. The shortlist step cost
+one round-trip per symbol, and which 15 names were kept depended on
+universe order rather than on how strong the setup was.
+
+HOW:
+- ``UniverseSnapshot`` loads the full-market snapshot
+  (``PolygonClient.get_all_tickers_snapshot``, one request) into columnar
+  NumPy arrays, restricted to the requested universe.
+- ``screen`` applies the same filters as the per-symbol path (red day,
+  volume >= 80% of the prior day, below VWAP) as boolean masks, scores
+  every survivor and returns the top N by score. Ties break on symbol so
+  the ranking is deterministic.
+
+Screen score (higher = weaker):
+    day decline %  +  below-VWAP %  +  2 * min(volume / prev volume - 1, 2)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+# Filters (identical to the per-symbol screen)
+MIN_VOLUME_RATIO = 0.8
+SHORTLIST_SIZE = 15
+
+# Score weights
+VOLUME_WEIGHT = 2.0
+VOLUME_EXCESS_CAP = 2.0
+
+
+@dataclass
+class ScreenResult:
+    """One shortlisted symbol with the values it was ranked on."""
+    symbol: str
+    score: float
+    change_pct: float
+    volume_ratio: float
+    vwap_distance_pct: float
+
+
+class UniverseSnapshot:
+    """Day / previous-day snapshot fields for a universe, one array per field."""
+
+    __slots__ = ("symbols", "open", "close", "vwap", "volume", "prev_volume")
+
+    def __init__(self, symbols, open, close, vwap, volume, prev_volume):
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.vwap = np.asarray(vwap, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+        self.prev_volume = np.asarray(prev_volume, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_tickers(
+        cls,
+        tickers: List[Dict[str, Any]],
+        universe: Optional[Iterable[str]] = None,
+    ) -> "UniverseSnapshot":
+        """
+        Build from ``get_all_tickers_snapshot`` results.
+
+        Tickers without day data (pre-market, halted) are dropped, as the
+        per-symbol screen skipped them. ``universe`` restricts the rows to
+        those symbols; None keeps every ticker.
+        """
+        wanted = set(universe) if universe is not None else None
+        rows = []
+        symbols = []
+        for t in tickers:
+            symbol = t.get("ticker")
+            if not symbol or (wanted is not None and symbol not in wanted):
+                continue
+            day = t.get("day") or {}
+            if not day:
+                continue
+            prev = t.get("prevDay") or {}
+            rows.append((
+                day.get("o", 0) or 0,
+                day.get("c", 0) or 0,
+                day.get("vw", 0) or 0,
+                day.get("v", 0) or 0,
+                prev.get("v", 1) or 0,
+            ))
+            symbols.append(symbol)
+
+        if not rows:
+            z = np.zeros(0)
+            return cls([], z, z, z, z, z)
+        data = np.array(rows, dtype=np.float64)
+        return cls(symbols, data[:, 0], data[:, 1], data[:, 2], data[:, 3], data[:, 4])
+
+
+def screen(snapshot: UniverseSnapshot, limit: int = SHORTLIST_SIZE) -> List[ScreenResult]:
+    """
+    Filter and rank a universe snapshot.
+
+    Args:
+        snapshot: Columnar universe snapshot
+        limit: Max names returned
+
+    Returns:
+        Up to ``limit`` results, strongest (highest score) first
+    """
+    if not len(snapshot):
+        return []
+
+    s = snapshot
+    red_day = (s.close - s.open) < 0
+    volume_ok = s.volume >= s.prev_volume * MIN_VOLUME_RATIO
+    below_vwap = (s.vwap <= 0) | (s.close < s.vwap)
+    passed = np.flatnonzero(red_day & volume_ok & below_vwap)
+    if not len(passed):
+        return []
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = np.where(s.open > 0, (s.close - s.open) / s.open * 100, 0.0)[passed]
+        volume_ratio = np.where(s.prev_volume > 0, s.volume / s.prev_volume, 1.0)[passed]
+        vwap_pct = np.where(s.vwap > 0, (s.close - s.vwap) / s.vwap * 100, 0.0)[passed]
+
+    volume_excess = np.clip(volume_ratio - 1.0, 0.0, VOLUME_EXCESS_CAP)
+    score = -change_pct - vwap_pct + VOLUME_WEIGHT * volume_excess
+
+    symbols = s.symbols[passed]
+    # lexsort: last key is primary -> score descending, then symbol ascending
+    order = np.lexsort((symbols.astype(str), -score))[:limit]
+
+    return [
+        ScreenResult(
+            symbol=str(symbols[i]),
+            score=round(float(score[i]), 4),
+            change_pct=round(float(change_pct[i]), 4),
+            volume_ratio=round(float(volume_ratio[i]), 4),
+            vwap_distance_pct=round(float(vwap_pct[i]), 4),
+        )
+        for i in order
+    ]
@@ -28,6 +28,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Set, Tuple
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 from enum import Enum
 
@@ -303,6 +304,7 @@ class SectorCorrelationScanner:
         }
 
 
+@instrumented("scanner", "sector_correlation")
 async def run_sector_correlation_scan(candidates: Dict[str, Dict]) -> Dict:
     """
     Run sector correlation scan on candidates.
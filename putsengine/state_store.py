@@ -0,0 +1,681 @@
+"""
+State Store - SQLite (WAL) store for state shared between engines.
+
+WHY:
+The scheduler, EWS, convergence engine, dashboard and scanners talked
+through JSON files in the project root. Every producer rewrote its whole
+file: ipi_history.json on every IPI snapshot, ews_attribution.json on every
+event update, dynamic_universe.json on every promotion. Every consumer
+(``ConvergenceEngine._load_*``, flash alerts, attribution reports)
+re-parsed the whole file to read a few records. Two processes writing the
+same file could also clobber each other.
+
+HOW:
+- One SQLite file in WAL mode (stdlib, same setup as the persistent HTTP
+  cache): concurrent readers, one writer at a time, busy_timeout instead
+  of errors on short contention.
+- Typed tables with indexes on (symbol, time):
+    scans / scan_candidates     scheduled scan results
+    ews_runs / ews_alerts       early warning runs and per-symbol alerts
+    ipi_snapshots               IPI time series (flash alert surge detection)
+    dui_entries                 Dynamic Universe Injection set
+    attribution_events          EWS attribution ledger (+ meta counters)
+    refresh_baselines           per-symbol EWS REFRESH planner baselines
+- Multi-row writes (a scan with its candidates, a DUI replace) are one
+  transaction, so readers never see half a scan.
+- ``import_legacy`` loads the existing JSON files once (marker in ``meta``);
+  ``export_legacy`` writes them back out in their original shapes.
+
+Footprints are not here: they already live in the append-only, per-symbol
+indexed FootprintStore (putsengine/footprint_store.py).
+
+The JSON files for scans, EWS alerts and DUI are still written as exports
+for the dashboard. Consumers that read through the store use it unless
+the JSON file is newer (e.g. written by a tool that doesn't know the store).
+
+Usage:
+    store = get_state_store()
+    store.record_scan(latest_results)
+    latest = store.latest_scan()                       # scheduled_scan_results.json shape
+    rows = store.candidate_history("AAPL", since=datetime.now() - timedelta(days=2))
+
+    python -m putsengine.state_store import|export [--root DIR]
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from loguru import logger
+
+from putsengine.codec import dump_file, dumps, load_file, loads
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / "putsengine_state.db"
+DB_PATH_ENV = "PUTSENGINE_STATE_DB"
+
+SCAN_ENGINES = ("gamma_drain", "distribution", "liquidity")
+
+# Legacy JSON files (relative to the project root)
+LEGACY_FILES = {
+    "scans": "scheduled_scan_results.json",
+    "ews": "early_warning_alerts.json",
+    "ipi": "ipi_history.json",
+    "dui": "dynamic_universe.json",
+    "attribution": "ews_attribution.json",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_type TEXT,
+    scanned_at TEXT NOT NULL,
+    market_regime TEXT,
+    tickers_scanned INTEGER,
+    recorded_at REAL NOT NULL,
+    meta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scans_time ON scans(scanned_at);
+CREATE TABLE IF NOT EXISTS scan_candidates (
+    scan_id INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    engine TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    score REAL,
+    scanned_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_symbol ON scan_candidates(symbol, scanned_at);
+CREATE INDEX IF NOT EXISTS idx_candidates_scan ON scan_candidates(scan_id);
+CREATE TABLE IF NOT EXISTS ews_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    meta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ews_alerts (
+    run_id INTEGER NOT NULL REFERENCES ews_runs(id) ON DELETE CASCADE,
+    symbol TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    ipi REAL,
+    level TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ews_alerts_symbol ON ews_alerts(symbol, ts);
+CREATE INDEX IF NOT EXISTS idx_ews_alerts_run ON ews_alerts(run_id);
+CREATE TABLE IF NOT EXISTS ipi_snapshots (
+    symbol TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    ipi REAL NOT NULL,
+    unique_footprints INTEGER NOT NULL,
+    footprint_types TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ipi_symbol ON ipi_snapshots(symbol, ts);
+CREATE INDEX IF NOT EXISTS idx_ipi_time ON ipi_snapshots(ts);
+CREATE TABLE IF NOT EXISTS dui_entries (
+    symbol TEXT PRIMARY KEY,
+    source TEXT,
+    score REAL,
+    added_date TEXT,
+    expires_date TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dui_expires ON dui_entries(expires_date);
+CREATE TABLE IF NOT EXISTS attribution_events (
+    event_id TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    ews_timestamp TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attribution_symbol ON attribution_events(symbol, ews_timestamp);
+CREATE TABLE IF NOT EXISTS refresh_baselines (
+    symbol TEXT PRIMARY KEY,
+    scanned_at TEXT NOT NULL,
+    ipi REAL NOT NULL,
+    price REAL,
+    volume REAL,
+    prev_volume REAL,
+    spread_bps REAL
+);
+"""
+
+TimeLike = Union[datetime, str]
+
+
+def _iso(value: Optional[TimeLike]) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+def _dumps(value: Any) -> str:
+    return dumps(value)
+
+
+class StateStore:
+    """Typed, indexed tables for engine state, shared across processes."""
+
+    # Keep this many scans / EWS runs (older ones are deleted on write)
+    KEEP_SCANS = 500
+    KEEP_EWS_RUNS = 500
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Connection / transactions
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        # A forked child must not reuse the parent's connection
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False,
+                                   isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+            self._conn = None
+            self._conn_pid = None
+
+    # ------------------------------------------------------------------
+    # Meta (small key/value: migration markers, counters)
+    # ------------------------------------------------------------------
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        rows = self._query("SELECT value FROM meta WHERE key = ?", (key,))
+        return loads(rows[0]["value"]) if rows else default
+
+    def set_meta(self, key: str, value: Any, conn: Optional[sqlite3.Connection] = None) -> None:
+        sql = "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)"
+        if conn is not None:
+            conn.execute(sql, (key, _dumps(value)))
+            return
+        with self._transaction() as c:
+            c.execute(sql, (key, _dumps(value)))
+
+    def update_meta(self, key: str, update: Callable[[Any], Any], default: Any = None) -> Any:
+        """
+        Read-modify-write ``key`` in one write transaction, so concurrent
+        writers (threads or processes) never lose each other's changes.
+        Returns the stored value.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchall()
+            value = update(loads(rows[0]["value"]) if rows else default)
+            self.set_meta(key, value, conn=conn)
+        return value
+
+    # ------------------------------------------------------------------
+    # Scans
+    # ------------------------------------------------------------------
+
+    def record_scan(self, results: Dict[str, Any]) -> int:
+        """
+        Store one scheduled scan (the ``latest_results`` dict) and its
+        candidates in a single transaction. Returns the scan id.
+        """
+        scanned_at = str(results.get("last_scan") or datetime.now().isoformat())
+        meta = {k: v for k, v in results.items() if k not in SCAN_ENGINES}
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO scans"
+                "(scan_type, scanned_at, market_regime, tickers_scanned, recorded_at, meta)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (results.get("scan_type"), scanned_at, results.get("market_regime"),
+                 results.get("tickers_scanned"), time.time(), _dumps(meta)),
+            )
+            scan_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO scan_candidates"
+                "(scan_id, position, engine, symbol, score, scanned_at, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        scan_id, i, engine, str(c.get("symbol", "")), c.get("score"),
+                        scanned_at, _dumps(c),
+                    )
+                    for engine in SCAN_ENGINES
+                    for i, c in enumerate(results.get(engine) or [])
+                    if isinstance(c, dict)
+                ],
+            )
+            conn.execute(
+                "DELETE FROM scans WHERE id <= ?", (scan_id - self.KEEP_SCANS,)
+            )
+        return scan_id
+
+    def latest_scan(self) -> Optional[Dict[str, Any]]:
+        """Most recent scan in the scheduled_scan_results.json shape (None if no scans)."""
+        rows = self._query("SELECT * FROM scans ORDER BY id DESC LIMIT 1")
+        if not rows:
+            return None
+        return self._scan_dict(rows[0])
+
+    def latest_scan_recorded_at(self) -> Optional[float]:
+        rows = self._query("SELECT recorded_at FROM scans ORDER BY id DESC LIMIT 1")
+        return rows[0]["recorded_at"] if rows else None
+
+    def _scan_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        result = loads(row["meta"])
+        for engine in SCAN_ENGINES:
+            result[engine] = []
+        for c in self._query(
+            "SELECT engine, payload FROM scan_candidates"
+            " WHERE scan_id = ? ORDER BY engine, position",
+            (row["id"],),
+        ):
+            result.setdefault(c["engine"], []).append(loads(c["payload"]))
+        return result
+
+    def candidate_history(
+        self, symbol: str, since: Optional[TimeLike] = None, engine: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Every stored candidate row for ``symbol`` (oldest first)."""
+        sql = "SELECT engine, scanned_at, payload FROM scan_candidates WHERE symbol = ?"
+        params: list = [symbol]
+        if since is not None:
+            sql += " AND scanned_at >= ?"
+            params.append(_iso(since))
+        if engine is not None:
+            sql += " AND engine = ?"
+            params.append(engine)
+        sql += " ORDER BY scanned_at"
+        return [
+            dict(loads(r["payload"]), engine=r["engine"], scanned_at=r["scanned_at"])
+            for r in self._query(sql, tuple(params))
+        ]
+
+    # ------------------------------------------------------------------
+    # Early warning runs
+    # ------------------------------------------------------------------
+
+    def record_ews(self, data: Dict[str, Any]) -> int:
+        """Store one EWS run (the early_warning_alerts.json dict)."""
+        ts = str(data.get("timestamp") or datetime.now().isoformat())
+        alerts = data.get("alerts") or {}
+        meta = {k: v for k, v in data.items() if k != "alerts"}
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO ews_runs(ts, recorded_at, meta) VALUES (?, ?, ?)",
+                (ts, time.time(), _dumps(meta)),
+            )
+            run_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO ews_alerts(run_id, symbol, ts, ipi, level, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, symbol, ts, alert.get("ipi"), alert.get("level"), _dumps(alert))
+                    for symbol, alert in alerts.items()
+                    if isinstance(alert, dict)
+                ],
+            )
+            conn.execute("DELETE FROM ews_runs WHERE id <= ?", (run_id - self.KEEP_EWS_RUNS,))
+        return run_id
+
+    def latest_ews(self) -> Optional[Dict[str, Any]]:
+        """Most recent EWS run in the early_warning_alerts.json shape."""
+        rows = self._query("SELECT * FROM ews_runs ORDER BY id DESC LIMIT 1")
+        if not rows:
+            return None
+        data = loads(rows[0]["meta"])
+        data["alerts"] = {
+            r["symbol"]: loads(r["payload"])
+            for r in self._query(
+                "SELECT symbol, payload FROM ews_alerts WHERE run_id = ?", (rows[0]["id"],)
+            )
+        }
+        return data
+
+    def latest_ews_recorded_at(self) -> Optional[float]:
+        rows = self._query("SELECT recorded_at FROM ews_runs ORDER BY id DESC LIMIT 1")
+        return rows[0]["recorded_at"] if rows else None
+
+    def ews_history(self, symbol: str, since: Optional[TimeLike] = None) -> List[Dict[str, Any]]:
+        """EWS alerts for ``symbol`` across runs (oldest first), each with its run ``timestamp``."""
+        sql = "SELECT ts, payload FROM ews_alerts WHERE symbol = ?"
+        params: list = [symbol]
+        if since is not None:
+            sql += " AND ts >= ?"
+            params.append(_iso(since))
+        sql += " ORDER BY ts"
+        rows = self._query(sql, tuple(params))
+        return [dict(loads(r["payload"]), timestamp=r["ts"]) for r in rows]
+
+    # ------------------------------------------------------------------
+    # IPI snapshots
+    # ------------------------------------------------------------------
+
+    def record_ipi(
+        self,
+        symbol: str,
+        ipi: float,
+        unique_footprints: int,
+        footprint_types: List[str],
+        timestamp: Optional[TimeLike] = None,
+    ) -> None:
+        self.record_ipi_many({symbol: [{
+            "timestamp": _iso(timestamp),
+            "ipi": ipi,
+            "unique_footprints": unique_footprints,
+            "footprint_types": footprint_types,
+        }]})
+
+    def record_ipi_many(self, history: Dict[str, List[Dict[str, Any]]]) -> int:
+        """Insert snapshots given in the ipi_history.json shape, in one transaction."""
+        now = datetime.now().isoformat()
+        rows = [
+            (symbol, _iso(s.get("timestamp")) or now, float(s.get("ipi", 0) or 0),
+             int(s.get("unique_footprints", 0) or 0), _dumps(list(s.get("footprint_types") or [])))
+            for symbol, snaps in history.items() for s in snaps
+            if isinstance(s, dict)
+        ]
+        if rows:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO ipi_snapshots(symbol, ts, ipi, unique_footprints, footprint_types)"
+                    " VALUES (?, ?, ?, ?, ?)", rows,
+                )
+        return len(rows)
+
+    def ipi_history(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[TimeLike] = None,
+        per_symbol: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        IPI snapshots grouped by symbol, oldest first (the ipi_history.json
+        shape). ``per_symbol`` keeps only the newest N per symbol.
+        """
+        sql = (
+            "SELECT symbol, ts, ipi, unique_footprints, footprint_types"
+            " FROM ipi_snapshots WHERE 1=1"
+        )
+        params: list = []
+        if symbol is not None:
+            sql += " AND symbol = ?"
+            params.append(symbol)
+        if since is not None:
+            sql += " AND ts > ?"
+            params.append(_iso(since))
+        sql += " ORDER BY symbol, ts"
+        history: Dict[str, List[Dict[str, Any]]] = {}
+        for r in self._query(sql, tuple(params)):
+            history.setdefault(r["symbol"], []).append({
+                "timestamp": r["ts"],
+                "ipi": r["ipi"],
+                "unique_footprints": r["unique_footprints"],
+                "footprint_types": loads(r["footprint_types"]),
+            })
+        if per_symbol is not None:
+            history = {s: snaps[-per_symbol:] for s, snaps in history.items()}
+        return history
+
+    def prune_ipi(self, before: TimeLike) -> int:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM ipi_snapshots WHERE ts <= ?", (_iso(before),)).rowcount
+
+    # ------------------------------------------------------------------
+    # Dynamic Universe Injection
+    # ------------------------------------------------------------------
+
+    def replace_dui(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the whole DUI set atomically."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM dui_entries")
+            conn.executemany(
+                "INSERT INTO dui_entries(symbol, source, score, added_date, expires_date, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (symbol, info.get("source"), info.get("score"), info.get("added_date"),
+                     info.get("expires_date"), _dumps(info))
+                    for symbol, info in entries.items()
+                    if isinstance(info, dict)
+                ],
+            )
+            self.set_meta("dui_updated_at", time.time(), conn=conn)
+
+    def dui_entries(self, active_on: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """DUI entries; ``active_on`` (ISO date) drops those expiring before it."""
+        sql = "SELECT symbol, payload FROM dui_entries"
+        params: tuple = ()
+        if active_on is not None:
+            sql += " WHERE expires_date >= ?"
+            params = (active_on,)
+        return {r["symbol"]: loads(r["payload"]) for r in self._query(sql, params)}
+
+    # ------------------------------------------------------------------
+    # Attribution events
+    # ------------------------------------------------------------------
+
+    def put_attribution_event(self, event: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO attribution_events"
+                "(event_id, symbol, ews_timestamp, payload)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    event["event_id"], event.get("symbol", ""), event.get("ews_timestamp"),
+                    _dumps(event),
+                ),
+            )
+
+    def get_attribution_event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT payload FROM attribution_events WHERE event_id = ?", (event_id,))
+        return loads(rows[0]["payload"]) if rows else None
+
+    def attribution_events(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = "SELECT payload FROM attribution_events"
+        params: tuple = ()
+        if symbol is not None:
+            sql += " WHERE symbol = ?"
+            params = (symbol,)
+        sql += " ORDER BY ews_timestamp"
+        return [loads(r["payload"]) for r in self._query(sql, params)]
+
+    def attribution_count(self) -> int:
+        return self._query("SELECT COUNT(*) AS n FROM attribution_events")[0]["n"]
+
+    # ------------------------------------------------------------------
+    # EWS refresh baselines
+    # ------------------------------------------------------------------
+
+    _BASELINE_FIELDS = ("price", "volume", "prev_volume", "spread_bps")
+
+    def upsert_refresh_baselines(self, baselines: Dict[str, Dict[str, Any]]) -> int:
+        """Insert or replace the baselines of the given symbols only, in one transaction."""
+        rows = [
+            (symbol, _iso(b["scanned_at"]), float(b.get("ipi", 0) or 0),
+             *(b.get(name) for name in self._BASELINE_FIELDS))
+            for symbol, b in baselines.items()
+        ]
+        if rows:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO refresh_baselines"
+                    "(symbol, scanned_at, ipi, price, volume, prev_volume, spread_bps)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)", rows,
+                )
+        return len(rows)
+
+    def refresh_baselines(self) -> Dict[str, Dict[str, Any]]:
+        """Baselines by symbol; snapshot fields that weren't recorded are absent."""
+        baselines = {}
+        for r in self._query("SELECT * FROM refresh_baselines"):
+            baseline = {"scanned_at": r["scanned_at"], "ipi": r["ipi"]}
+            baseline.update({
+                name: r[name] for name in self._BASELINE_FIELDS if r[name] is not None
+            })
+            baselines[r["symbol"]] = baseline
+        return baselines
+
+    # ------------------------------------------------------------------
+    # Legacy JSON migration / export
+    # ------------------------------------------------------------------
+
+    def import_legacy(
+        self, root: Union[str, Path] = PROJECT_ROOT, force: bool = False
+    ) -> Dict[str, int]:
+        """
+        Import the legacy JSON files under ``root`` once per kind.
+
+        Returns {kind: records imported}. A kind already imported (or whose
+        table already has data) is skipped unless ``force``.
+        """
+        root = Path(root)
+        imported: Dict[str, int] = {}
+        for kind, name in LEGACY_FILES.items():
+            marker = f"imported:{kind}"
+            path = root / name
+            if not path.exists() or (self.get_meta(marker) and not force):
+                continue
+            try:
+                data = load_file(path)
+                imported[kind] = self._import_kind(kind, data)
+                self.set_meta(marker, datetime.now().isoformat())
+                logger.info(f"State store: imported {imported[kind]} {kind} records from {path}")
+            except Exception as e:
+                logger.warning(f"State store: could not import {path}: {e}")
+        return imported
+
+    def _import_kind(self, kind: str, data: Any) -> int:
+        if kind == "scans":
+            self.record_scan(data)
+            return sum(len(data.get(e) or []) for e in SCAN_ENGINES)
+        if kind == "ews":
+            self.record_ews(data)
+            return len(data.get("alerts") or {})
+        if kind == "ipi":
+            return self.record_ipi_many({
+                symbol: [snap for snap in snaps if isinstance(snap, dict) and snap.get("timestamp")]
+                for symbol, snaps in data.items() if isinstance(snaps, list)
+            })
+        if kind == "dui":
+            entries = {s: i for s, i in data.items() if isinstance(i, dict)}
+            self.replace_dui(entries)
+            return len(entries)
+        if kind == "attribution":
+            events = [
+                e for e in data.get("events", []) if isinstance(e, dict) and e.get("event_id")
+            ]
+            for event in events:
+                self.put_attribution_event(event)
+            for key in ("version", "created", "summary"):
+                if key in data:
+                    self.set_meta(f"attribution:{key}", data[key])
+            return len(events)
+        return 0
+
+    def export_legacy(self, root: Union[str, Path] = PROJECT_ROOT) -> Dict[str, Path]:
+        """Write the store's current state back out as the legacy JSON files."""
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        exports = {
+            "scans": self.latest_scan(),
+            "ews": self.latest_ews(),
+            "ipi": self.ipi_history(),
+            "dui": self.dui_entries(),
+            "attribution": {
+                "version": self.get_meta("attribution:version", "1.0"),
+                "created": self.get_meta("attribution:created", datetime.now().isoformat()),
+                "events": self.attribution_events(),
+                "summary": self.get_meta("attribution:summary", {}),
+            },
+        }
+        written: Dict[str, Path] = {}
+        for kind, data in exports.items():
+            if data is None:
+                continue
+            path = root / LEGACY_FILES[kind]
+            dump_file(data, path)
+            written[kind] = path
+        return written
+
+
+def file_is_newer(path: Union[str, Path], recorded_at: Optional[float]) -> bool:
+    """True if ``path`` exists and was modified after ``recorded_at`` (epoch)."""
+    try:
+        mtime = Path(path).stat().st_mtime
+    except OSError:
+        return False
+    return recorded_at is None or mtime > recorded_at + 1.0
+
+
+_store: Optional[StateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """Process-wide store (``PUTSENGINE_STATE_DB`` overrides the path); imports legacy JSON once."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = StateStore(os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH)
+            try:
+                _store.import_legacy()
+            except Exception as e:
+                logger.warning(f"State store legacy import failed: {e}")
+        return _store
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PutsEngine state store")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument(
+        "--root", default=str(PROJECT_ROOT), help="Directory holding the JSON files"
+    )
+    parser.add_argument("--force", action="store_true", help="Re-import kinds already imported")
+    args = parser.parse_args()
+
+    store = StateStore(os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH)
+    if args.command == "import":
+        print(store.import_legacy(args.root, force=args.force))
+    else:
+        for kind, path in store.export_legacy(args.root).items():
+            print(f"{kind}: {path}")
@@ -3,6 +3,13 @@ Utility modules for PutsEngine.
 """
 
 from putsengine.utils.logging import setup_logging
-from putsengine.utils.cache import SimpleCache
+from putsengine.utils.cache import SimpleCache, enable_persistent_caches
+from putsengine.utils.persistent_cache import PersistentCache, get_persistent_cache
 
-__all__ = ["setup_logging", "SimpleCache"]
+__all__ = [
+    "setup_logging",
+    "SimpleCache",
+    "enable_persistent_caches",
+    "PersistentCache",
+    "get_persistent_cache",
+]
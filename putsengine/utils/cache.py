@@ -1,6 +1,10 @@
 """
 Simple caching utilities for PutsEngine.
 Helps reduce API calls by caching frequently accessed data.
+
+Each SimpleCache can optionally be backed by a PersistentCache
+(utils/persistent_cache.py) so entries survive restarts and are shared
+between the dashboard, the scheduler daemon and ad-hoc scripts.
 """
 
 import time
@@ -8,6 +12,9 @@ from typing import Any, Optional, Dict
 from functools import wraps
 from loguru import logger
 
+from putsengine.metrics import record_cache
+from putsengine.utils.persistent_cache import PersistentCache
+
 
 class SimpleCache:
     """
@@ -16,15 +23,31 @@ class SimpleCache:
     Used to cache API responses and reduce rate limit pressure.
     """
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        backend: Optional[PersistentCache] = None,
+        namespace: str = "simple"
+    ):
         """
         Initialize cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default 5 minutes)
+            backend: Optional persistent cache consulted on memory misses
+            namespace: Key prefix used in the persistent backend
         """
         self._cache: Dict[str, tuple] = {}  # key -> (value, expiry_time)
         self.default_ttl = default_ttl
+        self.backend = backend
+        self.namespace = namespace
+
+    def set_backend(self, backend: Optional[PersistentCache]) -> None:
+        """Attach (or detach with None) a persistent backend."""
+        self.backend = backend
+
+    def _backend_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -37,14 +60,23 @@ class SimpleCache:
             Cached value or None if not found/expired
         """
         if key not in self._cache:
-            return None
+            found = self.backend.get_with_expiry(self._backend_key(key)) if self.backend is not None else None
+            if found is None:
+                record_cache(self.namespace, "miss")
+                return None
+            # Warm the memory tier with the remaining TTL
+            self._cache[key] = found
+            record_cache(self.namespace, "hit")
+            return found[0]
 
         value, expiry = self._cache[key]
 
         if time.time() > expiry:
             del self._cache[key]
+            record_cache(self.namespace, "miss")
             return None
 
+        record_cache(self.namespace, "hit")
         return value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -61,6 +93,8 @@ class SimpleCache:
 
         expiry = time.time() + ttl
         self._cache[key] = (value, expiry)
+        if self.backend is not None:
+            self.backend.set(self._backend_key(key), value, ttl)
 
     def delete(self, key: str) -> bool:
         """
@@ -72,14 +106,19 @@ class SimpleCache:
         Returns:
             True if key was found and deleted
         """
+        deleted = False
         if key in self._cache:
             del self._cache[key]
-            return True
-        return False
+            deleted = True
+        if self.backend is not None:
+            deleted = self.backend.delete(self._backend_key(key)) or deleted
+        return deleted
 
     def clear(self) -> None:
-        """Clear all cached values."""
+        """Clear all cached values (including this namespace in the backend)."""
         self._cache.clear()
+        if self.backend is not None:
+            self.backend.clear(prefix=f"{self.namespace}:")
 
     def cleanup(self) -> int:
         """
@@ -152,7 +191,18 @@ def cached(ttl: int = 300, key_prefix: str = ""):
 
 
 # Global cache instances for different data types
-quote_cache = SimpleCache(default_ttl=30)  # 30 seconds for quotes
-bar_cache = SimpleCache(default_ttl=60)     # 1 minute for bars
-flow_cache = SimpleCache(default_ttl=120)   # 2 minutes for flow data
-gex_cache = SimpleCache(default_ttl=300)    # 5 minutes for GEX data
+quote_cache = SimpleCache(default_ttl=30, namespace="quote")  # 30 seconds for quotes
+bar_cache = SimpleCache(default_ttl=60, namespace="bar")       # 1 minute for bars
+flow_cache = SimpleCache(default_ttl=120, namespace="flow")    # 2 minutes for flow data
+gex_cache = SimpleCache(default_ttl=300, namespace="gex")      # 5 minutes for GEX data
+
+
+def enable_persistent_caches(backend: Optional[PersistentCache]) -> None:
+    """
+    Back the global quote/bar/flow/gex caches with a persistent store.
+
+    Example:
+        enable_persistent_caches(get_persistent_cache(settings))
+    """
+    for cache in (quote_cache, bar_cache, flow_cache, gex_cache):
+        cache.set_backend(backend)
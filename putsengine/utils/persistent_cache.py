@@ -0,0 +1,327 @@
+"""
+Persistent on-disk response cache shared between processes.
+
+WHY:
+The dashboard (Streamlit), the scheduler daemon and ad-hoc scripts
+(scan_puts.py, manual_trading_scan.py) each build their own clients.
+Their in-memory caches start empty, so a dashboard reload or a script run
+re-spent UW budget on data the daemon fetched minutes earlier.
+
+HOW:
+- SQLite file in WAL mode (stdlib, no extra dependency): many readers,
+  one writer at a time, safe across processes. busy_timeout absorbs
+  short write contention instead of raising.
+- Key = provider + endpoint + normalized params (sorted, auth params
+  stripped) -> same request from any process hits the same row.
+- Per-endpoint TTLs (ENDPOINT_TTLS) with a per-call override. Daily
+  aggregates get the long TTL only for fully historical ranges; a range
+  ending today or later still has a forming bar, so it gets
+  OPEN_RANGE_TTL.
+- Size-bounded LRU: when the stored payload exceeds ``max_bytes`` the
+  least recently accessed rows are evicted down to 90% of the bound.
+- Values are stored as JSON (``putsengine.codec``), never pickle: the file
+  is shared, so reading a row must not be able to run code.
+- Every sqlite call blocks, so async callers go through ``run_blocking``
+  (loop_monitor) rather than calling ``get``/``set`` on the event loop.
+
+Disabled unless ``settings.http_cache_path`` is set, so behaviour is
+unchanged for deployments that don't opt in.
+
+Usage:
+    cache = get_persistent_cache(settings)
+    if cache:
+        key = cache.make_key("uw", "/api/darkpool/AAPL")
+        data = await run_blocking(cache.get, key)
+        if data is None:
+            data = await fetch()
+            await run_blocking(cache.set, key, data, cache.ttl_for("uw", "/api/darkpool/AAPL"))
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from putsengine.codec import dumps_bytes, loads
+
+
+# Params that carry credentials — never part of a cache key
+_AUTH_PARAMS = {"apikey", "auth", "token", "api_key"}
+
+# (provider, endpoint regex, ttl seconds) — first match wins.
+# Providers/endpoints without a rule are never persisted (e.g. Polygon
+# market status, trades and quotes: live data nobody should read stale).
+# A ``to`` named group marks a date range end (see OPEN_RANGE_TTL).
+ENDPOINT_TTLS: List[Tuple[str, str, int]] = [
+    ("polygon", r"^/v2/aggs/ticker/[^/]+/range/\d+/day/[^/]+/(?P<to>[^/?]+)", 3600),
+    ("polygon", r"^/v2/aggs/ticker/[^/]+/range/\d+/minute/", 60),
+    ("polygon", r"^/v2/snapshot/", 15),
+    ("polygon", r"^/v3/snapshot/options/", 60),
+    ("polygon", r"^/v3/reference/", 86400),
+    ("polygon", r"^/v1/related-companies/", 86400),
+    ("polygon", r"^/v2/reference/news", 600),
+    ("polygon", r"^/v1/indicators/", 300),
+    ("uw", r"^/api/congress", 3600),
+    ("uw", r"^/api/earnings", 3600),
+    ("uw", r".*", 1800),  # Matches UnusualWhalesClient.RESPONSE_CACHE_TTL
+]
+_COMPILED_TTLS = [(p, re.compile(rx), ttl) for p, rx, ttl in ENDPOINT_TTLS]
+
+# TTL for ranges that end today or later (today's bar is still forming)
+OPEN_RANGE_TTL = 60
+
+
+def _range_is_open(to_value: str) -> bool:
+    """True unless ``to_value`` (ISO date or epoch ms) is before today."""
+    try:
+        if to_value.isdigit():
+            to_date = datetime.fromtimestamp(int(to_value) / 1000).date()
+        else:
+            to_date = date.fromisoformat(to_value[:10])
+    except ValueError:
+        return True
+    return to_date >= date.today()
+
+
+class PersistentCache:
+    """
+    SQLite-backed key/value cache with TTL and LRU size bound.
+
+    Values are JSON provider payloads (dicts, lists, scalars); anything
+    else is written the way ``codec`` writes it (e.g. ``str()``).
+    """
+
+    # Only bump last-access time if it is older than this (keeps reads cheap)
+    TOUCH_INTERVAL = 60.0
+    # Run size check every N writes
+    EVICT_CHECK_EVERY = 100
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, default_ttl: int = 300):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        # A forked child must not reuse the parent's connection
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " expires REAL NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " size INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed)")
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+            self._conn = None
+            self._conn_pid = None
+
+    # ------------------------------------------------------------------
+    # Keys / TTLs
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(provider: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from provider + endpoint + normalized params."""
+        if not params:
+            return f"{provider}:{endpoint}"
+        normalized = "&".join(
+            f"{k}={params[k]}" for k in sorted(params)
+            if str(k).lower() not in _AUTH_PARAMS and params[k] is not None
+        )
+        return f"{provider}:{endpoint}?{normalized}" if normalized else f"{provider}:{endpoint}"
+
+    @staticmethod
+    def ttl_for(provider: str, endpoint: str) -> int:
+        """Per-endpoint TTL from ENDPOINT_TTLS (0 = don't persist)."""
+        for p, rx, ttl in _COMPILED_TTLS:
+            if p != provider:
+                continue
+            match = rx.search(endpoint)
+            if match:
+                to_value = match.groupdict().get("to")
+                if to_value is not None and _range_is_open(to_value):
+                    return min(ttl, OPEN_RANGE_TTL)
+                return ttl
+        return 0
+
+    # ------------------------------------------------------------------
+    # Get / set
+    # ------------------------------------------------------------------
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, expires_epoch) or None if missing/expired."""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, expires, accessed FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or row[1] <= now:
+                    self.misses += 1
+                    return None
+                if now - row[2] > self.TOUCH_INTERVAL:
+                    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            value = loads(row[0])
+            self.hits += 1
+            return value, row[1]
+        except Exception as e:
+            logger.debug(f"Persistent cache read failed for {key}: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value or None if missing/expired."""
+        found = self.get_with_expiry(key)
+        return found[0] if found else None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value with TTL (seconds). ttl <= 0 is a no-op."""
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl <= 0:
+            return
+        try:
+            blob = dumps_bytes(value)
+        except Exception as e:
+            logger.debug(f"Persistent cache cannot serialize {key}: {e}")
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires, accessed, size) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, now + ttl, now, len(blob))
+                )
+                self._writes += 1
+                if self._writes % self.EVICT_CHECK_EVERY == 0:
+                    self._evict_locked(conn)
+        except Exception as e:
+            logger.debug(f"Persistent cache write failed for {key}: {e}")
+
+    def delete(self, key: str) -> bool:
+        try:
+            with self._lock:
+                cur = self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+                return cur.rowcount > 0
+        except Exception:
+            return False
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        """Remove all entries (or only keys starting with ``prefix``)."""
+        with self._lock:
+            conn = self._connection()
+            if prefix:
+                conn.execute("DELETE FROM entries WHERE key >= ? AND key < ?",
+                             (prefix, prefix + "\uffff"))
+            else:
+                conn.execute("DELETE FROM entries")
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def cleanup(self) -> int:
+        """Remove expired entries and enforce the size bound. Returns rows removed."""
+        with self._lock:
+            conn = self._connection()
+            cur = conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+            removed = cur.rowcount
+            removed += self._evict_locked(conn)
+        return removed
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> int:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        conn.execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed ASC").fetchall()
+        total = sum(size for _, size in rows)
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        if doomed:
+            conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            removed = len(doomed)
+            logger.debug(f"Persistent cache evicted {removed} LRU entries")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connection()
+            count, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        total = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": count,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_pct": round(self.hits / max(1, total) * 100, 1),
+        }
+
+
+# Singleton instance (one connection per process per path)
+_persistent_cache: Optional[PersistentCache] = None
+
+
+def get_persistent_cache(settings=None) -> Optional[PersistentCache]:
+    """
+    Get the process-wide persistent cache, or None when disabled.
+
+    Enabled by ``settings.http_cache_path``; size bound from
+    ``settings.http_cache_max_mb``.
+    """
+    global _persistent_cache
+    if _persistent_cache is not None:
+        return _persistent_cache
+    path = getattr(settings, "http_cache_path", None)
+    if not path:
+        return None
+    max_mb = getattr(settings, "http_cache_max_mb", 256)
+    _persistent_cache = PersistentCache(path, max_bytes=int(max_mb) * 1024 * 1024)
+    logger.info(f"Persistent HTTP cache enabled: {path} (max {max_mb} MB)")
+    return _persistent_cache
@@ -27,6 +27,8 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional
 import pytz
 from loguru import logger
+from putsengine.compute_pool import score_as_fetched
+from putsengine.metrics import instrumented
 from dataclasses import dataclass
 
 
@@ -112,6 +114,10 @@ class VolumePriceDivergenceScanner:
                 logger.debug(f"Failed to get bars for {symbol}: {e}")
                 return None
         
+        return self.score_bars(symbol, bars)
+    
+    def score_bars(self, symbol: str, bars: List) -> Optional[VolumePriceDivergenceAlert]:
+        """Divergence checks on fetched daily bars (pure CPU; runs on the compute pool)."""
         if len(bars) < 25:
             return None
         
@@ -242,27 +248,27 @@ class VolumePriceDivergenceScanner:
             "all": []
         }
         
-        for symbol in symbols:
-            try:
-                alert = await self.analyze_symbol(symbol)
+        # Fetch and score overlap: batches are scored on worker processes
+        scored = await score_as_fetched(
+            score_divergence, symbols,
+            fetch=lambda symbol: self.price_client.get_daily_bars(symbol, limit=30),
+        )
+        
+        for symbol, alert in scored.items():
+            if alert:
+                alerts["all"].append(alert)
+                alerts[alert.pattern_type].append(alert)
                 
-                if alert:
-                    alerts["all"].append(alert)
-                    alerts[alert.pattern_type].append(alert)
-                    
-                    if alert.severity == "CRITICAL":
-                        alerts["critical"].append(alert)
-                    elif alert.severity == "HIGH":
-                        alerts["high"].append(alert)
-                    
-                    logger.info(
-                        f"VOL-PRICE DIVERGENCE: {symbol} | Pattern: {alert.pattern_type} | "
-                        f"Dist Days: {alert.distribution_day_count} | RVOL: {alert.avg_volume_ratio:.1f}x | "
-                        f"Price: {alert.price_change_pct*100:+.1f}% | Confidence: {alert.confidence:.2f}"
-                    )
-                    
-            except Exception as e:
-                logger.debug(f"Error scanning {symbol}: {e}")
+                if alert.severity == "CRITICAL":
+                    alerts["critical"].append(alert)
+                elif alert.severity == "HIGH":
+                    alerts["high"].append(alert)
+                
+                logger.info(
+                    f"VOL-PRICE DIVERGENCE: {symbol} | Pattern: {alert.pattern_type} | "
+                    f"Dist Days: {alert.distribution_day_count} | RVOL: {alert.avg_volume_ratio:.1f}x | "
+                    f"Price: {alert.price_change_pct*100:+.1f}% | Confidence: {alert.confidence:.2f}"
+                )
         
         return {
             "distribution": alerts["distribution"],
@@ -284,6 +290,12 @@ class VolumePriceDivergenceScanner:
         }
 
 
+def score_divergence(symbol: str, bars: List) -> Optional[VolumePriceDivergenceAlert]:
+    """Compute-pool scorer (module level so worker processes can import it)."""
+    return VolumePriceDivergenceScanner(price_client=None).score_bars(symbol, bars)
+
+
+@instrumented("scanner", "volume_price")
 async def run_volume_price_scan(price_client, symbols: List[str]) -> Dict:
     """
     Run volume-price divergence scan on symbols.
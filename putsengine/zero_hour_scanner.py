@@ -38,6 +38,7 @@ from enum import Enum
 from pathlib import Path
 import pytz
 from loguru import logger
+from putsengine.metrics import instrumented
 
 
 EST = pytz.timezone("US/Eastern")
@@ -349,6 +350,7 @@ class ZeroHourScanner:
         return results
 
 
+@instrumented("scanner", "zero_hour")
 async def run_zero_hour_scan(price_client) -> Dict[str, Any]:
     """
     Run zero-hour scan.
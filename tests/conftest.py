@@ -0,0 +1,18 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from putsengine.config import Settings
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Settings with placeholder API keys (clients are never pointed at live APIs)."""
+    return Settings(
+        alpaca_api_key="test",
+        alpaca_secret_key="test",
+        polygon_api_key="test",
+        unusual_whales_api_key="test",
+    )
@@ -0,0 +1,118 @@
+"""
+Tests for the incremental minute-bar store.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from putsengine import bar_store
+from putsengine.bar_store import MinuteBarStore, get_minute_bar_store
+from putsengine.bars import BarArray
+
+
+def _ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+class FakePolygon:
+    """Serves minute bars from a growing 'exchange' series."""
+
+    def __init__(self, start: datetime, minutes: int):
+        self.start = start
+        self.minutes = minutes
+        self.calls = []
+
+    def _all(self) -> BarArray:
+        ts = [_ms(self.start + timedelta(minutes=i)) for i in range(self.minutes)]
+        close = np.arange(self.minutes, dtype=float)
+        return BarArray(ts, close, close + 1, close - 1, close, np.full(self.minutes, 100))
+
+    async def get_aggregates(self, symbol, multiplier, timespan, from_date, to_date, limit):
+        self.calls.append(from_date)
+        bars = self._all()
+        if isinstance(from_date, int):
+            start = from_date
+        else:
+            start = _ms(datetime.combine(from_date, datetime.min.time()))
+        return bars[bars.ts >= start][:limit]
+
+
+class TestMinuteBarStore:
+    """Tests for MinuteBarStore."""
+
+    def setup_method(self):
+        self.today = date.today()
+        open_at = datetime.combine(self.today, datetime.min.time()) + timedelta(hours=9)
+        self.polygon = FakePolygon(open_at, 60)
+
+    async def test_second_scan_fetches_only_the_delta(self):
+        store = MinuteBarStore(self.polygon, refresh_seconds=0)
+        first = await store.window("AAPL", self.today)
+        assert len(first) == 60
+
+        self.polygon.minutes = 90  # 30 new bars since the last scan
+        second = await store.window("AAPL", self.today)
+
+        assert len(second) == 90
+        assert np.array_equal(second.close, np.arange(90, dtype=float))
+        assert self.polygon.calls[1] == int(first.ts[-1])  # resumes at the last stored bar
+        assert store.stats()["delta_fetches"] == 1
+
+    async def test_fresh_series_is_served_without_a_request(self):
+        store = MinuteBarStore(self.polygon, refresh_seconds=300)
+        await store.window("AAPL", self.today)
+        limited = await store.window("AAPL", self.today, limit=10)
+
+        assert len(limited) == 10 and limited[0].close == 0.0
+        assert len(self.polygon.calls) == 1
+
+    async def test_wider_window_refetches_and_persists(self, tmp_path):
+        store = MinuteBarStore(self.polygon, root=tmp_path, refresh_seconds=300)
+        await store.window("AAPL", self.today)
+        await store.window("AAPL", self.today - timedelta(days=2))
+        assert store.stats()["full_fetches"] == 2
+
+        restarted = MinuteBarStore(self.polygon, root=tmp_path, refresh_seconds=300)
+        bars = await restarted.window("AAPL", self.today - timedelta(days=1))
+        assert len(bars) == 60
+        assert restarted.stats()["full_fetches"] == 0
+
+    async def test_window_before_retention_is_not_stored(self):
+        store = MinuteBarStore(self.polygon, retention_days=1)
+        old = self.today - timedelta(days=3)
+        await store.window("AAPL", old)
+        await store.window("AAPL", old)
+
+        assert store.stats() == {"series": 0, "full_fetches": 2, "delta_fetches": 0, "hits": 0}
+
+    async def test_least_recently_used_series_is_evicted(self):
+        store = MinuteBarStore(self.polygon, refresh_seconds=300, max_series=2)
+        for symbol in ("AAPL", "MSFT", "AAPL", "NVDA"):
+            await store.window(symbol, self.today)
+
+        assert list(store._series) == [("AAPL", "minute"), ("NVDA", "minute")]
+
+    def test_each_event_loop_gets_its_own_locks(self):
+        store = MinuteBarStore(self.polygon)
+
+        async def lock():
+            return store._lock(("AAPL", "minute"))
+
+        loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first = loop_a.run_until_complete(lock())
+            loop_b.run_until_complete(lock())
+            assert loop_a.run_until_complete(lock()) is first
+        finally:
+            loop_a.close()
+            loop_b.close()
+
+    def test_shared_store_fetches_through_the_latest_client(self, monkeypatch):
+        monkeypatch.setattr(bar_store, "_store", None)
+        first = get_minute_bar_store(self.polygon)
+        replacement = FakePolygon(self.polygon.start, 60)
+
+        assert get_minute_bar_store(replacement) is first
+        assert first.polygon is replacement
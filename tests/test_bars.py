@@ -0,0 +1,55 @@
+"""
+Tests for the columnar BarArray.
+"""
+
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from putsengine.bars import BarArray
+
+
+def _polygon_results():
+    base = int(datetime(2026, 2, 3, 10, 0).timestamp() * 1000)
+    day = 86_400_000
+    return [
+        {
+            "t": base + i * day, "o": 10 + i, "h": 11 + i, "l": 9 + i,
+            "c": 10.5 + i, "v": 1000 * (i + 1), "vw": 10.2 + i,
+        }
+        for i in range(5)
+    ]
+
+
+class TestBarArray:
+    """Tests for BarArray."""
+
+    def test_sequence_view_matches_pricebars(self):
+        bars = BarArray.from_polygon(_polygon_results())
+
+        assert len(bars) == 5 and bars
+        assert bars[-1].close == 14.5
+        assert bars[0].timestamp == datetime(2026, 2, 3, 10, 0)
+        assert sum(b.volume for b in bars[-3:-1]) == 7000
+        assert isinstance(bars[1:3], BarArray)
+        assert np.allclose(bars.close, [10.5, 11.5, 12.5, 13.5, 14.5])
+
+    def test_since_uses_dates(self):
+        bars = BarArray.from_polygon(_polygon_results())
+
+        recent = bars.since(date(2026, 2, 5))
+        assert len(recent) == 3
+        assert recent[0].timestamp.date() == date(2026, 2, 5)
+
+    def test_alpaca_timestamps_are_utc(self):
+        bars = BarArray.from_alpaca([
+            {"t": "2026-02-03T05:00:00Z", "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 10, "vw": 1.2},
+            {"t": "2026-02-04T05:00:00+00:00", "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 10},
+        ])
+
+        assert bars[0].timestamp == datetime(2026, 2, 3, 5, 0, tzinfo=timezone.utc)
+        assert bars[1].vwap == 0.0
+
+    def test_empty_is_falsy(self):
+        assert not BarArray.from_polygon([])
+        assert list(BarArray.from_alpaca([])) == []
@@ -0,0 +1,116 @@
+"""
+Tests for the pipeline benchmark.
+"""
+
+import json
+
+from putsengine import benchmark, codec, state_store
+from putsengine.bars import BarArray
+from putsengine.benchmark import (
+    JsonIOTimer,
+    LatencyProbe,
+    SyntheticReplayer,
+    check_thresholds,
+    compare_to_baseline,
+    percentile,
+    run_benchmark,
+)
+
+
+class _Layer:
+    async def analyze(self, delay=0):
+        return "ok"
+
+
+class TestMetrics:
+    """Percentiles, probes and threshold checks."""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([], 95) == 0.0
+
+    async def test_latency_probe_restores_methods(self):
+        original = _Layer.__dict__["analyze"]
+        with LatencyProbe({"layer": f"{__name__}:_Layer.analyze"}) as probe:
+            assert await _Layer().analyze() == "ok"
+            assert await _Layer().analyze() == "ok"
+
+        assert _Layer.__dict__["analyze"] is original
+        assert probe.summary()["layer"]["calls"] == 2
+
+    def test_json_io_timer_counts_codec_calls(self, tmp_path):
+        path = tmp_path / "state.json"
+        with JsonIOTimer() as json_io:
+            benchmark.dump_file({"a": 1}, path)              # imported binding
+            assert codec.load_file(path) == {"a": 1}          # load_file -> loads counts once
+            codec.dumps([1])
+            with open(path) as f:
+                json.load(f)
+
+        assert json_io.calls == 4
+        assert benchmark.dump_file is codec.dump_file
+        assert codec.loads.__module__ == "putsengine.codec"
+
+    def test_thresholds_and_baseline(self):
+        results = {"scenarios": {"run_scan": {
+            "wall_seconds": 30.0, "http_calls": 130, "http": {"uw": 130},
+            "calls_per_symbol": {"uw": 13.0}, "error": None,
+        }}}
+        baseline = {"scenarios": {"run_scan": {
+            "wall_seconds": 29.0, "http_calls": 100, "http": {"uw": 100},
+        }}}
+
+        assert check_thresholds(results, {"run_scan.calls_per_symbol.uw": 12.0}) == [
+            "run_scan.calls_per_symbol.uw = 13.0 > 12.0"
+        ]
+        assert check_thresholds(results, {"run_scan.missing.metric": 1.0}) == []
+        regressions = compare_to_baseline(results, baseline, tolerance=0.25)
+        assert regressions == [
+            "run_scan.http_calls: 100 -> 130 (+30%)",
+            "run_scan.http.uw: 100 -> 130 (+30%)",
+        ]
+
+
+class TestSyntheticProvider:
+    """Unrecorded requests get deterministic, parseable data."""
+
+    async def test_polygon_daily_bars(self):
+        url = "https://api.polygon.io/v2/aggs/ticker/AAPL/range/1/day/2026-01-05/2026-01-16"
+        first = await SyntheticReplayer(seed=3).respond("GET", url, {"limit": 50})
+        again = await SyntheticReplayer(seed=3).respond("GET", url, {"limit": 50})
+
+        bars = BarArray.from_polygon((await first.json())["results"])
+        assert len(bars) == 10
+        assert await first.text() == await again.text()
+
+    async def test_alpaca_bars_and_empty_payloads(self):
+        replayer = SyntheticReplayer()
+        bars = await replayer.respond(
+            "GET", "https://data.alpaca.markets/v2/stocks/MSFT/bars",
+            {"timeframe": "1Day", "start": "2026-01-05", "end": "2026-01-09"},
+        )
+        other = await replayer.respond("GET", "https://api.unusualwhales.com/api/stock/MSFT/flow-recent")
+
+        assert len(BarArray.from_alpaca((await bars.json())["bars"])) == 5
+        assert (await other.json())["data"] == []
+        assert replayer.stats["synthetic"] == 2
+
+
+class TestRunBenchmark:
+    """End to end on synthetic data, isolated in a scratch directory."""
+
+    def test_pipeline_runs_offline(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        store_before = state_store._store
+        results = run_benchmark(symbols=2, workdir=tmp_path / "bench")
+
+        assert list(results["scenarios"]) == list(benchmark.SCENARIOS)
+        scan = results["scenarios"]["run_scan"]
+        assert scan["error"] is None and scan["http"]["polygon"] > 0
+        assert "distribution" in scan["layers"]
+        assert check_thresholds(results) == []
+        assert (tmp_path / "bench" / "logs" / "convergence" / "latest_top9.json").exists()
+        assert state_store._store is store_before
+        json.dumps(results)
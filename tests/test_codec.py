@@ -0,0 +1,149 @@
+"""
+Tests for the JSON codec layer and typed OI-per-strike decoding.
+"""
+
+import importlib
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from putsengine import codec
+from putsengine.clients.transport import RecordedResponse
+from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+
+
+PAYLOAD = {
+    "when": datetime(2026, 2, 3, 9, 30),
+    "ipi": np.float64(0.42),
+    "count": np.int64(3),
+    "series": np.array([1.0, 2.5]),
+    "name": "AAPL ✓",
+    7: "int key",
+}
+EXPECTED = {
+    "when": "2026-02-03 09:30:00",
+    "ipi": 0.42,
+    "count": 3,
+    "series": [1.0, 2.5],
+    "name": "AAPL ✓",
+    "7": "int key",
+}
+
+
+@pytest.fixture
+def stdlib_codec(monkeypatch):
+    """The codec module as loaded without orjson."""
+    original = sys.modules.get("orjson")
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    module = importlib.reload(codec)
+    yield module
+    sys.modules["orjson"] = original
+    importlib.reload(codec)
+
+
+class TestEncoding:
+    """Both backends write the same shapes."""
+
+    def test_compact_and_indented(self):
+        compact = codec.dumps(PAYLOAD)
+        assert json.loads(compact) == EXPECTED
+        assert "\n" not in compact
+        assert json.loads(codec.dumps(PAYLOAD, indent=True)) == EXPECTED
+        assert codec.dumps(PAYLOAD, indent=True).count("\n") > 5
+
+    def test_stdlib_fallback_matches(self, stdlib_codec):
+        assert stdlib_codec.BACKEND == "json"
+        assert json.loads(stdlib_codec.dumps(PAYLOAD)) == EXPECTED
+        assert stdlib_codec.loads(memoryview(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+
+
+class TestFiles:
+    """Atomic compact writes and tolerant reads."""
+
+    def test_dump_file_round_trip(self, tmp_path):
+        path = tmp_path / "early_warning_alerts.json"
+        codec.dump_file({"alerts": {"AAPL": {"ipi": np.float32(0.5)}}}, path)
+
+        assert codec.load_file(path) == {"alerts": {"AAPL": {"ipi": 0.5}}}
+        assert [p.name for p in tmp_path.iterdir()] == ["early_warning_alerts.json"]
+        assert codec.load_file(tmp_path / "missing.json", default={}) == {}
+
+    def test_concurrent_dump_file_writers(self, tmp_path):
+        path = tmp_path / "ews_last_results.json"
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            def write(i):
+                codec.dump_file({"writer": i, "rows": list(range(2000))}, path)
+
+            list(pool.map(write, range(32)))
+
+        assert codec.load_file(path)["rows"] == list(range(2000))
+        assert [p.name for p in tmp_path.iterdir()] == ["ews_last_results.json"]
+
+    def test_failed_dump_removes_only_its_tmp_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "state.json"
+        codec.dump_file({"ok": True}, path)
+        other = tmp_path / ".state.json.other-writer.tmp"
+        other.write_text("{}")
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(codec.os, "replace", fail)
+        with pytest.raises(OSError):
+            codec.dump_file({"ok": False}, path)
+
+        assert codec.load_file(path) == {"ok": True}
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names == [".state.json.other-writer.tmp", "state.json"]
+
+    async def test_read_json(self):
+        assert await codec.read_json(RecordedResponse(200, '{"results": [1]}')) == {"results": [1]}
+        assert await codec.read_json(RecordedResponse(200, "")) is None
+        with pytest.raises(ValueError):
+            await codec.read_json(RecordedResponse(200, "<html>"))
+
+
+class TestTypedDecoding:
+    """OI-per-strike rows become numpy columns."""
+
+    def test_columns_with_fallback_keys(self):
+        rows = [
+            {"strike": "100", "put_oi": 50},
+            {"strike_price": 105.0, "put_open_interest": None},
+            "junk",
+            {"strike": 110, "put_oi": "n/a"},
+        ]
+
+        cols = codec.columns(rows, {
+            "strike": ("strike", "strike_price"),
+            "put_oi": ("put_oi", "put_open_interest"),
+        })
+
+        assert cols["strike"].tolist() == [100.0, 105.0, 110.0]
+        assert cols["put_oi"].tolist() == [50.0, 0.0, 0.0]
+
+    async def test_put_wall_from_arrays(self, settings):
+        client = UnusualWhalesClient(settings)
+        rows = [
+            {"strike": 50, "put_oi": 90_000},     # Outside ±30% of 100
+            {"strike": 95, "put_oi": 12_000},
+            {"strike": 90, "put_oi": 12_000},
+            {"strike": 105, "put_oi": 3_000},
+        ]
+
+        async def fake_request(endpoint, params=None, **kwargs):
+            return {"data": rows}
+
+        async def fake_price(symbol):
+            return 100.0
+
+        client._request = fake_request
+        client._get_underlying_price = fake_price
+
+        assert await client.get_put_wall("AAPL") == 95.0
+        oi = await client.get_oi_strikes("AAPL")
+        assert oi["call_oi"].tolist() == [0.0, 0.0, 0.0, 0.0]
@@ -0,0 +1,134 @@
+"""
+Tests for process-pool bar scoring over shared memory.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from putsengine import compute_pool
+from putsengine.bars import BarArray
+from putsengine.big_movers_scanner import BigMoversScanner
+from putsengine.compute_pool import (
+    SharedBars,
+    _score_batch,
+    configure_compute_pool,
+    score_as_fetched,
+)
+from putsengine.multiday_weakness_scanner import MultiDayWeaknessScanner, score_weakness
+
+
+def _bars(seed, n=25):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1.5, n))
+    return BarArray(
+        1_767_225_600_000 + np.arange(n) * 86_400_000,
+        close + rng.normal(0, 0.5, n), close + 1.0, close - 1.0, close,
+        rng.integers(100_000, 1_000_000, n), close,
+    )
+
+
+def _last_close(symbol, bars):
+    if symbol == "BAD":
+        raise ValueError("bad bars")
+    if not bars:
+        return (symbol, 0, None, None)
+    return (symbol, len(bars), float(bars.close[-1]), bars[-1].volume)
+
+
+class _Prices:
+    """Daily-bar client stub."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = 0
+
+    async def get_daily_bars(self, symbol, limit=20):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if symbol not in self.bars:
+            raise RuntimeError("no data")
+        return self.bars[symbol]
+
+
+@pytest.fixture
+def inline_pool():
+    pool = configure_compute_pool(0)
+    yield pool
+    compute_pool.shutdown_compute_pool()
+
+
+class TestSharedBars:
+    """Batches round-trip through one shared-memory block."""
+
+    def test_worker_entry_sees_identical_bars(self):
+        batch = {"AAA": _bars(1), "BBB": _bars(2, n=7), "EMPTY": BarArray.empty()}
+        block = SharedBars(batch)
+        try:
+            records, errors = _score_batch(block.name, block.rows, block.index, _last_close)
+        finally:
+            block.release()
+
+        assert errors == {}
+        assert records["AAA"] == ("AAA", 25, float(batch["AAA"].close[-1]), batch["AAA"][-1].volume)
+        assert records["BBB"][1] == 7
+        assert records["EMPTY"][1] == 0
+
+
+class TestScoreAsFetched:
+    """Fetch/score overlap keeps order, drops failures, matches direct scoring."""
+
+    async def test_inline_matches_direct_scoring(self, inline_pool):
+        bars = {f"S{i}": _bars(i) for i in range(10)}
+        fetch = _Prices(bars).get_daily_bars
+
+        results = await score_as_fetched(
+            score_weakness, ["S3", "MISSING", *bars], fetch, batch_size=4
+        )
+
+        assert list(results) == ["S3"] + [s for s in bars if s != "S3"]
+        scanner = MultiDayWeaknessScanner(price_client=None)
+        for symbol, report in results.items():
+            assert report.total_score == scanner.score_bars(symbol, bars[symbol]).total_score
+        assert inline_pool.stats["batches"] == 3
+
+    async def test_process_pool_scores_shared_batches(self):
+        configure_compute_pool(1)
+        try:
+            bars = {"AAA": _bars(1), "BAD": _bars(2), "CCC": _bars(3)}
+            results = await score_as_fetched(
+                _last_close, list(bars), _Prices(bars).get_daily_bars, batch_size=2
+            )
+            stats = compute_pool.get_compute_pool().stats
+        finally:
+            compute_pool.shutdown_compute_pool()
+
+        assert set(results) == {"AAA", "CCC"}
+        assert results["CCC"][2] == float(bars["CCC"].close[-1])
+        assert stats["inline_batches"] == 0 and stats["errors"] == 1
+
+
+class TestScanners:
+    """Universe scans go through the compute pool with unchanged results."""
+
+    async def test_big_movers_scan_universe(self, inline_pool):
+        bars = {f"S{i}": _bars(i) for i in range(20)}
+        scanner = BigMoversScanner(_Prices(bars))
+
+        results = await scanner.scan_universe(list(bars))
+
+        expected = [scanner.score_bars(s, b) for s, b in bars.items()]
+        expected = [p for p in expected if p]
+        assert results["summary"]["patterns_found"] == len(expected)
+        assert {p.symbol for p in results["all_patterns"]} == {p.symbol for p in expected}
+
+    async def test_weakness_scan_keeps_failed_fetches(self, inline_pool):
+        bars = {f"S{i}": _bars(i) for i in range(6)}
+        scanner = MultiDayWeaknessScanner(_Prices(bars))
+
+        results = await scanner.scan_universe([*bars, "MISSING"])
+
+        assert list(results) == [*bars, "MISSING"]
+        assert results["MISSING"].recommendation == "INSUFFICIENT DATA"
+        assert results["MISSING"].days_analyzed == 0
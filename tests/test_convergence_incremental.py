@@ -0,0 +1,87 @@
+"""
+Tests for incremental ConvergenceEngine runs.
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+import putsengine.state_store as state_store
+from putsengine.convergence_engine import ConvergenceEngine, ET
+from putsengine.state_store import StateStore
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(state_store, "_store", StateStore(tmp_path / "state.db"))
+    now = datetime.now(ET).isoformat()
+    _write(tmp_path / "early_warning_alerts.json", {
+        "timestamp": now,
+        "alerts": {
+            "AAPL": {"ipi": 0.45, "level": "watch", "unique_footprints": 2},
+            "MSFT": {"ipi": 0.35, "level": "watch", "unique_footprints": 1},
+        },
+    })
+    _write(tmp_path / "scheduled_scan_results.json", {
+        "last_scan": now,
+        "gamma_drain": [{"symbol": "AAPL", "score": 0.6, "signals": []}],
+        "distribution": [{"symbol": "NVDA", "score": 0.5, "signals": []}],
+        "liquidity": [],
+    })
+    return tmp_path
+
+
+class TestIncrementalConvergence:
+    """Tests for source versioning and per-symbol re-scoring."""
+
+    def test_unchanged_sources_skip_reload_and_rescoring(self, workdir):
+        engine = ConvergenceEngine()
+        first = engine.run()
+        assert first["status"] == "ok"
+        assert set(first["incremental"]["changed_sources"]) >= {"ews", "gamma"}
+        assert first["incremental"]["rescored"] == 3
+
+        second = engine.run()
+        assert second["incremental"]["changed_sources"] == []
+        assert second["incremental"]["rescored"] == 0
+        assert [c["symbol"] for c in second["top9"]] == [c["symbol"] for c in first["top9"]]
+
+    def test_changed_source_rescores_only_affected_symbols(self, workdir):
+        engine = ConvergenceEngine()
+        engine.run()
+
+        scans = json.loads((workdir / "scheduled_scan_results.json").read_text())
+        scans["distribution"][0]["score"] = 0.9
+        _write(workdir / "scheduled_scan_results.json", scans)
+        os.utime(workdir / "scheduled_scan_results.json", None)
+
+        report = engine.run()
+        assert report["incremental"]["changed_sources"] == ["gamma"]
+        assert report["incremental"]["rescored"] == 1
+        nvda = next(c for c in report["top9"] if c["symbol"] == "NVDA")
+        assert nvda["gamma_score"] == pytest.approx(0.9)
+
+    def test_force_runs_full_pass(self, workdir):
+        engine = ConvergenceEngine()
+        engine.run()
+        report = engine.run(force=True)
+        assert report["incremental"]["rescored"] == report["incremental"]["universe"]
+
+    def test_removed_source_drops_its_data(self, workdir):
+        engine = ConvergenceEngine()
+        engine.run()
+
+        (workdir / "scheduled_scan_results.json").unlink()
+        report = engine.run()
+
+        assert report["incremental"]["changed_sources"] == ["gamma"]
+        assert engine._scan_data == {}
+        assert "NVDA" not in [c["symbol"] for c in report["top9"]]
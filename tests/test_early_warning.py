@@ -0,0 +1,127 @@
+"""
+Tests for concurrent EWS scanning and per-scan daily-bar memoization.
+"""
+
+import asyncio
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+import pytest
+
+from putsengine import flash_alerts, footprint_store, state_store
+from putsengine.bars import BarArray
+from putsengine.early_warning_system import EarlyWarningScanner, run_early_warning_scan
+from putsengine.refresh_planner import plan_refresh, snapshot_features
+
+
+def _daily(days=10):
+    start = datetime.combine(date.today() - timedelta(days=days - 1), time())
+    ts = [int((start + timedelta(days=i)).timestamp() * 1000) for i in range(days)]
+    close = np.linspace(100.0, 90.0, days)
+    return BarArray(ts, close + 1, close + 2, close - 2, close, np.full(days, 1_000_000), close)
+
+
+class _Polygon:
+    """Daily-bar stub that counts fetches and in-flight requests."""
+
+    def __init__(self, fail=(), prices=None):
+        self.calls = Counter()
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.peak = 0
+        self.prices = prices or {}
+
+    async def get_all_tickers_snapshot(self, tickers=None):
+        return [
+            {"ticker": symbol, "lastTrade": {"p": price}, "day": {"v": 0}, "prevDay": {"v": 0}}
+            for symbol, price in self.prices.items()
+        ]
+
+    async def get_daily_bars(self, symbol, from_date=None, to_date=None, limit=None):
+        self.calls[symbol] += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if symbol in self.fail:
+                raise RuntimeError("boom")
+            return _daily()
+        finally:
+            self.in_flight -= 1
+
+
+class _Alpaca:
+    async def get_latest_quote(self, symbol):
+        return None
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    store = state_store.StateStore(tmp_path / "state.db")
+    monkeypatch.setattr(state_store, "_store", store)
+    monkeypatch.setattr(
+        footprint_store, "_footprint_store", footprint_store.FootprintStore(tmp_path / "fp")
+    )
+    monkeypatch.setattr(flash_alerts, "_tracker", flash_alerts.IPITracker(load=False))
+    monkeypatch.setattr(flash_alerts, "FLASH_ALERTS_FILE", tmp_path / "flash_alerts.json")
+    yield store
+    store.close()
+
+
+class TestDailyBarsMemo:
+    """One window fetch per symbol per scan, sliced per detector."""
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        polygon = _Polygon()
+        scanner = EarlyWarningScanner(None, polygon, None)
+
+        windows = await asyncio.gather(
+            *(scanner._daily_bars("SPY", days) for days in (3, 5, 10, 5))
+        )
+
+        assert polygon.calls["SPY"] == 1
+        assert [len(w) for w in windows] == [4, 6, 10, 6]
+
+    async def test_failed_fetch_is_retried(self):
+        polygon = _Polygon(fail={"XLK"})
+        scanner = EarlyWarningScanner(None, polygon, None)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await scanner._daily_bars("XLK", 5)
+        assert polygon.calls["XLK"] == 2
+
+
+class TestRunEarlyWarningScan:
+    """Symbols are scanned concurrently with shared sector/SPY/peer bars."""
+
+    async def test_bounded_concurrency_and_shared_bars(self, stores):
+        polygon = _Polygon()
+        symbols = ["AAPL", "MSFT", "NVDA", "AMD", "JPM", "BAC"]
+
+        await run_early_warning_scan(_Alpaca(), polygon, None, symbols, concurrency=3)
+
+        assert polygon.calls["SPY"] == 1
+        assert all(count == 1 for count in polygon.calls.values())
+        assert 1 < polygon.peak
+        assert set(symbols) <= set(polygon.calls)
+        assert len(flash_alerts.get_ipi_tracker().rings) == len(symbols)
+
+    async def test_full_scan_feeds_the_refresh_plan(self, stores):
+        symbols = ["AAPL", "MSFT", "NVDA"]
+        polygon = _Polygon(prices={symbol: 100.0 for symbol in symbols})
+
+        await run_early_warning_scan(_Alpaca(), polygon, None, symbols)
+
+        baselines = stores.refresh_baselines()
+        assert set(baselines) == set(symbols)
+        for baseline in baselines.values():
+            assert baseline["price"] == 100.0 and {"ipi", "scanned_at"} <= set(baseline)
+
+        # AAPL fell 3% since the full scan; XOM was never scanned
+        polygon.prices.update(AAPL=97.0, XOM=50.0)
+        features = {
+            t["ticker"]: snapshot_features(t) for t in await polygon.get_all_tickers_snapshot()
+        }
+        assert plan_refresh(symbols + ["XOM"], features) == ["XOM", "AAPL"]
@@ -0,0 +1,69 @@
+"""
+Tests for streaming IPI history and incremental flash alerts.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from putsengine import flash_alerts, state_store
+from putsengine.flash_alerts import IPITracker, _IPIRing
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = state_store.StateStore(tmp_path / "state.db")
+    monkeypatch.setattr(state_store, "_store", store)
+    monkeypatch.setattr(flash_alerts, "FLASH_ALERTS_FILE", tmp_path / "flash_alerts.json")
+    monkeypatch.setattr(flash_alerts, "_tracker", None)
+    yield store
+    store.close()
+
+
+class TestIPIRing:
+    """Fixed-size ring keeps the newest points in arrival order."""
+
+    def test_wraps_and_orders(self):
+        ring = _IPIRing(capacity=4)
+        for i in range(6):
+            ring.append(float(i), i / 10, i, [])
+
+        assert list(ring.ordered(ring.ts)) == [2.0, 3.0, 4.0, 5.0]
+        assert ring.newest_ts == 5.0
+
+
+class TestIPITracker:
+    """Surges are detected as each snapshot arrives."""
+
+    def test_alert_fires_on_the_surging_snapshot(self, store):
+        tracker = IPITracker(load=False)
+        start = datetime.now() - timedelta(minutes=70)
+        assert tracker.observe("AAPL", 0.20, 1, ["dark_pool_sequence"], timestamp=start) is None
+        half_hour = start + timedelta(minutes=30)
+        assert tracker.observe("AAPL", 0.35, 2, ["dark_pool_sequence"], timestamp=half_hour) is None
+
+        alert = tracker.observe("AAPL", 0.60, 3, ["dark_pool_sequence", "put_oi_accumulation"],
+                                timestamp=start + timedelta(minutes=65))
+
+        assert alert is not None
+        assert alert.previous_ipi == pytest.approx(0.20) and alert.minutes_elapsed == 65
+        assert alert.is_critical
+        assert flash_alerts.get_flash_alerts()["alerts"][0]["symbol"] == "AAPL"
+
+    def test_repeat_observation_is_ignored_and_flush_batches(self, store):
+        tracker = IPITracker(load=False)
+        when = datetime.now()
+        tracker.observe("MSFT", 0.4, 2, [], timestamp=when)
+        tracker.observe("MSFT", 0.4, 2, [], timestamp=when)
+
+        assert store.ipi_history() == {}
+        assert tracker.flush() == 1
+        assert len(store.ipi_history("MSFT")["MSFT"]) == 1
+
+    def test_history_is_loaded_from_the_store(self, store):
+        earlier = datetime.now() - timedelta(minutes=60)
+        store.record_ipi("NVDA", 0.1, 1, [], timestamp=earlier)
+
+        alert = flash_alerts.get_ipi_tracker().observe("NVDA", 0.5, 2, ["iv_term_inversion"])
+
+        assert alert is not None and alert.ipi_change == pytest.approx(0.4)
@@ -0,0 +1,64 @@
+"""
+Tests for the append-only footprint store.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from putsengine.footprint_store import FootprintStore
+
+
+def _record(footprint_type, when, strength=0.5):
+    return {
+        "footprint_type": footprint_type,
+        "timestamp": when.isoformat(),
+        "strength": strength,
+        "details": {},
+    }
+
+
+class TestFootprintStore:
+    """Tests for FootprintStore."""
+
+    def test_append_and_query_by_symbol(self, tmp_path):
+        store = FootprintStore(tmp_path)
+        now = datetime.now()
+        store.append("AAPL", _record("dark_pool_sequence", now - timedelta(hours=1)))
+        store.append("MSFT", _record("iv_term_inversion", now))
+        store.append("AAPL", _record("put_oi_accumulation", now))
+
+        records = store.query("AAPL")
+        types = [r["footprint_type"] for r in records]
+        assert types == ["dark_pool_sequence", "put_oi_accumulation"]
+        assert store.counts() == {"AAPL": 2, "MSFT": 1}
+        recent = store.query("AAPL", since=now - timedelta(minutes=5))
+        assert recent[0]["footprint_type"] == "put_oi_accumulation"
+
+    def test_reader_sees_appends_from_other_writer(self, tmp_path):
+        reader = FootprintStore(tmp_path)
+        writer = FootprintStore(tmp_path)  # e.g. the scheduler process
+        assert reader.counts() == {}
+        writer.append("NVDA", _record("flow_divergence", datetime.now()))
+        assert reader.symbols() == ["NVDA"]
+
+    def test_prune_drops_expired_segments(self, tmp_path):
+        now = datetime.now()
+        old = FootprintStore(tmp_path, retention_days=30)
+        old.append("AAPL", _record("dark_pool_sequence", now - timedelta(days=10)))
+        store = FootprintStore(tmp_path, retention_days=5)
+        store.append("AAPL", _record("dark_pool_sequence", now))
+
+        assert len(store.query("AAPL")) == 1
+        assert store.prune() == 0  # Expired segment already dropped on first append
+        assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+    def test_migrates_legacy_json_once(self, tmp_path):
+        legacy = tmp_path / "footprint_history.json"
+        record = _record("quote_degradation", datetime.now())
+        legacy.write_text(json.dumps({"TSLA": [record]}))
+        store = FootprintStore(tmp_path / "footprints")
+
+        assert store.migrate_legacy(legacy) == 1
+        assert store.migrate_legacy(legacy) == 0
+        assert store.history() == {"TSLA": [record]}
+        assert store.query("TSLA")[0]["symbol"] == "TSLA"
@@ -0,0 +1,121 @@
+"""
+Tests for the shared provider gateway.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from putsengine.clients import gateway as gateway_module
+from putsengine.clients.gateway import ProviderConfig, ProviderGateway, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_empty(self):
+        bucket = TokenBucket(rate_per_second=1.0, capacity=3)
+        assert all(bucket.try_take() for _ in range(3))
+        assert not bucket.try_take()
+        assert bucket.time_until() > 0
+
+
+class TestProviderGateway:
+    """Tests for ProviderGateway."""
+
+    async def test_unknown_provider_passes_through(self):
+        gateway = ProviderGateway()
+        await gateway.acquire("nobody")
+        assert gateway.get_status() == {}
+
+    async def test_priority_order(self):
+        gateway = ProviderGateway({"uw": ProviderConfig(rate_per_second=200.0, burst=1)})
+        await gateway.acquire("uw")  # drain the burst token
+        order = []
+
+        async def call(tag, priority):
+            await gateway.acquire("uw", priority=priority)
+            order.append(tag)
+
+        low = asyncio.create_task(call("p3", 3))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(call("p1", 1))
+        await asyncio.gather(low, high)
+
+        assert order == ["p1", "p3"]
+
+    async def test_cancelled_after_grant_returns_the_token(self):
+        gateway = ProviderGateway({"uw": ProviderConfig(rate_per_second=0.001, burst=1)})
+        await gateway.acquire("uw")  # drain the burst token
+        waiter = asyncio.create_task(gateway.acquire("uw"))
+        await asyncio.sleep(0)
+
+        # A token arrives and is granted, but the waiter is cancelled (e.g. a
+        # scan timeout) before it resumes
+        state = gateway._states["uw"]
+        state.bucket.refund()
+        gateway._dispatch(state, state.queues[asyncio.get_running_loop()])
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert gateway.available_tokens("uw") >= 1.0
+
+    async def test_throttle_halves_rate_and_success_recovers(self):
+        gateway = ProviderGateway({"polygon": ProviderConfig(rate_per_second=10.0, burst=5)})
+
+        penalty = gateway.report_throttled("polygon", retry_after=0.01)
+        status = gateway.get_status()["polygon"]
+        assert penalty == 0.01
+        assert status["rate_per_second"] == 5.0
+        assert status["throttles"] == 1
+
+        await gateway.acquire("polygon")
+        gateway.report_success("polygon")
+        assert gateway.get_status()["polygon"]["rate_per_second"] > 5.0
+
+    def test_loops_in_other_threads_share_the_bucket(self):
+        gateway = ProviderGateway({"uw": ProviderConfig(rate_per_second=50.0, burst=1)})
+        done = []
+
+        def worker():
+            async def calls():
+                for _ in range(3):
+                    await gateway.acquire("uw")
+            asyncio.run(calls())
+            done.append(time.monotonic())
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        # Neither loop dropped the other's waiters; 6 tokens at 50/s with burst 1
+        assert len(done) == 2
+        assert max(done) - started >= 0.09
+        assert gateway.get_status()["uw"]["acquired"] == 6
+        assert gateway.get_status()["uw"]["queue_depth"] == 0
+
+
+class TestGetProviderGateway:
+    """The process-wide gateway keeps its first limits."""
+
+    def test_later_settings_with_other_limits_are_logged(self, settings, monkeypatch):
+        monkeypatch.setattr(gateway_module, "_gateway", None)
+        gateway = gateway_module.get_provider_gateway(settings)
+        warnings = []
+        handler = gateway_module.logger.add(warnings.append, level="WARNING")
+        try:
+            assert gateway_module.get_provider_gateway(settings) is gateway
+            assert not warnings
+            faster = settings.model_copy(update={"polygon_rate_limit": 500})
+            assert gateway_module.get_provider_gateway(faster) is gateway
+        finally:
+            gateway_module.logger.remove(handler)
+
+        assert len(warnings) == 1 and "polygon" in warnings[0]
+        assert gateway.get_status()["polygon"]["configured_rate_per_second"] == 100
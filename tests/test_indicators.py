@@ -0,0 +1,63 @@
+"""
+Tests for the vectorized indicator library.
+"""
+
+import numpy as np
+
+from putsengine import indicators as ind
+
+
+def _loop_rsi(prices, period=14):
+    """Reference: the per-layer loop the library replaced."""
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain, avg_loss = np.mean(gains[:period]), np.mean(losses[:period])
+    out = []
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        out.append(100 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+class TestIndicators:
+    """Tests for putsengine.indicators."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(7)
+        self.closes = 100 + rng.standard_normal(60).cumsum()
+
+    def test_rsi_matches_layer_loop(self):
+        rsi = ind.wilder_rsi(self.closes, 14)
+        assert np.isnan(rsi[13]) and not np.isnan(rsi[14])
+        assert np.allclose(rsi[15:], _loop_rsi(self.closes))
+
+    def test_universe_rows_match_single_series(self):
+        universe = ind.stack([self.closes, self.closes[::-1], self.closes * 2])
+        rsi_all = ind.wilder_rsi(universe, 14)
+        ema_all = ind.ema(universe, 20)
+        assert np.allclose(rsi_all[1], ind.wilder_rsi(self.closes[::-1], 14), equal_nan=True)
+        assert np.allclose(ema_all[2], ind.ema(self.closes * 2, 20), equal_nan=True)
+
+    def test_realized_vol_matches_rolling_std(self):
+        returns = np.diff(np.log(self.closes))
+        expected = [np.std(returns[i:i + 20]) * np.sqrt(252) for i in range(len(returns) - 19)]
+        assert np.allclose(ind.realized_vol(self.closes, 20)[20:], expected)
+
+    def test_incremental_states_match_batch(self):
+        head, tail = self.closes[:40], self.closes[40:]
+        ema_state = ind.EMAState.from_series(head, 20)
+        rsi_state = ind.RSIState.from_series(head, 14)
+        for price in tail:
+            ema_state.update(price)
+            rsi_state.update(price)
+        assert np.isclose(ema_state.value, ind.ema(self.closes, 20)[-1])
+        assert np.isclose(rsi_state.value, ind.wilder_rsi(self.closes, 14)[-1])
+
+    def test_vwap_and_rvol(self):
+        high, low, close = np.array([11.0, 12.0]), np.array([9.0, 10.0]), np.array([10.0, 11.0])
+        assert ind.vwap(high, low, close, np.array([100, 300])) == (10 * 100 + 11 * 300) / 400
+        assert ind.vwap(high, low, close, np.array([0, 0])) == 11.0
+        volume = np.array([100, 100, 100, 300])
+        assert np.allclose(ind.rvol(volume, 3)[-1], 3.0)
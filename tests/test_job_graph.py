@@ -0,0 +1,146 @@
+"""
+Tests for the scheduler job dependency graph.
+"""
+
+import asyncio
+from datetime import time as dtime
+
+import pytest
+
+from putsengine.job_graph import JobGraph
+
+ALL_DAY = (dtime(0, 0), dtime(23, 59, 59))
+
+
+def _graph(calls, delays=None):
+    delays = delays or {}
+    graph = JobGraph()
+    for name in ("ews", "scan", "weather", "top9"):
+        graph.add_artifact(name, max_age_seconds=3600)
+
+    def job(name):
+        async def fn(*args):
+            calls.append((name, args))
+            await asyncio.sleep(delays.get(name, 0))
+        return fn
+
+    graph.add_job("early_warning", job("early_warning"), outputs=("ews",))
+    graph.add_job("scan", job("scan"), outputs=("scan",))
+    graph.add_job("weather", job("weather"), inputs=("scan",), outputs=("weather",), window=ALL_DAY)
+    graph.add_job(
+        "convergence", job("convergence"), inputs=("ews", "scan", "weather"), outputs=("top9",)
+    )
+    return graph
+
+
+class TestJobGraph:
+    """Tests for JobGraph."""
+
+    def test_consumers_start_when_inputs_fresh(self):
+        calls = []
+        graph = _graph(calls)
+
+        # Nothing downstream of EWS can run yet: scan/weather never produced
+        report = asyncio.run(graph.run("early_warning"))
+        assert [c[0] for c in calls] == ["early_warning"]
+        assert report["skipped"]["convergence"].startswith("stale input scan")
+
+        report = asyncio.run(graph.run("scan", "market_pulse"))
+        assert [c[0] for c in calls[1:]] == ["scan", "weather", "convergence"]
+        assert calls[1] == ("scan", ("market_pulse",))
+        assert [s["job"] for s in report["critical_path"]] == ["scan", "weather", "convergence"]
+
+    def test_independent_branches_run_concurrently(self):
+        calls = []
+        graph = _graph(calls, delays={"weather": 0.2})
+        graph.add_artifact("extra", max_age_seconds=3600)
+        graph.add_job("slow_side", lambda: asyncio.sleep(0.2), inputs=("scan",), outputs=("extra",))
+        asyncio.run(graph.run("early_warning"))
+
+        report = asyncio.run(graph.run("scan", "regular"))
+        # weather (0.2s) and slow_side (0.2s) overlap instead of adding up
+        assert report["total_ms"] < 380
+
+    def test_window_and_once_per_window(self):
+        calls = []
+        graph = _graph(calls)
+        graph.jobs["weather"].once_per_window = True
+        asyncio.run(graph.run("early_warning"))
+        asyncio.run(graph.run("scan", "a"))
+        report = asyncio.run(graph.run("scan", "b"))
+        assert report["skipped"]["weather"] == "already ran in window"
+
+        graph.jobs["weather"].window = (dtime(0, 0), dtime(0, 0))
+        graph.jobs["weather"].once_per_window = False
+        report = asyncio.run(graph.run("scan", "c"))
+        assert report["skipped"]["weather"] == "outside window"
+
+    def test_ensure_skips_recent_runs_and_deadlines_are_reported(self):
+        calls = []
+        graph = _graph(calls, delays={"scan": 0.05})
+        graph.jobs["scan"].deadline_seconds = 0.01
+
+        report = asyncio.run(graph.ensure("scan", 60))
+        assert report["missed_deadlines"] == ["scan"]
+        assert asyncio.run(graph.ensure("scan", 60)) is None
+        assert [c[0] for c in calls].count("scan") == 1
+
+    def test_rejects_cycles_and_unknown_artifacts(self):
+        graph = _graph([])
+        with pytest.raises(ValueError, match="cycle"):
+            graph.add_job("loop", lambda: None, inputs=("top9",), outputs=("scan",))
+        assert "loop" not in graph.jobs
+        with pytest.raises(ValueError, match="unknown artifact"):
+            graph.add_job("bad", lambda: None, inputs=("nope",))
+
+    def test_failed_job_does_not_trigger_consumers(self):
+        graph = _graph([])
+
+        async def boom(*args):
+            raise RuntimeError("api down")
+
+        graph.jobs["scan"].fn = boom
+        report = asyncio.run(graph.run("scan"))
+        assert report["jobs_run"] == ["scan"]
+        assert report["critical_path"][0]["error"] == "api down"
+        assert not graph.artifacts["scan"].is_fresh()
+
+    def test_job_returning_false_is_a_failure(self):
+        calls = []
+        graph = _graph(calls)
+
+        async def swallowed(*args):
+            calls.append(("scan", args))
+            return False
+
+        graph.jobs["scan"].fn = swallowed
+        report = asyncio.run(graph.ensure("scan", 60))
+        assert report["critical_path"][0]["error"] == "job reported failure"
+        assert not graph.artifacts["scan"].is_fresh()
+        assert "scan" not in graph.last_finished
+
+        # The deadline fallback retries instead of counting the failed run
+        asyncio.run(graph.ensure("scan", 60))
+        assert len(calls) == 2
+
+    def test_any_input_consumer_runs_on_one_fresh_input(self):
+        calls = []
+        graph = _graph(calls)
+        graph.jobs["convergence"].any_input = True
+
+        asyncio.run(graph.run("early_warning"))
+        assert [c[0] for c in calls] == ["early_warning", "convergence"]
+
+    def test_cascades_and_reruns_keep_the_scheduled_args(self):
+        calls = []
+        graph = _graph(calls, delays={"scan_b": 0.05, "weather": 0.2})
+        graph.add_job("scan_b", graph.jobs["scan"].fn, outputs=("scan",))
+        asyncio.run(graph.run("weather", "am"))
+
+        async def two_producers():
+            await asyncio.gather(graph.run("scan", "x"), graph.run("scan_b"))
+
+        calls.clear()
+        asyncio.run(two_producers())
+        # Cascaded run, then the rerun queued while it was running
+        assert [args for name, args in calls if name == "weather"] == [("am",), ("am",)]
@@ -0,0 +1,74 @@
+"""
+Tests for the event-loop lag monitor and blocking-work pool.
+"""
+
+import asyncio
+import time
+
+from putsengine.loop_monitor import LoopMonitor, _percentile, run_blocking
+from putsengine.metrics import attribute, current_caller, get_metrics
+
+
+def _hold_the_loop(seconds):
+    time.sleep(seconds)
+
+
+class TestLoopMonitor:
+    """Lag percentiles and stack capture for a blocked loop."""
+
+    async def test_blocked_loop_is_caught_with_its_stack(self):
+        monitor = LoopMonitor(interval=0.02, stall_threshold=0.1)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+            _hold_the_loop(0.4)
+            await asyncio.sleep(0.1)
+        finally:
+            monitor.stop()
+
+        stats = monitor.stats()
+        assert stats["stalls_total"] == 1
+        [stall] = stats["recent_stalls"]
+        assert stall["duration_ms"] >= 300
+        assert any("_hold_the_loop" in line for line in stall["stack"])
+        assert stats["max_ms"] >= 300
+        assert get_metrics().counters["putsengine_event_loop_stalls_total"]
+
+    async def test_idle_loop_has_low_lag(self):
+        monitor = LoopMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.2)
+        monitor.stop()
+
+        stats = monitor.stats(include_stacks=False)
+        assert stats["samples"] > 5
+        assert stats["stalls_total"] == 0
+        assert stats["p50_ms"] < 100
+
+    def test_percentile_is_nearest_rank(self):
+        ordered = [float(i) for i in range(1, 101)]
+        assert _percentile(ordered, 50) == 50.0
+        assert _percentile(ordered, 99) == 99.0
+        assert _percentile([], 95) == 0.0
+
+
+class TestRunBlocking:
+    """Blocking work leaves the loop free and keeps metrics attribution."""
+
+    async def test_runs_off_loop_with_caller_context(self):
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        def work():
+            time.sleep(0.15)
+            return current_caller()
+
+        with attribute(scanner="unit_scan"):
+            caller, _ = await asyncio.gather(run_blocking(work), ticker())
+
+        assert caller == "unit_scan"
+        assert len(ticks) == 5
@@ -0,0 +1,80 @@
+"""
+Tests for the scan-wide market datasets.
+"""
+
+from putsengine import market_pulse_engine
+from putsengine.flow_alerts_scanner import FlowAlertsScanner
+from putsengine.market_datasets import ALL_FEEDS, MarketDatasets
+
+
+class FakeUW:
+    def __init__(self):
+        self.calls = []
+
+    async def get_congress_trades(self, limit=20):
+        self.calls.append("congress")
+        return [
+            {"ticker": "aapl", "transaction_type": "Sale"},
+            {"ticker": "AAPL", "transaction_type": "Sale (Partial)"},
+            {"ticker": "MSFT", "transaction_type": "Purchase"},
+            {"ticker": None},
+        ]
+
+    async def get_greek_exposure(self, symbol):
+        self.calls.append(f"greeks:{symbol}")
+        return {"net_gex": -5}
+
+    async def get_global_flow_alerts(self, limit=100):
+        self.calls.append("flow_alerts")
+        return [{"ticker": "AAPL", "type": "put", "total_premium": 6_000_000}]
+
+    async def get_dark_pool_recent(self, limit=50):
+        self.calls.append("dark_pool")
+        return [{"ticker": "MSFT", "size": 100_000}]
+
+    async def get_market_tide(self):
+        self.calls.append("market_tide")
+        return {"calls": {"total_premium": 100}, "puts": {"total_premium": 200}}
+
+
+class FailingUW(FakeUW):
+    async def get_greek_exposure(self, symbol):
+        raise RuntimeError("UW down")
+
+
+class TestMarketDatasets:
+    """Tests for MarketDatasets."""
+
+    async def test_feeds_are_indexed_by_ticker(self):
+        uw = FakeUW()
+        market = await MarketDatasets.fetch(uw)
+
+        assert sorted(uw.calls) == ["congress", "greeks:SPY"]
+        assert len(market.congress_trades("AAPL")) == 2
+        assert market.congress_trades("NVDA") == []
+        assert market.spy_greek_exposure == {"net_gex": -5}
+
+    async def test_failed_or_skipped_feeds_are_absent(self):
+        market = await MarketDatasets.fetch(FailingUW(), feeds=("spy_greek_exposure",))
+
+        assert market.failed_feeds == ["spy_greek_exposure"]
+        assert not market.has("spy_greek_exposure")
+        assert not market.has("congress")
+        assert market.congress_trades("AAPL") == []
+
+    async def test_scanners_and_engines_reuse_prefetched_feeds(self, settings, monkeypatch):
+        monkeypatch.setattr(market_pulse_engine, "get_settings", lambda: settings)
+        uw = FakeUW()
+        market = await MarketDatasets.fetch(uw, ALL_FEEDS)
+        assert len(uw.calls) == len(ALL_FEEDS)
+        assert market.flow_alerts_for("aapl") == market.flow_alerts_raw
+        assert market.dark_pool_for("MSFT") == [{"ticker": "MSFT", "size": 100_000}]
+
+        await FlowAlertsScanner(uw).scan_flow_alerts(market=market)
+        engine = market_pulse_engine.MarketPulseEngine(
+            polygon_client=object(), uw_client=uw, market=market
+        )
+        tide = await engine._market_tide()
+
+        assert tide["puts"]["total_premium"] == 200
+        assert len(uw.calls) == len(ALL_FEEDS)  # No live refetch
@@ -0,0 +1,122 @@
+"""
+Tests for hot-path metrics and call attribution.
+"""
+
+import asyncio
+
+import pytest
+
+from putsengine import metrics
+from putsengine.clients import transport
+from putsengine.clients.transport import replaying
+from putsengine.metrics import attribute, get_metrics, instrumented, normalize_endpoint
+from putsengine.utils.cache import SimpleCache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    get_metrics().reset()
+    transport.set_transport(None)
+    yield
+    get_metrics().reset()
+    transport.set_transport(None)
+
+
+class TestEndpoints:
+    """Endpoint labels stay low-cardinality."""
+
+    def test_normalize_endpoint(self):
+        assert normalize_endpoint(
+            "https://api.unusualwhales.com/api/stock/AAPL/flow-recent?limit=5"
+        ) == "/api/stock/{ticker}/flow-recent"
+        assert normalize_endpoint(
+            "https://api.polygon.io/v2/aggs/ticker/BRK.B/range/1/day/2026-01-02/2026-02-02"
+        ) == "/v2/aggs/ticker/{ticker}/range/{n}/day/{date}/{date}"
+        assert normalize_endpoint(
+            "https://api.polygon.io/v3/snapshot/options/SPY/O:SPY260220P00600000"
+        ) == "/v3/snapshot/options/{ticker}/{contract}"
+        assert normalize_endpoint("https://elite.finviz.com/export.ashx") == "/export.ashx"
+
+
+class TestRegistry:
+    """Histograms, rendering and snapshots."""
+
+    def test_histogram_quantiles(self):
+        histogram = metrics.Histogram((0.1, 1.0, 10.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.95) == 10.0
+        assert histogram.summary()["count"] == 4
+
+    def test_prometheus_render(self):
+        registry = get_metrics()
+        registry.observe("putsengine_http_request_seconds", 0.2, provider="uw", endpoint="/api/x")
+        registry.inc("putsengine_cache_events_total", cache="uw", outcome="hit")
+        text = registry.render()
+
+        assert "# TYPE putsengine_http_request_seconds histogram" in text
+        bucket = 'putsengine_http_request_seconds_bucket{endpoint="/api/x",provider="uw",le='
+        assert bucket + '"0.25"} 1' in text
+        assert bucket + '"+Inf"} 1' in text
+        assert 'putsengine_cache_events_total{cache="uw",outcome="hit"} 1' in text
+
+    def test_export_writes_both_files(self, tmp_path):
+        get_metrics().inc("putsengine_cache_events_total", cache="uw", outcome="miss")
+        get_metrics().export(tmp_path / "m.prom", tmp_path / "m.json")
+
+        assert "putsengine_cache_events_total" in (tmp_path / "m.prom").read_text()
+        assert metrics.load_snapshot(tmp_path / "m.json")["caches"]["uw"]["miss"] == 1
+
+
+class TestAttribution:
+    """Calls are charged to the innermost layer/scanner and the current job."""
+
+    async def test_replayed_calls_attributed_through_tasks(self):
+        url = "https://api.unusualwhales.com/api/stock/AAPL/flow-recent"
+        exchange = {"m": "GET", "u": url, "p": {}, "s": 200, "h": {}, "t": "{}", "ms": 1.0}
+
+        @instrumented("layer", "distribution")
+        async def layer():
+            session = transport.create_session()
+            # Tasks created inside the layer inherit its attribution
+            await asyncio.gather(*(session.get(url) for _ in range(2)))
+
+        with replaying([exchange]):
+            with attribute(job="market_pulse_245pm", scanner="full_scan"):
+                await layer()
+                async with transport.create_session().get(url):
+                    pass
+
+        snapshot = get_metrics().snapshot()
+        assert snapshot["http"]["by_caller"] == {"distribution": {"uw": 2}, "full_scan": {"uw": 1}}
+        assert snapshot["http"]["by_job"] == {"market_pulse_245pm": {"uw": 3}}
+        assert snapshot["http"]["latency"]["uw /api/stock/{ticker}/flow-recent"]["count"] == 3
+        assert snapshot["stages"]["layer:distribution"]["count"] == 1
+
+    def test_sync_stage_records_errors(self):
+        @instrumented("scanner", "convergence")
+        def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            broken()
+        assert get_metrics().counters["putsengine_stage_errors_total"] == {
+            (("kind", "scanner"), ("name", "convergence")): 1.0
+        }
+        assert metrics.current_caller() == metrics.UNATTRIBUTED
+
+
+class TestCacheEvents:
+    """Hit ratios come from the caches themselves."""
+
+    def test_simple_cache_hits_and_misses(self):
+        cache = SimpleCache(namespace="bars")
+        cache.get("AAPL")
+        cache.set("AAPL", [1])
+        cache.get("AAPL")
+        cache.get("AAPL")
+
+        assert get_metrics().snapshot()["caches"]["bars"] == {
+            "hit": 2, "miss": 1, "hit_ratio": 0.667, "coalesce_ratio": 0.0
+        }
@@ -0,0 +1,86 @@
+"""
+Tests for the persistent on-disk response cache.
+"""
+
+import pickle
+import time
+from datetime import date, timedelta
+
+from putsengine.utils.cache import SimpleCache
+from putsengine.utils.persistent_cache import OPEN_RANGE_TTL, PersistentCache
+
+
+class TestPersistentCache:
+    """Tests for PersistentCache."""
+
+    def test_roundtrip_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        writer = PersistentCache(str(path))
+        key = writer.make_key("uw", "/api/darkpool/AAPL")
+        writer.set(key, {"data": [1, 2, 3]}, ttl=60)
+
+        reader = PersistentCache(str(path))  # e.g. the dashboard process
+        assert reader.get(key) == {"data": [1, 2, 3]}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+        cache.set("k", "v", ttl=60)
+        cache.set("gone", "v", ttl=0)  # ttl <= 0 is never stored
+        assert cache.get("k") == "v"
+        assert cache.get("gone") is None
+
+    def test_key_normalization_strips_auth(self):
+        a = PersistentCache.make_key(
+            "polygon", "/v2/x", {"limit": 10, "apiKey": "secret", "sort": "asc"}
+        )
+        b = PersistentCache.make_key("polygon", "/v2/x", {"sort": "asc", "limit": 10})
+        assert a == b
+        assert "secret" not in a
+
+    def test_endpoint_ttls(self):
+        snapshot = "/v2/snapshot/locale/us/markets/stocks/tickers/AAPL"
+        assert PersistentCache.ttl_for("polygon", snapshot) == 15
+        assert PersistentCache.ttl_for("uw", "/api/stock/AAPL/oi-change") == 1800
+        assert PersistentCache.ttl_for("unknown", "/anything") == 0
+        assert PersistentCache.ttl_for("polygon", "/v3/trades/AAPL") == 0  # Live tape
+        assert PersistentCache.ttl_for("polygon", "/v1/marketstatus/now") == 0
+
+    def test_values_are_json_and_pickles_never_load(self, tmp_path):
+        cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+        cache.set("k", {"data": [1.5, "x"]}, ttl=60)
+        conn = cache._connection()
+        stored = conn.execute("SELECT value FROM entries WHERE key = 'k'").fetchone()[0]
+        assert stored == b'{"data":[1.5,"x"]}'
+
+        # A row another process wrote with pickle is a miss, not code to run
+        conn.execute("UPDATE entries SET value = ? WHERE key = 'k'", (pickle.dumps({"data": 1}),))
+        assert cache.get("k") is None
+
+    def test_daily_aggs_cache_long_only_when_historical(self):
+        today = date.today()
+        closed = f"/v2/aggs/ticker/AAPL/range/1/day/2024-01-02/{today - timedelta(days=1)}"
+        open_range = f"/v2/aggs/ticker/AAPL/range/1/day/2024-01-02/{today}"
+        open_ms = f"/v2/aggs/ticker/AAPL/range/1/day/1704153600000/{int(time.time() * 1000)}"
+
+        assert PersistentCache.ttl_for("polygon", closed) == 3600
+        assert PersistentCache.ttl_for("polygon", open_range) == OPEN_RANGE_TTL
+        assert PersistentCache.ttl_for("polygon", open_ms) == OPEN_RANGE_TTL
+
+    def test_lru_eviction(self, tmp_path):
+        cache = PersistentCache(str(tmp_path / "cache.sqlite"), max_bytes=2000)
+        for i in range(20):
+            cache.set(f"k{i}", "x" * 200, ttl=60)
+        cache.cleanup()
+        assert cache.stats()["bytes"] <= 2000
+
+
+class TestSimpleCacheBackend:
+    """SimpleCache falls through to the persistent backend."""
+
+    def test_memory_miss_reads_backend(self, tmp_path):
+        backend = PersistentCache(str(tmp_path / "cache.sqlite"))
+        SimpleCache(default_ttl=60, backend=backend, namespace="bar").set("AAPL", [1.0, 2.0])
+
+        fresh = SimpleCache(default_ttl=60, backend=backend, namespace="bar")
+        assert fresh.get("AAPL") == [1.0, 2.0]
+        assert SimpleCache(default_ttl=60, backend=backend, namespace="quote").get("AAPL") is None
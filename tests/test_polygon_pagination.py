@@ -0,0 +1,85 @@
+"""
+Tests for PolygonClient auto-paginating iterators.
+"""
+
+from datetime import date
+
+from putsengine.clients.polygon_client import PolygonClient
+
+
+def _paged_client(settings, rows, page_size):
+    """Client whose _request serves ``rows`` in pages linked by next_url cursors."""
+    client = PolygonClient(settings)
+    calls = []
+
+    async def fake_request(endpoint, params=None):
+        params = dict(params or {})
+        calls.append((endpoint, params))
+        start = int(params.get("cursor", 0))
+        size = min(int(params.get("limit", page_size)), page_size)
+        result = {"results": rows[start:start + size]}
+        if start + size < len(rows):
+            result["next_url"] = f"{client.BASE_URL}{endpoint}?cursor={start + size}&limit={size}"
+        return result
+
+    client._request = fake_request
+    return client, calls
+
+
+class TestIterators:
+    """Pages are followed lazily, to the end or until the caller stops."""
+
+    async def test_trades_follow_every_page(self, settings):
+        trades = [{"size": i, "price": 10.0, "participant_timestamp": 1_700_000_000_000_000_000 + i}
+                  for i in range(25)]
+        client, calls = _paged_client(settings, trades, page_size=10)
+
+        seen = [t["size"] async for t in client.iter_trades("AAPL", from_date=date(2026, 1, 2))]
+
+        assert seen == list(range(25))
+        assert len(calls) == 3
+        assert calls[0][1]["timestamp.gte"] == "2026-01-02T00:00:00Z"
+        assert calls[1][0] == "/v3/trades/AAPL" and calls[1][1] == {"cursor": "10", "limit": "10"}
+
+    async def test_early_termination_stops_requesting(self, settings):
+        client, calls = _paged_client(settings, [{"size": i} for i in range(100)], page_size=10)
+
+        async for trade in client.iter_trades("AAPL"):
+            if trade["size"] == 12:
+                break
+        assert len(calls) == 2
+
+        assert len(await client.get_trades("AAPL", limit=15)) == 15
+        assert len(calls) == 4
+
+    async def test_options_snapshot_sends_filters_and_collects_all(self, settings):
+        rows = [{"details": {"strike_price": s}} for s in range(600)]
+        client, calls = _paged_client(settings, rows, page_size=250)
+
+        snaps = await client.get_options_snapshot(
+            "AAPL", option_type="put", strike_price_gte=90, expiration_date_lte=date(2026, 12, 18),
+        )
+
+        assert len(snaps) == 600 and len(calls) == 3
+        assert calls[0][1]["contract_type"] == "put"
+        assert calls[0][1]["strike_price.gte"] == 90
+        assert calls[0][1]["expiration_date.lte"] == "2026-12-18"
+
+    async def test_aggregates_yield_bar_chunks(self, settings):
+        rows = [{"t": 1_767_225_600_000 + i * 60_000, "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 100}
+                for i in range(7)]
+        client, _ = _paged_client(settings, rows, page_size=3)
+
+        chunks = [len(c) async for c in client.iter_aggregates("AAPL", from_date=date(2026, 1, 1))]
+
+        assert chunks == [3, 3, 1]
+
+    async def test_large_trades_keeps_only_large_prints(self, settings):
+        trades = [{"size": 50 if i % 4 else 20_000, "price": 10.0,
+                   "participant_timestamp": 1_700_000_000_000_000_000} for i in range(40)]
+        client, calls = _paged_client(settings, trades, page_size=16)
+
+        prints = await client.get_large_trades("AAPL", max_trades=40)
+
+        assert len(prints) == 10 and all(p.size == 20_000 for p in prints)
+        assert len(calls) == 3
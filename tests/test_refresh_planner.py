@@ -0,0 +1,134 @@
+"""
+Tests for change-driven EWS REFRESH ticker selection.
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from putsengine import state_store
+from putsengine.api_budget import APIBudgetManager
+from putsengine.early_warning_system import get_refresh_tickers
+from putsengine.refresh_planner import (
+    fetch_snapshot_features,
+    information_gain,
+    load_baselines,
+    plan_refresh,
+    record_scanned,
+)
+
+
+def _features(price=100.0, volume=1_000_000.0, prev_volume=3_900_000.0, spread_bps=5.0):
+    return {"price": price, "volume": volume, "prev_volume": prev_volume, "spread_bps": spread_bps}
+
+
+def _ticker(symbol, price, volume, bid, ask):
+    return {
+        "ticker": symbol,
+        "day": {"c": price, "v": volume},
+        "prevDay": {"c": price, "v": volume * 4},
+        "lastQuote": {"p": bid, "P": ask},
+        "lastTrade": {"p": price},
+    }
+
+
+class _Polygon:
+    """Bulk snapshot stub."""
+
+    def __init__(self, tickers):
+        self.tickers = tickers
+        self.calls = []
+
+    async def get_all_tickers_snapshot(self, tickers=None):
+        self.calls.append(tickers)
+        return [t for t in self.tickers if tickers is None or t["ticker"] in tickers]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = state_store.StateStore(tmp_path / "state.db")
+    monkeypatch.setattr(state_store, "_store", store)
+    yield store
+    store.close()
+
+
+class TestInformationGain:
+    """Gain grows with moves, volume pace, spread widening and prior IPI."""
+
+    def test_unchanged_ticker_scores_low(self):
+        now = datetime.now()
+        scanned_at = (now - timedelta(minutes=30)).isoformat()
+        baseline = {"scanned_at": scanned_at, "ipi": 0.0, **_features()}
+        current = _features(volume=1_000_000 + 3_900_000 * 30 / 390)
+
+        assert information_gain(current, baseline, now) < 0.5
+
+    def test_drop_outweighs_equal_rally(self):
+        now = datetime.now()
+        scanned_at = (now - timedelta(minutes=30)).isoformat()
+        baseline = {"scanned_at": scanned_at, "ipi": 0.0, **_features()}
+
+        drop = information_gain(_features(price=98.0), baseline, now)
+        rally = information_gain(_features(price=102.0), baseline, now)
+
+        assert drop > rally > 1.0
+
+    def test_missing_baseline_is_infinite(self):
+        assert math.isinf(information_gain(_features(), None))
+
+
+class TestPlanRefresh:
+    """Index ETFs, stale tickers, then top gain within the UW budget."""
+
+    def test_ranks_changed_and_stale_within_budget(self, store):
+        now = datetime.now()
+        recent = now - timedelta(minutes=20)
+        symbols = ["SPY", "FLAT", "DROP", "WIDE", "NEW", "OLD"]
+        prior_ipi = {s: 0.0 for s in symbols if s != "NEW"}
+        record_scanned({s: _features() for s in symbols}, prior_ipi, recent)
+        record_scanned({"OLD": _features()}, {"OLD": 0.0}, now - timedelta(hours=5))
+        current = {s: _features(volume=1_200_000) for s in symbols}
+        current["DROP"] = _features(price=97.0, volume=1_200_000)
+        current["WIDE"] = _features(spread_bps=15.0, volume=1_200_000)
+
+        budget = APIBudgetManager()
+        plan = plan_refresh(symbols, current, budget=budget, now=now)
+
+        assert plan == ["SPY", "NEW", "OLD", "DROP", "WIDE"]
+
+        budget._calls_today = budget._effective_ceiling() - 3 * 5
+        assert plan_refresh(symbols, current, budget=budget, now=now) == ["SPY", "NEW", "OLD"]
+
+    def test_record_scanned_keeps_other_baselines(self, store):
+        record_scanned({"AAA": _features()}, {"AAA": 0.4})
+        record_scanned({}, {"BBB": 0.1})
+
+        baselines = load_baselines()
+        assert baselines["AAA"]["ipi"] == 0.4 and baselines["AAA"]["price"] == 100.0
+        assert "price" not in baselines["BBB"]
+
+    def test_concurrent_record_scanned_keeps_every_ticker(self, store):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: record_scanned({}, {f"T{i:02d}": i / 100}), range(40)))
+
+        assert len(load_baselines()) == 40
+
+
+class TestSnapshotPrepass:
+    """One bulk Polygon call feeds the planner."""
+
+    async def test_features_and_refresh_tickers(self, store):
+        polygon = _Polygon([
+            _ticker("SPY", 500.0, 1e7, 499.99, 500.01),
+            _ticker("AAPL", 200.0, 5e6, 199.9, 200.1),
+            _ticker("ZZZZ", 1.0, 1.0, 0.9, 1.1),
+        ])
+
+        features = await fetch_snapshot_features(polygon, ["SPY", "AAPL"])
+        assert set(features) == {"SPY", "AAPL"}
+        assert features["AAPL"]["spread_bps"] == pytest.approx(10.0)
+
+        assert await get_refresh_tickers(["SPY", "AAPL"], polygon) == ["SPY", "AAPL"]
+        assert len(polygon.calls) == 2
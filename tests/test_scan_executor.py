@@ -0,0 +1,58 @@
+"""
+Tests for the concurrent scan executor.
+"""
+
+import asyncio
+
+from putsengine.scan_executor import ScanExecutor, ProviderLimit
+
+
+class TestScanExecutor:
+    """Tests for ScanExecutor."""
+
+    async def test_runs_all_symbols_and_streams_results(self):
+        executor = ScanExecutor(max_in_flight=4)
+        seen = []
+
+        async def worker(symbol):
+            await asyncio.sleep(0)
+            return symbol.lower()
+
+        stats = await executor.run(["AAPL", "MSFT", "NVDA"], worker,
+                                   on_result=lambda s, r: seen.append((s, r)))
+
+        assert stats.completed == 3
+        assert stats.errors == 0
+        assert sorted(seen) == [("AAPL", "aapl"), ("MSFT", "msft"), ("NVDA", "nvda")]
+
+    async def test_worker_errors_are_counted_not_raised(self):
+        executor = ScanExecutor(max_in_flight=2)
+
+        async def worker(symbol):
+            if symbol == "BAD":
+                raise ValueError("boom")
+            return symbol
+
+        stats = await executor.run(["GOOD", "BAD"], worker)
+
+        assert stats.completed == 1
+        assert stats.errors == 1
+
+    async def test_provider_concurrency_cap(self):
+        executor = ScanExecutor(max_in_flight=10, limits={
+            "uw": ProviderLimit(max_concurrency=2),
+        })
+        active = [0]
+        peak = [0]
+
+        async def worker(symbol):
+            async with executor.slot("uw"):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.01)
+                active[0] -= 1
+
+        stats = await executor.run([f"T{i}" for i in range(8)], worker)
+
+        assert peak[0] == 2
+        assert stats.slot_wait_seconds["uw"] > 0
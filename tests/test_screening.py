@@ -0,0 +1,43 @@
+"""
+Tests for bulk universe screening.
+"""
+
+from putsengine.screening import UniverseSnapshot, screen
+
+
+def _ticker(symbol, o, c, vw, v, prev_v):
+    return {"ticker": symbol, "day": {"o": o, "c": c, "vw": vw, "v": v}, "prevDay": {"v": prev_v}}
+
+
+class TestScreening:
+    """Tests for UniverseSnapshot / screen."""
+
+    def test_filters_match_per_symbol_rules(self):
+        tickers = [
+            _ticker("UP", 10, 11, 12, 1000, 1000),      # green day
+            _ticker("THIN", 10, 9, 10, 500, 1000),      # volume < 80% of prior
+            _ticker("ABOVE", 10, 9, 8.5, 1000, 1000),   # above VWAP
+            _ticker("PASS", 10, 9, 9.5, 1000, 1000),
+            _ticker("NOVWAP", 10, 9, 0, 1000, 1000),    # missing VWAP is allowed
+            {"ticker": "PRE", "day": {}, "prevDay": {"v": 1000}},
+        ]
+        symbols = {r.symbol for r in screen(UniverseSnapshot.from_tickers(tickers))}
+        assert symbols == {"PASS", "NOVWAP"}
+
+    def test_ranked_by_score_and_limited_to_universe(self):
+        tickers = [
+            _ticker("MILD", 100, 99, 99.5, 1000, 1000),
+            _ticker("HARD", 100, 90, 95, 3000, 1000),
+            _ticker("MID", 100, 95, 97, 1000, 1000),
+            _ticker("OTHER", 100, 80, 90, 5000, 1000),
+        ]
+        snapshot = UniverseSnapshot.from_tickers(tickers, universe=["MILD", "HARD", "MID"])
+        results = screen(snapshot, limit=2)
+
+        assert [r.symbol for r in results] == ["HARD", "MID"]
+        assert results[0].volume_ratio == 3.0
+
+    def test_ties_break_on_symbol(self):
+        tickers = [_ticker(s, 10, 9, 9.5, 1000, 1000) for s in ("ZZ", "AA", "MM")]
+        results = screen(UniverseSnapshot.from_tickers(tickers))
+        assert [r.symbol for r in results] == ["AA", "MM", "ZZ"]
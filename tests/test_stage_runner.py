@@ -0,0 +1,63 @@
+"""
+Tests for the dependency-aware stage runner.
+"""
+
+import asyncio
+import time
+
+from putsengine.layers.stages import StageRunner
+
+
+class TestStageRunner:
+    """Tests for StageRunner."""
+
+    async def test_independent_stages_overlap(self):
+        async def slow(value):
+            await asyncio.sleep(0.05)
+            return value
+
+        runner = StageRunner("AAPL")
+        for name in ("a", "b", "c", "d"):
+            runner.add(name, lambda name=name: slow(name))
+        started = time.perf_counter()
+        results = await runner.run()
+
+        assert results == {"a": "a", "b": "b", "c": "c", "d": "d"}
+        assert time.perf_counter() - started < 0.15
+        assert set(runner.timings) == {"a", "b", "c", "d"}
+
+    async def test_dependencies_receive_results(self):
+        order = []
+
+        async def pv():
+            await asyncio.sleep(0.01)
+            order.append("pv")
+            return {"current_vwap": 10.0}
+
+        async def prints():
+            order.append("prints")
+            return [1, 2, 3]
+
+        async def guard(pv_result, prints_result):
+            order.append("guard")
+            return pv_result["current_vwap"] * len(prints_result)
+
+        runner = StageRunner()
+        runner.add("pv", pv).add("prints", prints)
+        runner.add("guard", guard, after=("pv", "prints"))
+        results = await runner.run()
+
+        assert results["guard"] == 30.0
+        assert order[-1] == "guard"
+
+    async def test_failed_stage_yields_default(self):
+        async def boom():
+            raise RuntimeError("UW down")
+
+        async def dependent(value):
+            return value
+
+        runner = StageRunner()
+        runner.add("flow", boom, default={})
+        runner.add("after", dependent, after=("flow",))
+        assert await runner.run() == {"flow": {}, "after": {}}
@@ -0,0 +1,107 @@
+"""
+Tests for the SQLite state store.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from putsengine.state_store import LEGACY_FILES, StateStore, file_is_newer
+
+
+def _scan(when, symbols):
+    return {
+        "last_scan": when.isoformat(),
+        "scan_type": "regular",
+        "tickers_scanned": 100,
+        "market_regime": "neutral",
+        "gamma_drain": [{"symbol": s, "score": 0.5 + i / 10} for i, s in enumerate(symbols)],
+        "distribution": [],
+        "liquidity": [{"symbol": symbols[0], "score": 0.4}],
+    }
+
+
+class TestStateStore:
+    """Tests for StateStore."""
+
+    def test_scan_round_trip_and_candidate_history(self, tmp_path):
+        store = StateStore(tmp_path / "state.db")
+        now = datetime.now()
+        store.record_scan(_scan(now - timedelta(hours=1), ["AAPL", "MSFT"]))
+        store.record_scan(_scan(now, ["NVDA", "AAPL"]))
+
+        latest = store.latest_scan()
+        assert latest["last_scan"] == now.isoformat()
+        assert [c["symbol"] for c in latest["gamma_drain"]] == ["NVDA", "AAPL"]
+        assert latest["tickers_scanned"] == 100
+
+        history = store.candidate_history("AAPL")
+        assert len(history) == 3
+        assert {h["engine"] for h in history} == {"gamma_drain", "liquidity"}
+        recent = store.candidate_history(
+            "AAPL", since=now - timedelta(minutes=5), engine="gamma_drain"
+        )
+        assert len(recent) == 1
+
+    def test_ews_latest_and_history(self, tmp_path):
+        store = StateStore(tmp_path / "state.db")
+        store.record_ews({
+            "timestamp": "2026-01-05T10:00:00", "alerts": {"AAPL": {"ipi": 0.5, "level": "watch"}},
+        })
+        store.record_ews({
+            "timestamp": "2026-01-05T11:00:00", "alerts": {"AAPL": {"ipi": 0.7, "level": "act"}},
+        })
+
+        assert store.latest_ews()["alerts"]["AAPL"]["level"] == "act"
+        assert [a["ipi"] for a in store.ews_history("AAPL")] == [0.5, 0.7]
+
+    def test_ipi_per_symbol_and_prune(self, tmp_path):
+        store = StateStore(tmp_path / "state.db")
+        base = datetime(2026, 1, 5, 10)
+        for i in range(5):
+            store.record_ipi(
+                "AAPL", 0.1 * i, i, ["dark_pool_sequence"], timestamp=base + timedelta(hours=i)
+            )
+
+        assert [s["unique_footprints"] for s in store.ipi_history(per_symbol=2)["AAPL"]] == [3, 4]
+        assert store.prune_ipi(base + timedelta(hours=1)) == 2
+        assert len(store.ipi_history("AAPL")["AAPL"]) == 3
+
+    def test_attribution_event_update(self, tmp_path):
+        store = StateStore(tmp_path / "state.db")
+        store.put_attribution_event({"event_id": "AAPL_1", "symbol": "AAPL", "ews_level": "act"})
+        event = store.get_attribution_event("AAPL_1")
+        event["outcome"] = "win"
+        store.put_attribution_event(event)
+
+        assert store.attribution_count() == 1
+        assert store.attribution_events("AAPL")[0]["outcome"] == "win"
+
+    def test_import_legacy_once_and_export(self, tmp_path):
+        legacy = tmp_path / "legacy"
+        legacy.mkdir()
+        (legacy / LEGACY_FILES["dui"]).write_text(json.dumps({
+            "AAPL": {
+                "source": "distribution", "score": 0.4,
+                "added_date": "2026-01-01", "expires_date": "2026-01-04",
+            },
+        }))
+        (legacy / LEGACY_FILES["scans"]).write_text(json.dumps(_scan(datetime.now(), ["TSLA"])))
+
+        store = StateStore(tmp_path / "state.db")
+        assert store.import_legacy(legacy) == {"scans": 1 + 1, "dui": 1}
+        assert store.import_legacy(legacy) == {}  # Marker prevents re-import
+        assert store.dui_entries(active_on="2026-01-05") == {}
+        assert "AAPL" in store.dui_entries(active_on="2026-01-03")
+
+        out = tmp_path / "out"
+        written = store.export_legacy(out)
+        assert set(written) >= {"scans", "dui"}
+        exported = json.loads((out / LEGACY_FILES["scans"]).read_text())
+        assert exported["gamma_drain"][0]["symbol"] == "TSLA"
+
+    def test_file_is_newer(self, tmp_path):
+        path = tmp_path / "f.json"
+        assert not file_is_newer(path, None)
+        path.write_text("{}")
+        assert file_is_newer(path, None)
+        assert not file_is_newer(path, path.stat().st_mtime)
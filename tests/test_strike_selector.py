@@ -0,0 +1,70 @@
+"""
+Tests for put contract selection from the Polygon options snapshot.
+"""
+
+from datetime import date, datetime, timedelta
+
+from putsengine.clients.polygon_client import PolygonClient
+from putsengine.models import PutCandidate
+from putsengine.scoring.strike_selector import StrikeSelector
+
+
+def _snapshot(
+    expiration: date, strike: float, delta: float, iv: float, bid: float, ask: float
+) -> dict:
+    """One result of /v3/snapshot/options/{underlying}, as Polygon returns it."""
+    ticker = f"O:AAPL{expiration:%y%m%d}P{int(strike * 1000):08d}"
+    return {
+        "break_even_price": strike - (bid + ask) / 2,
+        "day": {"change": -0.12, "close": ask, "high": ask, "low": bid, "open": ask,
+                "previous_close": ask + 0.1, "volume": 420, "vwap": bid},
+        "details": {"contract_type": "put", "exercise_style": "american",
+                    "expiration_date": expiration.isoformat(), "shares_per_contract": 100,
+                    "strike_price": strike, "ticker": ticker},
+        "greeks": {"delta": delta, "gamma": 0.031, "theta": -0.045, "vega": 0.11},
+        "implied_volatility": iv,
+        "last_quote": {"ask": ask, "ask_size": 12, "bid": bid, "bid_size": 9,
+                       "midpoint": (bid + ask) / 2, "timeframe": "REAL-TIME"},
+        "last_trade": {"price": bid + 0.05, "size": 3, "exchange": 65, "timeframe": "REAL-TIME"},
+        "open_interest": 2600,
+        "underlying_asset": {"change_to_break_even": -12.4, "price": 150.0, "ticker": "AAPL"},
+    }
+
+
+class TestSelectContract:
+    """Snapshot pages flow through filtering and ranking."""
+
+    async def test_selects_from_paged_snapshot_with_top_level_iv(self, settings):
+        today = date.today()
+        expiration = next(today + timedelta(days=d) for d in range(12, 22)
+                          if (today + timedelta(days=d)).weekday() == 4)
+        pages = [
+            [_snapshot(expiration, 140.0, -0.30, 0.38, 2.00, 2.10),
+             _snapshot(expiration, 143.0, -0.41, 0.36, 2.80, 2.90)],    # delta outside tier band
+            [_snapshot(expiration, 139.0, -0.27, 0.40, 1.00, 1.60)],    # spread too wide
+        ]
+        client = PolygonClient(settings)
+        calls = []
+
+        async def fake_request(endpoint, params=None):
+            calls.append((endpoint, dict(params or {})))
+            page = int((params or {}).get("cursor", 0))
+            result = {"status": "OK", "results": pages[page]}
+            if page + 1 < len(pages):
+                result["next_url"] = f"{client.BASE_URL}{endpoint}?cursor={page + 1}"
+            return result
+
+        client._request = fake_request
+        selector = StrikeSelector(alpaca=None, polygon=client, settings=settings)
+        candidate = PutCandidate(symbol="AAPL", timestamp=datetime.now(), current_price=150.0,
+                                 composite_score=0.5)
+
+        contract = await selector.select_contract(candidate)
+
+        assert len(calls) == 2
+        assert calls[0][0] == "/v3/snapshot/options/AAPL"
+        assert calls[0][1]["contract_type"] == "put"
+        assert contract.strike == 140.0
+        assert contract.implied_volatility == 0.38
+        assert contract.delta == -0.30 and contract.vega == 0.11
+        assert contract.open_interest == 2600 and contract.volume == 420
@@ -0,0 +1,77 @@
+"""
+Tests for the per-symbol market data context shared by the layers.
+"""
+
+from datetime import date, datetime, timedelta
+
+from putsengine.layers.context import SymbolContext, context_daily_bars, context_minute_bars
+from putsengine.models import PriceBar
+
+
+def _bars(days: int, per_day: int = 1):
+    bars = []
+    for d in range(days, -1, -1):
+        day = datetime.combine(date.today() - timedelta(days=d), datetime.min.time())
+        for m in range(per_day):
+            bars.append(PriceBar(timestamp=day + timedelta(minutes=m), open=1, high=1,
+                                 low=1, close=1, volume=100))
+    return bars
+
+
+class FakePolygon:
+    def __init__(self):
+        self.calls = []
+
+    async def get_daily_bars(self, symbol, from_date=None):
+        self.calls.append("daily")
+        return _bars(30)
+
+    async def get_minute_bars(self, symbol, from_date=None, limit=5000):
+        self.calls.append("minute")
+        return _bars(5, per_day=3)[:limit]
+
+    async def get_snapshot(self, symbol):
+        self.calls.append("snapshot")
+        return {"ticker": {"lastTrade": {"p": 12.5}}}
+
+
+class FakeAlpaca:
+    async def get_latest_quote(self, symbol):
+        raise RuntimeError("quote down")
+
+
+class TestSymbolContext:
+    """Tests for SymbolContext."""
+
+    async def test_layers_slice_instead_of_refetching(self):
+        polygon = FakePolygon()
+        context = await SymbolContext.fetch("AAPL", polygon, FakeAlpaca())
+        assert sorted(polygon.calls) == ["daily", "minute", "snapshot"]
+
+        today = date.today()
+        daily = await context_daily_bars(
+            polygon, "AAPL", today - timedelta(days=10), context=context
+        )
+        minute = await context_minute_bars(
+            polygon, "AAPL", today - timedelta(days=2), 4, context=context
+        )
+
+        assert len(daily) == 11
+        assert len(minute) == 4
+        assert minute[0].timestamp.date() == date.today() - timedelta(days=2)
+        assert len(polygon.calls) == 3
+
+    async def test_failed_or_uncovered_items_fall_back(self):
+        polygon = FakePolygon()
+        context = await SymbolContext.fetch("AAPL", polygon, FakeAlpaca())
+
+        assert context.quote is None  # Quote failed -> layers fetch it themselves
+        assert context.current_price == 12.5  # Snapshot fallback
+        assert context.daily_since(date.today() - timedelta(days=60)) is None
+
+    async def test_truncated_minute_window_is_not_sliced(self):
+        polygon = FakePolygon()
+        context = await SymbolContext.fetch("AAPL", polygon, minute_limit=6, include_snapshot=False)
+
+        assert context.minute_since(date.today() - timedelta(days=1)) is None
+        assert len(context.minute_since(context.minute_from)) == 6
@@ -0,0 +1,140 @@
+"""
+Tests for the HTTP record/replay transport.
+"""
+
+import aiohttp
+import pytest
+
+from putsengine.clients import transport
+from putsengine.clients.transport import (
+    Recorder,
+    Replayer,
+    ReplayMissError,
+    create_session,
+    load_archive,
+    replaying,
+)
+from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+
+
+def _exchange(url, params=None, status=200, text='{"data": []}', ms=10.0):
+    return {
+        "m": "GET", "u": url, "p": params or {}, "s": status,
+        "h": {"Content-Type": "application/json"}, "t": text, "ms": ms,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_transport():
+    transport.set_transport(None)
+    yield
+    transport.set_transport(None)
+
+
+class TestRecorder:
+    """Recorded exchanges are compact and carry no credentials."""
+
+    def test_save_strips_secrets(self, tmp_path):
+        recorder = Recorder(tmp_path / "a.jsonl.gz")
+        recorder.add(
+            "GET", "https://api.polygon.io/v2/aggs?apiKey=SECRET", {"limit": 5, "apiKey": "SECRET"},
+            None, 200, {"Content-Type": "application/json"}, '{"results": []}', 12.5,
+        )
+        path = recorder.save()
+
+        [exchange] = load_archive(path)
+        assert exchange["u"] == "https://api.polygon.io/v2/aggs"
+        assert exchange["p"] == {"limit": "5"}
+        assert "SECRET" not in path.read_bytes().decode("latin-1")
+
+    def test_round_trip_through_replay(self, tmp_path):
+        recorder = Recorder(tmp_path / "a.jsonl.gz")
+        recorder.add("GET", "https://x.test/a", {"q": 1}, None, 200, {}, '{"ok": true}', 5.0)
+        replayer = Replayer(recorder.save())
+
+        assert replayer._lookup("GET", "https://x.test/a", {"q": "1"}, None)["t"] == '{"ok": true}'
+
+
+class TestReplayer:
+    """Matching, ordering, misses and fault injection."""
+
+    async def test_exact_match_and_order(self):
+        replayer = Replayer([
+            _exchange("https://x.test/a", {"n": "1"}, text='{"v": 1}'),
+            _exchange("https://x.test/a", {"n": "1"}, text='{"v": 2}'),
+        ])
+        session = replayer.session()
+        seen = []
+        for _ in range(3):
+            async with session.get("https://x.test/a", params={"n": 1}) as response:
+                seen.append((await response.json())["v"])
+
+        assert seen == [1, 2, 2]
+        assert replayer.stats["exact"] == 3
+
+    async def test_route_fallback_ignores_dates(self):
+        aggs = "https://x.test/v2/aggs/ticker/AAPL/range/1/day"
+        replayer = Replayer([
+            _exchange(f"{aggs}/2026-01-02/2026-02-02", {"limit": "50"}),
+            _exchange(
+                "https://x.test/v2/bars", {"symbols": "AAPL", "start": "2026-01-28T00:00:00Z"}
+            ),
+        ])
+        session = replayer.session()
+
+        async with session.get(f"{aggs}/2026-03-01/2026-04-01", params={"limit": 50}) as r1:
+            assert r1.status == 200
+        bars_params = {"symbols": "AAPL", "start": "2026-03-28T00:00:00Z"}
+        async with session.get("https://x.test/v2/bars", params=bars_params) as r2:
+            assert r2.status == 200
+        assert replayer.stats["route"] == 2
+
+    async def test_miss_returns_404_or_raises_when_strict(self):
+        async with Replayer([]).session().get("https://x.test/none") as response:
+            assert response.status == 404
+
+        with pytest.raises(ReplayMissError):
+            await Replayer([], strict=True).respond("GET", "https://x.test/none")
+
+    async def test_throttle_injection_is_seeded(self):
+        runs = []
+        for _ in range(2):
+            replayer = Replayer(
+                [_exchange("https://x.test/a")], throttle_rate=0.5, retry_after=2, seed=7
+            )
+            responses = [await replayer.respond("GET", "https://x.test/a") for _ in range(20)]
+            runs.append([r.status for r in responses])
+            throttled = [r for r in responses if r.status == 429]
+            assert throttled and throttled[0].headers["retry-after"] == "2"
+
+        assert runs[0] == runs[1]
+        assert set(runs[0]) == {200, 429}
+
+
+class TestClientIntegration:
+    """Clients pick up the active transport through create_session."""
+
+    async def test_live_session_without_transport(self):
+        session = create_session(headers={"Accept": "application/json"})
+        try:
+            assert isinstance(session, aiohttp.ClientSession)
+        finally:
+            await session.close()
+
+    async def test_uw_client_served_from_archive(self, settings):
+        client = UnusualWhalesClient(settings)
+        url = f"{client.BASE_URL}/api/stock/AAPL/greek-exposure"
+        with replaying([_exchange(url, text='{"data": [{"gamma": 1}]}')]) as replayer:
+            result = await client._request("/api/stock/AAPL/greek-exposure")
+            assert not isinstance(await client._get_session(), aiohttp.ClientSession)
+            await client.close()
+
+        assert result == {"data": [{"gamma": 1}]}
+        assert replayer.stats["requests"] == 1
+
+    def test_session_base_requires_send(self):
+        class Incomplete(transport._SessionBase):
+            pass
+
+        with pytest.raises(TypeError, match="_send"):
+            Incomplete()
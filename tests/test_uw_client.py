@@ -0,0 +1,78 @@
+"""
+Tests for UnusualWhalesClient request coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from putsengine.clients.unusual_whales_client import UnusualWhalesClient
+
+
+class TestSingleFlight:
+    """Concurrent identical requests share one HTTP call."""
+
+    async def test_concurrent_identical_requests_coalesce(self, settings):
+        client = UnusualWhalesClient(settings)
+        calls = []
+
+        async def fake_uncached(endpoint, cache_key, *args):
+            calls.append(endpoint)
+            await asyncio.sleep(0.01)
+            result = {"data": [endpoint]}
+            await client._cache_response(cache_key, result)
+            return result
+
+        client._request_uncached = fake_uncached
+
+        results = await asyncio.gather(*[
+            client._request("/api/stock/AAPL/greek-exposure") for _ in range(3)
+        ])
+
+        assert calls == ["/api/stock/AAPL/greek-exposure"]
+        assert all(r == {"data": ["/api/stock/AAPL/greek-exposure"]} for r in results)
+        stats = client.get_cache_stats()
+        assert stats["requests_coalesced"] == 2
+        assert stats["requests_in_flight"] == 0
+
+        # A later request is served from the response cache
+        await client._request("/api/stock/AAPL/greek-exposure")
+        assert len(calls) == 1
+        assert client.get_cache_stats()["cache_hits"] == 1
+
+    async def test_failing_leader_fails_joined_callers(self, settings):
+        client = UnusualWhalesClient(settings)
+        calls = []
+
+        async def failing_uncached(endpoint, cache_key, *args):
+            calls.append(endpoint)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        client._request_uncached = failing_uncached
+
+        results = await asyncio.gather(*[
+            client._request("/api/stock/AAPL/greek-exposure") for _ in range(3)
+        ], return_exceptions=True)
+
+        assert len(calls) == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert client.get_cache_stats()["requests_in_flight"] == 0
+
+    async def test_cancelled_leader_cancels_joined_callers(self, settings):
+        client = UnusualWhalesClient(settings)
+
+        async def slow_uncached(endpoint, cache_key, *args):
+            await asyncio.sleep(10)
+
+        client._request_uncached = slow_uncached
+
+        leader = asyncio.create_task(client._request("/api/stock/AAPL/greek-exposure"))
+        await asyncio.sleep(0)
+        joined = asyncio.create_task(client._request("/api/stock/AAPL/greek-exposure"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await joined
+        assert client.get_cache_stats()["requests_in_flight"] == 0